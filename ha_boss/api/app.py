@@ -12,6 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
+from ha_boss.api.websocket_manager import get_websocket_manager
 from ha_boss.core.config import load_config
 from ha_boss.service.main import HABossService
 
@@ -59,6 +60,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     try:
         # Load configuration
         config = load_config()
+        get_websocket_manager().configure(
+            flush_interval=config.api.websocket_flush_interval_ms / 1000,
+            client_queue_size=config.api.websocket_client_queue_size,
+            send_timeout=config.api.websocket_send_timeout_seconds,
+        )
 
         # Create and start service
         _service = HABossService(config)
@@ -75,6 +81,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         if _service:
             await _service.stop()
             _service = None
+        await get_websocket_manager().close()
         logger.info("✓ HA Boss service stopped")
 
 
@@ -0,0 +1,229 @@
+"""Rate limiting of dashboard entity broadcasts for one Home Assistant instance."""
+
+import asyncio
+import logging
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class BroadcastLimiter:
+    """Decides which entity updates of one instance are broadcast to dashboards.
+
+    Two limits apply:
+
+    - Per-entity throttle: attribute-only updates of an entity are dropped if
+      it was broadcast less than ``min_interval`` seconds ago. The last
+      broadcast times are kept in an LRU registry bounded to ``max_entities``,
+      so entities that come and go cannot grow it without limit.
+    - Instance token bucket: every broadcast, state changes included, takes a
+      token. Tokens refill at ``rate`` per second up to ``burst``. When the
+      bucket is empty the limiter switches to summary mode. In that mode
+      individual updates are folded into an aggregate, and ``send_summary``
+      receives that aggregate every ``summary_interval`` seconds. Summary mode
+      ends after an interval in which updates arrived no faster than ``rate``.
+    """
+
+    def __init__(
+        self,
+        instance_id: str,
+        send_summary: Callable[[dict[str, Any]], Awaitable[None]],
+        min_interval: float = 1.0,
+        max_entities: int = 10_000,
+        rate: float = 50.0,
+        burst: int = 200,
+        summary_interval: float = 5.0,
+    ) -> None:
+        """Initialize broadcast limiter.
+
+        Args:
+            instance_id: Home Assistant instance identifier
+            send_summary: Coroutine called with each aggregate summary
+            min_interval: Minimum seconds between attribute-only broadcasts of an entity
+            max_entities: Entities tracked by the throttle registry (least recent dropped)
+            rate: Sustained broadcasts per second allowed for the instance
+            burst: Broadcasts allowed in a burst before the rate applies
+            summary_interval: Seconds between summaries while in summary mode
+        """
+        self.instance_id = instance_id
+        self.min_interval = min_interval
+        self.max_entities = max_entities
+        self.rate = rate
+        self.burst = burst
+        self.summary_interval = summary_interval
+        self._send_summary = send_summary
+
+        # Throttle registry: {entity_id: last broadcast (monotonic)}, oldest first
+        self._last_broadcast: OrderedDict[str, float] = OrderedDict()
+
+        # Token bucket
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+
+        # Summary mode: updates since the last summary
+        self._summary_mode = False
+        self._summary_task: asyncio.Task[None] | None = None
+        self._window_started = 0.0
+        self._window_updates = 0
+        self._window_entities: set[str] = set()
+        self._window_domains: Counter[str] = Counter()
+        self._window_state_changes = 0
+
+        # Statistics
+        self._admitted = 0
+        self._throttled = 0
+        self._rate_limited = 0
+        self._coalesced = 0
+        self._registry_evictions = 0
+        self._summaries_sent = 0
+
+    @property
+    def summary_mode(self) -> bool:
+        """Whether updates are currently being aggregated into summaries."""
+        return self._summary_mode
+
+    def admit(self, entity_id: str, state_changed: bool) -> bool:
+        """Decide whether an entity update should be broadcast individually.
+
+        Updates that are not admitted because the bucket is empty are added to
+        the next summary. Throttled attribute-only updates are dropped.
+
+        Args:
+            entity_id: Entity identifier
+            state_changed: True if the state value changed (not just attributes)
+
+        Returns:
+            True if the update should be broadcast now
+        """
+        now = time.monotonic()
+
+        if self._summary_mode:
+            self._add_to_summary(entity_id, state_changed)
+            return False
+
+        if not state_changed:
+            last = self._last_broadcast.get(entity_id)
+            if last is not None and now - last < self.min_interval:
+                self._throttled += 1
+                return False
+
+        self._refill(now)
+        if self._tokens < 1:
+            self._enter_summary_mode(now)
+            self._add_to_summary(entity_id, state_changed)
+            return False
+
+        self._tokens -= 1
+        self._admitted += 1
+        self._last_broadcast[entity_id] = now
+        self._last_broadcast.move_to_end(entity_id)
+        if len(self._last_broadcast) > self.max_entities:
+            self._last_broadcast.popitem(last=False)
+            self._registry_evictions += 1
+        return True
+
+    def forget(self, entity_id: str) -> None:
+        """Drop an entity from the throttle registry (e.g. when it is removed).
+
+        Args:
+            entity_id: Entity identifier
+        """
+        self._last_broadcast.pop(entity_id, None)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(float(self.burst), self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _enter_summary_mode(self, now: float) -> None:
+        self._summary_mode = True
+        self._window_started = now
+        logger.info(
+            f"[{self.instance_id}] Dashboard broadcast rate exceeded "
+            f"({self.rate:g}/s, burst {self.burst}), switching to summary updates"
+        )
+        if self._summary_task is None or self._summary_task.done():
+            self._summary_task = asyncio.create_task(self._summary_loop())
+
+    def _add_to_summary(self, entity_id: str, state_changed: bool) -> None:
+        self._rate_limited += 1
+        self._window_updates += 1
+        if state_changed:
+            self._window_state_changes += 1
+        if entity_id in self._window_entities:
+            self._coalesced += 1
+        elif len(self._window_entities) < self.max_entities:
+            self._window_entities.add(entity_id)
+        self._window_domains[entity_id.partition(".")[0]] += 1
+
+    async def _summary_loop(self) -> None:
+        while self._summary_mode:
+            await asyncio.sleep(self.summary_interval)
+            now = time.monotonic()
+            elapsed = now - self._window_started
+            summary = self._take_summary(elapsed)
+
+            # Leave summary mode once updates arrive no faster than the bucket refills
+            if summary["updates"] <= self.rate * elapsed:
+                self._summary_mode = False
+                self._tokens = float(self.burst)
+                self._refilled_at = now
+                summary["summary_mode"] = False
+                logger.info(
+                    f"[{self.instance_id}] Dashboard broadcast rate recovered, "
+                    "resuming individual updates"
+                )
+            self._window_started = now
+
+            try:
+                await self._send_summary(summary)
+                self._summaries_sent += 1
+            except Exception as e:
+                logger.debug(f"[{self.instance_id}] Failed to send broadcast summary: {e}")
+
+    def _take_summary(self, elapsed: float) -> dict[str, Any]:
+        summary = {
+            "instance_id": self.instance_id,
+            "window_seconds": round(elapsed, 3),
+            "updates": self._window_updates,
+            "state_changes": self._window_state_changes,
+            "entities": len(self._window_entities),
+            "domains": dict(self._window_domains),
+            "summary_mode": True,
+            "timestamp": datetime.now(UTC).isoformat(),
+        }
+        self._window_updates = 0
+        self._window_state_changes = 0
+        self._window_entities = set()
+        self._window_domains = Counter()
+        return summary
+
+    async def close(self) -> None:
+        """Stop the summary timer (instance shutdown)."""
+        self._summary_mode = False
+        if self._summary_task is not None and not self._summary_task.done():
+            self._summary_task.cancel()
+            await asyncio.gather(self._summary_task, return_exceptions=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get broadcast limiter statistics.
+
+        Returns:
+            Dictionary with admitted, throttled, rate-limited and coalesced
+            update counts, registry size and summary mode state
+        """
+        self._refill(time.monotonic())
+        return {
+            "admitted": self._admitted,
+            "throttled": self._throttled,
+            "rate_limited": self._rate_limited,
+            "coalesced": self._coalesced,
+            "tracked_entities": len(self._last_broadcast),
+            "registry_evictions": self._registry_evictions,
+            "summary_mode": self._summary_mode,
+            "summaries_sent": self._summaries_sent,
+            "tokens": round(self._tokens, 1),
+        }
@@ -844,7 +844,7 @@ async def get_automation_health(
 
         from ha_boss.core.database import AutomationHealthStatus
 
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             stmt = select(AutomationHealthStatus).where(
                 AutomationHealthStatus.instance_id == instance_id,
                 AutomationHealthStatus.automation_id == automation_id,
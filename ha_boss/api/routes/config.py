@@ -231,12 +231,16 @@ async def reload_config() -> dict[str, str]:
     """
     try:
         # Ensure service is running
-        get_service()
+        service = get_service()
 
         # For now, just log that a reload was requested
         # Full hot-reload implementation requires coordination with service components
         logger.info("Configuration reload requested via API")
 
+        # Drop memoized include/exclude verdicts so pattern edits apply immediately
+        for monitor in service.health_monitors.values():
+            monitor.pattern_matcher.invalidate()
+
         # TODO: Implement actual hot-reload coordination
         # This would involve:
         # 1. Loading updated config from database
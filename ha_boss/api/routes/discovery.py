@@ -138,7 +138,7 @@ async def get_discovery_stats(
         monitored_count = 0
         last_refresh_record = None
 
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             for inst_id in instance_ids:
                 # Count automations
                 total_automations_result = await session.execute(
@@ -280,7 +280,7 @@ async def list_automations(
             logger.error("Database not initialized")
             raise HTTPException(status_code=503, detail="Database not initialized") from None
 
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             # Build query
             query = select(Automation)
 
@@ -396,7 +396,7 @@ async def get_automation_details(
         if not service.database:
             raise HTTPException(status_code=503, detail="Database not initialized") from None
 
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             # Get automation for this instance
             result = await session.execute(
                 select(Automation).where(
@@ -490,7 +490,7 @@ async def get_entity_usage(
         if not service.database:
             raise HTTPException(status_code=503, detail="Database not initialized") from None
 
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             # Get automations using this entity in this instance
             automation_results = await session.execute(
                 select(AutomationEntity, Automation)
@@ -238,6 +238,11 @@ async def suppress_healing(
 
             await session.commit()
 
+            # Keep the healing manager's in-memory policy state in sync
+            healing_manager = service.healing_managers.get(instance_id)
+            if healing_manager:
+                healing_manager.policy.set_suppressed(entity_id, True)
+
             return SuppressionActionResponse(
                 entity_id=entity_id,
                 suppressed=True,
@@ -310,6 +315,11 @@ async def unsuppress_healing(
                 await session.commit()
                 logger.info(f"[{instance_id}] Healing unsuppressed for entity: {entity_id}")
 
+                # Keep the healing manager's in-memory policy state in sync
+                healing_manager = service.healing_managers.get(instance_id)
+                if healing_manager:
+                    healing_manager.policy.set_suppressed(entity_id, False)
+
             return SuppressionActionResponse(
                 entity_id=entity_id,
                 suppressed=False,
@@ -472,7 +482,7 @@ async def get_healing_history(
         start_time = end_time - timedelta(hours=hours)
 
         # Query database for healing actions
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             from sqlalchemy import func, select
 
             from ha_boss.core.database import HealingAction, Integration
@@ -530,7 +540,7 @@ async def get_healing_history(
 
         # Convert to response models with enhanced details
         actions = []
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             for action, integration_domain in rows:
                 # Look up the trigger reason from the most recent HealthEvent for this entity
                 # that occurred before or at the same time as the healing action
@@ -604,7 +614,7 @@ async def get_suppressed_entities(
         if not service.database:
             raise HTTPException(status_code=503, detail="Database not initialized") from None
 
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             from sqlalchemy import select
 
             # Query entities with healing suppressed
@@ -678,7 +688,7 @@ async def get_cascade_details(
         if not service.database:
             raise HTTPException(status_code=503, detail="Database not initialized") from None
 
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             from sqlalchemy import select
 
             # Fetch cascade execution
@@ -742,7 +752,7 @@ async def list_cascades(
         raise HTTPException(status_code=503, detail="Database not available")
 
     try:
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             stmt = sa_select(HealingCascadeExecution).order_by(
                 desc(HealingCascadeExecution.created_at)
             )
@@ -832,7 +842,7 @@ async def get_healing_statistics(
                 detail="start_date must be before end_date",
             )
 
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             from sqlalchemy import Integer, case, cast, select
 
             # Calculate statistics per level using database aggregation
@@ -978,7 +988,7 @@ async def get_automation_health(
         if not service.database:
             raise HTTPException(status_code=503, detail="Database not initialized") from None
 
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             from sqlalchemy import select
 
             # Fetch automation health status
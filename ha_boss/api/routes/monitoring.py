@@ -2,6 +2,7 @@
 
 import logging
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 from fastapi import APIRouter, HTTPException, Query
 from sqlalchemy import select
@@ -10,6 +11,7 @@ from ha_boss.api.app import get_service
 from ha_boss.api.models import EntityHistoryResponse, EntityStateResponse
 from ha_boss.api.utils.instance_helpers import get_instance_ids, is_aggregate_mode
 from ha_boss.core.database import Entity
+from ha_boss.monitoring.state_tracker import EntityState, StateTracker
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,10 @@ async def list_entities(
     instance_id: str = Query("all", description="Instance ID or 'all' for aggregate"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum entities to return"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    domain: str | None = Query(None, description="Only entities of this domain"),
+    state: str | None = Query(None, description="Only entities currently in this state"),
+    integration_id: str | None = Query(None, description="Only entities of this integration"),
+    device_id: str | None = Query(None, description="Only entities of this device"),
 ) -> list[EntityStateResponse]:
     """List all monitored entities with current states.
 
@@ -31,9 +37,14 @@ async def list_entities(
         instance_id: Instance ID or 'all' for aggregate (default: "all")
         limit: Maximum number of entities to return (1-1000)
         offset: Pagination offset
+        domain: Optional domain filter (e.g., 'light')
+        state: Optional current state filter (e.g., 'unavailable')
+        integration_id: Optional integration config entry filter
+        device_id: Optional device filter
 
     When instance_id is 'all', returns entities from all instances.
     Each entity's instance_id field indicates which instance it belongs to.
+    Filtered requests are answered from the state trackers' in-memory indexes.
 
     Returns:
         List of entity state information
@@ -48,8 +59,21 @@ async def list_entities(
         instance_ids = get_instance_ids(service, instance_id)
         aggregate = is_aggregate_mode(instance_id)
 
+        if any(f is not None for f in (domain, state, integration_id, device_id)):
+            return await _query_entities(
+                service,
+                instance_ids,
+                aggregate,
+                limit,
+                offset,
+                domain=domain,
+                state=state,
+                integration_id=integration_id,
+                device_id=device_id,
+            )
+
         # Query database for monitored entities
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             query = select(Entity).where(Entity.is_monitored == True)  # noqa: E712
 
             # Filter by instance(s)
@@ -77,7 +101,7 @@ async def list_entities(
                     EntityStateResponse(
                         entity_id=cached_state.entity_id,
                         state=cached_state.state,
-                        attributes=cached_state.attributes,
+                        attributes=dict(cached_state.attributes),
                         last_changed=None,
                         last_updated=cached_state.last_updated,
                         monitored=True,
@@ -107,56 +131,36 @@ async def list_entities(
         raise HTTPException(status_code=503, detail=str(e)) from None
 
 
-@router.get("/entities/{entity_id:path}", response_model=EntityStateResponse)
-async def get_entity(
-    entity_id: str, instance_id: str = Query("default", description="Instance identifier")
-) -> EntityStateResponse:
-    """Get current state of a specific entity for a specific instance.
-
-    Args:
-        entity_id: Entity ID (e.g., 'sensor.temperature')
-        instance_id: Instance identifier (default: "default")
-
-    Returns:
-        Entity state information
-
-    Raises:
-        HTTPException: Instance or entity not found (404) or service error (500)
-    """
-    try:
-        service = get_service()
-
-        # Validate instance exists
-        state_tracker = service.state_trackers.get(instance_id)
-        if not state_tracker:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Instance '{instance_id}' not found. Available instances: {list(service.state_trackers.keys())}",
-            ) from None
-
-        # Get entity state
-        state = await state_tracker.get_state(entity_id)
-
-        if not state:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Entity '{entity_id}' not found in instance '{instance_id}'",
-            ) from None
-
-        return EntityStateResponse(
-            entity_id=state.entity_id,
-            state=state.state,
-            attributes=state.attributes,
-            last_changed=None,  # EntityState doesn't track last_changed
-            last_updated=state.last_updated,
+async def _query_entities(
+    service: Any,
+    instance_ids: list[str],
+    aggregate: bool,
+    limit: int,
+    offset: int,
+    **filters: str | None,
+) -> list[EntityStateResponse]:
+    """List entities matching filters from the state trackers' indexes."""
+    matches: list[tuple[str, EntityState]] = []
+    for inst_id in sorted(instance_ids):
+        state_tracker = service.state_trackers.get(inst_id)
+        if not isinstance(state_tracker, StateTracker):
+            continue
+        if filters.get("device_id") is not None and state_tracker.registry_cache is None:
+            continue
+        matches.extend((inst_id, s) for s in await state_tracker.query(**filters))
+
+    return [
+        EntityStateResponse(
+            entity_id=entity_state.entity_id,
+            state=entity_state.state,
+            attributes=dict(entity_state.attributes),
+            last_changed=None,
+            last_updated=entity_state.last_updated,
             monitored=True,
+            instance_id=inst_id if aggregate else None,
         )
-
-    except HTTPException:
-        raise
-    except RuntimeError as e:
-        logger.error(f"[{instance_id}] Service not initialized: {e}")
-        raise HTTPException(status_code=503, detail=str(e)) from None
+        for inst_id, entity_state in matches[offset : offset + limit]
+    ]
 
 
 @router.get("/entities/{entity_id:path}/history", response_model=EntityHistoryResponse)
@@ -188,15 +192,30 @@ async def get_entity_history(
                 detail=f"Instance '{instance_id}' not found. Available instances: {list(service.ha_clients.keys())}",
             ) from None
 
-        if not service.database:
-            raise HTTPException(status_code=503, detail="Database not initialized") from None
-
         # Calculate time range
         end_time = datetime.now(UTC)
         start_time = end_time - timedelta(hours=hours)
 
+        # Serve recent ranges from the state tracker's in-memory transitions
+        state_tracker = service.state_trackers.get(instance_id)
+        if isinstance(state_tracker, StateTracker):
+            transitions = state_tracker.get_recent_transitions(entity_id, start_time, end_time)
+            if transitions is not None:
+                history = [
+                    {"state": t.state, "timestamp": t.timestamp, "attributes": {}}
+                    for t in reversed(transitions)
+                ]
+                return EntityHistoryResponse(
+                    entity_id=entity_id,
+                    history=history,
+                    count=len(history),
+                )
+
+        if not service.database:
+            raise HTTPException(status_code=503, detail="Database not initialized") from None
+
         # Query database for entity history for this instance
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             from sqlalchemy import select
 
             from ha_boss.core.database import StateHistory
@@ -247,3 +266,55 @@ async def get_entity_history(
     except Exception as e:
         logger.error(f"[{instance_id}] Error retrieving entity history: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to retrieve entity history") from None
+
+
+@router.get("/entities/{entity_id:path}", response_model=EntityStateResponse)
+async def get_entity(
+    entity_id: str, instance_id: str = Query("default", description="Instance identifier")
+) -> EntityStateResponse:
+    """Get current state of a specific entity for a specific instance.
+
+    Args:
+        entity_id: Entity ID (e.g., 'sensor.temperature')
+        instance_id: Instance identifier (default: "default")
+
+    Returns:
+        Entity state information
+
+    Raises:
+        HTTPException: Instance or entity not found (404) or service error (500)
+    """
+    try:
+        service = get_service()
+
+        # Validate instance exists
+        state_tracker = service.state_trackers.get(instance_id)
+        if not state_tracker:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Instance '{instance_id}' not found. Available instances: {list(service.state_trackers.keys())}",
+            ) from None
+
+        # Get entity state
+        state = await state_tracker.get_state(entity_id)
+
+        if not state:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Entity '{entity_id}' not found in instance '{instance_id}'",
+            ) from None
+
+        return EntityStateResponse(
+            entity_id=state.entity_id,
+            state=state.state,
+            attributes=dict(state.attributes),
+            last_changed=None,  # EntityState doesn't track last_changed
+            last_updated=state.last_updated,
+            monitored=True,
+        )
+
+    except HTTPException:
+        raise
+    except RuntimeError as e:
+        logger.error(f"[{instance_id}] Service not initialized: {e}")
+        raise HTTPException(status_code=503, detail=str(e)) from None
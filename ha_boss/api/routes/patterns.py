@@ -156,7 +156,7 @@ async def get_failure_events(
         start_time = end_time - timedelta(hours=hours)
 
         # Query database for failure events
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             from sqlalchemy import select
 
             from ha_boss.core.database import HealthEvent
@@ -248,7 +248,7 @@ async def get_weekly_summary(
         start_date = end_date - timedelta(days=days)
 
         # Query database for summary stats
-        async with service.database.async_session() as session:
+        async with service.database.read_session() as session:
             from sqlalchemy import Integer, cast, func, select
 
             from ha_boss.core.database import HealingAction, HealthEvent
@@ -22,6 +22,7 @@ from ha_boss.api.models import (
     HealingPlanValidateRequest,
     HealingPlanValidationResponse,
 )
+from ha_boss.core.exceptions import HealingPlanNotFoundError
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +54,19 @@ def _get_plan_components(instance_id: str = "default") -> tuple[Any, Any]:
     return plan_matcher, plan_executor
 
 
+async def _refresh_plan_indexes() -> None:
+    """Rebuild the compiled plan index of every instance after a plan change."""
+    service = get_service()
+    for instance_id, orchestrator in service.cascade_orchestrators.items():
+        plan_matcher = getattr(orchestrator, "plan_matcher", None)
+        if not plan_matcher:
+            continue
+        try:
+            await plan_matcher.refresh()
+        except Exception as e:
+            logger.error(f"[{instance_id}] Failed to rebuild plan index: {e}")
+
+
 def _plan_to_response(plan: Any, source: str = "unknown") -> HealingPlanResponse:
     """Convert a plan definition to API response model."""
     match_criteria = HealingPlanMatchCriteria(
@@ -128,8 +142,16 @@ async def toggle_plan(plan_name: str) -> dict[str, Any]:
 
     for plan in plan_matcher.plans:
         if plan.name == plan_name:
-            current = getattr(plan, "enabled", True)
-            plan.enabled = not current
+            enabled = not getattr(plan, "enabled", True)
+            try:
+                await plan_matcher.plan_loader.set_plan_enabled(plan_name, enabled)
+            except HealingPlanNotFoundError as e:
+                raise HTTPException(status_code=404, detail=str(e)) from e
+            except Exception as e:
+                logger.error(f"Failed to toggle plan '{plan_name}': {e}")
+                raise HTTPException(status_code=500, detail=f"Failed to toggle plan: {e}") from e
+            plan.enabled = enabled
+            await _refresh_plan_indexes()
             return {
                 "plan_name": plan_name,
                 "enabled": plan.enabled,
@@ -229,6 +251,7 @@ async def create_plan(request: HealingPlanValidateRequest) -> HealingPlanRespons
         logger.error(f"Failed to save plan: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to save plan: {e}") from e
 
+    await _refresh_plan_indexes()
     return _plan_to_response(plan, source="api")
 
 
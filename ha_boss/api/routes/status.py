@@ -2,6 +2,7 @@
 
 import logging
 from datetime import UTC, datetime
+from typing import Literal
 
 from fastapi import APIRouter, HTTPException, Query, Response
 
@@ -15,6 +16,7 @@ from ha_boss.api.models import (
 )
 from ha_boss.api.utils.instance_helpers import get_instance_ids, is_aggregate_mode
 from ha_boss.core.database import HealingAction
+from ha_boss.service.startup import InstanceReadiness, InstanceStartup
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +34,7 @@ async def get_healing_stats_from_db(database, instance_ids: list[str]) -> tuple[
         Tuple of (attempted, succeeded, failed) counts
     """
     try:
-        async with database.async_session() as session:
+        async with database.read_session() as session:
             from sqlalchemy import Integer, cast, func, select
 
             # Build query for healing statistics
@@ -140,7 +142,7 @@ async def get_status(
             db_count = 0
             db_success = False
             try:
-                async with service.database.async_session() as session:
+                async with service.database.read_session() as session:
                     from sqlalchemy import func, select
 
                     from ha_boss.core.database import Entity
@@ -258,6 +260,7 @@ async def check_tier1_critical(service, instance_id: str) -> dict[str, Component
 
     Components:
     - service_state: Service running state
+    - instance_readiness: Instance startup phase (when started by the service)
     - ha_rest_connection: Home Assistant REST API connection
     - database_accessible: Database engine accessibility
     - configuration_valid: Configuration loaded and valid
@@ -293,7 +296,27 @@ async def check_tier1_critical(service, instance_id: str) -> dict[str, Component
             },
         )
 
-    # 2. Home Assistant REST Connection
+    # 2. Instance startup readiness
+    startup = service.instance_startup.get(instance_id)
+    if isinstance(startup, InstanceStartup):
+        readiness_status: Literal["healthy", "degraded", "unhealthy"]
+        if startup.state == InstanceReadiness.READY:
+            readiness_status = "healthy"
+            readiness_message = f"Instance ready (startup took {startup.total_ms:.0f}ms)"
+        elif startup.state == InstanceReadiness.FAILED:
+            readiness_status = "unhealthy"
+            readiness_message = f"Instance startup failed ({startup.error})"
+        else:
+            readiness_status = "degraded"
+            readiness_message = f"Instance starting (phase: {startup.state})"
+        components["instance_readiness"] = ComponentHealth(
+            status=readiness_status,
+            message=readiness_message,
+            last_update=startup.ready_at,
+            details={**startup.to_dict(), "instance_id": instance_id},
+        )
+
+    # 3. Home Assistant REST Connection
     ha_client = service.ha_clients.get(instance_id)
     ha_session_valid = (
         ha_client is not None
@@ -323,7 +346,7 @@ async def check_tier1_critical(service, instance_id: str) -> dict[str, Component
             },
         )
 
-    # 3. Database Accessible
+    # 4. Database Accessible
     db_engine_valid = (
         service.database is not None
         and hasattr(service.database, "engine")
@@ -349,7 +372,7 @@ async def check_tier1_critical(service, instance_id: str) -> dict[str, Component
             },
         )
 
-    # 4. Configuration Valid
+    # 5. Configuration Valid
     if service.config is not None:
         components["configuration_valid"] = ComponentHealth(
             status="healthy",
@@ -419,7 +442,7 @@ async def check_tier2_essential(service, instance_id: str) -> dict[str, Componen
 
         # Also check database for monitored entities (more reliable than cache)
         try:
-            async with service.database.async_session() as session:
+            async with service.database.read_session() as session:
                 from sqlalchemy import func, select
 
                 from ha_boss.core.database import Entity
@@ -509,7 +532,7 @@ async def check_tier2_essential(service, instance_id: str) -> dict[str, Componen
         # Get last discovery refresh timestamp from database
         last_refresh = None
         try:
-            async with service.database.async_session() as session:
+            async with service.database.read_session() as session:
                 from sqlalchemy import select
 
                 from ha_boss.core.database import DiscoveryRefresh
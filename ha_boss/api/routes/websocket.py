@@ -114,19 +114,20 @@ async def websocket_endpoint(
 
                 if message_type == "ping":
                     # Respond to heartbeat
-                    await websocket.send_json(
-                        {"type": "pong", "timestamp": message.get("timestamp")}
+                    await manager.send(
+                        websocket, {"type": "pong", "timestamp": message.get("timestamp")}
                     )
 
                 elif message_type == "subscribe":
                     # Update subscriptions
                     subscriptions = set(message.get("subscriptions", []))
                     await manager.update_subscription(websocket, subscriptions)
-                    await websocket.send_json(
+                    await manager.send(
+                        websocket,
                         {
                             "type": "subscribed",
                             "subscriptions": list(subscriptions),
-                        }
+                        },
                     )
 
                 elif message_type == "switch_instance":
@@ -134,6 +134,22 @@ class Dashboard {
       }
     });
 
+    // Coalesced entity state changes (one frame per flush interval)
+    this.ws.on('entity_states_batch', (message) => {
+      console.log('Entity states changed:', message.updates.length);
+      if (this.currentTab === 'monitoring') {
+        this.loadMonitoringTab();
+      }
+    });
+
+    // Aggregate of rate-limited entity updates (sent instead of individual updates)
+    this.ws.on('entity_updates_summary', (message) => {
+      console.log('Entity updates summary:', message.updates, 'updates,', message.entities, 'entities');
+      if (this.currentTab === 'monitoring') {
+        this.loadMonitoringTab();
+      }
+    });
+
     // Health status updates
     this.ws.on('health_status', (message) => {
       console.log('Health status update received');
@@ -1,8 +1,11 @@
 """WebSocket manager for real-time dashboard updates."""
 
 import asyncio
+import json
 import logging
-from collections import defaultdict
+import time
+from collections import defaultdict, deque
+from collections.abc import Mapping
 from datetime import UTC, datetime
 from typing import Any
 
@@ -10,25 +13,110 @@ from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+# Close code for evicted slow consumers ("try again later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+# Fan-out latency samples kept for percentile reporting
+LATENCY_WINDOW = 1024
+
+
+class _ClientChannel:
+    """Bounded outbound queue of serialized frames and the task writing them to one client."""
+
+    __slots__ = ("queue", "writer")
+
+    def __init__(self, max_queue: int) -> None:
+        # Items are (frame, enqueued_at perf_counter)
+        self.queue: asyncio.Queue[tuple[str, float]] = asyncio.Queue(maxsize=max_queue)
+        self.writer: asyncio.Task[None] | None = None
+
+    def stop(self) -> None:
+        """Cancel the writer (unless called from it) and discard unsent frames."""
+        if self.writer is not None and self.writer is not asyncio.current_task():
+            self.writer.cancel()
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.queue.task_done()
+
 
 class WebSocketManager:
     """Manages WebSocket connections and broadcasts real-time updates to dashboard clients.
 
     Handles client subscriptions per instance, connection lifecycle,
     and event broadcasting with proper error handling.
+
+    Broadcasts never wait on client I/O: each message is serialized once and the
+    frame is queued for every recipient. Each client has a bounded queue and its
+    own writer task. A client whose queue overflows, or whose send takes longer
+    than the send timeout, is evicted so it cannot hold back the others. Entity
+    state updates are coalesced per instance (latest state wins) and flushed as
+    one frame per flush interval.
     """
 
-    def __init__(self) -> None:
-        """Initialize WebSocket manager."""
+    def __init__(
+        self,
+        flush_interval: float = 0.1,
+        client_queue_size: int = 256,
+        send_timeout: float = 10.0,
+    ) -> None:
+        """Initialize WebSocket manager.
+
+        Args:
+            flush_interval: Seconds entity updates are coalesced before a batch is sent
+            client_queue_size: Frames buffered per client before it is evicted
+            send_timeout: Seconds a single send may take before the client is evicted
+        """
+        self.flush_interval = flush_interval
+        self.client_queue_size = client_queue_size
+        self.send_timeout = send_timeout
+
         # Active connections: {websocket: {"instance_id": str, "subscriptions": set}}
         self._connections: dict[WebSocket, dict[str, Any]] = {}
 
         # Instance subscriptions: {instance_id: set of websockets}
         self._instance_subscriptions: dict[str, set[WebSocket]] = defaultdict(set)
 
+        # Outbound queue and writer task per connection
+        self._channels: dict[WebSocket, _ClientChannel] = {}
+
+        # Entity updates awaiting the next flush: {instance_id: {entity_id: state}}
+        self._pending_entities: dict[str, dict[str, dict[str, Any]]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        self._background_tasks: set[asyncio.Task[None]] = set()
+
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
 
+        # Statistics
+        self._messages_serialized = 0
+        self._frames_queued = 0
+        self._frames_sent = 0
+        self._entity_updates = 0
+        self._entity_updates_coalesced = 0
+        self._batches_sent = 0
+        self._evictions = 0
+        self._latencies_ms: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def configure(
+        self,
+        flush_interval: float | None = None,
+        client_queue_size: int | None = None,
+        send_timeout: float | None = None,
+    ) -> None:
+        """Apply broadcast settings (queue size applies to new connections).
+
+        Args:
+            flush_interval: Seconds entity updates are coalesced before a batch is sent
+            client_queue_size: Frames buffered per client before it is evicted
+            send_timeout: Seconds a single send may take before the client is evicted
+        """
+        if flush_interval is not None:
+            self.flush_interval = flush_interval
+        if client_queue_size is not None:
+            self.client_queue_size = client_queue_size
+        if send_timeout is not None:
+            self.send_timeout = send_timeout
+
     async def connect(self, websocket: WebSocket, instance_id: str = "default") -> None:
         """Register a new WebSocket connection.
 
@@ -49,6 +137,10 @@ class WebSocketManager:
             # Add to instance subscriptions
             self._instance_subscriptions[instance_id].add(websocket)
 
+            channel = _ClientChannel(self.client_queue_size)
+            channel.writer = asyncio.create_task(self._write_loop(websocket, channel))
+            self._channels[websocket] = channel
+
             logger.info(f"WebSocket connected: {id(websocket)} for instance '{instance_id}'")
 
             # Send welcome message
@@ -84,6 +176,11 @@ class WebSocketManager:
             # Remove connection
             del self._connections[websocket]
 
+            # Stop the writer (evicted clients have already lost their channel)
+            channel = self._channels.pop(websocket, None)
+            if channel is not None:
+                channel.stop()
+
             logger.info(f"WebSocket disconnected: {id(websocket)} from instance '{instance_id}'")
 
     async def switch_instance(self, websocket: WebSocket, new_instance_id: str) -> None:
@@ -146,46 +243,85 @@ class WebSocketManager:
             instance_id: Instance identifier
             message: Message to broadcast
         """
-        if instance_id not in self._instance_subscriptions:
+        clients = self._instance_subscriptions.get(instance_id)
+        if not clients:
             return
 
-        # Get snapshot of clients (avoid holding lock during sends)
-        async with self._lock:
-            clients = list(self._instance_subscriptions[instance_id])
-
-        # Broadcast to all clients
-        disconnected = []
-        for websocket in clients:
-            success = await self._send_to_client(websocket, message)
-            if not success:
-                disconnected.append(websocket)
-
-        # Clean up disconnected clients
-        for websocket in disconnected:
-            await self.disconnect(websocket)
+        # Serialize once; queue the same frame for every client
+        self._fan_out(list(clients), self._serialize(message))
 
     async def broadcast_entity_state(
         self, instance_id: str, entity_id: str, state: dict[str, Any]
     ) -> None:
         """Broadcast entity state change to subscribed clients.
 
-        Only sends to clients with 'entities' or '*' subscription.
+        Only sends to clients with 'entities' or '*' subscription. Updates are
+        coalesced per instance until the next flush, keeping the latest state of
+        each entity. A flush with a single update is sent as an
+        ``entity_state_changed`` message, otherwise as one
+        ``entity_states_batch`` message listing all updates.
 
         Args:
             instance_id: Instance identifier
             entity_id: Entity identifier
             state: Entity state data
         """
-        message = {
-            "type": "entity_state_changed",
-            "instance_id": instance_id,
-            "entity_id": entity_id,
-            "state": state,
-            "timestamp": datetime.now(UTC).isoformat(),
-        }
-        await self._broadcast_with_subscription_filter(
-            instance_id, message, required_subscription="entities"
-        )
+        if instance_id not in self._instance_subscriptions:
+            return
+
+        pending = self._pending_entities.setdefault(instance_id, {})
+        if entity_id in pending:
+            self._entity_updates_coalesced += 1
+        pending[entity_id] = state
+        self._entity_updates += 1
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after(self.flush_interval))
+
+    async def _flush_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self.flush_entity_updates()
+
+    def flush_entity_updates(self) -> None:
+        """Send all coalesced entity updates now (one frame per instance)."""
+        pending, self._pending_entities = self._pending_entities, {}
+        timestamp = datetime.now(UTC).isoformat()
+        for instance_id, updates in pending.items():
+            message: dict[str, Any]
+            if len(updates) == 1:
+                ((entity_id, state),) = updates.items()
+                message = {
+                    "type": "entity_state_changed",
+                    "instance_id": instance_id,
+                    "entity_id": entity_id,
+                    "state": state,
+                    "timestamp": timestamp,
+                }
+            else:
+                message = {
+                    "type": "entity_states_batch",
+                    "instance_id": instance_id,
+                    "updates": [
+                        {"entity_id": entity_id, "state": state}
+                        for entity_id, state in updates.items()
+                    ],
+                    "timestamp": timestamp,
+                }
+                self._batches_sent += 1
+            self._broadcast_filtered(instance_id, message, required_subscription="entities")
+
+    async def broadcast_entity_summary(self, instance_id: str, summary: dict[str, Any]) -> None:
+        """Broadcast an aggregate of rate-limited entity updates.
+
+        Sent instead of individual entity updates while an instance exceeds its
+        broadcast rate. Only sends to clients with 'entities' or '*' subscription.
+
+        Args:
+            instance_id: Instance identifier
+            summary: Aggregate counts (updates, entities, domains, window)
+        """
+        message = {"type": "entity_updates_summary", **summary, "instance_id": instance_id}
+        self._broadcast_filtered(instance_id, message, required_subscription="entities")
 
     async def broadcast_health_status(self, instance_id: str, health: dict[str, Any]) -> None:
         """Broadcast health status change to subscribed clients.
@@ -254,26 +390,23 @@ class WebSocketManager:
             required_subscription: Subscription key required to receive message
                                  (clients with '*' always receive)
         """
-        if instance_id not in self._instance_subscriptions:
-            return
+        self._broadcast_filtered(instance_id, message, required_subscription)
 
-        # Get snapshot of clients (avoid holding lock during sends)
-        async with self._lock:
-            clients = list(self._instance_subscriptions[instance_id])
+    def _broadcast_filtered(
+        self, instance_id: str, message: dict[str, Any], required_subscription: str
+    ) -> None:
+        clients = self._instance_subscriptions.get(instance_id)
+        if not clients:
+            return
 
-        # Filter clients by subscription and broadcast
-        disconnected = []
+        # Check if client has required subscription or wildcard
+        recipients = []
         for websocket in clients:
-            # Check if client has required subscription or wildcard
             subscriptions = self._connections[websocket]["subscriptions"]
             if required_subscription in subscriptions or "*" in subscriptions:
-                success = await self._send_to_client(websocket, message)
-                if not success:
-                    disconnected.append(websocket)
-
-        # Clean up disconnected clients
-        for websocket in disconnected:
-            await self.disconnect(websocket)
+                recipients.append(websocket)
+        if recipients:
+            self._fan_out(recipients, self._serialize(message))
 
     async def update_subscription(self, websocket: WebSocket, subscriptions: set[str]) -> None:
         """Update client subscriptions.
@@ -287,24 +420,139 @@ class WebSocketManager:
                 self._connections[websocket]["subscriptions"] = subscriptions
                 logger.debug(f"Updated subscriptions for {id(websocket)}: {subscriptions}")
 
+    async def send(self, websocket: WebSocket, message: dict[str, Any]) -> bool:
+        """Queue a message for a single client, in order with its broadcasts.
+
+        Args:
+            websocket: WebSocket connection
+            message: Message to send
+
+        Returns:
+            True if queued, False if the client is gone or was evicted
+        """
+        return await self._send_to_client(websocket, message)
+
     async def _send_to_client(self, websocket: WebSocket, message: dict[str, Any]) -> bool:
-        """Send message to a specific client.
+        """Queue a message for a specific client.
 
         Args:
             websocket: WebSocket connection
             message: Message to send
 
         Returns:
-            True if sent successfully, False if client disconnected
+            True if queued, False if the client is gone or was evicted
         """
+        return self._enqueue(websocket, self._serialize(message), time.perf_counter())
+
+    def _serialize(self, message: dict[str, Any]) -> str:
+        self._messages_serialized += 1
+        return json.dumps(message, separators=(",", ":"), default=_encode_mapping)
+
+    def _fan_out(self, clients: list[WebSocket], frame: str) -> None:
+        enqueued_at = time.perf_counter()
+        for websocket in clients:
+            self._enqueue(websocket, frame, enqueued_at)
+
+    def _enqueue(self, websocket: WebSocket, frame: str, enqueued_at: float) -> bool:
+        channel = self._channels.get(websocket)
+        if channel is None:
+            return False
         try:
-            await websocket.send_json(message)
-            return True
-        except Exception as e:
-            logger.warning(
-                f"Failed to send message to {id(websocket)}: {e}. Marking for disconnect."
-            )
+            channel.queue.put_nowait((frame, enqueued_at))
+        except asyncio.QueueFull:
+            self._evict(websocket, f"outbound queue full ({self.client_queue_size} frames)")
             return False
+        self._frames_queued += 1
+        return True
+
+    async def _write_loop(self, websocket: WebSocket, channel: _ClientChannel) -> None:
+        """Send queued frames to one client until it disconnects or is evicted."""
+        while True:
+            frame, enqueued_at = await channel.queue.get()
+            try:
+                await asyncio.wait_for(websocket.send_text(frame), timeout=self.send_timeout)
+            except TimeoutError:
+                self._evict(websocket, f"send exceeded {self.send_timeout}s")
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Failed to send message to {id(websocket)}: {e}. Marking for disconnect."
+                )
+                await self.disconnect(websocket)
+                return
+            else:
+                self._frames_sent += 1
+                self._latencies_ms.append((time.perf_counter() - enqueued_at) * 1000)
+            finally:
+                channel.queue.task_done()
+
+    def _evict(self, websocket: WebSocket, reason: str) -> None:
+        """Drop a slow consumer: stop its writer now, unregister and close it in the background."""
+        channel = self._channels.pop(websocket, None)
+        if channel is None:
+            return
+        channel.stop()
+        self._evictions += 1
+        logger.warning(f"Evicting slow WebSocket client {id(websocket)}: {reason}")
+        task = asyncio.create_task(self._close_evicted(websocket))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _close_evicted(self, websocket: WebSocket) -> None:
+        await self.disconnect(websocket)
+        try:
+            await websocket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="Slow consumer")
+        except Exception as e:
+            logger.debug(f"Error closing evicted WebSocket {id(websocket)}: {e}")
+
+    async def drain(self) -> None:
+        """Flush coalesced entity updates and wait until every queued frame is sent."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self.flush_entity_updates()
+        await asyncio.gather(*(channel.queue.join() for channel in list(self._channels.values())))
+
+    async def close(self) -> None:
+        """Stop the flush timer and all writer tasks (service shutdown)."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        self._pending_entities.clear()
+        writers = [c.writer for c in self._channels.values() if c.writer is not None]
+        for channel in self._channels.values():
+            channel.stop()
+        await asyncio.gather(*writers, *self._background_tasks, return_exceptions=True)
+        self._channels.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get broadcast pipeline statistics.
+
+        Returns:
+            Dictionary with connection, coalescing, queue, eviction and fan-out
+            latency (enqueue to send completion, over recent frames) statistics
+        """
+        latencies = sorted(self._latencies_ms)
+
+        def percentile(fraction: float) -> float | None:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(fraction * len(latencies)))], 2)
+
+        return {
+            "connections": len(self._connections),
+            "messages_serialized": self._messages_serialized,
+            "frames_queued": self._frames_queued,
+            "frames_sent": self._frames_sent,
+            "queued_frames": sum(c.queue.qsize() for c in self._channels.values()),
+            "entity_updates": self._entity_updates,
+            "entity_updates_coalesced": self._entity_updates_coalesced,
+            "batches_sent": self._batches_sent,
+            "evictions": self._evictions,
+            "fanout_latency_ms": {
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": round(latencies[-1], 2) if latencies else None,
+            },
+        }
 
     def get_connection_count(self) -> int:
         """Get total number of active connections.
@@ -326,6 +574,13 @@ class WebSocketManager:
         return len(self._instance_subscriptions.get(instance_id, set()))
 
 
+def _encode_mapping(value: Any) -> dict[str, Any]:
+    """Encode read-only mappings (e.g. lazily parsed attributes) at flush time."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 # Global WebSocket manager instance
 _websocket_manager: WebSocketManager | None = None
 
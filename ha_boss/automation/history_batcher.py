@@ -0,0 +1,221 @@
+"""Batching of state history requests made by outcome validation."""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from ha_boss.core.ha_client import HomeAssistantClient
+
+logger = logging.getLogger(__name__)
+
+# History of one entity: states in the window, oldest first
+EntityHistory = list[dict[str, Any]]
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite doesn't preserve timezone, so add UTC if naive
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+def _changed_at(state: dict[str, Any]) -> datetime | None:
+    value = state.get("last_changed") or state.get("last_updated")
+    if not value:
+        return None
+    try:
+        return _aware(datetime.fromisoformat(value.replace("Z", "+00:00")))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class _HistoryRequest:
+    """History wanted by one validation."""
+
+    entity_ids: list[str]
+    start_time: datetime
+    end_time: datetime
+    attributes: bool
+    future: asyncio.Future[dict[str, EntityHistory]] = field(repr=False)
+
+
+class HistoryBatcher:
+    """Collapses concurrent history requests into as few REST calls as possible.
+
+    Outcome validation needs the history of every entity an automation should
+    have changed. Requests arriving within a short window are grouped by
+    overlapping time windows, and each group is fetched with a single
+    ``/api/history/period`` call for all of its entities (comma-separated
+    ``filter_entity_id``) over the union of the windows. The response is then
+    fanned back out per request and entity, trimmed to each request's window.
+
+    Attributes are only requested (no ``minimal_response``/``no_attributes``)
+    when a request in the group compares attributes.
+    """
+
+    def __init__(
+        self,
+        ha_client: HomeAssistantClient,
+        window_seconds: float = 0.05,
+        instance_id: str = "default",
+    ) -> None:
+        """Initialize history batcher.
+
+        Args:
+            ha_client: Home Assistant client used for history queries
+            window_seconds: Time requests are collected before fetching
+            instance_id: Home Assistant instance identifier (for logging)
+        """
+        self.ha_client = ha_client
+        self.window_seconds = window_seconds
+        self.instance_id = instance_id
+
+        self._pending: list[_HistoryRequest] = []
+        self._window: asyncio.Task[None] | None = None
+
+        # Statistics
+        self._requests = 0
+        self._entities_requested = 0
+        self._fetches = 0
+
+    async def fetch(
+        self,
+        entity_ids: list[str],
+        start_time: datetime,
+        end_time: datetime,
+        attributes: bool = True,
+    ) -> dict[str, EntityHistory]:
+        """Get the history of entities within a time window.
+
+        Args:
+            entity_ids: Entities to get history for
+            start_time: Start of the window
+            end_time: End of the window
+            attributes: Whether states must include attributes
+
+        Returns:
+            History per entity ID (entities without history are omitted)
+
+        Raises:
+            HomeAssistantAPIError: If the batched history request fails
+        """
+        if not entity_ids:
+            return {}
+
+        request = _HistoryRequest(
+            entity_ids=list(entity_ids),
+            start_time=start_time,
+            end_time=end_time,
+            attributes=attributes,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._requests += 1
+        self._entities_requested += len(request.entity_ids)
+        self._pending.append(request)
+        if self._window is None:
+            self._window = asyncio.create_task(self._fetch_after_window())
+        return await request.future
+
+    async def _fetch_after_window(self) -> None:
+        await asyncio.sleep(self.window_seconds)
+        pending, self._pending = self._pending, []
+        self._window = None
+
+        groups: list[list[_HistoryRequest]] = []
+        group_end: datetime | None = None
+        for request in sorted(pending, key=lambda r: _aware(r.start_time)):
+            start, end = _aware(request.start_time), _aware(request.end_time)
+            if group_end is None or start > group_end:
+                groups.append([request])
+                group_end = end
+            else:
+                groups[-1].append(request)
+                group_end = max(group_end, end)
+
+        await asyncio.gather(*(self._fetch_group(group) for group in groups))
+
+    async def _fetch_group(self, requests: list[_HistoryRequest]) -> None:
+        entity_ids = sorted({entity_id for r in requests for entity_id in r.entity_ids})
+        start = min(_aware(r.start_time) for r in requests)
+        end = max(_aware(r.end_time) for r in requests)
+        attributes = any(r.attributes for r in requests)
+
+        try:
+            self._fetches += 1
+            history = await self.ha_client.get_history(
+                filter_entity_id=entity_ids,
+                start_time=start,
+                end_time=end,
+                minimal_response=not attributes,
+                no_attributes=not attributes,
+            )
+        except Exception as e:
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        # Groups carry the entity ID on their first state
+        by_entity: dict[str, EntityHistory] = {}
+        for states in history or []:
+            if not states:
+                continue
+            entity_id = states[0].get("entity_id")
+            if entity_id is None and len(entity_ids) == 1:
+                entity_id = entity_ids[0]
+            if entity_id is not None:
+                by_entity[entity_id] = states
+
+        if len(requests) > 1:
+            logger.debug(
+                f"[{self.instance_id}] Fetched history of {len(entity_ids)} entities "
+                f"for {len(requests)} validations in one request"
+            )
+
+        for request in requests:
+            if request.future.done():
+                continue
+            request.future.set_result(
+                {
+                    entity_id: self._trim(by_entity[entity_id], request)
+                    for entity_id in request.entity_ids
+                    if entity_id in by_entity
+                }
+            )
+
+    @staticmethod
+    def _trim(states: EntityHistory, request: _HistoryRequest) -> EntityHistory:
+        """Cut an entity's history down to a request's window.
+
+        The state in effect at the window start is kept, with its change time
+        moved to the window start (as Home Assistant reports the start state).
+        """
+        start, end = _aware(request.start_time), _aware(request.end_time)
+        initial: dict[str, Any] | None = None
+        trimmed: EntityHistory = []
+        for state in states:
+            changed_at = _changed_at(state)
+            if changed_at is None:
+                trimmed.append(state)
+            elif changed_at < start:
+                initial = state
+            elif changed_at <= end:
+                trimmed.append(state)
+
+        if initial is not None and not (trimmed and _changed_at(trimmed[0]) == start):
+            trimmed.insert(0, dict(initial, last_changed=start.isoformat()))
+        return trimmed
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get history batching statistics.
+
+        Returns:
+            Dictionary with request, entity and fetch counts
+        """
+        return {
+            "requests": self._requests,
+            "entities_requested": self._entities_requested,
+            "fetches": self._fetches,
+            "requests_saved": max(self._entities_requested - self._fetches, 0),
+        }
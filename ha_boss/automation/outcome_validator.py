@@ -21,7 +21,9 @@ if TYPE_CHECKING:
         HealingContext,
     )
     from ha_boss.intelligence.llm_router import LLMRouter
+    from ha_boss.monitoring.state_tracker import StateTracker
 
+from ha_boss.automation.history_batcher import EntityHistory, HistoryBatcher
 from ha_boss.core.config import Config
 from ha_boss.core.database import (
     AutomationDesiredState,
@@ -96,6 +98,8 @@ class OutcomeValidator:
         cascade_orchestrator: "CascadeOrchestrator | None" = None,
         health_tracker: "AutomationHealthTracker | None" = None,
         config: Config | None = None,
+        state_tracker: "StateTracker | None" = None,
+        history_batcher: HistoryBatcher | None = None,
     ) -> None:
         """Initialize outcome validator.
 
@@ -107,6 +111,10 @@ class OutcomeValidator:
             cascade_orchestrator: Optional cascade orchestrator for triggering healing
             health_tracker: Optional health tracker for recording execution results
             config: Optional configuration for healing timeouts and settings
+            state_tracker: Optional state tracker whose in-memory transitions answer
+                recent validation windows without a history API call
+            history_batcher: Optional history batcher to share with other validators
+                (default: one owned by this validator)
         """
         self.database = database
         self.ha_client = ha_client
@@ -115,6 +123,8 @@ class OutcomeValidator:
         self.cascade_orchestrator = cascade_orchestrator
         self.health_tracker = health_tracker
         self.config = config
+        self.state_tracker = state_tracker
+        self.history_batcher = history_batcher or HistoryBatcher(ha_client, instance_id=instance_id)
         self._background_tasks: set[asyncio.Task[CascadeResult | None]] = set()
 
     async def validate_execution(
@@ -169,17 +179,7 @@ class OutcomeValidator:
 
         # Query actual states within validation window
         end_time = executed_at + timedelta(seconds=validation_window_seconds)
-        entity_results = {}
-
-        for desired in desired_states:
-            entity_result = await self._validate_entity(
-                entity_id=desired.entity_id,
-                desired_state=desired.desired_state,
-                desired_attributes=desired.desired_attributes,
-                start_time=executed_at,
-                end_time=end_time,
-            )
-            entity_results[desired.entity_id] = entity_result
+        entity_results = await self._validate_entities(desired_states, executed_at, end_time)
 
         # Determine overall success
         overall_success = all(result.achieved for result in entity_results.values())
@@ -262,20 +262,98 @@ class OutcomeValidator:
             )
             return list(result.scalars().all())
 
-    async def _validate_entity(
+    async def _validate_entities(
+        self,
+        desired_states: list[AutomationDesiredState],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> dict[str, EntityValidationResult]:
+        """Validate the outcome of every entity of an execution.
+
+        Entities the state tracker cannot answer from memory share a single
+        (batched) history request.
+
+        Args:
+            desired_states: Desired states of the automation
+            start_time: Start of validation window
+            end_time: End of validation window
+
+        Returns:
+            EntityValidationResult per entity ID
+        """
+        # SQLite doesn't preserve timezone, so add UTC if naive
+        start_time = start_time if start_time.tzinfo else start_time.replace(tzinfo=UTC)
+        end_time = end_time if end_time.tzinfo else end_time.replace(tzinfo=UTC)
+
+        entity_results: dict[str, EntityValidationResult] = {}
+        remaining: list[AutomationDesiredState] = []
+        for desired in desired_states:
+            try:
+                recent = await self._validate_from_memory(
+                    desired.entity_id,
+                    desired.desired_state,
+                    desired.desired_attributes,
+                    start_time,
+                    end_time,
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error validating entity {desired.entity_id} from memory: {e}",
+                    exc_info=True,
+                )
+                recent = None
+            if recent is not None:
+                entity_results[desired.entity_id] = recent
+            else:
+                remaining.append(desired)
+
+        if not remaining:
+            return entity_results
+
+        history: dict[str, EntityHistory] | None
+        try:
+            history = await self.history_batcher.fetch(
+                [desired.entity_id for desired in remaining],
+                start_time,
+                end_time,
+                attributes=any(desired.desired_attributes for desired in remaining),
+            )
+        except Exception as e:
+            logger.error(
+                f"Error querying history for {len(remaining)} entities: {e}",
+                exc_info=True,
+            )
+            history = None
+
+        for desired in remaining:
+            entity_results[desired.entity_id] = self._validate_entity(
+                entity_id=desired.entity_id,
+                desired_state=desired.desired_state,
+                desired_attributes=desired.desired_attributes,
+                entity_history=history.get(desired.entity_id) if history is not None else None,
+                start_time=start_time,
+                end_time=end_time,
+            )
+        # Keep the desired states' order
+        return {desired.entity_id: entity_results[desired.entity_id] for desired in desired_states}
+
+    def _validate_entity(
         self,
         entity_id: str,
         desired_state: str,
         desired_attributes: dict[str, Any] | None,
+        entity_history: EntityHistory | None,
         start_time: datetime,
         end_time: datetime,
     ) -> EntityValidationResult:
-        """Validate a single entity's outcome.
+        """Validate a single entity's outcome against its history.
 
         Args:
             entity_id: Entity to validate
             desired_state: Expected state
             desired_attributes: Expected attributes (optional)
+            entity_history: Entity's states in the validation window (None if the
+                history query failed)
             start_time: Start of validation window
             end_time: End of validation window
 
@@ -283,15 +361,7 @@ class OutcomeValidator:
             EntityValidationResult with achieved status and timing
         """
         try:
-            # Query HA history for this entity in the time window
-            history = await self.ha_client.get_history(
-                filter_entity_id=entity_id,
-                start_time=start_time,
-                end_time=end_time,
-            )
-
-            # History returns list of lists (grouped by entity)
-            if not history or not history[0]:
+            if not entity_history:
                 logger.debug(
                     f"No history found for {entity_id} in window " f"{start_time} to {end_time}"
                 )
@@ -305,7 +375,6 @@ class OutcomeValidator:
                 )
 
             # Get the last state in the window
-            entity_history = history[0]
             last_state = entity_history[-1]
 
             actual_state = last_state.get("state")
@@ -362,6 +431,54 @@ class OutcomeValidator:
                 achieved=False,
             )
 
+    async def _validate_from_memory(
+        self,
+        entity_id: str,
+        desired_state: str,
+        desired_attributes: dict[str, Any] | None,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> EntityValidationResult | None:
+        """Validate an entity from the state tracker's recent transitions.
+
+        Only used when the window is covered in memory, no attributes are
+        expected (transitions record states only) and the entity has not changed
+        since the window closed, so its cached state is the state at end_time.
+
+        Returns:
+            EntityValidationResult, or None if the history API must be queried
+        """
+        if self.state_tracker is None or desired_attributes:
+            return None
+
+        start = start_time if start_time.tzinfo else start_time.replace(tzinfo=UTC)
+        end = end_time if end_time.tzinfo else end_time.replace(tzinfo=UTC)
+        transitions = self.state_tracker.get_recent_transitions(entity_id, start)
+        if transitions is None or (transitions and transitions[-1].timestamp > end):
+            return None
+        current = await self.state_tracker.get_state(entity_id)
+        if current is None:
+            return None
+
+        achieved = self._compare_states(desired_state, current.state)
+        time_to_achievement_ms = None
+        if achieved:
+            for transition in transitions:
+                if self._compare_states(desired_state, transition.state):
+                    delta = transition.timestamp - start
+                    time_to_achievement_ms = int(delta.total_seconds() * 1000)
+                    break
+
+        return EntityValidationResult(
+            entity_id=entity_id,
+            desired_state=desired_state,
+            desired_attributes=desired_attributes,
+            actual_state=current.state,
+            actual_attributes=dict(current.attributes),
+            achieved=achieved,
+            time_to_achievement_ms=time_to_achievement_ms,
+        )
+
     def _compare_states(self, desired: str, actual: str | None) -> bool:
         """Compare desired and actual states.
 
@@ -7,13 +7,17 @@ and compares actual vs. expected trigger conditions.
 
 import asyncio
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ha_boss.core.database import AutomationDesiredState, Database
 from ha_boss.core.ha_client import HomeAssistantClient
 
+if TYPE_CHECKING:
+    from ha_boss.monitoring.state_tracker import StateTracker
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +64,7 @@ class TriggerFailureDetector:
         database: Database,
         ha_client: HomeAssistantClient,
         instance_id: str = "default",
+        state_tracker: "StateTracker | None" = None,
     ) -> None:
         """Initialize trigger failure detector.
 
@@ -67,10 +72,14 @@ class TriggerFailureDetector:
             database: Database for querying automation configurations
             ha_client: Home Assistant client for state queries
             instance_id: Home Assistant instance identifier
+            state_tracker: Optional state tracker; when set, a failure is reported
+                as soon as a state change meets the trigger instead of after the
+                full validation window
         """
         self.database = database
         self.ha_client = ha_client
         self.instance_id = instance_id
+        self.state_tracker = state_tracker
 
     async def monitor_state_changes(
         self,
@@ -121,7 +130,16 @@ class TriggerFailureDetector:
                 return None
 
             # Wait for the validation window
-            await asyncio.sleep(validation_window)
+            if self.state_tracker is None:
+                await asyncio.sleep(validation_window)
+            else:
+                early_states = await self._watch_trigger_entities(
+                    automation_id, initial_states, validation_window
+                )
+                if early_states is not None:
+                    return self._trigger_failure(
+                        automation_id, expected_trigger, initial_states, early_states
+                    )
 
             # Get final states after window
             final_states = await self._get_trigger_entity_states(expected_trigger)
@@ -139,17 +157,8 @@ class TriggerFailureDetector:
             )
 
             if trigger_should_fire:
-                logger.warning(
-                    f"Trigger failure detected for {automation_id}: "
-                    f"state changes should have triggered automation but didn't"
-                )
-                return TriggerFailureContext(
-                    automation_id=automation_id,
-                    instance_id=self.instance_id,
-                    expected_trigger=expected_trigger,
-                    actual_state={"initial": initial_states, "final": final_states},
-                    timestamp=datetime.now(UTC),
-                    detection_method="state_change_monitoring",
+                return self._trigger_failure(
+                    automation_id, expected_trigger, initial_states, final_states
                 )
 
             logger.debug(
@@ -168,6 +177,122 @@ class TriggerFailureDetector:
             )
             return None
 
+    async def _watch_trigger_entities(
+        self,
+        automation_id: str,
+        initial_states: dict[str, dict[str, Any]],
+        validation_window: float,
+    ) -> dict[str, dict[str, Any]] | None:
+        """Re-validate on every trigger entity change until the window closes.
+
+        Args:
+            automation_id: Automation being monitored
+            initial_states: Trigger entity states at the start of the window
+            validation_window: Seconds to watch
+
+        Returns:
+            States that met the trigger as soon as they occurred, or None if no
+            change within the window did
+        """
+        assert self.state_tracker is not None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + validation_window
+        watch_start = datetime.now(UTC)
+        baseline = {eid: state.get("state") for eid, state in initial_states.items()}
+        # Last replayed transition per entity (epoch ms)
+        replayed: dict[str, int] = {}
+
+        while (remaining := deadline - loop.time()) > 0:
+            wait = await self.state_tracker.wait_for(
+                baseline,
+                lambda s: s.state != baseline.get(s.entity_id),
+                count=1,
+                timeout=remaining,
+            )
+            if not wait.satisfied:
+                return None
+
+            current = dict(initial_states)
+            for entity_id in baseline:
+                tracked = await self.state_tracker.get_state(entity_id)
+                if tracked is not None:
+                    current[entity_id] = {
+                        "entity_id": entity_id,
+                        "state": tracked.state,
+                        "attributes": dict(tracked.attributes),
+                    }
+                    baseline[entity_id] = tracked.state
+
+            # Replay intermediate states from the transition buffer so a short
+            # flip (e.g. on -> off -> on) between wakeups is still evaluated
+            for entity_id, state in self._unreplayed_transitions(baseline, watch_start, replayed):
+                if state == current[entity_id].get("state"):
+                    continue
+                intermediate = dict(current)
+                intermediate[entity_id] = {"entity_id": entity_id, "state": state, "attributes": {}}
+                if await self.validate_trigger_fired(
+                    automation_id, {"initial": initial_states, "final": intermediate}
+                ):
+                    return intermediate
+
+            if await self.validate_trigger_fired(
+                automation_id, {"initial": initial_states, "final": current}
+            ):
+                return current
+
+        return None
+
+    def _unreplayed_transitions(
+        self,
+        entity_ids: Iterable[str],
+        since: datetime,
+        replayed: dict[str, int],
+    ) -> list[tuple[str, str]]:
+        """Get transitions since ``since`` not yet replayed, oldest first.
+
+        Args:
+            entity_ids: Trigger entities
+            since: Start of the watch
+            replayed: Last replayed transition time per entity (updated in place)
+
+        Returns:
+            (entity_id, state) pairs in transition order
+        """
+        assert self.state_tracker is not None
+        pending: list[tuple[int, str, str]] = []
+        for entity_id in entity_ids:
+            transitions = self.state_tracker.get_recent_transitions(entity_id, since)
+            if not transitions:
+                continue
+            last = replayed.get(entity_id, -1)
+            pending.extend(
+                (t.timestamp_ms, entity_id, t.state) for t in transitions if t.timestamp_ms > last
+            )
+            replayed[entity_id] = transitions[-1].timestamp_ms
+        pending.sort()
+        return [(entity_id, state) for _, entity_id, state in pending]
+
+    def _trigger_failure(
+        self,
+        automation_id: str,
+        expected_trigger: dict[str, Any],
+        initial_states: dict[str, dict[str, Any]],
+        final_states: dict[str, dict[str, Any]],
+    ) -> TriggerFailureContext:
+        """Build (and log) the failure context for a trigger that should have fired."""
+        logger.warning(
+            f"Trigger failure detected for {automation_id}: "
+            f"state changes should have triggered automation but didn't"
+        )
+        return TriggerFailureContext(
+            automation_id=automation_id,
+            instance_id=self.instance_id,
+            expected_trigger=expected_trigger,
+            actual_state={"initial": initial_states, "final": final_states},
+            timestamp=datetime.now(UTC),
+            detection_method="state_change_monitoring",
+        )
+
     async def validate_trigger_fired(
         self,
         automation_id: str,
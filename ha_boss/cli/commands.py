@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -11,11 +11,11 @@ import typer
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from ha_boss.core.config import Config, load_config
-from ha_boss.core.database import Database
+from ha_boss.core.database import DEFAULT_CLEANUP_CHUNK_SIZE, Database
 from ha_boss.core.exceptions import (
     ConfigurationError,
     HomeAssistantAuthError,
@@ -659,19 +659,32 @@ def cleanup_database(
         "--dry-run",
         help="Show what would be deleted without actually deleting",
     ),
+    vacuum: bool = typer.Option(
+        False,
+        "--vacuum",
+        help="Reclaim freed disk space with an incremental VACUUM afterwards",
+    ),
+    chunk_size: int = typer.Option(
+        DEFAULT_CLEANUP_CHUNK_SIZE,
+        "--chunk-size",
+        min=1,
+        help="Maximum rows deleted per transaction",
+    ),
 ) -> None:
     """Clean up old database records.
 
-    Removes:
-    - Health events older than specified days
-    - Healing actions older than specified days
-    - Entities that no longer exist
+    Removes records older than specified days from all time-series tables
+    (health events, healing actions, state history, automation executions,
+    service calls, outcome validations, cascade executions and reliability
+    events). Rows are deleted in small chunks so the running service is
+    not blocked.
 
     This helps keep the database size manageable and performance optimal.
 
     Example:
         haboss db cleanup --days 30
         haboss db cleanup --days 7 --dry-run
+        haboss db cleanup --days 90 --vacuum
     """
     console.print(
         Panel.fit(
@@ -685,90 +698,84 @@ def cleanup_database(
 
     try:
         config = load_config(config_path)
-        asyncio.run(_cleanup_db(config, days, dry_run))
+        asyncio.run(_cleanup_db(config, days, dry_run, vacuum, chunk_size))
 
     except Exception as e:
         handle_error(e)
 
 
-async def _cleanup_db(config: Config, days: int, dry_run: bool) -> None:
+async def _cleanup_db(
+    config: Config,
+    days: int,
+    dry_run: bool,
+    vacuum: bool = False,
+    chunk_size: int = DEFAULT_CLEANUP_CHUNK_SIZE,
+) -> None:
     """Clean up old database records.
 
     Args:
         config: HA Boss configuration
         days: Remove records older than this many days
         dry_run: If True, show what would be deleted without deleting
+        vacuum: Run an incremental VACUUM after deleting
+        chunk_size: Maximum rows deleted per transaction
     """
-    from sqlalchemy import delete, func, select
-
-    from ha_boss.core.database import Database, HealingAction, HealthEvent
-
-    cutoff_date = datetime.now(UTC) - timedelta(days=days)
-
     async with Database(str(config.database.path)) as db:
-        async with db.async_session() as session:
-            # Count records to be deleted
-            health_count = await session.scalar(
-                select(func.count())
-                .select_from(HealthEvent)
-                .where(HealthEvent.timestamp < cutoff_date)
-            )
+        counts = await db.count_expired_records(days)
+        total = sum(counts.values())
 
-            healing_count = await session.scalar(
-                select(func.count())
-                .select_from(HealingAction)
-                .where(HealingAction.timestamp < cutoff_date)
-            )
-
-            table = Table(show_header=False)
-            table.add_column("Record Type", style="cyan")
-            table.add_column("Count", justify="right")
-
-            table.add_row("Health Events", str(health_count or 0))
-            table.add_row("Healing Actions", str(healing_count or 0))
+        table = Table(show_header=False)
+        table.add_column("Record Type", style="cyan")
+        table.add_column("Count", justify="right")
 
-            console.print("\n", table)
+        for key, count in counts.items():
+            table.add_row(key.replace("_", " ").title(), str(count))
 
-            if dry_run:
-                console.print(
-                    "\n[yellow]Dry-run mode:[/yellow] No records were deleted", style="dim"
-                )
-                return
+        console.print("\n", table)
 
-            if not health_count and not healing_count:
-                console.print("\n[green]No records to delete[/green]")
-                return
+        if dry_run:
+            console.print("\n[yellow]Dry-run mode:[/yellow] No records were deleted", style="dim")
+            return
 
-            # Confirm deletion
-            if not typer.confirm(
-                f"\nDelete {(health_count or 0) + (healing_count or 0)} records?",
-                default=False,
-            ):
-                console.print("[yellow]Cancelled[/yellow]")
+        if not total:
+            console.print("\n[green]No records to delete[/green]")
+            if not vacuum:
                 return
+        elif not typer.confirm(f"\nDelete {total} records?", default=False):
+            console.print("[yellow]Cancelled[/yellow]")
+            return
 
-            # Delete old records
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task("Deleting records...", total=None)
-
-                await session.execute(
-                    delete(HealthEvent).where(HealthEvent.timestamp < cutoff_date)
-                )
-                await session.execute(
-                    delete(HealingAction).where(HealingAction.timestamp < cutoff_date)
+        # Delete old records, reporting progress per chunk
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Deleting records...", total=total)
+            table_progress: dict[str, int] = {}
+
+            def on_progress(table_key: str, deleted: int) -> None:
+                table_progress[table_key] = deleted
+                progress.update(
+                    task,
+                    completed=sum(table_progress.values()),
+                    description=f"Deleting {table_key.replace('_', ' ')}...",
                 )
-                await session.commit()
 
-                progress.remove_task(task)
-
-            console.print(
-                f"\n[green]✓ Deleted {(health_count or 0) + (healing_count or 0)} records[/green]"
+            deleted = await db.cleanup_old_records(
+                days,
+                chunk_size=chunk_size,
+                vacuum=vacuum,
+                progress_callback=on_progress,
             )
 
+        pages_freed = deleted.pop("vacuum_pages_freed", None)
+        console.print(f"\n[green]✓ Deleted {sum(deleted.values())} records[/green]")
+        if pages_freed is not None:
+            console.print(f"[green]✓ Vacuum released {pages_freed} pages[/green]")
+
 
 # Patterns subcommands
 patterns_app = typer.Typer(name="patterns", help="Pattern analysis and reliability reports")
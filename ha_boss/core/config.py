@@ -56,6 +56,12 @@ class HomeAssistantConfig(BaseSettings):
     instances: list[HomeAssistantInstance] = Field(
         default_factory=list, description="List of Home Assistant instances to monitor"
     )
+    startup_concurrency: int = Field(
+        default=4,
+        description="Maximum number of instances initialized concurrently at startup",
+        ge=1,
+        le=32,
+    )
 
     @model_validator(mode="after")
     def validate_instances(self) -> "HomeAssistantConfig":
@@ -221,6 +227,24 @@ class MonitoringConfig(BaseSettings):
         description="Periodic health check interval",
         ge=10,
     )
+    history_buffer_size: int = Field(
+        default=64,
+        description="Recent state transitions kept in memory per entity (0 disables)",
+        ge=0,
+        le=10000,
+    )
+    history_buffer_seconds: int = Field(
+        default=86400,
+        description="Maximum age of in-memory state transitions",
+        ge=60,
+    )
+    cached_attributes: list[str] | None = Field(
+        default=None,
+        description=(
+            "Attribute names kept on cached entity states (e.g. friendly_name, "
+            "device_class); None keeps all attributes"
+        ),
+    )
 
     # Auto-discovery configuration
     auto_discovery: AutoDiscoveryConfig = Field(
@@ -274,6 +298,15 @@ class HealingConfig(BaseSettings):
         description="Reset circuit breaker after this time",
         ge=0,
     )
+    coalesce_window_seconds: float = Field(
+        default=2.0,
+        ge=0.0,
+        le=60.0,
+        description=(
+            "Window in which health issues of one integration are grouped into a single "
+            "reload (0 heals each entity separately)"
+        ),
+    )
 
     # Entity-level healing configuration
     entity_healing_max_attempts: int = Field(
@@ -392,6 +425,42 @@ class LoggingConfig(BaseSettings):
     )
 
 
+class DatabaseTuningConfig(BaseSettings):
+    """SQLite storage tuning applied to every new database connection."""
+
+    wal_enabled: bool = Field(
+        default=True,
+        description="Use write-ahead logging so readers never block the writer",
+    )
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        default="NORMAL",
+        description="PRAGMA synchronous level (NORMAL is durable enough with WAL)",
+    )
+    busy_timeout_ms: int = Field(
+        default=5000,
+        description="How long a connection waits for a lock before failing",
+        ge=0,
+    )
+    mmap_size_mb: int = Field(
+        default=64,
+        description="Memory-mapped I/O size (0 disables mmap)",
+        ge=0,
+    )
+    cache_size_kb: int = Field(
+        default=16384,
+        description="Page cache size per connection",
+        ge=0,
+    )
+    temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = Field(
+        default="MEMORY",
+        description="Where temporary tables and indices are stored",
+    )
+    read_only_engine_enabled: bool = Field(
+        default=True,
+        description="Serve API query routes from a separate read-only connection pool",
+    )
+
+
 class DatabaseConfig(BaseSettings):
     """Database configuration."""
 
@@ -409,6 +478,34 @@ class DatabaseConfig(BaseSettings):
         ge=1,
     )
 
+    # Write-behind persistence for entity state updates
+    write_behind_enabled: bool = Field(
+        default=True,
+        description="Batch entity state writes through a write-behind queue",
+    )
+    write_batch_size: int = Field(
+        default=500,
+        description="Pending rows that trigger an immediate write-behind flush",
+        ge=1,
+    )
+    write_flush_interval_seconds: float = Field(
+        default=1.0,
+        description="Maximum delay before queued state writes are flushed",
+        ge=0.05,
+        le=60.0,
+    )
+    write_queue_max_pending: int = Field(
+        default=10000,
+        description="Pending rows above which state updates are throttled (backpressure)",
+        ge=1,
+    )
+
+    # SQLite pragmas and connection layout
+    tuning: DatabaseTuningConfig = Field(
+        default_factory=DatabaseTuningConfig,
+        description="SQLite storage tuning profile",
+    )
+
 
 class WebSocketConfig(BaseSettings):
     """WebSocket client configuration."""
@@ -429,6 +526,33 @@ class WebSocketConfig(BaseSettings):
         ge=5,
     )
 
+    # Event processing pipeline (reception is decoupled from processing)
+    event_queue_size: int = Field(
+        default=10000,
+        description="Maximum pending events per event type before overflow policy applies",
+        ge=10,
+    )
+    state_workers: int = Field(
+        default=4,
+        description="Worker tasks for state_changed events (per-entity ordering is kept)",
+        ge=1,
+        le=32,
+    )
+    overflow_policy: Literal["coalesce", "drop"] = Field(
+        default="coalesce",
+        description=(
+            "state_changed overflow handling: 'coalesce' keeps only the latest pending "
+            "state per entity, 'drop' queues every event and drops new ones when full"
+        ),
+    )
+    decoder: Literal["auto", "msgspec", "orjson", "json"] = Field(
+        default="auto",
+        description=(
+            "Frame decoder: 'auto' uses msgspec (lazy attributes) or orjson when "
+            "installed, otherwise the standard library"
+        ),
+    )
+
 
 class RESTConfig(BaseSettings):
     """REST API client configuration."""
@@ -448,6 +572,19 @@ class RESTConfig(BaseSettings):
         description="Base delay for exponential backoff",
         ge=0.1,
     )
+    coalesce_requests: bool = Field(
+        default=True,
+        description="Share one in-flight request between concurrent identical GETs",
+    )
+    snapshot_cache_ttl_seconds: float = Field(
+        default=0.0,
+        description=(
+            "Serve /api/states and registry lists from a cache for this many seconds "
+            "(0 = disabled)"
+        ),
+        ge=0.0,
+        le=300.0,
+    )
 
 
 class IntelligenceConfig(BaseSettings):
@@ -571,6 +708,48 @@ class APIConfig(BaseModel):
         default=False,
         description="Require HTTPS for API requests",
     )
+    websocket_flush_interval_ms: int = Field(
+        default=100,
+        ge=0,
+        le=5000,
+        description="Interval over which dashboard entity updates are coalesced into one frame",
+    )
+    websocket_client_queue_size: int = Field(
+        default=256,
+        ge=8,
+        le=10000,
+        description="Frames buffered per dashboard client before it is evicted as a slow consumer",
+    )
+    websocket_send_timeout_seconds: float = Field(
+        default=10.0,
+        gt=0,
+        description="Maximum time for a single send before the client is evicted",
+    )
+    websocket_entity_min_interval_seconds: float = Field(
+        default=1.0,
+        ge=0,
+        description="Minimum time between attribute-only dashboard updates of one entity",
+    )
+    websocket_throttle_max_entities: int = Field(
+        default=10000,
+        ge=100,
+        description="Entities tracked per instance for update throttling (least recent dropped)",
+    )
+    websocket_rate_limit_per_second: float = Field(
+        default=50.0,
+        gt=0,
+        description="Sustained dashboard entity updates per second per instance",
+    )
+    websocket_rate_limit_burst: int = Field(
+        default=200,
+        ge=1,
+        description="Dashboard entity updates allowed in a burst before the rate limit applies",
+    )
+    websocket_summary_interval_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Interval of aggregate summary frames while an instance is rate limited",
+    )
 
 
 class Config(BaseSettings):
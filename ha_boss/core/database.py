@@ -1,20 +1,41 @@
 """Database models and management for HA Boss."""
 
+import asyncio
 import logging
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import JSON, Boolean, DateTime, Float, Index, Integer, String, Text, select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+    delete,
+    event,
+    func,
+    select,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from ha_boss.core.config import DatabaseTuningConfig
 from ha_boss.core.exceptions import DatabaseError
 
 logger = logging.getLogger(__name__)
 
 # Current database schema version
-CURRENT_DB_VERSION = 10
+CURRENT_DB_VERSION = 11
 
 
 class Base(DeclarativeBase):
@@ -116,6 +137,8 @@ class HealingAction(Base):
     success: Mapped[bool] = mapped_column(Boolean, nullable=False)
     error: Mapped[str | None] = mapped_column(Text)
     duration_seconds: Mapped[float | None] = mapped_column(Float)
+    # Entities covered by a coalesced integration reload (None for single-entity actions)
+    group_members: Mapped[list[str] | None] = mapped_column(JSON)
 
     def __repr__(self) -> str:
         status = "success" if self.success else "failed"
@@ -1092,30 +1115,128 @@ class StoredInstance(Base):
         return f"<StoredInstance({self.instance_id}, {self.url}, {status})>"
 
 
+# Time-series tables purged by retention cleanup:
+# result key -> (model, name of the timestamp column compared against the cutoff)
+RETENTION_TABLES: dict[str, tuple[type[Base], str]] = {
+    "health_events": (HealthEvent, "timestamp"),
+    "healing_actions": (HealingAction, "timestamp"),
+    "state_history": (StateHistory, "timestamp"),
+    "automation_executions": (AutomationExecution, "executed_at"),
+    "automation_service_calls": (AutomationServiceCall, "called_at"),
+    "automation_outcome_validations": (AutomationOutcomeValidation, "validation_timestamp"),
+    "healing_cascade_executions": (HealingCascadeExecution, "created_at"),
+    "device_healing_actions": (DeviceHealingAction, "created_at"),
+    "entity_healing_actions": (EntityHealingAction, "created_at"),
+    "integration_reliability": (IntegrationReliability, "timestamp"),
+}
+
+# Default number of rows removed per retention cleanup transaction
+DEFAULT_CLEANUP_CHUNK_SIZE = 5000
+
+
 class Database:
     """Database manager for HA Boss."""
 
-    def __init__(self, db_path: Path | str, echo: bool = False) -> None:
+    def __init__(
+        self,
+        db_path: Path | str,
+        echo: bool = False,
+        tuning: DatabaseTuningConfig | None = None,
+    ) -> None:
         """Initialize database manager.
 
         Args:
             db_path: Path to SQLite database file
             echo: Enable SQL query logging
+            tuning: SQLite tuning profile applied on connect (defaults if None)
         """
         self.db_path = Path(db_path)
         self.echo = echo
+        self.tuning = tuning or DatabaseTuningConfig()
 
-        # Create async engine
-        db_url = f"sqlite+aiosqlite:///{self.db_path}"
-        self.engine = create_async_engine(db_url, echo=echo)
+        self._create_engines()
 
-        # Create session factory
+    def _create_engines(self) -> None:
+        """Create the read-write engine, the read-only engine and session factories."""
+        self.engine = self._create_engine(read_only=False)
         self.async_session = async_sessionmaker(
             self.engine,
             class_=AsyncSession,
             expire_on_commit=False,
         )
 
+        # Separate read-only pool for API queries. With WAL, these readers work on a
+        # snapshot and never block (or wait for) the writer. In-memory databases are
+        # private to one connection, so they fall back to the read-write engine.
+        self.read_engine: AsyncEngine | None = None
+        if self.tuning.read_only_engine_enabled and not self._is_memory:
+            self.read_engine = self._create_engine(read_only=True)
+            self.read_session = async_sessionmaker(
+                self.read_engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+            )
+        else:
+            self.read_session = self.async_session
+
+    @property
+    def _is_memory(self) -> bool:
+        """Whether this is an in-memory database."""
+        return str(self.db_path) == ":memory:"
+
+    def _create_engine(self, read_only: bool) -> AsyncEngine:
+        """Create an engine that applies the tuning pragmas to each new connection.
+
+        Args:
+            read_only: Open connections with ``mode=ro``
+
+        Returns:
+            Configured async engine
+        """
+        if read_only:
+            db_url = f"sqlite+aiosqlite:///file:{self.db_path}?mode=ro&uri=true"
+        else:
+            db_url = f"sqlite+aiosqlite:///{self.db_path}"
+        engine = create_async_engine(db_url, echo=self.echo)
+
+        pragmas = self._connection_pragmas(read_only)
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _apply_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma in pragmas:
+                    cursor.execute(pragma)
+            finally:
+                cursor.close()
+
+        return engine
+
+    def _connection_pragmas(self, read_only: bool) -> list[str]:
+        """Build the PRAGMA statements for the tuning profile.
+
+        Args:
+            read_only: Whether the statements are for the read-only engine
+
+        Returns:
+            PRAGMA statements to run on connect
+        """
+        tuning = self.tuning
+        pragmas = [f"PRAGMA busy_timeout = {tuning.busy_timeout_ms}"]
+        # journal_mode is persistent in the file; only the writer sets it
+        if tuning.wal_enabled and not read_only and not self._is_memory:
+            pragmas.append("PRAGMA journal_mode = WAL")
+        pragmas.extend(
+            [
+                f"PRAGMA synchronous = {tuning.synchronous}",
+                f"PRAGMA mmap_size = {tuning.mmap_size_mb * 1024 * 1024}",
+                # Negative cache_size is in KiB rather than pages
+                f"PRAGMA cache_size = -{tuning.cache_size_kb}",
+                f"PRAGMA temp_store = {tuning.temp_store}",
+            ]
+        )
+        return pragmas
+
     async def init_db(self) -> None:
         """Initialize database (create tables if they don't exist)."""
         try:
@@ -1244,20 +1365,14 @@ class Database:
         try:
             # Close connections before backup to ensure data is flushed
             await self.engine.dispose()
+            if self.read_engine is not None:
+                await self.read_engine.dispose()
 
             # Copy the database file
             shutil.copy2(self.db_path, backup_path)
 
-            # Recreate the engine after backup
-            self.engine = create_async_engine(
-                f"sqlite+aiosqlite:///{self.db_path}",
-                echo=False,
-            )
-            self.async_session = async_sessionmaker(
-                self.engine,
-                class_=AsyncSession,
-                expire_on_commit=False,
-            )
+            # Recreate the engines (with the same tuning profile) after backup
+            self._create_engines()
 
             logger.info(f"Database backup created: {backup_path}")
             return backup_path
@@ -1310,6 +1425,8 @@ class Database:
     async def close(self) -> None:
         """Close database connections."""
         await self.engine.dispose()
+        if self.read_engine is not None:
+            await self.read_engine.dispose()
 
     async def __aenter__(self) -> "Database":
         """Enter async context manager."""
@@ -1321,61 +1438,191 @@ class Database:
         """Exit async context manager."""
         await self.close()
 
-    async def cleanup_old_records(self, retention_days: int) -> dict[str, int]:
-        """Clean up old records based on retention policy.
+    async def count_expired_records(self, retention_days: int) -> dict[str, int]:
+        """Count records that retention cleanup would delete.
 
         Args:
             retention_days: Keep records newer than this many days
 
         Returns:
-            Dictionary with counts of deleted records per table
+            Dictionary with counts of expired records per table
         """
         cutoff_date = datetime.now(UTC) - timedelta(days=retention_days)
-        deleted_counts = {}
+        counts: dict[str, int] = {}
 
         async with self.async_session() as session:
-            # Clean up old health events
-            result = await session.execute(
-                select(HealthEvent).where(HealthEvent.timestamp < cutoff_date)
-            )
-            old_events = result.scalars().all()
-            for event in old_events:
-                await session.delete(event)
-            deleted_counts["health_events"] = len(old_events)
-
-            # Clean up old healing actions
-            result = await session.execute(
-                select(HealingAction).where(HealingAction.timestamp < cutoff_date)
-            )
-            old_actions = result.scalars().all()
-            for action in old_actions:
-                await session.delete(action)
-            deleted_counts["healing_actions"] = len(old_actions)
-
-            # Clean up old state history
-            result = await session.execute(
-                select(StateHistory).where(StateHistory.timestamp < cutoff_date)
-            )
-            old_history = result.scalars().all()
-            for history in old_history:
-                await session.delete(history)
-            deleted_counts["state_history"] = len(old_history)
+            for key, (model, column_name) in RETENTION_TABLES.items():
+                column = getattr(model, column_name)
+                count = await session.scalar(
+                    select(func.count()).select_from(model).where(column < cutoff_date)
+                )
+                counts[key] = count or 0
+
+        return counts
 
-            await session.commit()
+    async def cleanup_old_records(
+        self,
+        retention_days: int,
+        chunk_size: int = DEFAULT_CLEANUP_CHUNK_SIZE,
+        vacuum: bool = False,
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> dict[str, int]:
+        """Clean up old records based on retention policy.
+
+        Expired rows are removed with set-based DELETE statements in bounded
+        chunks by primary key range. Each chunk runs in its own short
+        transaction and the event loop is yielded between chunks, so the
+        database is never locked for long and no rows are loaded into memory.
+
+        Args:
+            retention_days: Keep records newer than this many days
+            chunk_size: Maximum rows deleted per transaction
+            vacuum: Run an incremental VACUUM afterwards to reclaim free pages
+            progress_callback: Optional callback called after each chunk with
+                the table key and the number of rows deleted so far for it
+
+        Returns:
+            Dictionary with counts of deleted records per table (plus
+            ``vacuum_pages_freed`` when vacuum is enabled)
+
+        Raises:
+            DatabaseError: If cleanup fails
+        """
+        cutoff_date = datetime.now(UTC) - timedelta(days=retention_days)
+        deleted_counts: dict[str, int] = {}
+
+        try:
+            for key, (model, column_name) in RETENTION_TABLES.items():
+                deleted_counts[key] = await self._delete_expired_chunked(
+                    key, model, column_name, cutoff_date, chunk_size, progress_callback
+                )
+        except Exception as e:
+            raise DatabaseError(f"Failed to clean up old records: {e}") from e
+
+        logger.info(
+            f"Retention cleanup removed {sum(deleted_counts.values())} records "
+            f"older than {retention_days} days"
+        )
+
+        if vacuum:
+            deleted_counts["vacuum_pages_freed"] = await self.incremental_vacuum()
 
         return deleted_counts
 
+    async def _delete_expired_chunked(
+        self,
+        key: str,
+        model: type[Base],
+        column_name: str,
+        cutoff_date: datetime,
+        chunk_size: int,
+        progress_callback: Callable[[str, int], None] | None,
+    ) -> int:
+        """Delete expired rows from one table in primary-key-range chunks.
+
+        Args:
+            key: Table key used for progress reporting
+            model: ORM model of the table
+            column_name: Timestamp column compared against the cutoff
+            cutoff_date: Delete rows older than this
+            chunk_size: Maximum rows deleted per transaction
+            progress_callback: Optional progress callback
+
+        Returns:
+            Number of rows deleted
+        """
+        id_column = model.id  # type: ignore[attr-defined]
+        ts_column = getattr(model, column_name)
+        expired = ts_column < cutoff_date
+        total = 0
+        low: int | None = None
+
+        while True:
+            async with self.async_session() as session:
+                # Upper id of the next chunk: the chunk_size-th expired row after `low`
+                bound_query = select(id_column).where(expired)
+                if low is not None:
+                    bound_query = bound_query.where(id_column > low)
+                bound_query = bound_query.order_by(id_column).offset(chunk_size - 1).limit(1)
+                upper = await session.scalar(bound_query)
+                if upper is None:
+                    # Fewer than chunk_size expired rows left: final chunk
+                    upper = await session.scalar(select(func.max(id_column)).where(expired))
+                    if upper is None:
+                        return total
+
+                statement = delete(model).where(expired, id_column <= upper)
+                if low is not None:
+                    statement = statement.where(id_column > low)
+                result = await session.execute(
+                    statement.execution_options(synchronize_session=False)
+                )
+                await session.commit()
+
+            total += result.rowcount or 0  # type: ignore[attr-defined]
+            low = upper
+            if progress_callback:
+                progress_callback(key, total)
+
+            # Let other tasks (state updates, API requests) run between chunks
+            await asyncio.sleep(0)
+
+    async def incremental_vacuum(self, max_pages: int | None = None) -> int:
+        """Reclaim free pages left behind by deletes.
+
+        Uses ``PRAGMA incremental_vacuum``. Databases created without
+        ``auto_vacuum=INCREMENTAL`` are converted once with a full VACUUM;
+        later runs are incremental.
+
+        Args:
+            max_pages: Maximum pages to release (None = all free pages)
+
+        Returns:
+            Number of pages released back to the filesystem
+
+        Raises:
+            DatabaseError: If vacuum fails
+        """
+        try:
+            async with self.engine.connect() as conn:
+                conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                free_before = (await conn.exec_driver_sql("PRAGMA freelist_count")).scalar() or 0
+                auto_vacuum = (await conn.exec_driver_sql("PRAGMA auto_vacuum")).scalar()
+
+                if auto_vacuum != 2:
+                    logger.info("Enabling incremental auto_vacuum (one-time full VACUUM)")
+                    await conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+                    await conn.exec_driver_sql("VACUUM")
+                else:
+                    pragma = "PRAGMA incremental_vacuum"
+                    if max_pages is not None:
+                        pragma += f"({int(max_pages)})"
+                    await conn.exec_driver_sql(pragma)
+
+                free_after = (await conn.exec_driver_sql("PRAGMA freelist_count")).scalar() or 0
+        except Exception as e:
+            raise DatabaseError(f"Failed to vacuum database: {e}") from e
+
+        freed = max(int(free_before) - int(free_after), 0)
+        logger.info(f"Incremental vacuum released {freed} pages")
+        return freed
+
 
-async def init_database(db_path: Path | str, echo: bool = False) -> Database:
+async def init_database(
+    db_path: Path | str,
+    echo: bool = False,
+    tuning: DatabaseTuningConfig | None = None,
+) -> Database:
     """Initialize database and create tables.
 
     Args:
         db_path: Path to SQLite database file
         echo: Enable SQL query logging
+        tuning: SQLite tuning profile applied on connect
 
     Returns:
         Initialized database manager
     """
-    db = Database(db_path, echo=echo)
+    db = Database(db_path, echo=echo, tuning=tuning)
     await db.init_db()
     return db
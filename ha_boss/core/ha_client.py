@@ -2,7 +2,9 @@
 
 import asyncio
 import logging
+import time
 from datetime import datetime
+from functools import partial
 from typing import Any, cast
 
 import aiohttp
@@ -16,12 +18,38 @@ from ha_boss.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Full-snapshot endpoints eligible for the opt-in TTL cache
+CACHEABLE_ENDPOINTS = frozenset(
+    {
+        "/api/states",
+        "/api/config/entity_registry/list",
+        "/api/config/device_registry/list",
+    }
+)
+
+
+def _stats_key(endpoint: str) -> str:
+    """Group endpoints for request statistics (drop query and per-entity parts)."""
+    path = endpoint.split("?", 1)[0]
+    if path.startswith("/api/states/"):
+        return "/api/states/{entity_id}"
+    if path.startswith("/api/history/period"):
+        return "/api/history/period"
+    if path.startswith("/api/services/"):
+        return "/api/services/{domain}/{service}"
+    return path
+
 
 class HomeAssistantClient:
     """Client for interacting with Home Assistant REST API.
 
     Provides methods for common HA operations with built-in retry logic,
     error handling, and authentication.
+
+    Concurrent identical GET requests are coalesced into a single in-flight
+    request (single-flight). Full-snapshot endpoints (``CACHEABLE_ENDPOINTS``)
+    can additionally be served from a short-lived cache by setting
+    ``rest.snapshot_cache_ttl_seconds``; any write request clears it.
     """
 
     def __init__(self, instance: HomeAssistantInstance, config: Config) -> None:
@@ -38,6 +66,13 @@ class HomeAssistantClient:
         self.timeout = config.rest.timeout_seconds
         self.max_retries = config.rest.retry_attempts
         self.retry_base_delay = config.rest.retry_base_delay_seconds
+        self.coalesce_requests = config.rest.coalesce_requests
+        self.snapshot_cache_ttl = config.rest.snapshot_cache_ttl_seconds
+
+        # Single-flight GETs and snapshot cache (endpoint -> (expires_at, result))
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self._snapshot_cache: dict[str, tuple[float, Any]] = {}
+        self._request_stats: dict[str, dict[str, int]] = {}
 
         # Session will be created in async context
         self._session: aiohttp.ClientSession | None = None
@@ -74,8 +109,103 @@ class HomeAssistantClient:
         endpoint: str,
         data: dict[str, Any] | None = None,
         retry: bool = True,
+        fresh: bool = False,
+    ) -> Any:
+        """Make HTTP request to Home Assistant API.
+
+        GET requests are answered from the snapshot cache when enabled, or
+        joined to an identical request already in flight. Other methods
+        invalidate the snapshot cache since they may change state.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Optional JSON data for request body
+            retry: Whether to retry on failure
+            fresh: Send a new GET even if a cached or in-flight response exists, so
+                the response reflects state at or after the call (later callers may
+                still join it)
+
+        Returns:
+            JSON response data (cached lists are returned as shallow copies)
+
+        Raises:
+            HomeAssistantConnectionError: Connection failed
+            HomeAssistantAuthError: Authentication failed (401)
+            HomeAssistantAPIError: API returned error
+        """
+        if method != "GET":
+            self._snapshot_cache.clear()
+            return await self._send(method, endpoint, data, retry)
+
+        stats = self._request_stats.setdefault(
+            _stats_key(endpoint),
+            {"requests": 0, "cache_hits": 0, "cache_misses": 0, "coalesced": 0},
+        )
+        stats["requests"] += 1
+
+        cacheable = self.snapshot_cache_ttl > 0 and endpoint in CACHEABLE_ENDPOINTS
+        if cacheable and not fresh:
+            cached = self._snapshot_cache.get(endpoint)
+            if cached is not None and cached[0] > time.monotonic():
+                stats["cache_hits"] += 1
+                return _copy_result(cached[1])
+            stats["cache_misses"] += 1
+
+        if not self.coalesce_requests or data is not None:
+            result = await self._send(method, endpoint, data, retry)
+        else:
+            task = None if fresh else self._inflight.get(endpoint)
+            if task is None:
+                task = asyncio.get_running_loop().create_task(
+                    self._send(method, endpoint, data, retry)
+                )
+                self._inflight[endpoint] = task
+                task.add_done_callback(partial(self._finish_inflight, endpoint))
+            else:
+                stats["coalesced"] += 1
+            # Shield so one caller's cancellation does not abort the shared request
+            result = await asyncio.shield(task)
+
+        if cacheable:
+            self._snapshot_cache[endpoint] = (time.monotonic() + self.snapshot_cache_ttl, result)
+        return _copy_result(result)
+
+    def _finish_inflight(self, endpoint: str, task: "asyncio.Task[Any]") -> None:
+        """Forget a completed shared request."""
+        if self._inflight.get(endpoint) is task:
+            del self._inflight[endpoint]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved when every waiter was cancelled
+
+    def invalidate_cache(self, endpoint: str | None = None) -> None:
+        """Drop cached snapshots.
+
+        Args:
+            endpoint: Endpoint to invalidate, or None for all
+        """
+        if endpoint is None:
+            self._snapshot_cache.clear()
+        else:
+            self._snapshot_cache.pop(endpoint, None)
+
+    def get_request_stats(self) -> dict[str, dict[str, int]]:
+        """Get per-endpoint GET request statistics.
+
+        Returns:
+            Mapping of endpoint to requests, cache_hits, cache_misses and
+            coalesced (joined an in-flight request) counters
+        """
+        return {endpoint: dict(stats) for endpoint, stats in self._request_stats.items()}
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        retry: bool = True,
     ) -> Any:
-        """Make HTTP request to Home Assistant API with retry logic.
+        """Send HTTP request to Home Assistant API with retry logic.
 
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -165,19 +295,23 @@ class HomeAssistantClient:
         """
         return cast(dict[str, Any], await self._request("GET", "/api/config"))
 
-    async def get_states(self) -> list[dict[str, Any]]:
+    async def get_states(self, fresh: bool = False) -> list[dict[str, Any]]:
         """Get all entity states.
 
+        Args:
+            fresh: Bypass the snapshot cache and in-flight requests (see ``_request``)
+
         Returns:
             List of entity state dictionaries
         """
-        return cast(list[dict[str, Any]], await self._request("GET", "/api/states"))
+        return cast(list[dict[str, Any]], await self._request("GET", "/api/states", fresh=fresh))
 
-    async def get_state(self, entity_id: str) -> dict[str, Any]:
+    async def get_state(self, entity_id: str, fresh: bool = False) -> dict[str, Any]:
         """Get state for specific entity.
 
         Args:
             entity_id: Entity ID (e.g., "sensor.temperature")
+            fresh: Bypass in-flight requests for the entity (see ``_request``)
 
         Returns:
             Entity state dictionary
@@ -185,7 +319,9 @@ class HomeAssistantClient:
         Raises:
             HomeAssistantAPIError: Entity not found
         """
-        return cast(dict[str, Any], await self._request("GET", f"/api/states/{entity_id}"))
+        return cast(
+            dict[str, Any], await self._request("GET", f"/api/states/{entity_id}", fresh=fresh)
+        )
 
     async def set_state(
         self,
@@ -247,6 +383,26 @@ class HomeAssistantClient:
             list[dict[str, Any]] | None, await self._request("POST", endpoint, data=service_data)
         )
 
+    async def get_entity_registry(self) -> list[dict[str, Any]]:
+        """Get the entity registry.
+
+        Returns:
+            List of entity registry entries (entity_id, device_id, platform, ...)
+        """
+        return cast(
+            list[dict[str, Any]], await self._request("GET", "/api/config/entity_registry/list")
+        )
+
+    async def get_device_registry(self) -> list[dict[str, Any]]:
+        """Get the device registry.
+
+        Returns:
+            List of device registry entries (id, manufacturer, config_entries, ...)
+        """
+        return cast(
+            list[dict[str, Any]], await self._request("GET", "/api/config/device_registry/list")
+        )
+
     async def get_services(self) -> dict[str, Any]:
         """Get all available services.
 
@@ -257,16 +413,22 @@ class HomeAssistantClient:
 
     async def get_history(
         self,
-        filter_entity_id: str | None = None,
+        filter_entity_id: str | list[str] | None = None,
         start_time: datetime | None = None,
         end_time: datetime | None = None,
+        minimal_response: bool = False,
+        no_attributes: bool = False,
     ) -> list[list[dict[str, Any]]]:
         """Get state history.
 
         Args:
-            filter_entity_id: Optional entity ID to filter
+            filter_entity_id: Optional entity ID, or several entity IDs fetched in
+                one request
             start_time: Optional start time (ISO format)
             end_time: Optional end time (ISO format)
+            minimal_response: Only return last_changed and state for states other
+                than the first and last of each entity
+            no_attributes: Omit attributes from all states
 
         Returns:
             History data grouped by entity
@@ -279,9 +441,15 @@ class HomeAssistantClient:
 
         params = []
         if filter_entity_id:
+            if not isinstance(filter_entity_id, str):
+                filter_entity_id = ",".join(filter_entity_id)
             params.append(f"filter_entity_id={filter_entity_id}")
         if end_time:
             params.append(f"end_time={end_time.isoformat()}")
+        if minimal_response:
+            params.append("minimal_response")
+        if no_attributes:
+            params.append("no_attributes")
 
         if params:
             endpoint += "?" + "&".join(params)
@@ -434,6 +602,11 @@ class HomeAssistantClient:
                 )
 
 
+def _copy_result(result: Any) -> Any:
+    """Copy shared list results so callers cannot reorder each other's data."""
+    return list(result) if isinstance(result, list) else result
+
+
 async def create_ha_client(config: Config, instance_id: str | None = None) -> HomeAssistantClient:
     """Create and initialize Home Assistant client.
 
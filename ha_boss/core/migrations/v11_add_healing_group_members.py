@@ -0,0 +1,54 @@
+"""Database migration: v10 → v11 - Add group_members to healing_actions.
+
+This migration adds a JSON column to healing_actions listing the entities
+covered by a coalesced integration reload, so one reload triggered by many
+entities of the same integration is recorded as a single healing action.
+"""
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+async def migrate_v10_to_v11(session: AsyncSession) -> None:
+    """Migrate database from v10 to v11.
+
+    Args:
+        session: Database session
+
+    Raises:
+        RuntimeError: If migration fails
+    """
+    logger.info("Starting migration from v10 to v11")
+
+    try:
+        connection = await session.connection()
+
+        # Add group_members column to healing_actions
+        # Use try/except for idempotency (column may already exist on new installs)
+        try:
+            await connection.execute(
+                text("ALTER TABLE healing_actions ADD COLUMN group_members JSON")
+            )
+            logger.info("Added group_members column to healing_actions")
+        except Exception:
+            logger.debug("group_members column already exists, skipping")
+
+        # Update schema version
+        await connection.execute(
+            text(
+                "INSERT INTO schema_version (version, description, applied_at) "
+                "VALUES (11, 'Add healing action group members', datetime('now'))"
+            )
+        )
+        logger.info("Updated schema version to 11")
+
+        await session.commit()
+        logger.info("Migration v10 → v11 completed successfully")
+
+    except Exception as e:
+        logger.error(f"Migration v10 → v11 failed: {e}", exc_info=True)
+        raise RuntimeError(f"Migration v10 → v11 failed: {e}") from e
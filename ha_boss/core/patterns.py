@@ -0,0 +1,186 @@
+"""Compiled entity include/exclude glob matching.
+
+Monitoring filters, discovery and healing plans all match entity IDs against
+fnmatch-style globs. Instead of looping over every pattern with ``fnmatch`` on
+each call, patterns are compiled once into a single alternation regex and the
+per-entity verdict is memoized in a bounded LRU cache.
+"""
+
+import re
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from fnmatch import translate
+from functools import lru_cache
+from typing import Any
+
+DEFAULT_CACHE_SIZE = 10000
+
+
+@lru_cache(maxsize=256)
+def compile_globs(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile glob patterns into one combined regex.
+
+    Matching is case-sensitive, like ``fnmatch.fnmatch`` on POSIX.
+
+    Args:
+        patterns: fnmatch glob patterns
+
+    Returns:
+        Combined compiled regex, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{translate(pattern)})" for pattern in patterns))
+
+
+class EntityPatternMatcher:
+    """Include/exclude entity matcher with a bounded per-entity verdict cache.
+
+    Verdict rules (same as the monitoring config):
+    - Entities matching any exclude pattern are rejected
+    - If there are no include patterns, every other entity is accepted
+    - Otherwise an entity must match at least one include pattern
+
+    Call :meth:`sync` with the current configured patterns before matching;
+    it is cheap when nothing changed and recompiles/invalidates the cache when
+    the configuration was hot-reloaded.
+    """
+
+    def __init__(
+        self,
+        include: Iterable[str] = (),
+        exclude: Iterable[str] = (),
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """Initialize matcher.
+
+        Args:
+            include: Include glob patterns (empty = include everything)
+            exclude: Exclude glob patterns
+            cache_size: Maximum number of memoized entity verdicts
+        """
+        self.cache_size = cache_size
+        self._include: list[str] = []
+        self._exclude: list[str] = []
+        self._include_re: re.Pattern[str] | None = None
+        self._exclude_re: re.Pattern[str] | None = None
+        self._cache: OrderedDict[str, bool] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._compile(list(include), list(exclude))
+
+    def sync(self, include: Sequence[str], exclude: Sequence[str]) -> None:
+        """Recompile if the configured patterns differ from the compiled ones.
+
+        Args:
+            include: Current include patterns
+            exclude: Current exclude patterns
+        """
+        if list(include) == self._include and list(exclude) == self._exclude:
+            return
+        self._compile(list(include), list(exclude))
+
+    def invalidate(self) -> None:
+        """Drop all memoized verdicts."""
+        self._cache.clear()
+
+    def matches(self, entity_id: str) -> bool:
+        """Check whether an entity passes the include/exclude patterns.
+
+        Args:
+            entity_id: Entity identifier
+
+        Returns:
+            True if the entity is accepted
+        """
+        verdict = self._cache.get(entity_id)
+        if verdict is not None:
+            self._hits += 1
+            self._cache.move_to_end(entity_id)
+            return verdict
+
+        self._misses += 1
+        verdict = self._evaluate(entity_id)
+        self._cache[entity_id] = verdict
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return verdict
+
+    def filter(self, entity_ids: Iterable[str]) -> list[str]:
+        """Return the entities that pass the include/exclude patterns.
+
+        Args:
+            entity_ids: Entity identifiers to filter
+
+        Returns:
+            Accepted entity IDs, in input order
+        """
+        return [entity_id for entity_id in entity_ids if self.matches(entity_id)]
+
+    def any_match(self, entity_ids: Iterable[str]) -> bool:
+        """Check whether at least one entity passes the patterns.
+
+        Args:
+            entity_ids: Entity identifiers
+
+        Returns:
+            True if any entity is accepted
+        """
+        return any(self.matches(entity_id) for entity_id in entity_ids)
+
+    def cache_info(self) -> dict[str, Any]:
+        """Get verdict cache statistics.
+
+        Returns:
+            Dictionary with hits, misses and current size
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(self._cache),
+            "max_size": self.cache_size,
+        }
+
+    def _compile(self, include: list[str], exclude: list[str]) -> None:
+        """Compile patterns and reset the verdict cache.
+
+        Args:
+            include: Include patterns
+            exclude: Exclude patterns
+        """
+        self._include = include
+        self._exclude = exclude
+        self._include_re = compile_globs(tuple(include))
+        self._exclude_re = compile_globs(tuple(exclude))
+        self._cache.clear()
+
+    def _evaluate(self, entity_id: str) -> bool:
+        """Evaluate the patterns for an entity without the cache.
+
+        Args:
+            entity_id: Entity identifier
+
+        Returns:
+            True if the entity is accepted
+        """
+        if self._exclude_re is not None and self._exclude_re.match(entity_id):
+            return False
+        if self._include_re is None:
+            return True
+        return self._include_re.match(entity_id) is not None
+
+
+@lru_cache(maxsize=128)
+def get_pattern_matcher(
+    include: tuple[str, ...], exclude: tuple[str, ...] = ()
+) -> EntityPatternMatcher:
+    """Get a shared matcher for a fixed set of patterns (e.g. a healing plan).
+
+    Args:
+        include: Include glob patterns
+        exclude: Exclude glob patterns
+
+    Returns:
+        Shared matcher instance whose verdict cache persists across calls
+    """
+    return EntityPatternMatcher(include=include, exclude=exclude)
@@ -1,7 +1,6 @@
 """Entity discovery service for automations, scenes, and scripts."""
 
 import asyncio
-import fnmatch
 import logging
 import time
 from datetime import UTC, datetime
@@ -21,6 +20,7 @@ from ha_boss.core.database import (
     ScriptEntity,
 )
 from ha_boss.core.ha_client import HomeAssistantClient
+from ha_boss.core.patterns import EntityPatternMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -243,6 +243,9 @@ class EntityDiscoveryService:
         self._refresh_lock = asyncio.Lock()
         self._periodic_task: asyncio.Task[None] | None = None
 
+        # Exclude-only matcher (include patterns are handled by the health monitor)
+        self._exclude_matcher = EntityPatternMatcher(exclude=config.monitoring.exclude)
+
     async def discover_and_refresh(
         self, trigger_type: str, trigger_source: str | None = None
     ) -> dict[str, int]:
@@ -650,13 +653,10 @@ class EntityDiscoveryService:
         # In StateTracker integration, it will handle include patterns
 
         # Apply config.exclude patterns (REMOVE)
-        excluded: set[str] = set()
-        for pattern in self.config.monitoring.exclude:
-            excluded.update(
-                entity_id for entity_id in monitored if fnmatch.fnmatch(entity_id, pattern)
-            )
-
-        monitored -= excluded
+        self._exclude_matcher.sync([], self.config.monitoring.exclude)
+        kept = set(self._exclude_matcher.filter(monitored))
+        excluded = monitored - kept
+        monitored = kept
 
         self._monitored_set = monitored
         logger.debug(
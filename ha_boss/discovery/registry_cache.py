@@ -0,0 +1,256 @@
+"""Indexed cache of the Home Assistant entity and device registries."""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from ha_boss.core.ha_client import HomeAssistantClient
+
+logger = logging.getLogger(__name__)
+
+
+class RegistryCache:
+    """Per-instance cache of the entity and device registries with O(1) lookups.
+
+    The registries are fetched once (lazily, on first lookup) and indexed as
+    entity -> device, device -> entities and device -> config entries. HA's
+    ``entity_registry_updated`` and ``device_registry_updated`` events keep the
+    cache current:
+
+    - ``remove`` actions are applied to the indexes in place.
+    - ``create`` actions and updates that move an entity to another device or
+      rename it mark the affected registry stale; it is re-fetched on the next
+      lookup, so a burst of registry events costs a single download.
+    - Other updates (names, icons, ...) do not touch the indexes and are ignored.
+
+    After a WebSocket reconnect events may have been missed, so the client calls
+    ``invalidate()`` to force a full reload.
+    """
+
+    def __init__(self, ha_client: HomeAssistantClient, instance_id: str = "default") -> None:
+        """Initialize registry cache.
+
+        Args:
+            ha_client: Home Assistant API client used to fetch the registries
+            instance_id: Instance identifier for multi-instance setups
+        """
+        self.ha_client = ha_client
+        self.instance_id = instance_id
+
+        self._entity_device: dict[str, str | None] = {}
+        self._device_entities: dict[str, set[str]] = {}
+        self._devices: dict[str, dict[str, Any]] = {}
+
+        self._entities_stale = True
+        self._devices_stale = True
+        self._lock = asyncio.Lock()
+
+        # Statistics
+        self._entity_loads = 0
+        self._device_loads = 0
+        self._events_applied = 0
+        self._events_ignored = 0
+        self._invalidations = 0
+        self._last_load_ms: float | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether both registries are cached and current."""
+        return not (self._entities_stale or self._devices_stale)
+
+    async def ensure_loaded(self) -> None:
+        """Fetch whichever registries are missing or stale.
+
+        Concurrent callers share a single reload.
+
+        Raises:
+            HomeAssistantConnectionError: Registry could not be fetched
+            HomeAssistantAPIError: API returned error
+        """
+        if self.is_loaded:
+            return
+
+        async with self._lock:
+            start = time.perf_counter()
+            entities_stale, devices_stale = self._entities_stale, self._devices_stale
+            # Clear the flags first so events arriving during the fetch re-mark them
+            self._entities_stale = self._devices_stale = False
+            try:
+                entity_registry, device_registry = await asyncio.gather(
+                    self.ha_client.get_entity_registry() if entities_stale else _none(),
+                    self.ha_client.get_device_registry() if devices_stale else _none(),
+                )
+            except BaseException:
+                self._entities_stale |= entities_stale
+                self._devices_stale |= devices_stale
+                raise
+
+            if isinstance(entity_registry, list):
+                self._index_entities(entity_registry)
+                self._entity_loads += 1
+            if isinstance(device_registry, list):
+                self._devices = {
+                    device["id"]: device
+                    for device in device_registry
+                    if isinstance(device, dict) and device.get("id")
+                }
+                self._device_loads += 1
+
+            self._last_load_ms = round((time.perf_counter() - start) * 1000, 1)
+            logger.debug(
+                f"[{self.instance_id}] Registry cache loaded: {len(self._entity_device)} entities, "
+                f"{len(self._devices)} devices in {self._last_load_ms}ms"
+            )
+
+    def _index_entities(self, entity_registry: list[dict[str, Any]]) -> None:
+        entity_device: dict[str, str | None] = {}
+        device_entities: dict[str, set[str]] = {}
+        for entry in entity_registry:
+            if not isinstance(entry, dict) or not entry.get("entity_id"):
+                continue
+            entity_id = entry["entity_id"]
+            device_id = entry.get("device_id")
+            entity_device[entity_id] = device_id
+            if device_id:
+                device_entities.setdefault(device_id, set()).add(entity_id)
+        self._entity_device = entity_device
+        self._device_entities = device_entities
+
+    async def get_device_id(self, entity_id: str) -> str | None:
+        """Get the device an entity belongs to.
+
+        Args:
+            entity_id: Entity ID
+
+        Returns:
+            Device ID, or None if the entity is unknown or has no device
+        """
+        await self.ensure_loaded()
+        return self._entity_device.get(entity_id)
+
+    async def get_devices_for_entities(self, entity_ids: list[str]) -> dict[str, list[str]]:
+        """Group entities by the device they belong to.
+
+        Entities without a device are skipped.
+
+        Args:
+            entity_ids: Entity IDs to map
+
+        Returns:
+            Dict mapping device_id -> [entity_id, ...] (in input order)
+        """
+        await self.ensure_loaded()
+        device_map: dict[str, list[str]] = {}
+        for entity_id in entity_ids:
+            device_id = self._entity_device.get(entity_id)
+            if device_id:
+                device_map.setdefault(device_id, []).append(entity_id)
+        return device_map
+
+    async def get_device_entities(self, device_id: str) -> set[str]:
+        """Get all entities registered to a device.
+
+        Args:
+            device_id: Device ID
+
+        Returns:
+            Entity IDs of the device (empty if unknown)
+        """
+        await self.ensure_loaded()
+        return set(self._device_entities.get(device_id, ()))
+
+    async def get_device(self, device_id: str) -> dict[str, Any] | None:
+        """Get a device registry entry.
+
+        Args:
+            device_id: Device ID
+
+        Returns:
+            Device registry entry or None if not found
+        """
+        await self.ensure_loaded()
+        return self._devices.get(device_id)
+
+    async def get_config_entries(self, device_id: str) -> list[str]:
+        """Get the config entries a device belongs to.
+
+        Args:
+            device_id: Device ID
+
+        Returns:
+            Config entry IDs (empty if the device is unknown)
+        """
+        device = await self.get_device(device_id)
+        return list(device.get("config_entries") or []) if device else []
+
+    def handle_entity_registry_updated(self, data: dict[str, Any]) -> None:
+        """Apply an ``entity_registry_updated`` event.
+
+        Args:
+            data: Event data (action, entity_id, and changes or old_entity_id on update)
+        """
+        action = data.get("action")
+        entity_id = data.get("entity_id")
+        if not entity_id:
+            return
+
+        if action == "remove":
+            device_id = self._entity_device.pop(entity_id, None)
+            if device_id:
+                entities = self._device_entities.get(device_id)
+                if entities is not None:
+                    entities.discard(entity_id)
+            self._events_applied += 1
+        elif action == "update" and not (
+            "device_id" in (data.get("changes") or {}) or data.get("old_entity_id")
+        ):
+            self._events_ignored += 1
+        else:
+            self._entities_stale = True
+            self._events_applied += 1
+
+    def handle_device_registry_updated(self, data: dict[str, Any]) -> None:
+        """Apply a ``device_registry_updated`` event.
+
+        Args:
+            data: Event data (action, device_id and changes on update)
+        """
+        device_id = data.get("device_id")
+        if not device_id:
+            return
+
+        if data.get("action") == "remove":
+            self._devices.pop(device_id, None)
+            for entity_id in self._device_entities.pop(device_id, set()):
+                self._entity_device[entity_id] = None
+        else:
+            self._devices_stale = True
+        self._events_applied += 1
+
+    def invalidate(self) -> None:
+        """Mark both registries stale, forcing a reload on the next lookup."""
+        self._entities_stale = self._devices_stale = True
+        self._invalidations += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache size and maintenance statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        return {
+            "loaded": self.is_loaded,
+            "entities": len(self._entity_device),
+            "devices": len(self._devices),
+            "entity_registry_loads": self._entity_loads,
+            "device_registry_loads": self._device_loads,
+            "events_applied": self._events_applied,
+            "events_ignored": self._events_ignored,
+            "invalidations": self._invalidations,
+            "last_load_ms": self._last_load_ms,
+        }
+
+
+async def _none() -> None:
+    return None
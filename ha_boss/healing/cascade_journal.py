@@ -0,0 +1,373 @@
+"""Per-cascade journal of healing writes, flushed in a single transaction.
+
+A healing cascade used to commit every level transition, flag, pattern update
+and healer action row in its own session. The journal collects those writes in
+memory while the cascade runs and :class:`CascadeJournalWriter` applies them
+atomically when it finishes, so the cascade record and the actions it caused
+are either all visible or not at all.
+
+Healers do not know which cascade they run in. While a journal is active
+(:meth:`CascadeJournal.activate`) it is published through a context variable,
+so :func:`journal_healing_action` picks it up in every task spawned by the
+cascade and outside cascades the healers keep committing directly.
+
+If the final transaction fails, the journal is appended to a JSON-lines
+fallback file (fsynced) and replayed on the next start. Nothing is persisted
+before the cascade ends: if the process dies mid-cascade, that cascade's
+journaled writes, including the healers' action rows, are lost.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import and_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ha_boss.core.database import (
+    AutomationOutcomePattern,
+    Base,
+    Database,
+    DeviceHealingAction,
+    EntityHealingAction,
+    HealingAction,
+    HealingCascadeExecution,
+)
+
+logger = logging.getLogger(__name__)
+
+# Healer action rows that may be journaled, by model name
+JOURNALED_MODELS: dict[str, type[Base]] = {
+    model.__name__: model for model in (EntityHealingAction, DeviceHealingAction, HealingAction)
+}
+
+_active_journal: ContextVar["CascadeJournal | None"] = ContextVar(
+    "active_cascade_journal", default=None
+)
+
+
+def journal_healing_action(row: Base) -> bool:
+    """Add a healer action row to the active cascade journal, if any.
+
+    Args:
+        row: Unsaved action row (EntityHealingAction, DeviceHealingAction, HealingAction)
+
+    Returns:
+        True if the row was journaled (the caller must not commit it),
+        False outside a cascade
+    """
+    journal = _active_journal.get()
+    if journal is None:
+        return False
+    journal.add_action(row)
+    return True
+
+
+@dataclass
+class PatternSuccess:
+    """Successful healing to be recorded as an automation outcome pattern."""
+
+    entity_id: str
+    level: str
+    strategy: str
+
+
+class CascadeJournal:
+    """Writes of one cascade execution, kept in memory until the cascade ends.
+
+    The journal is not persisted while the cascade runs. A crash before it is
+    flushed loses the level transitions, flags, pattern successes and healer
+    action rows recorded so far; only the cascade execution record created
+    upfront remains, with ``completed_at`` unset. This trades the audit rows
+    of an interrupted cascade for not writing to disk on every transition.
+    """
+
+    def __init__(self, cascade_exec_id: int, instance_id: str, automation_id: str) -> None:
+        """Initialize cascade journal.
+
+        Args:
+            cascade_exec_id: Cascade execution record ID
+            instance_id: Home Assistant instance identifier
+            automation_id: Automation the cascade heals
+        """
+        self.cascade_exec_id = cascade_exec_id
+        self.instance_id = instance_id
+        self.automation_id = automation_id
+
+        # Column values to set on the cascade execution record
+        self.cascade_updates: dict[str, Any] = {}
+        # (model name, column values) of healer action rows
+        self.actions: list[tuple[str, dict[str, Any]]] = []
+        # Successful healings to record as patterns, one per healed entity
+        self.pattern_successes: list[PatternSuccess] = []
+
+    def record_level(
+        self, level: str, attempted: bool = False, success: bool | None = None
+    ) -> None:
+        """Record a level attempt/result.
+
+        Args:
+            level: Healing level value ("entity", "device", "integration")
+            attempted: Whether level was attempted
+            success: Whether level succeeded (None if only marking attempted)
+        """
+        if attempted:
+            self.cascade_updates[f"{level}_level_attempted"] = True
+        if success is not None:
+            self.cascade_updates[f"{level}_level_success"] = success
+
+    def update_cascade(self, **values: Any) -> None:
+        """Record column values for the cascade execution record."""
+        self.cascade_updates.update(values)
+
+    def add_action(self, row: Base) -> None:
+        """Record a healer action row.
+
+        Args:
+            row: Unsaved row of one of the journaled models
+        """
+        model_name = type(row).__name__
+        if model_name not in JOURNALED_MODELS:
+            raise TypeError(f"{model_name} rows cannot be journaled")
+        values = {
+            column.key: getattr(row, column.key)
+            for column in row.__table__.columns
+            if getattr(row, column.key) is not None
+        }
+        self.actions.append((model_name, values))
+
+    def record_pattern_success(self, entity_id: str, level: str, strategy: str) -> None:
+        """Record a successful healing of an entity for pattern learning."""
+        self.pattern_successes.append(PatternSuccess(entity_id, level, strategy))
+
+    @contextmanager
+    def activate(self) -> Iterator["CascadeJournal"]:
+        """Make this the journal healer actions are recorded in (current context)."""
+        token = _active_journal.set(self)
+        try:
+            yield self
+        finally:
+            _active_journal.reset(token)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the journal for the fallback file."""
+        return {
+            "cascade_exec_id": self.cascade_exec_id,
+            "instance_id": self.instance_id,
+            "automation_id": self.automation_id,
+            "cascade_updates": self.cascade_updates,
+            "actions": self.actions,
+            "pattern_successes": [vars(success) for success in self.pattern_successes],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CascadeJournal":
+        """Restore a journal read from the fallback file."""
+        journal = cls(data["cascade_exec_id"], data["instance_id"], data["automation_id"])
+        journal.cascade_updates = data["cascade_updates"]
+        journal.actions = [(model_name, values) for model_name, values in data["actions"]]
+        journal.pattern_successes = [
+            PatternSuccess(**success) for success in data["pattern_successes"]
+        ]
+        return journal
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _decode(obj: dict[str, Any]) -> Any:
+    if "__datetime__" in obj:
+        return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+class CascadeJournalWriter:
+    """Applies cascade journals to the database in one transaction each."""
+
+    def __init__(self, database: Database, fallback_path: Path | None = None) -> None:
+        """Initialize journal writer.
+
+        Args:
+            database: Database manager
+            fallback_path: JSON-lines file for journals that could not be written
+                (None: such journals are only logged)
+        """
+        self.database = database
+        self.fallback_path = fallback_path
+
+        # Statistics
+        self._flushed = 0
+        self._fallback_writes = 0
+        self._replayed = 0
+
+    async def flush(self, journal: CascadeJournal) -> bool:
+        """Write a journal in a single transaction.
+
+        Args:
+            journal: Finished cascade journal
+
+        Returns:
+            True if written to the database, False if it went to the fallback file
+        """
+        try:
+            async with self.database.async_session() as session:
+                await self._apply(session, journal)
+                await session.commit()
+        except Exception as e:
+            logger.error(
+                f"Failed to write journal of cascade {journal.cascade_exec_id}: {e}",
+                exc_info=True,
+            )
+            self._append_fallback(journal)
+            return False
+
+        self._flushed += 1
+        return True
+
+    async def _apply(self, session: AsyncSession, journal: CascadeJournal) -> None:
+        """Apply all journaled writes in an open session (caller commits).
+
+        Args:
+            session: Open database session
+            journal: Journal to apply
+        """
+        if journal.cascade_updates:
+            await session.execute(
+                update(HealingCascadeExecution)
+                .where(HealingCascadeExecution.id == journal.cascade_exec_id)
+                .values(**journal.cascade_updates)
+            )
+
+        for model_name, values in journal.actions:
+            session.add(JOURNALED_MODELS[model_name](**values))
+
+        now = datetime.now(UTC)
+        for success in journal.pattern_successes:
+            result = await session.execute(
+                select(AutomationOutcomePattern).where(
+                    and_(
+                        AutomationOutcomePattern.instance_id == journal.instance_id,
+                        AutomationOutcomePattern.automation_id == journal.automation_id,
+                        AutomationOutcomePattern.entity_id == success.entity_id,
+                    )
+                )
+            )
+            pattern = result.scalar_one_or_none()
+            if pattern:
+                pattern.successful_healing_level = success.level
+                pattern.successful_healing_strategy = success.strategy
+                pattern.healing_success_count += 1
+                pattern.last_observed = now
+            else:
+                pattern = AutomationOutcomePattern(
+                    instance_id=journal.instance_id,
+                    automation_id=journal.automation_id,
+                    entity_id=success.entity_id,
+                    observed_state="unknown",  # We don't track state here
+                    successful_healing_level=success.level,
+                    successful_healing_strategy=success.strategy,
+                    healing_success_count=1,
+                    first_observed=now,
+                    last_observed=now,
+                )
+                session.add(pattern)
+
+            logger.info(
+                f"Recorded successful healing pattern for {journal.automation_id} "
+                f"({success.entity_id}): {success.level}/{success.strategy} "
+                f"(count: {pattern.healing_success_count})"
+            )
+
+    def _append_fallback(self, journal: CascadeJournal) -> None:
+        """Append a journal to the fallback file and fsync it."""
+        if self.fallback_path is None:
+            logger.error(f"Journal of cascade {journal.cascade_exec_id} dropped")
+            return
+        try:
+            line = json.dumps(journal.to_dict(), default=_encode)
+            with open(self.fallback_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._fallback_writes += 1
+            logger.warning(
+                f"Journal of cascade {journal.cascade_exec_id} saved to {self.fallback_path}"
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to save journal of cascade {journal.cascade_exec_id}: {e}",
+                exc_info=True,
+            )
+
+    async def replay_fallback(self) -> int:
+        """Write journals left in the fallback file by earlier failures.
+
+        Journals that still cannot be written stay in the file.
+
+        Returns:
+            Number of journals written
+        """
+        if self.fallback_path is None:
+            return 0
+        try:
+            if not os.path.exists(self.fallback_path):
+                return 0
+            with open(self.fallback_path, encoding="utf-8") as f:
+                lines = [line for line in f if line.strip()]
+        except Exception as e:
+            logger.error(f"Failed to read cascade journal fallback file: {e}")
+            return 0
+
+        replayed = 0
+        remaining: list[str] = []
+        for line in lines:
+            try:
+                journal = CascadeJournal.from_dict(json.loads(line, object_hook=_decode))
+            except (ValueError, KeyError, TypeError) as e:
+                logger.error(f"Skipping unreadable cascade journal entry: {e}")
+                continue
+            try:
+                async with self.database.async_session() as session:
+                    await self._apply(session, journal)
+                    await session.commit()
+                replayed += 1
+            except Exception as e:
+                logger.error(f"Failed to replay journal of cascade {journal.cascade_exec_id}: {e}")
+                remaining.append(line)
+
+        try:
+            tmp_path = f"{self.fallback_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(remaining)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.fallback_path)
+        except Exception as e:
+            logger.error(f"Failed to rewrite cascade journal fallback file: {e}")
+
+        self._replayed += replayed
+        if replayed:
+            logger.info(f"Replayed {replayed} cascade journal(s) from {self.fallback_path}")
+        return replayed
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get journal writer statistics.
+
+        Returns:
+            Dictionary with flushed, fallback and replayed journal counts
+        """
+        return {
+            "flushed": self._flushed,
+            "fallback_writes": self._fallback_writes,
+            "replayed": self._replayed,
+        }
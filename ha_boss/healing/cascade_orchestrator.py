@@ -18,9 +18,10 @@ from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import and_, func, select
 
 if TYPE_CHECKING:
     from ha_boss.healing.plan_executor import PlanExecutor
@@ -32,10 +33,12 @@ from ha_boss.core.database import (
     HealingCascadeExecution,
 )
 from ha_boss.core.types import HealthIssue
+from ha_boss.healing.cascade_journal import CascadeJournal, CascadeJournalWriter
 from ha_boss.healing.device_healer import DeviceHealer
 from ha_boss.healing.entity_healer import EntityHealer, EntityHealingResult
 from ha_boss.healing.escalation import NotificationEscalator
 from ha_boss.healing.heal_strategies import HealingManager
+from ha_boss.healing.pattern_index import HealingPatternIndex, PatternEntry
 
 # Type variable for generic concurrent healing
 T = TypeVar("T")
@@ -106,15 +109,14 @@ class CascadeOrchestrator:
         accuracy for mixed-entity scenarios.
 
     Database Transaction Lifecycle:
-        For MVP simplicity, cascade execution records are created upfront and updated
-        throughout the cascade. This means orphaned records may exist if the process crashes
-        mid-cascade. This is acceptable for MVP as:
-        - Records include timestamps for cleanup
-        - Failed cascades still provide valuable debugging info
-        - Transaction overhead would impact healing latency
-
-        Future enhancement: Consider wrapping entire cascade in a single transaction with
-        appropriate timeout handling if orphaned records become problematic.
+        The cascade execution record is created upfront (plan executions reference its
+        ID). Everything else the cascade writes - level transitions, flags, pattern
+        updates and the healers' action rows - is collected in a CascadeJournal and
+        written in one transaction when the cascade ends. A crash mid-cascade therefore
+        leaves only the started record (``completed_at`` unset), never a partially
+        updated one; the journal itself is in memory only, so the actions that cascade
+        already took are not recorded. Journals whose transaction fails are kept in an
+        append-only fallback file and replayed by :meth:`replay_journals`.
     """
 
     def __init__(
@@ -129,6 +131,7 @@ class CascadeOrchestrator:
         max_concurrent_healings: int = 3,
         plan_matcher: "PlanMatcher | None" = None,
         plan_executor: "PlanExecutor | None" = None,
+        journal_fallback_path: Path | None = None,
     ) -> None:
         """Initialize cascade orchestrator.
 
@@ -143,6 +146,7 @@ class CascadeOrchestrator:
             max_concurrent_healings: Maximum concurrent entity healing operations
             plan_matcher: Optional plan matcher for YAML plan-based routing
             plan_executor: Optional plan executor for YAML plan-based routing
+            journal_fallback_path: File for cascade journals that could not be written
         """
         self.database = database
         if pattern_match_threshold < 1:
@@ -163,6 +167,13 @@ class CascadeOrchestrator:
         self.plan_matcher = plan_matcher
         self.plan_executor = plan_executor
 
+        # Journals of running cascades (cascade_exec_id -> journal)
+        self._journals: dict[int, CascadeJournal] = {}
+        self.journal_writer = CascadeJournalWriter(database, journal_fallback_path)
+
+        # Learned healing patterns for intelligent routing (warmed from the database)
+        self.pattern_index = HealingPatternIndex(database, instance_id)
+
     async def execute_cascade(
         self,
         context: HealingContext,
@@ -188,14 +199,18 @@ class CascadeOrchestrator:
         try:
             # Create cascade execution record
             cascade_exec_id = await self._create_cascade_record(context)
-
-            # Execute healing with timeout (single timeout point for entire cascade)
-            result = await asyncio.wait_for(
-                self._execute_healing_with_routing(
-                    context, cascade_exec_id, use_intelligent_routing
-                ),
-                timeout=context.timeout_seconds,
-            )
+            journal = CascadeJournal(cascade_exec_id, context.instance_id, context.automation_id)
+            self._journals[cascade_exec_id] = journal
+
+            # Execute healing with timeout (single timeout point for entire cascade).
+            # Healer tasks inherit the active journal from this context.
+            with journal.activate():
+                result = await asyncio.wait_for(
+                    self._execute_healing_with_routing(
+                        context, cascade_exec_id, use_intelligent_routing
+                    ),
+                    timeout=context.timeout_seconds,
+                )
 
             success = result.success
             routing_strategy = result.routing_strategy
@@ -206,13 +221,6 @@ class CascadeOrchestrator:
             logger.error(
                 f"Cascade execution timed out after {duration:.2f}s for {context.automation_id}"
             )
-            if cascade_exec_id:
-                await self._finalize_cascade_record(
-                    cascade_exec_id,
-                    success=False,
-                    duration=duration,
-                    routing_strategy=routing_strategy,
-                )
             return CascadeResult(
                 success=False,
                 routing_strategy=ROUTING_STRATEGY_SEQUENTIAL,
@@ -228,13 +236,6 @@ class CascadeOrchestrator:
             logger.error(
                 f"Cascade execution failed for {context.automation_id}: {e}", exc_info=True
             )
-            if cascade_exec_id:
-                await self._finalize_cascade_record(
-                    cascade_exec_id,
-                    success=False,
-                    duration=duration,
-                    routing_strategy=routing_strategy,
-                )
             return CascadeResult(
                 success=False,
                 routing_strategy=ROUTING_STRATEGY_SEQUENTIAL,
@@ -249,7 +250,7 @@ class CascadeOrchestrator:
             duration = (datetime.now(UTC) - start_time).total_seconds()
             if cascade_exec_id:
                 await self._finalize_cascade_record(
-                    cascade_exec_id,
+                    self._journals.pop(cascade_exec_id),
                     success=success,
                     duration=duration,
                     routing_strategy=routing_strategy,
@@ -374,30 +375,20 @@ class CascadeOrchestrator:
 
         # If plan framework is active but no plan matched, flag for AI generation
         if self.plan_matcher and self.database:
-            await self._flag_plan_generation_suggested(cascade_exec_id)
+            self._flag_plan_generation_suggested(cascade_exec_id)
 
         # Try intelligent routing first if enabled
         if use_intelligent_routing:
             pattern = await self._get_matching_pattern(context)
             if pattern:
-                # Re-fetch pattern to avoid race condition (pattern may have been deleted/updated)
-                pattern = await self._refetch_pattern(pattern.id)
-                if pattern:
-                    logger.info(
-                        f"Found matching pattern for {context.automation_id}, "
-                        f"routing to {pattern.successful_healing_level} level"
-                    )
-                    result = await self._execute_intelligent_healing(
-                        context, pattern, cascade_exec_id
-                    )
-                    if result.success:
-                        # Update pattern success count
-                        await self._update_pattern_success(pattern.id)
-                        return result
-                else:
-                    logger.warning(
-                        "Pattern was deleted/updated after match, falling back to sequential"
-                    )
+                logger.info(
+                    f"Found matching pattern for {context.automation_id}, "
+                    f"routing to {pattern.successful_healing_level} level"
+                )
+                result = await self._execute_intelligent_healing(context, pattern, cascade_exec_id)
+                if result.success:
+                    self._record_successful_pattern(cascade_exec_id, context, result)
+                    return result
 
         # Fall back to sequential cascade
         logger.info(
@@ -407,10 +398,8 @@ class CascadeOrchestrator:
         result = await self._execute_sequential_cascade(context, cascade_exec_id)
 
         # Learn from successful healing
-        if result.success and result.successful_level and result.successful_strategy:
-            await self._record_successful_pattern(
-                context, result.successful_level, result.successful_strategy
-            )
+        if result.success:
+            self._record_successful_pattern(cascade_exec_id, context, result)
 
         return result
 
@@ -452,7 +441,7 @@ class CascadeOrchestrator:
         # Level 1: Entity-level healing (concurrent)
         logger.info(f"Attempting Level 1 (entity) healing for {context.automation_id}")
         levels_attempted.append(HealingLevel.ENTITY)
-        await self._update_cascade_level(cascade_exec_id, HealingLevel.ENTITY, attempted=True)
+        self._update_cascade_level(cascade_exec_id, HealingLevel.ENTITY, attempted=True)
 
         entity_success = False
         final_action = None
@@ -480,7 +469,7 @@ class CascadeOrchestrator:
                     final_action = result.final_action
 
         if entity_success:
-            await self._update_cascade_level(cascade_exec_id, HealingLevel.ENTITY, success=True)
+            self._update_cascade_level(cascade_exec_id, HealingLevel.ENTITY, success=True)
             duration = (datetime.now(UTC) - start_time).total_seconds()
             return CascadeResult(
                 success=True,
@@ -492,14 +481,14 @@ class CascadeOrchestrator:
                 total_duration_seconds=duration,
             )
 
-        await self._update_cascade_level(cascade_exec_id, HealingLevel.ENTITY, success=False)
+        self._update_cascade_level(cascade_exec_id, HealingLevel.ENTITY, success=False)
 
         # Level 2: Device-level healing
         logger.info(
             f"Level 1 failed, attempting Level 2 (device) healing for {context.automation_id}"
         )
         levels_attempted.append(HealingLevel.DEVICE)
-        await self._update_cascade_level(cascade_exec_id, HealingLevel.DEVICE, attempted=True)
+        self._update_cascade_level(cascade_exec_id, HealingLevel.DEVICE, attempted=True)
 
         device_result = await self.device_healer.heal(
             entity_ids=context.failed_entities,
@@ -513,7 +502,7 @@ class CascadeOrchestrator:
             for entity_id in context.failed_entities:
                 entity_results[entity_id] = True
 
-            await self._update_cascade_level(cascade_exec_id, HealingLevel.DEVICE, success=True)
+            self._update_cascade_level(cascade_exec_id, HealingLevel.DEVICE, success=True)
             duration = (datetime.now(UTC) - start_time).total_seconds()
             return CascadeResult(
                 success=True,
@@ -525,23 +514,21 @@ class CascadeOrchestrator:
                 total_duration_seconds=duration,
             )
 
-        await self._update_cascade_level(cascade_exec_id, HealingLevel.DEVICE, success=False)
+        self._update_cascade_level(cascade_exec_id, HealingLevel.DEVICE, success=False)
 
         # Level 3: Integration-level healing
         logger.info(
             f"Level 2 failed, attempting Level 3 (integration) healing for {context.automation_id}"
         )
         levels_attempted.append(HealingLevel.INTEGRATION)
-        await self._update_cascade_level(cascade_exec_id, HealingLevel.INTEGRATION, attempted=True)
+        self._update_cascade_level(cascade_exec_id, HealingLevel.INTEGRATION, attempted=True)
 
         integration_success = await self._execute_integration_healing(
             context.failed_entities, entity_results
         )
 
         if integration_success:
-            await self._update_cascade_level(
-                cascade_exec_id, HealingLevel.INTEGRATION, success=True
-            )
+            self._update_cascade_level(cascade_exec_id, HealingLevel.INTEGRATION, success=True)
             duration = (datetime.now(UTC) - start_time).total_seconds()
             return CascadeResult(
                 success=True,
@@ -553,7 +540,7 @@ class CascadeOrchestrator:
                 total_duration_seconds=duration,
             )
 
-        await self._update_cascade_level(cascade_exec_id, HealingLevel.INTEGRATION, success=False)
+        self._update_cascade_level(cascade_exec_id, HealingLevel.INTEGRATION, success=False)
 
         # All levels failed - escalate to notification
         logger.warning(
@@ -596,7 +583,7 @@ class CascadeOrchestrator:
     async def _execute_intelligent_healing(
         self,
         context: HealingContext,
-        pattern: AutomationOutcomePattern,
+        pattern: PatternEntry,
         cascade_exec_id: int,
     ) -> CascadeResult:
         """Execute intelligent healing by jumping to proven level.
@@ -627,7 +614,7 @@ class CascadeOrchestrator:
         levels_attempted.append(target_level)
 
         if target_level == HealingLevel.ENTITY:
-            await self._update_cascade_level(cascade_exec_id, HealingLevel.ENTITY, attempted=True)
+            self._update_cascade_level(cascade_exec_id, HealingLevel.ENTITY, attempted=True)
             entity_success = False
             final_action = None
 
@@ -654,7 +641,7 @@ class CascadeOrchestrator:
                         final_action = result.final_action
 
             if entity_success:
-                await self._update_cascade_level(cascade_exec_id, HealingLevel.ENTITY, success=True)
+                self._update_cascade_level(cascade_exec_id, HealingLevel.ENTITY, success=True)
                 duration = (datetime.now(UTC) - start_time).total_seconds()
                 return CascadeResult(
                     success=True,
@@ -666,10 +653,10 @@ class CascadeOrchestrator:
                     total_duration_seconds=duration,
                     matched_pattern_id=pattern.id,
                 )
-            await self._update_cascade_level(cascade_exec_id, HealingLevel.ENTITY, success=False)
+            self._update_cascade_level(cascade_exec_id, HealingLevel.ENTITY, success=False)
 
         elif target_level == HealingLevel.DEVICE:
-            await self._update_cascade_level(cascade_exec_id, HealingLevel.DEVICE, attempted=True)
+            self._update_cascade_level(cascade_exec_id, HealingLevel.DEVICE, attempted=True)
             device_result = await self.device_healer.heal(
                 entity_ids=context.failed_entities,
                 triggered_by=context.trigger_type,
@@ -680,7 +667,7 @@ class CascadeOrchestrator:
             if device_result.success:
                 for entity_id in context.failed_entities:
                     entity_results[entity_id] = True
-                await self._update_cascade_level(cascade_exec_id, HealingLevel.DEVICE, success=True)
+                self._update_cascade_level(cascade_exec_id, HealingLevel.DEVICE, success=True)
                 duration = (datetime.now(UTC) - start_time).total_seconds()
                 return CascadeResult(
                     success=True,
@@ -692,20 +679,16 @@ class CascadeOrchestrator:
                     total_duration_seconds=duration,
                     matched_pattern_id=pattern.id,
                 )
-            await self._update_cascade_level(cascade_exec_id, HealingLevel.DEVICE, success=False)
+            self._update_cascade_level(cascade_exec_id, HealingLevel.DEVICE, success=False)
 
         elif target_level == HealingLevel.INTEGRATION:
-            await self._update_cascade_level(
-                cascade_exec_id, HealingLevel.INTEGRATION, attempted=True
-            )
+            self._update_cascade_level(cascade_exec_id, HealingLevel.INTEGRATION, attempted=True)
             integration_success = await self._execute_integration_healing(
                 context.failed_entities, entity_results
             )
 
             if integration_success:
-                await self._update_cascade_level(
-                    cascade_exec_id, HealingLevel.INTEGRATION, success=True
-                )
+                self._update_cascade_level(cascade_exec_id, HealingLevel.INTEGRATION, success=True)
                 duration = (datetime.now(UTC) - start_time).total_seconds()
                 return CascadeResult(
                     success=True,
@@ -717,9 +700,7 @@ class CascadeOrchestrator:
                     total_duration_seconds=duration,
                     matched_pattern_id=pattern.id,
                 )
-            await self._update_cascade_level(
-                cascade_exec_id, HealingLevel.INTEGRATION, success=False
-            )
+            self._update_cascade_level(cascade_exec_id, HealingLevel.INTEGRATION, success=False)
 
         # Intelligent routing failed, return failure
         # Caller will fall back to sequential cascade
@@ -735,35 +716,14 @@ class CascadeOrchestrator:
             matched_pattern_id=pattern.id,
         )
 
-    async def _refetch_pattern(self, pattern_id: int) -> AutomationOutcomePattern | None:
-        """Re-fetch pattern by ID to avoid stale data race conditions.
-
-        Args:
-            pattern_id: Pattern ID to fetch
-
-        Returns:
-            Pattern if still exists, None if deleted
-        """
-        try:
-            async with self.database.async_session() as session:
-                stmt = select(AutomationOutcomePattern).where(
-                    AutomationOutcomePattern.id == pattern_id
-                )
-                result = await session.execute(stmt)
-                return result.scalar_one_or_none()
-
-        except Exception as e:
-            logger.error(f"Failed to refetch pattern {pattern_id}: {e}", exc_info=True)
-            return None
-
     async def _get_matching_pattern(
         self,
         context: HealingContext,
-    ) -> AutomationOutcomePattern | None:
+    ) -> PatternEntry | None:
         """Find matching healing pattern for automation.
 
-        Looks for patterns where healing has succeeded multiple times for specific
-        entities in this automation, ordered by healing success count.
+        Looks up every failed entity of the automation in the pattern index and
+        picks the pattern with the highest healing success count.
 
         Args:
             context: Healing context with automation info
@@ -772,29 +732,18 @@ class CascadeOrchestrator:
             Matching pattern or None if no pattern found
         """
         try:
-            async with self.database.async_session() as session:
-                stmt = (
-                    select(AutomationOutcomePattern)
-                    .where(
-                        and_(
-                            AutomationOutcomePattern.instance_id == context.instance_id,
-                            AutomationOutcomePattern.automation_id == context.automation_id,
-                            AutomationOutcomePattern.entity_id.in_(context.failed_entities),
-                            AutomationOutcomePattern.healing_success_count
-                            >= self.pattern_match_threshold,
-                            AutomationOutcomePattern.successful_healing_level.isnot(None),
-                        )
-                    )
-                    .order_by(desc(AutomationOutcomePattern.healing_success_count))
-                    .limit(1)
-                )
-                result = await session.execute(stmt)
-                return result.scalar_one_or_none()
-
+            await self.pattern_index.ensure_loaded()
         except Exception as e:
-            logger.error(f"Failed to query healing patterns: {e}", exc_info=True)
+            logger.error(f"Failed to load healing patterns: {e}", exc_info=True)
             return None
 
+        return self.pattern_index.match(
+            context.instance_id,
+            context.automation_id,
+            context.failed_entities,
+            self.pattern_match_threshold,
+        )
+
     async def _create_cascade_record(self, context: HealingContext) -> int:
         """Create cascade execution record in database.
 
@@ -870,14 +819,14 @@ class CascadeOrchestrator:
 
         return integration_success
 
-    async def _update_cascade_level(
+    def _update_cascade_level(
         self,
         cascade_exec_id: int,
         level: HealingLevel,
         attempted: bool = False,
         success: bool | None = None,
     ) -> None:
-        """Update cascade execution record for level attempt/result.
+        """Journal a level attempt/result for the cascade execution record.
 
         Args:
             cascade_exec_id: Cascade execution record ID
@@ -885,196 +834,104 @@ class CascadeOrchestrator:
             attempted: Whether level was attempted
             success: Whether level succeeded (None if only marking attempted)
         """
-        try:
-            async with self.database.async_session() as session:
-                stmt = select(HealingCascadeExecution).where(
-                    HealingCascadeExecution.id == cascade_exec_id
-                )
-                result = await session.execute(stmt)
-                cascade_exec = result.scalar_one_or_none()
-
-                if not cascade_exec:
-                    logger.warning(f"Cascade execution {cascade_exec_id} not found")
-                    return
-
-                if level == HealingLevel.ENTITY:
-                    if attempted:
-                        cascade_exec.entity_level_attempted = True
-                    if success is not None:
-                        cascade_exec.entity_level_success = success
-                elif level == HealingLevel.DEVICE:
-                    if attempted:
-                        cascade_exec.device_level_attempted = True
-                    if success is not None:
-                        cascade_exec.device_level_success = success
-                elif level == HealingLevel.INTEGRATION:
-                    if attempted:
-                        cascade_exec.integration_level_attempted = True
-                    if success is not None:
-                        cascade_exec.integration_level_success = success
-
-                await session.commit()
-
-        except Exception as e:
-            logger.error(f"Failed to update cascade level: {e}", exc_info=True)
+        journal = self._journals.get(cascade_exec_id)
+        if not journal:
+            logger.warning(f"Cascade execution {cascade_exec_id} has no journal")
+            return
+        journal.record_level(level.value, attempted=attempted, success=success)
 
-    async def _batch_update_cascade_levels(
+    def _batch_update_cascade_levels(
         self,
         cascade_exec_id: int,
         updates: list[tuple[HealingLevel, bool, bool | None]],
     ) -> None:
-        """Batch update multiple cascade level statuses in a single session.
-
-        More efficient than calling _update_cascade_level multiple times
-        when several updates need to happen together.
+        """Journal multiple cascade level statuses.
 
         Args:
             cascade_exec_id: Cascade execution record ID
             updates: List of (level, attempted, success) tuples
         """
-        if not updates:
-            return
-
-        try:
-            async with self.database.async_session() as session:
-                stmt = select(HealingCascadeExecution).where(
-                    HealingCascadeExecution.id == cascade_exec_id
-                )
-                result = await session.execute(stmt)
-                cascade_exec = result.scalar_one_or_none()
-
-                if not cascade_exec:
-                    logger.warning(f"Cascade execution {cascade_exec_id} not found")
-                    return
-
-                for level, attempted, success in updates:
-                    if level == HealingLevel.ENTITY:
-                        if attempted:
-                            cascade_exec.entity_level_attempted = True
-                        if success is not None:
-                            cascade_exec.entity_level_success = success
-                    elif level == HealingLevel.DEVICE:
-                        if attempted:
-                            cascade_exec.device_level_attempted = True
-                        if success is not None:
-                            cascade_exec.device_level_success = success
-                    elif level == HealingLevel.INTEGRATION:
-                        if attempted:
-                            cascade_exec.integration_level_attempted = True
-                        if success is not None:
-                            cascade_exec.integration_level_success = success
-
-                await session.commit()
-
-        except Exception as e:
-            logger.error(f"Failed to batch update cascade levels: {e}", exc_info=True)
+        for level, attempted, success in updates:
+            self._update_cascade_level(cascade_exec_id, level, attempted, success)
 
     async def _finalize_cascade_record(
         self,
-        cascade_exec_id: int,
+        journal: CascadeJournal,
         success: bool,
         duration: float,
         routing_strategy: str | None = None,
     ) -> None:
-        """Finalize cascade execution record.
+        """Finalize cascade execution record and write the cascade's journal.
 
         Args:
-            cascade_exec_id: Cascade execution record ID
+            journal: Journal of the finished cascade
             success: Overall cascade success
             duration: Total duration in seconds
             routing_strategy: Routing strategy used (intelligent or sequential)
         """
-        try:
-            async with self.database.async_session() as session:
-                stmt = select(HealingCascadeExecution).where(
-                    HealingCascadeExecution.id == cascade_exec_id
-                )
-                result = await session.execute(stmt)
-                cascade_exec = result.scalar_one_or_none()
+        journal.update_cascade(
+            final_success=success,
+            total_duration_seconds=duration,
+            completed_at=datetime.now(UTC),
+        )
+        if routing_strategy:
+            journal.update_cascade(routing_strategy=routing_strategy)
 
-                if not cascade_exec:
-                    logger.warning(f"Cascade execution {cascade_exec_id} not found")
-                    return
+        await self.journal_writer.flush(journal)
 
-                cascade_exec.final_success = success
-                cascade_exec.total_duration_seconds = duration
-                cascade_exec.completed_at = datetime.now(UTC)
-                if routing_strategy:
-                    cascade_exec.routing_strategy = routing_strategy
+    async def replay_journals(self) -> int:
+        """Write cascade journals left in the fallback file by earlier failures.
 
-                await session.commit()
+        Returns:
+            Number of journals written
+        """
+        return await self.journal_writer.replay_fallback()
+
+    async def warm_pattern_index(self) -> None:
+        """Load learned healing patterns into the pattern index.
 
+        Failures are logged; the index is then loaded on first use instead.
+        """
+        try:
+            await self.pattern_index.load()
         except Exception as e:
-            logger.error(f"Failed to finalize cascade record: {e}", exc_info=True)
+            logger.error(f"Failed to warm healing pattern index: {e}", exc_info=True)
 
-    async def _record_successful_pattern(
+    def _record_successful_pattern(
         self,
+        cascade_exec_id: int,
         context: HealingContext,
-        level: HealingLevel,
-        strategy: str,
+        result: CascadeResult,
     ) -> None:
-        """Record or update successful healing pattern.
+        """Learn a successful healing for every entity it healed.
 
-        Note: This method currently records patterns only for the first failed entity
-        as a representative for the automation. This is a simplification that works well
-        when all entities in an automation typically share the same healing strategy.
-        For heterogeneous entity failures, consider recording patterns per entity.
+        The pattern index is updated immediately; the database patterns are
+        recorded or updated when the cascade journal is flushed.
 
         Args:
+            cascade_exec_id: Cascade execution record ID
             context: Healing context
-            level: Successful healing level
-            strategy: Successful healing strategy
+            result: Successful cascade result
         """
-        try:
-            async with self.database.async_session() as session:
-                # Try to find existing pattern for the first failed entity
-                # (we use first entity as representative for pattern matching)
-                if not context.failed_entities:
-                    return
-
-                entity_id = context.failed_entities[0]
-
-                stmt = select(AutomationOutcomePattern).where(
-                    and_(
-                        AutomationOutcomePattern.instance_id == context.instance_id,
-                        AutomationOutcomePattern.automation_id == context.automation_id,
-                        AutomationOutcomePattern.entity_id == entity_id,
-                    )
-                )
-                result = await session.execute(stmt)
-                pattern = result.scalar_one_or_none()
-
-                if pattern:
-                    # Update existing pattern
-                    pattern.successful_healing_level = level.value
-                    pattern.successful_healing_strategy = strategy
-                    pattern.healing_success_count += 1
-                    pattern.last_observed = datetime.now(UTC)
-                else:
-                    # Create new pattern
-                    pattern = AutomationOutcomePattern(
-                        instance_id=context.instance_id,
-                        automation_id=context.automation_id,
-                        entity_id=entity_id,
-                        observed_state="unknown",  # We don't track state here
-                        successful_healing_level=level.value,
-                        successful_healing_strategy=strategy,
-                        healing_success_count=1,
-                        first_observed=datetime.now(UTC),
-                        last_observed=datetime.now(UTC),
-                    )
-                    session.add(pattern)
-
-                await session.commit()
-                logger.info(
-                    f"Recorded successful healing pattern for {context.automation_id}: "
-                    f"{level.value}/{strategy} (count: {pattern.healing_success_count})"
-                )
+        if not result.successful_level or not result.successful_strategy:
+            return
 
-        except Exception as e:
-            logger.error(f"Failed to record healing pattern: {e}", exc_info=True)
+        level = result.successful_level.value
+        journal = self._journals.get(cascade_exec_id)
+        for entity_id in context.failed_entities:
+            if not result.entity_results.get(entity_id):
+                continue
+            self.pattern_index.record_success(
+                context.instance_id,
+                context.automation_id,
+                entity_id,
+                level,
+                result.successful_strategy,
+            )
+            if journal:
+                journal.record_pattern_success(entity_id, level, result.successful_strategy)
 
-    async def _flag_plan_generation_suggested(self, cascade_exec_id: int) -> None:
+    def _flag_plan_generation_suggested(self, cascade_exec_id: int) -> None:
         """Mark cascade execution as a candidate for AI plan generation.
 
         Called when the plan framework is active but no plan matched the failure.
@@ -1082,45 +939,10 @@ class CascadeOrchestrator:
         Args:
             cascade_exec_id: Cascade execution record ID
         """
-        try:
-            async with self.database.async_session() as session:
-                stmt = select(HealingCascadeExecution).where(
-                    HealingCascadeExecution.id == cascade_exec_id
-                )
-                result = await session.execute(stmt)
-                cascade_exec = result.scalar_one_or_none()
-
-                if cascade_exec:
-                    cascade_exec.plan_generation_suggested = True
-                    await session.commit()
-                    logger.debug(
-                        f"Flagged cascade {cascade_exec_id} for AI plan generation suggestion"
-                    )
-
-        except Exception as e:
-            logger.warning(f"Failed to flag cascade {cascade_exec_id} for plan generation: {e}")
-
-    async def _update_pattern_success(self, pattern_id: int) -> None:
-        """Increment healing success count for pattern.
-
-        Args:
-            pattern_id: Pattern ID to update
-        """
-        try:
-            async with self.database.async_session() as session:
-                stmt = select(AutomationOutcomePattern).where(
-                    AutomationOutcomePattern.id == pattern_id
-                )
-                result = await session.execute(stmt)
-                pattern = result.scalar_one_or_none()
-
-                if pattern:
-                    pattern.healing_success_count += 1
-                    pattern.last_observed = datetime.now(UTC)
-                    await session.commit()
-
-        except Exception as e:
-            logger.error(f"Failed to update pattern success: {e}", exc_info=True)
+        journal = self._journals.get(cascade_exec_id)
+        if journal:
+            journal.update_cascade(plan_generation_suggested=True)
+            logger.debug(f"Flagged cascade {cascade_exec_id} for AI plan generation suggestion")
 
     async def get_routing_metrics(
         self,
@@ -1132,6 +954,7 @@ class CascadeOrchestrator:
         - Pattern coverage: How many automations have learned patterns
         - Routing effectiveness: Success rates of intelligent vs sequential routing
         - Level distribution: Which healing levels are most commonly used
+        - Pattern index: In-memory pattern lookups and their hit rate
 
         Args:
             instance_id: Home Assistant instance identifier
@@ -1287,6 +1110,7 @@ class CascadeOrchestrator:
                             else 0.0
                         ),
                     },
+                    "pattern_index": self.pattern_index.get_stats(self.pattern_match_threshold),
                 }
 
         except Exception as e:
@@ -1294,4 +1118,5 @@ class CascadeOrchestrator:
             return {
                 "pattern_coverage": {"error": str(e)},
                 "routing_effectiveness": {"error": str(e)},
+                "pattern_index": self.pattern_index.get_stats(self.pattern_match_threshold),
             }
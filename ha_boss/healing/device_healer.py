@@ -9,12 +9,19 @@ Device-level healing attempts to fix device-wide failures by:
 
 import asyncio
 import logging
+import math
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ha_boss.core.database import Database, DeviceHealingAction
 from ha_boss.core.ha_client import HomeAssistantClient
+from ha_boss.healing.cascade_journal import journal_healing_action
+from ha_boss.monitoring.state_tracker import is_available
+
+if TYPE_CHECKING:
+    from ha_boss.discovery.registry_cache import RegistryCache
+    from ha_boss.monitoring.state_tracker import StateTracker
 
 logger = logging.getLogger(__name__)
 
@@ -48,8 +55,11 @@ class DeviceHealer:
         ha_client: HomeAssistantClient,
         instance_id: str = "default",
         reboot_timeout_seconds: float = 30.0,
+        reboot_settle_seconds: float = 5.0,
         state_verification_timeout: float = 5.0,
         state_verification_partial_threshold: float = 0.5,
+        registry_cache: "RegistryCache | None" = None,
+        state_tracker: "StateTracker | None" = None,
     ) -> None:
         """Initialize device healer.
 
@@ -58,15 +68,25 @@ class DeviceHealer:
             ha_client: Home Assistant API client for device operations
             instance_id: Instance identifier for multi-instance setups
             reboot_timeout_seconds: Timeout for device reboot operations
+            reboot_settle_seconds: How long to wait for entities to go down after a
+                reboot command; states received before then never count as recovery
             state_verification_timeout: Timeout in seconds for state verification
             state_verification_partial_threshold: Threshold (0.0-1.0) for partial success
+            registry_cache: Optional shared registry cache; when set, entity/device
+                lookups are served from its indexes instead of fetching the registries
+            state_tracker: Optional state tracker; when set, post-action waits and
+                verification end as soon as the entities recover (event-driven)
+                instead of always waiting out the full delay
         """
         self.database = database
         self.ha_client = ha_client
         self.instance_id = instance_id
         self.reboot_timeout_seconds = reboot_timeout_seconds
+        self.reboot_settle_seconds = reboot_settle_seconds
         self.state_verification_timeout = state_verification_timeout
         self.state_verification_partial_threshold = state_verification_partial_threshold
+        self.registry_cache = registry_cache
+        self.state_tracker = state_tracker
 
     async def heal(
         self,
@@ -115,9 +135,12 @@ class DeviceHealer:
             )
 
         try:
-            # Cache device registry once at start to avoid repeated full-registry fetches
-            logger.debug("Fetching device registry (cached for this healing attempt)")
-            device_registry = await self._fetch_device_registry()
+            # Without a shared registry cache, fetch the device registry once for
+            # this healing attempt to avoid repeated full-registry fetches
+            device_registry: list[dict[str, Any]] | None = None
+            if self.registry_cache is None:
+                logger.debug("Fetching device registry (cached for this healing attempt)")
+                device_registry = await self._fetch_device_registry()
 
             # Map entities to devices
             device_map = await self._get_devices_for_entities(entity_ids)
@@ -181,15 +204,20 @@ class DeviceHealer:
 
                         logger.info(f"Trying {action_type} for device {device_id}")
                         action_start = datetime.now(UTC)
+                        since = self._state_version()
                         success = False
                         action_error: str | None = None
 
                         try:
-                            success = await strategy_func(device_id, device_registry)
+                            success = await strategy_func(
+                                device_id, device_registry, entity_ids=device_entities
+                            )
 
                             # Verify entity states if healing reported success
                             if success:
-                                verified = await self._verify_entity_states(device_entities)
+                                verified = await self._verify_entity_states(
+                                    device_entities, updated_after=since
+                                )
                                 if not verified:
                                     success = False
                                     action_error = (
@@ -267,7 +295,8 @@ class DeviceHealer:
     ) -> dict[str, list[str]]:
         """Map entity IDs to device IDs via HA device registry.
 
-        Uses HA API: GET /api/config/entity_registry/list
+        Uses the registry cache when available, otherwise HA API:
+        GET /api/config/entity_registry/list
 
         Args:
             entity_ids: List of entity IDs to map
@@ -276,6 +305,9 @@ class DeviceHealer:
             Dict mapping device_id -> [entity_id, entity_id, ...]
         """
         try:
+            if self.registry_cache is not None:
+                return await self.registry_cache.get_devices_for_entities(entity_ids)
+
             # Get entity registry
             entity_registry = await self.ha_client._request(
                 "GET", "/api/config/entity_registry/list"
@@ -318,6 +350,7 @@ class DeviceHealer:
         self,
         device_id: str,
         device_registry: list[dict[str, Any]] | None = None,
+        entity_ids: list[str] | None = None,
     ) -> bool:
         """Attempt device reconnection.
 
@@ -329,6 +362,7 @@ class DeviceHealer:
         Args:
             device_id: Device ID to reconnect
             device_registry: Optional cached device registry to avoid API calls
+            entity_ids: Affected entities; with a state tracker, waits end once they recover
 
         Returns:
             True on success, False otherwise
@@ -348,12 +382,14 @@ class DeviceHealer:
                 # Zigbee networks - try reconfigure
                 logger.info(f"Attempting Zigbee reconfigure for device {device_id}")
                 try:
+                    since = self._state_version()
                     await self.ha_client.call_service(
                         domain=integration,
                         service="reconfigure_device",
                         service_data={"device_id": device_id},
                     )
-                    await asyncio.sleep(2.0)  # Wait for reconfigure to complete
+                    # Reconfigure to complete
+                    await self._wait_for_recovery(entity_ids, 2.0, since)
                     return True
                 except Exception as e:
                     logger.debug(f"Zigbee reconfigure failed: {e}")
@@ -363,12 +399,13 @@ class DeviceHealer:
                 # Z-Wave networks - try ping/heal
                 logger.info(f"Attempting Z-Wave heal for device {device_id}")
                 try:
+                    since = self._state_version()
                     await self.ha_client.call_service(
                         domain=integration,
                         service="ping",
                         service_data={"device_id": device_id},
                     )
-                    await asyncio.sleep(2.0)
+                    await self._wait_for_recovery(entity_ids, 2.0, since)
                     return True
                 except Exception as e:
                     logger.debug(f"Z-Wave ping failed: {e}")
@@ -387,6 +424,7 @@ class DeviceHealer:
         self,
         device_id: str,
         device_registry: list[dict[str, Any]] | None = None,
+        entity_ids: list[str] | None = None,
     ) -> bool:
         """Attempt device reboot/power cycle.
 
@@ -398,6 +436,7 @@ class DeviceHealer:
         Args:
             device_id: Device ID to reboot
             device_registry: Optional cached device registry to avoid API calls
+            entity_ids: Affected entities; with a state tracker, waits end once they recover
 
         Returns:
             True on success, False otherwise
@@ -418,6 +457,7 @@ class DeviceHealer:
                     # Different integrations use different service names
                     service_name = "reboot" if integration == "esphome" else "restart"
 
+                    since = self._state_version()
                     await asyncio.wait_for(
                         self.ha_client.call_service(
                             domain=integration,
@@ -429,7 +469,7 @@ class DeviceHealer:
 
                     # Wait for device to come back online
                     logger.debug(f"Waiting {self.reboot_timeout_seconds}s for device to reboot")
-                    await asyncio.sleep(self.reboot_timeout_seconds)
+                    await self._wait_for_reboot(entity_ids, self.reboot_timeout_seconds, since)
 
                     # Check if device is back online by getting its info
                     updated_info = await self._get_device_info(device_id, device_registry)
@@ -454,6 +494,7 @@ class DeviceHealer:
         self,
         device_id: str,
         device_registry: list[dict[str, Any]] | None = None,
+        entity_ids: list[str] | None = None,
     ) -> bool:
         """Attempt device re-discovery.
 
@@ -464,6 +505,7 @@ class DeviceHealer:
         Args:
             device_id: Device ID to rediscover
             device_registry: Optional cached device registry to avoid API calls
+            entity_ids: Affected entities; with a state tracker, waits end once they recover
 
         Returns:
             True on success, False otherwise
@@ -486,12 +528,13 @@ class DeviceHealer:
             logger.info(f"Attempting rediscovery for device {device_id} via {integration}")
             for entry_id in config_entries:
                 try:
+                    since = self._state_version()
                     await asyncio.wait_for(
                         self.ha_client.reload_integration(entry_id),
                         timeout=30.0,
                     )
                     # Wait for discovery to complete
-                    await asyncio.sleep(5.0)
+                    await self._wait_for_recovery(entity_ids, 5.0, since)
 
                     # Check if device still exists
                     updated_info = await self._get_device_info(device_id, device_registry)
@@ -521,7 +564,7 @@ class DeviceHealer:
         error_message: str | None,
         duration_seconds: float,
     ) -> None:
-        """Record device healing action to database.
+        """Record device healing action to database or the active cascade journal.
 
         Args:
             device_id: Device being healed
@@ -533,19 +576,22 @@ class DeviceHealer:
             error_message: Optional error message
             duration_seconds: Duration of action
         """
+        action = DeviceHealingAction(
+            instance_id=self.instance_id,
+            device_id=device_id,
+            action_type=action_type,
+            triggered_by=triggered_by,
+            automation_id=automation_id,
+            execution_id=execution_id,
+            success=success,
+            error_message=error_message,
+            duration_seconds=duration_seconds,
+            created_at=datetime.now(UTC),
+        )
+        if journal_healing_action(action):
+            return
+
         async with self.database.async_session() as session:
-            action = DeviceHealingAction(
-                instance_id=self.instance_id,
-                device_id=device_id,
-                action_type=action_type,
-                triggered_by=triggered_by,
-                automation_id=automation_id,
-                execution_id=execution_id,
-                success=success,
-                error_message=error_message,
-                duration_seconds=duration_seconds,
-                created_at=datetime.now(UTC),
-            )
             session.add(action)
             await session.commit()
 
@@ -623,7 +669,9 @@ class DeviceHealer:
             logger.error(f"Failed to fetch device registry: {e}", exc_info=True)
             return []
 
-    async def _verify_entity_states(self, entity_ids: list[str]) -> bool:
+    async def _verify_entity_states(
+        self, entity_ids: list[str], updated_after: int | None = None
+    ) -> bool:
         """Verify that entities are now available after healing.
 
         Implements partial success logic based on configurable threshold.
@@ -632,20 +680,40 @@ class DeviceHealer:
 
         Args:
             entity_ids: List of entity IDs to check
+            updated_after: State tracker version taken before the healing action;
+                only states received after it count as recovered
 
         Returns:
             True if percentage of available entities meets threshold, False otherwise
         """
         try:
-            # Wait briefly for entity states to settle after healing
-            await asyncio.sleep(self.state_verification_timeout)
+            if self.state_tracker is not None and entity_ids:
+                # Event-driven: done as soon as enough entities report a real state
+                wait = await self.state_tracker.wait_until_available(
+                    entity_ids,
+                    count=self._required_available(len(entity_ids)),
+                    timeout=self.state_verification_timeout,
+                    updated_after=updated_after,
+                )
+                if wait.satisfied:
+                    if wait.pending:
+                        logger.warning(
+                            f"Partial success: {len(wait.matched)}/{len(entity_ids)} entities "
+                            f"recovered. Still unavailable: {wait.pending}"
+                        )
+                    return True
+                # Deadline passed (or entities are not tracked): confirm via REST below
+            else:
+                # Wait briefly for entity states to settle after healing
+                await asyncio.sleep(self.state_verification_timeout)
 
             available_count = 0
             unavailable_entities: list[str] = []
 
             for entity_id in entity_ids:
                 try:
-                    state_data = await self.ha_client.get_state(entity_id)
+                    # Fresh: a coalesced read may have been sent before the action took effect
+                    state_data = await self.ha_client.get_state(entity_id, fresh=True)
                     # Consider unavailable or unknown states as unavailable
                     if isinstance(state_data, dict):
                         state_value = state_data.get("state")
@@ -686,6 +754,78 @@ class DeviceHealer:
             logger.debug(f"Entity state verification failed: {e}")
             return False
 
+    def _required_available(self, total: int) -> int:
+        """Number of entities that must recover to meet the partial success threshold."""
+        return math.ceil(round(total * self.state_verification_partial_threshold, 9))
+
+    def _state_version(self) -> int | None:
+        """State tracker version to take before issuing a healing action."""
+        return self.state_tracker.version if self.state_tracker is not None else None
+
+    async def _wait_for_recovery(
+        self, entity_ids: list[str] | None, timeout: float, updated_after: int | None = None
+    ) -> None:
+        """Give a healing action time to take effect.
+
+        With a state tracker the wait ends as soon as enough of the entities
+        report a state received after the action; otherwise it sleeps for the
+        full timeout. Entities that were already available before the action
+        do not end the wait early.
+
+        Args:
+            entity_ids: Entities expected to recover
+            timeout: Maximum seconds to wait
+            updated_after: State tracker version taken before the action
+        """
+        if self.state_tracker is None or not entity_ids:
+            await asyncio.sleep(timeout)
+            return
+
+        wait = await self.state_tracker.wait_until_available(
+            entity_ids,
+            count=self._required_available(len(entity_ids)),
+            timeout=timeout,
+            updated_after=updated_after,
+        )
+        if wait.satisfied:
+            logger.debug(
+                f"Entities recovered after {wait.elapsed_seconds:.1f}s (waited up to {timeout}s)"
+            )
+
+    async def _wait_for_reboot(
+        self, entity_ids: list[str] | None, timeout: float, updated_after: int | None = None
+    ) -> None:
+        """Wait for a rebooting device to go down and come back.
+
+        A device often reports a last available state before it actually goes
+        down, so recovery only counts states received after the entities have
+        left an available state, or after the settle time if they never report
+        going down.
+
+        Args:
+            entity_ids: Entities expected to recover
+            timeout: Maximum seconds to wait in total
+            updated_after: State tracker version taken before the reboot command
+        """
+        if self.state_tracker is None or not entity_ids:
+            await asyncio.sleep(timeout)
+            return
+
+        settle = min(self.reboot_settle_seconds, timeout)
+        down = await self.state_tracker.wait_for(
+            entity_ids,
+            lambda state: not is_available(state),
+            count=self._required_available(len(entity_ids)),
+            timeout=settle,
+            updated_after=updated_after,
+        )
+        if down.satisfied:
+            logger.debug(f"Entities went down {down.elapsed_seconds:.1f}s after reboot command")
+
+        await self._wait_for_recovery(
+            entity_ids, max(timeout - down.elapsed_seconds, 0.0), self._state_version()
+        )
+
     async def _get_device_info(
         self, device_id: str, device_registry: list[dict[str, Any]] | None = None
     ) -> dict[str, Any] | None:
@@ -693,12 +833,16 @@ class DeviceHealer:
 
         Args:
             device_id: Device ID to look up
-            device_registry: Optional cached device registry (avoids fetching again)
+            device_registry: Optional cached device registry (avoids fetching again);
+                when omitted, the registry cache is used if configured
 
         Returns:
             Device info dictionary or None if not found
         """
         try:
+            if device_registry is None and self.registry_cache is not None:
+                return await self.registry_cache.get_device(device_id)
+
             # Use cached registry if provided, otherwise fetch
             if device_registry is None:
                 device_registry = await self._fetch_device_registry()
@@ -16,6 +16,7 @@ from sqlalchemy import select
 
 from ha_boss.core.database import AutomationServiceCall, Database, EntityHealingAction
 from ha_boss.core.ha_client import HomeAssistantClient
+from ha_boss.healing.cascade_journal import journal_healing_action
 
 logger = logging.getLogger(__name__)
 
@@ -417,7 +418,7 @@ class EntityHealer:
         error_message: str | None,
         duration_seconds: float,
     ) -> None:
-        """Record healing action to database.
+        """Record healing action to database or the active cascade journal.
 
         Args:
             entity_id: Entity being healed
@@ -432,22 +433,25 @@ class EntityHealer:
             error_message: Optional error message
             duration_seconds: Duration of action
         """
+        action = EntityHealingAction(
+            instance_id=self.instance_id,
+            entity_id=entity_id,
+            action_type=action_type,
+            service_domain=service_domain,
+            service_name=service_name,
+            service_data=service_data,
+            triggered_by=triggered_by,
+            automation_id=automation_id,
+            execution_id=execution_id,
+            success=success,
+            error_message=error_message,
+            duration_seconds=duration_seconds,
+            created_at=datetime.now(UTC),
+        )
+        if journal_healing_action(action):
+            return
+
         async with self.database.async_session() as session:
-            action = EntityHealingAction(
-                instance_id=self.instance_id,
-                entity_id=entity_id,
-                action_type=action_type,
-                service_domain=service_domain,
-                service_name=service_name,
-                service_data=service_data,
-                triggered_by=triggered_by,
-                automation_id=automation_id,
-                execution_id=execution_id,
-                success=success,
-                error_message=error_message,
-                duration_seconds=duration_seconds,
-                created_at=datetime.now(UTC),
-            )
             session.add(action)
             await session.commit()
 
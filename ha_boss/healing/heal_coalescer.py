@@ -0,0 +1,166 @@
+"""Coalescing of integration-level healing across entities of the same integration."""
+
+import asyncio
+import logging
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from ha_boss.core.types import HealthIssue
+from ha_boss.healing.heal_strategies import HealingManager
+from ha_boss.healing.integration_manager import IntegrationDiscovery
+
+logger = logging.getLogger(__name__)
+
+# Called once per group with (issues, healed issues, error)
+HealOutcomeCallback = Callable[
+    [list[HealthIssue], list[HealthIssue], Exception | None], Coroutine[Any, Any, None]
+]
+
+
+class HealCoalescer:
+    """Groups health issues by integration so each integration is reloaded once.
+
+    When a hub or coordinator drops, many entities of one integration fail
+    together. Instead of one heal attempt per entity (each going through the
+    suppression, circuit breaker, cooldown and attempt-count checks before the
+    cooldown rejects it), issues are collected per integration for a short
+    debounce window and healed with a single reload. The outcome is then
+    reported for every entity in the group.
+
+    ``submit`` never waits for healing, so the health monitor can keep
+    reporting issues while a window is open.
+    """
+
+    def __init__(
+        self,
+        healing_manager: HealingManager,
+        integration_discovery: IntegrationDiscovery,
+        on_outcome: HealOutcomeCallback,
+        window_seconds: float = 2.0,
+        instance_id: str = "default",
+    ) -> None:
+        """Initialize heal coalescer.
+
+        Args:
+            healing_manager: Healing manager performing the reloads
+            integration_discovery: Integration discovery used to group entities
+            on_outcome: Coroutine called with each group's issues, healed issues and error
+            window_seconds: Debounce window before a group is healed
+            instance_id: Home Assistant instance identifier (for logging)
+        """
+        self.healing_manager = healing_manager
+        self.integration_discovery = integration_discovery
+        self.on_outcome = on_outcome
+        self.window_seconds = window_seconds
+        self.instance_id = instance_id
+
+        # Open groups: {integration_id: {entity_id: issue}}
+        self._pending: dict[str, dict[str, HealthIssue]] = {}
+        self._windows: dict[str, asyncio.Task[None]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+        # Statistics
+        self._issues_received = 0
+        self._groups_healed = 0
+        self._reloads_saved = 0
+        self._largest_group = 0
+
+    def submit(self, issue: HealthIssue) -> None:
+        """Queue a health issue for healing with the rest of its integration.
+
+        Issues of entities without a known integration are healed on their own
+        right away (the healing manager reports the missing integration).
+
+        Args:
+            issue: Health issue to heal
+        """
+        self._issues_received += 1
+        integration_id = self.integration_discovery.get_integration_for_entity(issue.entity_id)
+        if not integration_id:
+            self._start(self._heal([issue], None))
+            return
+
+        group = self._pending.get(integration_id)
+        if group is None:
+            self._pending[integration_id] = {issue.entity_id: issue}
+            self._windows[integration_id] = asyncio.create_task(
+                self._heal_after_window(integration_id)
+            )
+        else:
+            # Latest issue per entity wins
+            group[issue.entity_id] = issue
+
+    def _start(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _heal_after_window(self, integration_id: str) -> None:
+        await asyncio.sleep(self.window_seconds)
+        del self._windows[integration_id]
+        group = self._pending.pop(integration_id)
+        self._start(self._heal(list(group.values()), integration_id))
+
+    async def _heal(self, issues: list[HealthIssue], integration_id: str | None) -> None:
+        healed: list[HealthIssue] = []
+        error: Exception | None = None
+        try:
+            if integration_id is None or len(issues) == 1:
+                if await self.healing_manager.heal(issues[0]):
+                    healed = issues
+            else:
+                logger.info(
+                    f"[{self.instance_id}] Coalesced {len(issues)} health issues into one "
+                    f"reload of {integration_id}"
+                )
+                healed = await self.healing_manager.heal_group(integration_id, issues)
+        except Exception as e:
+            error = e
+
+        self._groups_healed += 1
+        self._reloads_saved += len(issues) - 1
+        self._largest_group = max(self._largest_group, len(issues))
+
+        try:
+            await self.on_outcome(issues, healed, error)
+        except Exception as e:
+            logger.error(
+                f"[{self.instance_id}] Error handling healing outcome for "
+                f"{len(issues)} entities: {e}",
+                exc_info=True,
+            )
+
+    async def flush(self) -> None:
+        """Heal every open group now and wait for all healing to finish."""
+        pending, self._pending = self._pending, {}
+        windows, self._windows = self._windows, {}
+        for window in windows.values():
+            window.cancel()
+        for integration_id, group in pending.items():
+            self._start(self._heal(list(group.values()), integration_id))
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Drop open groups and cancel healing in progress (instance shutdown)."""
+        self._pending.clear()
+        tasks = [*self._windows.values(), *self._tasks]
+        self._windows.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get coalescing statistics.
+
+        Returns:
+            Dictionary with issues received, groups healed, reloads saved,
+            largest group and open group counts
+        """
+        return {
+            "issues_received": self._issues_received,
+            "groups_healed": self._groups_healed,
+            "reloads_saved": self._reloads_saved,
+            "largest_group": self._largest_group,
+            "open_groups": len(self._pending),
+        }
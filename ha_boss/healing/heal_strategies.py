@@ -8,7 +8,7 @@ from typing import Any
 from sqlalchemy import select
 
 from ha_boss.core.config import Config
-from ha_boss.core.database import Database, Entity, HealingAction, Integration
+from ha_boss.core.database import Database, HealingAction
 from ha_boss.core.exceptions import (
     CircuitBreakerOpenError,
     HealingFailedError,
@@ -16,7 +16,9 @@ from ha_boss.core.exceptions import (
 )
 from ha_boss.core.ha_client import HomeAssistantClient
 from ha_boss.core.types import HealthIssue
+from ha_boss.healing.cascade_journal import journal_healing_action
 from ha_boss.healing.integration_manager import IntegrationDiscovery
+from ha_boss.healing.policy_store import HealingPolicyStore
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +32,10 @@ class HealingManager:
     - Dry-run mode: Test without executing
     - Database tracking: Records all healing attempts
     - Escalation: Notifies when healing fails
+
+    Suppression, circuit breaker, cooldown and attempt-count checks read the
+    instance's HealingPolicyStore, so deciding whether to heal needs no
+    database access; changes are written through by the store.
     """
 
     def __init__(
@@ -38,6 +44,7 @@ class HealingManager:
         database: Database,
         ha_client: HomeAssistantClient,
         integration_discovery: IntegrationDiscovery,
+        policy_store: HealingPolicyStore | None = None,
     ) -> None:
         """Initialize healing manager.
 
@@ -46,19 +53,20 @@ class HealingManager:
             database: Database manager
             ha_client: Home Assistant API client
             integration_discovery: Integration discovery service
+            policy_store: Healing policy state of the instance (created if omitted;
+                loaded from the database on first use)
         """
         self.config = config
         self.database = database
         self.ha_client = ha_client
         self.integration_discovery = integration_discovery
+        self.policy = policy_store or HealingPolicyStore(database, ha_client.instance_id)
 
-        # Track last healing attempt per integration for cooldown
-        # integration_id -> last_attempt_time
-        self._last_attempt: dict[str, datetime] = {}
-
-        # Track consecutive failures per integration (in-memory cache)
-        # integration_id -> failure_count
-        self._failure_count: dict[str, int] = {}
+        # Views into the policy store
+        # integration_id -> last_attempt_time (cooldown)
+        self._last_attempt = self.policy.last_attempt
+        # integration_id -> consecutive failure count
+        self._failure_count = self.policy.failure_count
 
     async def heal(self, health_issue: HealthIssue) -> bool:
         """Attempt to heal a health issue.
@@ -77,9 +85,10 @@ class HealingManager:
         issue_type = health_issue.issue_type
 
         logger.info(f"Attempting to heal {entity_id} ({issue_type})")
+        await self.policy.ensure_loaded()
 
         # Check if healing is suppressed for this entity
-        if await self._is_healing_suppressed(entity_id):
+        if self.policy.is_suppressed(entity_id):
             logger.info(f"Healing suppressed for {entity_id}, skipping (issue: {issue_type})")
             return False
 
@@ -91,6 +100,62 @@ class HealingManager:
                 "Run integration discovery first."
             )
 
+        await self._reload_integration(integration_id, [entity_id])
+        return True
+
+    async def heal_group(
+        self, integration_id: str, health_issues: list[HealthIssue]
+    ) -> list[HealthIssue]:
+        """Heal several entities of one integration with a single reload.
+
+        Safety checks (suppression, circuit breaker, cooldown) run once for the
+        group, and the reload is recorded as one healing action listing every
+        member.
+
+        Args:
+            integration_id: Integration entry ID shared by all issues
+            health_issues: Health issues of entities belonging to the integration
+
+        Returns:
+            Issues the reload was performed for (suppressed entities are left out;
+            empty if every entity is suppressed)
+
+        Raises:
+            CircuitBreakerOpenError: If circuit breaker is open for this integration
+            HealingFailedError: If the cooldown is active or the reload failed
+        """
+        await self.policy.ensure_loaded()
+        entity_ids = [issue.entity_id for issue in health_issues]
+        suppressed = {entity_id for entity_id in entity_ids if self.policy.is_suppressed(entity_id)}
+        if suppressed:
+            logger.info(
+                f"Healing suppressed for {len(suppressed)} of {len(entity_ids)} entities "
+                f"of {integration_id}, skipping them"
+            )
+        members = [issue for issue in health_issues if issue.entity_id not in suppressed]
+        if not members:
+            return []
+
+        logger.info(f"Attempting to heal {len(members)} entities of {integration_id} together")
+        await self._reload_integration(integration_id, [issue.entity_id for issue in members])
+        return members
+
+    async def _reload_integration(self, integration_id: str, entity_ids: list[str]) -> None:
+        """Reload an integration on behalf of one or more entities.
+
+        Args:
+            integration_id: Integration entry ID
+            entity_ids: Entities being healed (the first one is recorded as the
+                action's entity; all are listed as group members if more than one)
+
+        Raises:
+            CircuitBreakerOpenError: If circuit breaker is open for this integration
+            HealingFailedError: If the cooldown is active or the reload failed
+        """
+        entity_id = entity_ids[0]
+        group_members = entity_ids if len(entity_ids) > 1 else None
+        target = entity_id if group_members is None else f"{len(entity_ids)} entities"
+
         integration_details = self.integration_discovery.get_integration_details(integration_id)
         integration_name = integration_details["title"] if integration_details else integration_id
 
@@ -98,10 +163,10 @@ class HealingManager:
         await self._check_circuit_breaker(integration_id, integration_name)
 
         # Check cooldown
-        await self._check_cooldown(integration_id, integration_name)
+        self._check_cooldown(integration_id, integration_name)
 
         # Get current attempt number
-        attempt_number = await self._get_next_attempt_number(entity_id, integration_id)
+        attempt_number = self.policy.next_attempt_number(entity_id, integration_id)
 
         # Execute healing
         start_time = datetime.now(UTC)
@@ -120,9 +185,7 @@ class HealingManager:
                 # Actually perform the reload
                 await self.ha_client.reload_integration(integration_id)
                 success = True
-                logger.info(
-                    f"Successfully reloaded integration {integration_name} for entity {entity_id}"
-                )
+                logger.info(f"Successfully reloaded integration {integration_name} for {target}")
 
         except Exception as e:
             success = False
@@ -143,20 +206,18 @@ class HealingManager:
             success=success,
             error=error_message,
             duration=duration,
+            group_members=group_members,
         )
 
-        # Update tracking
-        self._last_attempt[integration_id] = datetime.now(UTC)
+        # Update tracking (starts the cooldown)
+        self.policy.record_attempt(entity_id, integration_id, datetime.now(UTC))
 
         if success:
             # Reset failure count on success
-            self._failure_count[integration_id] = 0
-            await self._update_integration_success(integration_id)
+            await self.policy.record_success(integration_id)
         else:
             # Increment failure count
-            current_failures = self._failure_count.get(integration_id, 0) + 1
-            self._failure_count[integration_id] = current_failures
-            await self._update_integration_failure(integration_id, current_failures)
+            current_failures = await self.policy.record_failure(integration_id)
 
             # Check if we should open circuit breaker
             if current_failures >= self.config.healing.circuit_breaker_threshold:
@@ -164,17 +225,15 @@ class HealingManager:
                     f"Circuit breaker threshold reached for {integration_name} "
                     f"({current_failures} failures)"
                 )
-                await self._open_circuit_breaker(integration_id)
-
-            raise HealingFailedError(
-                f"Failed to heal {entity_id}: {error_message or 'Unknown error'}"
-            )
+                await self._open_circuit_breaker(integration_id, integration_name)
 
-        return success
+            raise HealingFailedError(f"Failed to heal {target}: {error_message or 'Unknown error'}")
 
     async def _check_circuit_breaker(self, integration_id: str, integration_name: str) -> None:
         """Check if circuit breaker is open for an integration.
 
+        An expired circuit breaker is reset (the only case that writes).
+
         Args:
             integration_id: Integration entry ID
             integration_name: Human-readable integration name
@@ -182,37 +241,20 @@ class HealingManager:
         Raises:
             CircuitBreakerOpenError: If circuit breaker is open
         """
-        async with self.database.async_session() as session:
-            result = await session.execute(
-                select(Integration).where(
-                    Integration.instance_id == self.ha_client.instance_id,
-                    Integration.entry_id == integration_id,
-                )
+        time_remaining = self.policy.circuit_breaker_remaining(integration_id)
+        if time_remaining is None:
+            return
+        if time_remaining:
+            raise CircuitBreakerOpenError(
+                f"Circuit breaker is open for {integration_name}. "
+                f"Retry in {time_remaining.total_seconds():.0f} seconds."
             )
-            integration = result.scalar_one_or_none()
-
-            if integration and integration.circuit_breaker_open_until:
-                now = datetime.now(UTC)
-                # SQLite doesn't preserve timezone, so add UTC if naive
-                cb_until = integration.circuit_breaker_open_until
-                if cb_until.tzinfo is None:
-                    cb_until = cb_until.replace(tzinfo=UTC)
-                if cb_until > now:
-                    time_remaining = cb_until - now
-                    raise CircuitBreakerOpenError(
-                        f"Circuit breaker is open for {integration_name}. "
-                        f"Retry in {time_remaining.total_seconds():.0f} seconds."
-                    )
-                else:
-                    # Circuit breaker timeout expired, reset it
-                    logger.info(
-                        f"Circuit breaker timeout expired for {integration_name}, resetting"
-                    )
-                    integration.circuit_breaker_open_until = None
-                    integration.consecutive_failures = 0
-                    await session.commit()
-
-    async def _check_cooldown(self, integration_id: str, integration_name: str) -> None:
+
+        # Circuit breaker timeout expired, reset it
+        logger.info(f"Circuit breaker timeout expired for {integration_name}, resetting")
+        await self.policy.reset_circuit_breaker(integration_id)
+
+    def _check_cooldown(self, integration_id: str, integration_name: str) -> None:
         """Check if cooldown period has passed since last attempt.
 
         Args:
@@ -222,38 +264,13 @@ class HealingManager:
         Raises:
             HealingFailedError: If cooldown period has not passed
         """
-        if integration_id in self._last_attempt:
-            last_attempt = self._last_attempt[integration_id]
-            cooldown = timedelta(seconds=self.config.healing.cooldown_seconds)
-            time_since_last = datetime.now(UTC) - last_attempt
-
-            if time_since_last < cooldown:
-                time_remaining = cooldown - time_since_last
-                raise HealingFailedError(
-                    f"Cooldown active for {integration_name}. "
-                    f"Retry in {time_remaining.total_seconds():.0f} seconds."
-                )
-
-    async def _get_next_attempt_number(self, entity_id: str, integration_id: str) -> int:
-        """Get the next attempt number for this entity/integration.
-
-        Args:
-            entity_id: Entity ID
-            integration_id: Integration entry ID
-
-        Returns:
-            Next attempt number (starts at 1)
-        """
-        async with self.database.async_session() as session:
-            # Count previous attempts for this entity and integration
-            result = await session.execute(
-                select(HealingAction).where(
-                    HealingAction.entity_id == entity_id,
-                    HealingAction.integration_id == integration_id,
-                )
+        cooldown = timedelta(seconds=self.config.healing.cooldown_seconds)
+        time_remaining = self.policy.cooldown_remaining(integration_id, cooldown)
+        if time_remaining is not None:
+            raise HealingFailedError(
+                f"Cooldown active for {integration_name}. "
+                f"Retry in {time_remaining.total_seconds():.0f} seconds."
             )
-            previous_attempts = result.scalars().all()
-            return len(previous_attempts) + 1
 
     async def _record_healing_action(
         self,
@@ -263,8 +280,9 @@ class HealingManager:
         success: bool,
         error: str | None,
         duration: float,
+        group_members: list[str] | None = None,
     ) -> None:
-        """Record healing action to database.
+        """Record healing action to database or the active cascade journal.
 
         Args:
             entity_id: Entity ID that was healed
@@ -273,110 +291,39 @@ class HealingManager:
             success: Whether healing succeeded
             error: Error message if failed
             duration: Duration in seconds
+            group_members: All entities covered by a coalesced reload
         """
+        action = HealingAction(
+            instance_id=self.ha_client.instance_id,
+            entity_id=entity_id,
+            integration_id=integration_id,
+            action="reload_integration",
+            attempt_number=attempt_number,
+            timestamp=datetime.now(UTC),
+            success=success,
+            error=error,
+            duration_seconds=duration,
+            group_members=group_members,
+        )
+        if journal_healing_action(action):
+            return
+
         async with self.database.async_session() as session:
-            action = HealingAction(
-                instance_id=self.ha_client.instance_id,
-                entity_id=entity_id,
-                integration_id=integration_id,
-                action="reload_integration",
-                attempt_number=attempt_number,
-                timestamp=datetime.now(UTC),
-                success=success,
-                error=error,
-                duration_seconds=duration,
-            )
             session.add(action)
             await session.commit()
 
-    async def _update_integration_success(self, integration_id: str) -> None:
-        """Update integration after successful healing.
-
-        Args:
-            integration_id: Integration entry ID
-        """
-        async with self.database.async_session() as session:
-            result = await session.execute(
-                select(Integration).where(
-                    Integration.instance_id == self.ha_client.instance_id,
-                    Integration.entry_id == integration_id,
-                )
-            )
-            integration = result.scalar_one_or_none()
-
-            if integration:
-                integration.last_successful_reload = datetime.now(UTC)
-                integration.consecutive_failures = 0
-                integration.circuit_breaker_open_until = None
-                await session.commit()
-
-    async def _update_integration_failure(self, integration_id: str, failure_count: int) -> None:
-        """Update integration after failed healing.
-
-        Args:
-            integration_id: Integration entry ID
-            failure_count: Current consecutive failure count
-        """
-        async with self.database.async_session() as session:
-            result = await session.execute(
-                select(Integration).where(
-                    Integration.instance_id == self.ha_client.instance_id,
-                    Integration.entry_id == integration_id,
-                )
-            )
-            integration = result.scalar_one_or_none()
-
-            if integration:
-                integration.consecutive_failures = failure_count
-                await session.commit()
-
-    async def _open_circuit_breaker(self, integration_id: str) -> None:
+    async def _open_circuit_breaker(self, integration_id: str, integration_name: str) -> None:
         """Open circuit breaker for an integration.
 
         Args:
             integration_id: Integration entry ID
+            integration_name: Human-readable integration name
         """
         reset_time = datetime.now(UTC) + timedelta(
             seconds=self.config.healing.circuit_breaker_reset_seconds
         )
-
-        async with self.database.async_session() as session:
-            result = await session.execute(
-                select(Integration).where(
-                    Integration.instance_id == self.ha_client.instance_id,
-                    Integration.entry_id == integration_id,
-                )
-            )
-            integration = result.scalar_one_or_none()
-
-            if integration:
-                integration.circuit_breaker_open_until = reset_time
-                await session.commit()
-
-                logger.warning(f"Circuit breaker opened for {integration.title} until {reset_time}")
-
-    async def _is_healing_suppressed(self, entity_id: str) -> bool:
-        """Check if healing is suppressed for an entity.
-
-        Args:
-            entity_id: Entity ID to check
-
-        Returns:
-            True if healing is suppressed, False otherwise
-        """
-        try:
-            async with self.database.async_session() as session:
-                result = await session.execute(
-                    select(Entity.healing_suppressed).where(
-                        Entity.instance_id == self.ha_client.instance_id,
-                        Entity.entity_id == entity_id,
-                    )
-                )
-                row = result.scalar_one_or_none()
-                return bool(row) if row is not None else False
-        except Exception as e:
-            logger.warning(f"Error checking healing suppression for {entity_id}: {e}")
-            return False
+        await self.policy.open_circuit_breaker(integration_id, reset_time)
+        logger.warning(f"Circuit breaker opened for {integration_name} until {reset_time}")
 
     async def can_heal(self, entity_id: str) -> tuple[bool, str]:
         """Check if entity can be healed (without attempting).
@@ -387,8 +334,10 @@ class HealingManager:
         Returns:
             Tuple of (can_heal: bool, reason: str)
         """
+        await self.policy.ensure_loaded()
+
         # Check if healing is suppressed
-        if await self._is_healing_suppressed(entity_id):
+        if self.policy.is_suppressed(entity_id):
             return False, "Healing is suppressed for this entity"
 
         # Check if integration is known
@@ -406,14 +355,10 @@ class HealingManager:
             return False, str(e)
 
         # Check cooldown
-        if integration_id in self._last_attempt:
-            last_attempt = self._last_attempt[integration_id]
-            cooldown = timedelta(seconds=self.config.healing.cooldown_seconds)
-            time_since_last = datetime.now(UTC) - last_attempt
-
-            if time_since_last < cooldown:
-                time_remaining = cooldown - time_since_last
-                return False, f"Cooldown active ({time_remaining.total_seconds():.0f}s remaining)"
+        cooldown = timedelta(seconds=self.config.healing.cooldown_seconds)
+        time_remaining = self.policy.cooldown_remaining(integration_id, cooldown)
+        if time_remaining is not None:
+            return False, f"Cooldown active ({time_remaining.total_seconds():.0f}s remaining)"
 
         return True, "Can heal"
 
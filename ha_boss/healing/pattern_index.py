@@ -0,0 +1,171 @@
+"""In-memory index of learned healing patterns for intelligent routing."""
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import select
+
+from ha_boss.core.database import AutomationOutcomePattern, Database
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PatternEntry:
+    """Healing outcome learned for one entity of an automation."""
+
+    automation_id: str
+    entity_id: str
+    successful_healing_level: str | None
+    successful_healing_strategy: str | None
+    healing_success_count: int
+    # Database ID (None until a pattern learned since startup is reloaded)
+    id: int | None = None
+
+
+class HealingPatternIndex:
+    """Learned healing patterns of one Home Assistant instance, keyed by entity.
+
+    Entries are keyed by (instance_id, automation_id, entity_id). The index is
+    warmed from ``AutomationOutcomePattern`` once, matching reads memory only,
+    and successes are applied incrementally as cascades finish. Persisting
+    them stays with the cascade journal.
+    """
+
+    def __init__(self, database: Database, instance_id: str = "default") -> None:
+        """Initialize healing pattern index.
+
+        Args:
+            database: Database manager for warming the index
+            instance_id: Home Assistant instance identifier
+        """
+        self.database = database
+        self.instance_id = instance_id
+        self.loaded = False
+
+        self.entries: dict[tuple[str, str, str], PatternEntry] = {}
+
+        # Statistics
+        self._lookups = 0
+        self._hits = 0
+
+    async def load(self) -> None:
+        """Load (or reload) learned patterns from the database."""
+        async with self.database.async_session() as session:
+            result = await session.execute(
+                select(
+                    AutomationOutcomePattern.id,
+                    AutomationOutcomePattern.automation_id,
+                    AutomationOutcomePattern.entity_id,
+                    AutomationOutcomePattern.successful_healing_level,
+                    AutomationOutcomePattern.successful_healing_strategy,
+                    AutomationOutcomePattern.healing_success_count,
+                ).where(AutomationOutcomePattern.instance_id == self.instance_id)
+            )
+            rows = result.all()
+
+        self.entries.clear()
+        for pattern_id, automation_id, entity_id, level, strategy, count in rows:
+            self.entries[(self.instance_id, automation_id, entity_id)] = PatternEntry(
+                automation_id=automation_id,
+                entity_id=entity_id,
+                successful_healing_level=level,
+                successful_healing_strategy=strategy,
+                healing_success_count=count or 0,
+                id=pattern_id,
+            )
+
+        self.loaded = True
+        logger.debug(f"[{self.instance_id}] Loaded {len(self.entries)} healing patterns")
+
+    async def ensure_loaded(self) -> None:
+        """Load patterns on first use."""
+        if not self.loaded:
+            await self.load()
+
+    def match(
+        self, instance_id: str, automation_id: str, entity_ids: list[str], threshold: int
+    ) -> PatternEntry | None:
+        """Find the strongest proven pattern among an automation's failed entities.
+
+        Args:
+            instance_id: Home Assistant instance identifier
+            automation_id: Automation ID
+            entity_ids: Failed entity IDs (all are considered)
+            threshold: Minimum healing success count
+
+        Returns:
+            Pattern with the highest success count, or None if none qualifies
+        """
+        self._lookups += 1
+        best: PatternEntry | None = None
+        for entity_id in entity_ids:
+            entry = self.entries.get((instance_id, automation_id, entity_id))
+            if (
+                entry is None
+                or entry.successful_healing_level is None
+                or entry.healing_success_count < threshold
+            ):
+                continue
+            if best is None or entry.healing_success_count > best.healing_success_count:
+                best = entry
+
+        if best is not None:
+            self._hits += 1
+        return best
+
+    def record_success(
+        self, instance_id: str, automation_id: str, entity_id: str, level: str, strategy: str
+    ) -> PatternEntry:
+        """Apply a successful healing of an entity.
+
+        Args:
+            instance_id: Home Assistant instance identifier
+            automation_id: Automation ID
+            entity_id: Healed entity ID
+            level: Successful healing level
+            strategy: Successful healing strategy
+
+        Returns:
+            Updated pattern entry
+        """
+        key = (instance_id, automation_id, entity_id)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = PatternEntry(
+                automation_id=automation_id,
+                entity_id=entity_id,
+                successful_healing_level=level,
+                successful_healing_strategy=strategy,
+                healing_success_count=1,
+            )
+            self.entries[key] = entry
+        else:
+            entry.successful_healing_level = level
+            entry.successful_healing_strategy = strategy
+            entry.healing_success_count += 1
+        return entry
+
+    def get_stats(self, threshold: int) -> dict[str, Any]:
+        """Get pattern index statistics.
+
+        Args:
+            threshold: Minimum healing success count for a pattern to be actionable
+
+        Returns:
+            Dictionary with pattern counts and lookup hit rate
+        """
+        return {
+            "loaded": self.loaded,
+            "patterns": len(self.entries),
+            "actionable_patterns": sum(
+                1
+                for entry in self.entries.values()
+                if entry.successful_healing_level is not None
+                and entry.healing_success_count >= threshold
+            ),
+            "lookups": self._lookups,
+            "hits": self._hits,
+            "hit_rate": round(self._hits / self._lookups, 4) if self._lookups > 0 else 0.0,
+        }
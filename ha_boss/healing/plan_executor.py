@@ -9,6 +9,7 @@ import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 
 from sqlalchemy import select
 
@@ -18,6 +19,9 @@ from ha_boss.healing.device_healer import DeviceHealer
 from ha_boss.healing.entity_healer import EntityHealer
 from ha_boss.healing.plan_models import HealingPlanDefinition, HealingStep
 
+if TYPE_CHECKING:
+    from ha_boss.monitoring.state_tracker import StateTracker
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +56,10 @@ class PlanExecutor:
     Each plan step is executed in order. If a step succeeds, execution
     stops early (the entity is healed). If a step fails, the next step
     is tried. After all steps, the overall result is recorded.
+
+    With a state tracker, each step also finishes as soon as all failed
+    entities report a real state again, without waiting for the healer's
+    own delays and verification to run out.
     """
 
     def __init__(
@@ -59,6 +67,7 @@ class PlanExecutor:
         database: Database,
         entity_healer: EntityHealer,
         device_healer: DeviceHealer,
+        state_tracker: "StateTracker | None" = None,
     ) -> None:
         """Initialize plan executor.
 
@@ -66,10 +75,12 @@ class PlanExecutor:
             database: Database for recording execution results
             entity_healer: Entity-level healer
             device_healer: Device-level healer
+            state_tracker: Optional state tracker used to end steps on recovery
         """
         self.database = database
         self.entity_healer = entity_healer
         self.device_healer = device_healer
+        self.state_tracker = state_tracker
 
     async def execute_plan(
         self,
@@ -106,7 +117,7 @@ class PlanExecutor:
 
             try:
                 success = await asyncio.wait_for(
-                    self._execute_step(step, context),
+                    self._run_step(step, context),
                     timeout=step.timeout_seconds,
                 )
             except TimeoutError:
@@ -199,6 +210,43 @@ class PlanExecutor:
 
         return result
 
+    async def _run_step(self, step: HealingStep, context: HealingContext) -> bool:
+        """Execute a step, ending early if the failed entities recover meanwhile.
+
+        Args:
+            step: Step to execute
+            context: Healing context
+
+        Returns:
+            True if the step succeeded or the entities recovered while it ran
+        """
+        if self.state_tracker is None or not context.failed_entities:
+            return await self._execute_step(step, context)
+
+        loop = asyncio.get_running_loop()
+        step_task = loop.create_task(self._execute_step(step, context))
+        recovery_task = loop.create_task(
+            self.state_tracker.wait_until_available(context.failed_entities)
+        )
+        try:
+            done, _ = await asyncio.wait(
+                {step_task, recovery_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            pending = [task for task in (step_task, recovery_task) if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if step_task in done:
+            return step_task.result()
+
+        logger.info(
+            f"All failed entities recovered during step '{step.name}' "
+            f"for {context.automation_id}, finishing early"
+        )
+        return True
+
     async def _execute_step(self, step: HealingStep, context: HealingContext) -> bool:
         """Execute a single plan step.
 
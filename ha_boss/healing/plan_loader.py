@@ -34,6 +34,9 @@ class PlanLoader:
     Plans are loaded from the filesystem on startup and synced to the
     database. The database copy is the runtime source of truth for
     enabled/disabled state and execution statistics.
+
+    :attr:`revision` changes whenever the loader changes stored plans, so
+    consumers that compile plans (PlanMatcher) know when to rebuild.
     """
 
     def __init__(
@@ -53,6 +56,12 @@ class PlanLoader:
         self.user_plans_dir = Path(user_plans_directory) if user_plans_directory else None
         self.use_builtin = use_builtin
         self._plans: dict[str, HealingPlanDefinition] = {}
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        """Counter incremented each time stored plans are changed by this loader."""
+        return self._revision
 
     async def load_all_plans(self) -> list[HealingPlanDefinition]:
         """Load all plans from filesystem and sync to database.
@@ -83,6 +92,7 @@ class PlanLoader:
 
         # Cache plans
         self._plans = {plan.name: plan for plan in plans}
+        self._revision += 1
 
         logger.info(f"Total plans loaded: {len(plans)}")
         return plans
@@ -228,13 +238,23 @@ class PlanLoader:
         Returns:
             List of enabled plan definitions sorted by priority
         """
+        return await self.get_all_plans(enabled_only=True)
+
+    async def get_all_plans(self, enabled_only: bool = False) -> list[HealingPlanDefinition]:
+        """Get stored plans sorted by priority (highest first).
+
+        Args:
+            enabled_only: Only return enabled plans
+
+        Returns:
+            List of plan definitions sorted by priority
+        """
         try:
             async with self.database.async_session() as session:
-                result = await session.execute(
-                    select(HealingPlan)
-                    .where(HealingPlan.enabled == True)  # noqa: E712
-                    .order_by(HealingPlan.priority.desc())
-                )
+                query = select(HealingPlan).order_by(HealingPlan.priority.desc())
+                if enabled_only:
+                    query = query.where(HealingPlan.enabled == True)  # noqa: E712
+                result = await session.execute(query)
                 db_plans = result.scalars().all()
 
                 plans = []
@@ -261,5 +281,27 @@ class PlanLoader:
                 return plans
 
         except Exception as e:
-            logger.error(f"Failed to load enabled plans from database: {e}", exc_info=True)
+            logger.error(f"Failed to load plans from database: {e}", exc_info=True)
             return []
+
+    async def set_plan_enabled(self, name: str, enabled: bool) -> None:
+        """Enable or disable a stored plan.
+
+        Args:
+            name: Plan name
+            enabled: New enabled state
+
+        Raises:
+            HealingPlanNotFoundError: If plan not found in the database
+        """
+        async with self.database.async_session() as session:
+            result = await session.execute(select(HealingPlan).where(HealingPlan.name == name))
+            db_plan = result.scalar_one_or_none()
+            if db_plan is None:
+                raise HealingPlanNotFoundError(f"Plan '{name}' not found")
+
+            db_plan.enabled = enabled
+            db_plan.updated_at = datetime.now(UTC)
+            await session.commit()
+
+        self._revision += 1
@@ -1,14 +1,26 @@
 """Match healing contexts to the best applicable healing plan.
 
 Uses fnmatch glob patterns for entity matching, consistent with the
-existing monitoring include/exclude patterns. Plans are evaluated in
-priority order (highest first), and the first matching plan wins.
+existing monitoring include/exclude patterns (compiled once via
+ha_boss.core.patterns). Plans are evaluated in priority order (highest
+first), and the first matching plan wins.
+
+Plans are compiled into a :class:`PlanIndex` that buckets them by failure
+type and integration domain, so matching does not touch the database and
+only tests the entity patterns of plausible candidates. The index is rebuilt
+when the plan loader syncs plans or when a plan is changed through the API.
 """
 
+import heapq
 import logging
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
-from fnmatch import fnmatch
+from operator import attrgetter
 
+from ha_boss.core.patterns import compile_globs
 from ha_boss.healing.cascade_orchestrator import HealingContext
 from ha_boss.healing.plan_loader import PlanLoader
 from ha_boss.healing.plan_models import HealingPlanDefinition, MatchCriteria
@@ -16,6 +28,105 @@ from ha_boss.healing.plan_models import HealingPlanDefinition, MatchCriteria
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _CompiledPlan:
+    """Enabled plan with its entity patterns precompiled."""
+
+    rank: int  # Position in priority order
+    plan: HealingPlanDefinition
+    entity_re: re.Pattern[str] | None
+
+    def matches(self, entities: list[str]) -> bool:
+        """Check the criteria not covered by the index buckets.
+
+        Args:
+            entities: Failed entity IDs
+
+        Returns:
+            True if entity patterns and time window are satisfied
+        """
+        if self.entity_re is not None:
+            if not any(self.entity_re.match(entity) for entity in entities):
+                return False
+
+        time_window = self.plan.match.time_window
+        if time_window:
+            current_hour = datetime.now().hour
+            if not (time_window.start_hour <= current_hour < time_window.end_hour):
+                return False
+
+        return True
+
+
+class PlanIndex:
+    """Enabled plans bucketed by failure type and integration domain.
+
+    Plans without failure types or integration domains are stored under the
+    ``None`` wildcard key. Each bucket keeps priority order, so candidates are
+    produced by merging a handful of buckets.
+    """
+
+    def __init__(self, plans: Iterable[HealingPlanDefinition]) -> None:
+        """Compile plans into the index.
+
+        Args:
+            plans: All known plans (disabled plans are kept for listing only)
+        """
+        # Stable sort keeps the loader's order among equal priorities
+        self.plans: list[HealingPlanDefinition] = sorted(plans, key=lambda p: -p.priority)
+
+        by_failure_type: defaultdict[str | None, list[_CompiledPlan]] = defaultdict(list)
+        by_key: defaultdict[tuple[str | None, str | None], list[_CompiledPlan]] = defaultdict(list)
+        self.enabled_count = 0
+        for plan in self.plans:
+            if not plan.enabled:
+                continue
+            compiled = _CompiledPlan(
+                rank=self.enabled_count,
+                plan=plan,
+                entity_re=compile_globs(tuple(plan.match.entity_patterns)),
+            )
+            self.enabled_count += 1
+            # None stands for "any" when the plan doesn't restrict the criterion
+            failure_types: list[str | None] = [*plan.match.failure_types] or [None]
+            domains: list[str | None] = [*plan.match.integration_domains] or [None]
+            for failure_type in failure_types:
+                by_failure_type[failure_type].append(compiled)
+                for domain in domains:
+                    by_key[(failure_type, domain)].append(compiled)
+
+        self._by_failure_type = dict(by_failure_type)
+        self._by_key = dict(by_key)
+
+    def candidates(self, failure_type: str, domains: set[str] | None) -> Iterator[_CompiledPlan]:
+        """Get plans whose failure type and integration criteria fit, by priority.
+
+        Args:
+            failure_type: Failure type of the context
+            domains: Integration domains of the failed entities, or None when
+                unknown (integration criteria are then ignored)
+
+        Yields:
+            Candidate plans in priority order
+        """
+        failure_types = (failure_type, None)
+        if domains is None:
+            buckets = [self._by_failure_type.get(ft, []) for ft in failure_types]
+        else:
+            buckets = [
+                self._by_key.get((ft, domain), [])
+                for ft in failure_types
+                for domain in (*domains, None)
+            ]
+
+        last_rank = -1
+        for compiled in heapq.merge(*buckets, key=attrgetter("rank")):
+            # A plan listed in several buckets comes out consecutively
+            if compiled.rank != last_rank:
+                last_rank = compiled.rank
+                yield compiled
+
+
 class PlanMatcher:
     """Match healing contexts to applicable healing plans.
 
@@ -31,6 +142,34 @@ class PlanMatcher:
             plan_loader: Loader providing access to plan definitions
         """
         self.plan_loader = plan_loader
+        self._index: PlanIndex | None = None
+        self._index_revision: int | None = None
+
+    @property
+    def plans(self) -> list[HealingPlanDefinition]:
+        """All plans of the current index in priority order (empty before first build)."""
+        return self._index.plans if self._index else []
+
+    async def refresh(self) -> PlanIndex:
+        """Rebuild the plan index from the stored plans.
+
+        Returns:
+            The new index
+        """
+        revision = self.plan_loader.revision
+        self._index = PlanIndex(await self.plan_loader.get_all_plans())
+        self._index_revision = revision
+        logger.debug(
+            f"Compiled plan index: {self._index.enabled_count} enabled of "
+            f"{len(self._index.plans)} plans"
+        )
+        return self._index
+
+    async def _get_index(self) -> PlanIndex:
+        """Get the plan index, rebuilding it if the loader changed plans."""
+        if self._index is None or self._index_revision != self.plan_loader.revision:
+            return await self.refresh()
+        return self._index
 
     async def find_matching_plan(
         self,
@@ -41,7 +180,11 @@ class PlanMatcher:
         """Find the best matching plan for a healing context.
 
         Plans are evaluated in priority order (highest first).
-        Returns the first plan that matches all specified criteria.
+        Returns the first plan that matches all specified criteria:
+        - entity_patterns: at least one failed entity matches a pattern
+        - integration_domains: at least one entity's integration matches
+        - failure_types: the failure type is in the list
+        - time_window: current hour is within the window
 
         Args:
             context: Healing context with failed entities and metadata
@@ -51,14 +194,23 @@ class PlanMatcher:
         Returns:
             Best matching plan or None if no plan matches
         """
-        plans = await self.plan_loader.get_all_enabled_plans()
+        index = await self._get_index()
 
-        if not plans:
+        if not index.enabled_count:
             logger.debug("No enabled plans available")
             return None
 
-        for plan in plans:
-            if self._plan_matches(plan, context, entity_integration_map, failure_type):
+        domains = (
+            {entity_integration_map.get(entity, "") for entity in context.failed_entities}
+            if entity_integration_map
+            else None
+        )
+
+        checked = 0
+        for compiled in index.candidates(failure_type, domains):
+            checked += 1
+            if compiled.matches(context.failed_entities):
+                plan = compiled.plan
                 logger.info(
                     f"Plan '{plan.name}' (priority={plan.priority}) matches "
                     f"context for {context.automation_id} "
@@ -67,99 +219,11 @@ class PlanMatcher:
                 return plan
 
         logger.debug(
-            f"No plan matched for {context.automation_id} " f"(checked {len(plans)} plans)"
+            f"No plan matched for {context.automation_id} "
+            f"(checked {checked} of {index.enabled_count} plans)"
         )
         return None
 
-    def _plan_matches(
-        self,
-        plan: HealingPlanDefinition,
-        context: HealingContext,
-        entity_integration_map: dict[str, str] | None,
-        failure_type: str,
-    ) -> bool:
-        """Check if a plan matches the given context.
-
-        A plan matches if ALL specified criteria are satisfied:
-        - entity_patterns: at least one failed entity matches a pattern
-        - integration_domains: at least one entity's integration matches
-        - failure_types: the failure type is in the list
-        - time_window: current hour is within the window
-
-        Args:
-            plan: Plan to check
-            context: Healing context
-            entity_integration_map: entity_id -> integration domain mapping
-            failure_type: Failure type string
-
-        Returns:
-            True if plan matches
-        """
-        match = plan.match
-
-        # Check failure types (if specified)
-        if match.failure_types and failure_type not in match.failure_types:
-            return False
-
-        # Check entity patterns (if specified)
-        if match.entity_patterns:
-            if not self._any_entity_matches_patterns(
-                context.failed_entities, match.entity_patterns
-            ):
-                return False
-
-        # Check integration domains (if specified)
-        if match.integration_domains and entity_integration_map:
-            if not self._any_entity_matches_integrations(
-                context.failed_entities,
-                match.integration_domains,
-                entity_integration_map,
-            ):
-                return False
-
-        # Check time window (if specified)
-        if match.time_window:
-            current_hour = datetime.now().hour
-            if not (match.time_window.start_hour <= current_hour < match.time_window.end_hour):
-                return False
-
-        return True
-
-    @staticmethod
-    def _any_entity_matches_patterns(entities: list[str], patterns: list[str]) -> bool:
-        """Check if any entity matches any of the glob patterns.
-
-        Args:
-            entities: List of entity IDs
-            patterns: List of fnmatch glob patterns
-
-        Returns:
-            True if at least one entity matches at least one pattern
-        """
-        return any(fnmatch(entity, pattern) for entity in entities for pattern in patterns)
-
-    @staticmethod
-    def _any_entity_matches_integrations(
-        entities: list[str],
-        domains: list[str],
-        entity_integration_map: dict[str, str],
-    ) -> bool:
-        """Check if any entity belongs to a matching integration domain.
-
-        Args:
-            entities: List of entity IDs
-            domains: List of integration domains
-            entity_integration_map: entity_id -> domain mapping
-
-        Returns:
-            True if at least one entity's integration matches
-        """
-        for entity in entities:
-            entity_domain = entity_integration_map.get(entity, "")
-            if entity_domain in domains:
-                return True
-        return False
-
     @staticmethod
     def match_criteria_to_dict(criteria: MatchCriteria) -> dict[str, object]:
         """Convert match criteria to a dict for API responses.
@@ -0,0 +1,252 @@
+"""In-memory healing policy state with write-through persistence."""
+
+import logging
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func, select, update
+
+from ha_boss.core.database import Database, Entity, HealingAction, Integration
+
+logger = logging.getLogger(__name__)
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite doesn't preserve timezone, so add UTC if naive
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+class HealingPolicyStore:
+    """Authoritative healing policy state of one Home Assistant instance.
+
+    Holds everything the heal decision depends on: suppressed entities,
+    circuit breaker deadlines and consecutive failures per integration, the
+    last attempt per integration (cooldown) and attempt counters per
+    entity/integration pair. The state is loaded from the database once, all
+    decisions read memory only, and every change is written through to the
+    database so a restart picks it up again.
+
+    Suppression is changed outside the healing manager (API), so callers that
+    update ``Entity.healing_suppressed`` must call :meth:`set_suppressed`.
+    """
+
+    def __init__(self, database: Database, instance_id: str = "default") -> None:
+        """Initialize healing policy store.
+
+        Args:
+            database: Database manager for loading and write-through
+            instance_id: Home Assistant instance identifier
+        """
+        self.database = database
+        self.instance_id = instance_id
+        self.loaded = False
+
+        self.suppressed: set[str] = set()
+        # integration_id -> circuit breaker deadline
+        self.circuit_open_until: dict[str, datetime] = {}
+        # integration_id -> consecutive failures
+        self.failure_count: dict[str, int] = {}
+        # integration_id -> last healing attempt (cooldown)
+        self.last_attempt: dict[str, datetime] = {}
+        # (entity_id, integration_id) -> attempts recorded so far
+        self.attempt_count: Counter[tuple[str, str]] = Counter()
+
+    async def load(self) -> None:
+        """Load (or reload) policy state from the database.
+
+        Containers are refilled in place so references held elsewhere stay valid.
+        """
+        async with self.database.async_session() as session:
+            suppressed = await session.execute(
+                select(Entity.entity_id).where(
+                    Entity.instance_id == self.instance_id,
+                    Entity.healing_suppressed.is_(True),
+                )
+            )
+            integrations = await session.execute(
+                select(
+                    Integration.entry_id,
+                    Integration.consecutive_failures,
+                    Integration.circuit_breaker_open_until,
+                ).where(Integration.instance_id == self.instance_id)
+            )
+            attempts = await session.execute(
+                select(
+                    HealingAction.entity_id,
+                    HealingAction.integration_id,
+                    func.count(HealingAction.id),
+                    func.max(HealingAction.timestamp),
+                )
+                .where(
+                    HealingAction.instance_id == self.instance_id,
+                    HealingAction.integration_id.is_not(None),
+                )
+                .group_by(HealingAction.entity_id, HealingAction.integration_id)
+            )
+
+            self.suppressed.clear()
+            self.suppressed.update(suppressed.scalars().all())
+
+            self.circuit_open_until.clear()
+            self.failure_count.clear()
+            for entry_id, failures, open_until in integrations.all():
+                if failures:
+                    self.failure_count[entry_id] = failures
+                if open_until is not None:
+                    self.circuit_open_until[entry_id] = _aware(open_until)
+
+            self.attempt_count.clear()
+            self.last_attempt.clear()
+            for entity_id, integration_id, count, last in attempts.all():
+                if integration_id is None:
+                    continue  # Excluded by the query; narrows the type
+                self.attempt_count[(entity_id, integration_id)] = count
+                last = _aware(last)
+                previous = self.last_attempt.get(integration_id)
+                if previous is None or last > previous:
+                    self.last_attempt[integration_id] = last
+
+        self.loaded = True
+        logger.debug(
+            f"[{self.instance_id}] Loaded healing policy state: "
+            f"{len(self.suppressed)} suppressed entities, "
+            f"{len(self.circuit_open_until)} circuit breakers, "
+            f"{len(self.last_attempt)} integrations with prior attempts"
+        )
+
+    async def ensure_loaded(self) -> None:
+        """Load policy state on first use."""
+        if not self.loaded:
+            await self.load()
+
+    # Decisions (memory only)
+
+    def is_suppressed(self, entity_id: str) -> bool:
+        """Check whether healing is suppressed for an entity."""
+        return entity_id in self.suppressed
+
+    def circuit_breaker_remaining(
+        self, integration_id: str, now: datetime | None = None
+    ) -> timedelta | None:
+        """Get the time until an integration's circuit breaker closes.
+
+        Args:
+            integration_id: Integration entry ID
+            now: Current time (default: now)
+
+        Returns:
+            Remaining time if the breaker is open, zero if its deadline has
+            passed (it should be reset), None if no breaker is set
+        """
+        open_until = self.circuit_open_until.get(integration_id)
+        if open_until is None:
+            return None
+        return max(open_until - (now or datetime.now(UTC)), timedelta(0))
+
+    def cooldown_remaining(
+        self, integration_id: str, cooldown: timedelta, now: datetime | None = None
+    ) -> timedelta | None:
+        """Get the cooldown left before an integration may be healed again.
+
+        Args:
+            integration_id: Integration entry ID
+            cooldown: Required time between attempts
+            now: Current time (default: now)
+
+        Returns:
+            Remaining cooldown, or None if the integration may be healed
+        """
+        last_attempt = self.last_attempt.get(integration_id)
+        if last_attempt is None:
+            return None
+        since = (now or datetime.now(UTC)) - last_attempt
+        return cooldown - since if since < cooldown else None
+
+    def next_attempt_number(self, entity_id: str, integration_id: str) -> int:
+        """Get the next attempt number for an entity/integration pair (starts at 1)."""
+        return self.attempt_count[(entity_id, integration_id)] + 1
+
+    # Changes (memory, then database)
+
+    def record_attempt(self, entity_id: str, integration_id: str, when: datetime) -> None:
+        """Count an attempt and start the integration's cooldown.
+
+        The attempt itself is persisted as a ``HealingAction`` row by the caller.
+        """
+        self.attempt_count[(entity_id, integration_id)] += 1
+        self.last_attempt[integration_id] = when
+
+    def set_suppressed(self, entity_id: str, suppressed: bool) -> None:
+        """Apply a suppression change already committed to the database.
+
+        Args:
+            entity_id: Entity ID
+            suppressed: New suppression flag
+        """
+        if suppressed:
+            self.suppressed.add(entity_id)
+        else:
+            self.suppressed.discard(entity_id)
+
+    async def record_success(self, integration_id: str) -> None:
+        """Reset failures and close the circuit breaker after a successful reload."""
+        self.failure_count[integration_id] = 0
+        self.circuit_open_until.pop(integration_id, None)
+        await self._persist(
+            integration_id,
+            last_successful_reload=datetime.now(UTC),
+            consecutive_failures=0,
+            circuit_breaker_open_until=None,
+        )
+
+    async def record_failure(self, integration_id: str) -> int:
+        """Count a failed reload.
+
+        Returns:
+            Consecutive failures of the integration
+        """
+        failures = self.failure_count.get(integration_id, 0) + 1
+        self.failure_count[integration_id] = failures
+        await self._persist(integration_id, consecutive_failures=failures)
+        return failures
+
+    async def open_circuit_breaker(self, integration_id: str, until: datetime) -> None:
+        """Open an integration's circuit breaker until the given time."""
+        self.circuit_open_until[integration_id] = until
+        await self._persist(integration_id, circuit_breaker_open_until=until)
+
+    async def reset_circuit_breaker(self, integration_id: str) -> None:
+        """Close an expired circuit breaker and clear the failure count."""
+        self.circuit_open_until.pop(integration_id, None)
+        self.failure_count[integration_id] = 0
+        await self._persist(integration_id, circuit_breaker_open_until=None, consecutive_failures=0)
+
+    async def _persist(self, integration_id: str, **values: Any) -> None:
+        async with self.database.async_session() as session:
+            await session.execute(
+                update(Integration)
+                .where(
+                    Integration.instance_id == self.instance_id,
+                    Integration.entry_id == integration_id,
+                )
+                .values(**values)
+            )
+            await session.commit()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get policy state statistics.
+
+        Returns:
+            Dictionary with suppressed entity, open circuit breaker and tracked
+            integration counts
+        """
+        now = datetime.now(UTC)
+        return {
+            "loaded": self.loaded,
+            "suppressed_entities": len(self.suppressed),
+            "circuit_breakers_open": sum(
+                1 for until in self.circuit_open_until.values() if until > now
+            ),
+            "integrations_tracked": len(self.last_attempt),
+        }
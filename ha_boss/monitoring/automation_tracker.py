@@ -13,6 +13,7 @@ from ha_boss.core.ha_client import HomeAssistantClient
 if TYPE_CHECKING:
     from ha_boss.automation.health_tracker import AutomationHealthTracker
     from ha_boss.healing.cascade_orchestrator import CascadeOrchestrator
+    from ha_boss.monitoring.state_tracker import StateTracker
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,7 @@ class AutomationTracker:
         config: Config | None = None,
         cascade_orchestrator: "CascadeOrchestrator | None" = None,
         health_tracker: "AutomationHealthTracker | None" = None,
+        state_tracker: "StateTracker | None" = None,
     ):
         """Initialize automation tracker.
 
@@ -43,6 +45,7 @@ class AutomationTracker:
             config: Configuration for outcome validation (optional)
             cascade_orchestrator: CascadeOrchestrator for cascading healing (optional)
             health_tracker: AutomationHealthTracker for health tracking (optional)
+            state_tracker: StateTracker serving recent transitions to validation (optional)
         """
         self.instance_id = instance_id
         self.database = database
@@ -50,7 +53,9 @@ class AutomationTracker:
         self.config = config
         self.cascade_orchestrator = cascade_orchestrator
         self.health_tracker = health_tracker
-        self._validators: list[OutcomeValidator] = []  # Track validators for cleanup
+        self.state_tracker = state_tracker
+        # Shared by all executions so overlapping validations batch their history queries
+        self._validator: OutcomeValidator | None = None
         logger.debug(f"[{instance_id}] AutomationTracker initialized")
 
     async def record_execution(
@@ -177,18 +182,18 @@ class AutomationTracker:
         await asyncio.sleep(delay)
 
         try:
-            validator = OutcomeValidator(
-                database=self.database,
-                ha_client=self.ha_client,
-                instance_id=self.instance_id,
-                cascade_orchestrator=self.cascade_orchestrator,
-                health_tracker=self.health_tracker,
-                config=self.config,
-            )
-            # Track validator for cleanup
-            self._validators.append(validator)
+            if self._validator is None:
+                self._validator = OutcomeValidator(
+                    database=self.database,
+                    ha_client=self.ha_client,
+                    instance_id=self.instance_id,
+                    cascade_orchestrator=self.cascade_orchestrator,
+                    health_tracker=self.health_tracker,
+                    config=self.config,
+                    state_tracker=self.state_tracker,
+                )
 
-            result = await validator.validate_execution(
+            result = await self._validator.validate_execution(
                 execution_id=execution_id,
                 validation_window_seconds=delay,
             )
@@ -218,14 +223,16 @@ class AutomationTracker:
             )
 
     async def cleanup(self) -> None:
-        """Clean up all validators and their background tasks.
+        """Clean up the validator and its background tasks.
 
         This method should be called during service shutdown to ensure
         all background cascade tasks complete gracefully.
         """
-        if self._validators:
-            logger.debug(f"[{self.instance_id}] Cleaning up {len(self._validators)} validators")
-            cleanup_tasks = [validator.cleanup() for validator in self._validators]
-            await asyncio.gather(*cleanup_tasks, return_exceptions=True)
-            self._validators.clear()
+        if self._validator is not None:
+            logger.debug(f"[{self.instance_id}] Cleaning up validator")
+            try:
+                await self._validator.cleanup()
+            except Exception as e:
+                logger.error(f"[{self.instance_id}] Validator cleanup failed: {e}")
+            self._validator = None
             logger.debug(f"[{self.instance_id}] Validator cleanup complete")
@@ -0,0 +1,280 @@
+"""Pluggable decoding of Home Assistant WebSocket frames.
+
+Every frame used to be decoded with ``json.loads`` into complete dicts, even
+though ``state_changed`` consumers only need entity_id, state, last_updated and
+context from ``new_state``; the bulky ``attributes`` and the entire
+``old_state`` are rarely read. Decoders produce the same message shape the
+client always handled, but pick the fastest available backend:
+
+- ``msgspec``: ``state_changed`` events are decoded into typed structs.
+  ``attributes`` and ``old_state`` are kept as raw JSON bytes and wrapped in
+  ``LazyJSON`` mappings that are parsed only when first read.
+- ``orjson``: Full decode with orjson (no lazy attributes).
+- ``json``: Standard library fallback.
+
+Install the optional extra (``pip install ha-boss[fast]``) to enable the fast
+backends.
+"""
+
+import json
+import logging
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any, Literal
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on installed extras
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+DecoderBackend = Literal["auto", "msgspec", "orjson", "json"]
+
+
+class LazyJSON(Mapping[str, Any]):
+    """Read-only mapping backed by raw JSON that is parsed on first access.
+
+    Keys in ``peek_keys`` (e.g. ``friendly_name``, read for every persisted
+    state) are served by ``peek``, a cheaper decoder that extracts only those
+    keys, so reading them does not materialize the whole payload.
+    """
+
+    __slots__ = ("_raw", "_loads", "_data", "_peek", "_peek_keys", "_peeked")
+
+    def __init__(
+        self,
+        raw: bytes,
+        loads: Callable[[bytes], Any],
+        peek: Callable[[bytes], dict[str, Any]] | None = None,
+        peek_keys: frozenset[str] = frozenset(),
+    ) -> None:
+        """Initialize lazy mapping.
+
+        Args:
+            raw: Raw JSON object bytes
+            loads: Function used to parse ``raw`` on first full access
+            peek: Function extracting only ``peek_keys`` from ``raw``
+            peek_keys: Keys answered by ``peek`` while not fully parsed
+        """
+        self._raw = raw
+        self._loads = loads
+        self._data: dict[str, Any] | None = None
+        self._peek = peek
+        self._peek_keys = peek_keys
+        self._peeked: dict[str, Any] | None = None
+
+    @property
+    def raw(self) -> bytes:
+        """Raw JSON bytes of the mapping."""
+        return self._raw
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the raw JSON has been fully parsed."""
+        return self._data is not None
+
+    def _load(self) -> dict[str, Any]:
+        if self._data is None:
+            data = self._loads(self._raw)
+            self._data = data if isinstance(data, dict) else {}
+        return self._data
+
+    def _lookup(self, key: str) -> dict[str, Any]:
+        """Return the cheapest parsed view that can answer ``key``."""
+        if self._data is None and self._peek is not None and key in self._peek_keys:
+            if self._peeked is None:
+                self._peeked = self._peek(self._raw)
+            return self._peeked
+        return self._load()
+
+    def __getitem__(self, key: str) -> Any:
+        return self._lookup(key)[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._lookup(key).get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._load()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __repr__(self) -> str:
+        if self._data is None:
+            return f"<LazyJSON ({len(self._raw)} bytes, not loaded)>"
+        return f"<LazyJSON {self._data!r}>"
+
+
+class EventDecoder:
+    """Decoder for raw WebSocket frames using a selectable JSON backend."""
+
+    def __init__(self, backend: DecoderBackend = "auto") -> None:
+        """Initialize decoder.
+
+        Args:
+            backend: "msgspec", "orjson", "json", or "auto" (fastest installed)
+
+        Raises:
+            ValueError: Requested backend is not installed
+        """
+        if backend == "auto":
+            backend = "msgspec" if msgspec else "orjson" if orjson else "json"
+        elif backend == "msgspec" and msgspec is None:
+            raise ValueError("msgspec decoder requested but msgspec is not installed")
+        elif backend == "orjson" and orjson is None:
+            raise ValueError("orjson decoder requested but orjson is not installed")
+
+        self.backend: str = backend
+        self.frames_decoded = 0
+        self._decode: Callable[[str | bytes], dict[str, Any]]
+
+        if backend == "msgspec":
+            self._decode = _MsgspecDecoder().decode
+        elif backend == "orjson":
+            self._decode = orjson.loads
+        else:
+            self._decode = json.loads
+
+        logger.debug(f"WebSocket frame decoder: {self.backend}")
+
+    def decode(self, frame: str | bytes) -> dict[str, Any]:
+        """Decode a WebSocket frame into a message dict.
+
+        Args:
+            frame: Raw text or binary frame
+
+        Returns:
+            Decoded message
+
+        Raises:
+            ValueError: Frame is not valid JSON (all backends raise a subclass)
+        """
+        message = self._decode(frame)
+        self.frames_decoded += 1
+        return message
+
+
+if msgspec is not None:
+
+    class _Context(msgspec.Struct):
+        id: str | None = None
+        parent_id: str | None = None
+        user_id: str | None = None
+
+    class _AttributeHead(msgspec.Struct):
+        friendly_name: str | None = None
+
+    class _NewState(msgspec.Struct):
+        entity_id: str = ""
+        state: str | None = None
+        last_changed: str | None = None
+        last_updated: str | None = None
+        attributes: msgspec.Raw = msgspec.Raw(b"{}")
+        context: _Context | None = None
+
+    class _StateChangedData(msgspec.Struct):
+        entity_id: str = ""
+        old_state: msgspec.Raw = msgspec.Raw(b"null")
+        new_state: _NewState | None = None
+
+    class _Event(msgspec.Struct):
+        event_type: str = ""
+        data: _StateChangedData | None = None
+
+    class _Envelope(msgspec.Struct):
+        type: str = ""
+        id: int | None = None
+        event: _Event | None = None
+
+
+class _MsgspecDecoder:
+    """Typed msgspec decoding with lazy attributes for state_changed events.
+
+    Frames are decoded in a single typed pass that assumes a state_changed
+    payload (unknown fields are skipped without allocation). Other event types
+    and non-event messages are decoded generically in a second pass; they are a
+    small fraction of the stream.
+    """
+
+    PEEK_KEYS = frozenset({"friendly_name"})
+
+    def __init__(self) -> None:
+        self._typed = msgspec.json.Decoder(_Envelope)
+        self._generic = msgspec.json.Decoder()
+        self._attribute_head = msgspec.json.Decoder(_AttributeHead)
+
+    def decode(self, frame: str | bytes) -> dict[str, Any]:
+        try:
+            envelope = self._typed.decode(frame)
+        except msgspec.ValidationError:
+            # Valid JSON that does not fit the state_changed shape
+            return self._generic.decode(frame)  # type: ignore[no-any-return]
+
+        event = envelope.event
+        if event is None or event.event_type != "state_changed" or event.data is None:
+            return self._generic.decode(frame)  # type: ignore[no-any-return]
+
+        return {
+            "type": envelope.type,
+            "id": envelope.id,
+            "event": {"event_type": event.event_type, "data": self._state_changed(event.data)},
+        }
+
+    def _peek_attributes(self, raw: bytes) -> dict[str, Any]:
+        head = self._attribute_head.decode(raw)
+        return {} if head.friendly_name is None else {"friendly_name": head.friendly_name}
+
+    def _state_changed(self, data: "_StateChangedData") -> dict[str, Any]:
+        old_raw = bytes(data.old_state)
+        new_state = data.new_state
+
+        new_state_dict: dict[str, Any] | None = None
+        if new_state is not None:
+            context = new_state.context
+            new_state_dict = {
+                "entity_id": new_state.entity_id or data.entity_id,
+                "state": new_state.state,
+                "last_changed": new_state.last_changed,
+                "last_updated": new_state.last_updated,
+                "attributes": LazyJSON(
+                    bytes(new_state.attributes),
+                    self._generic.decode,
+                    peek=self._peek_attributes,
+                    peek_keys=self.PEEK_KEYS,
+                ),
+                "context": (
+                    {"id": context.id, "parent_id": context.parent_id, "user_id": context.user_id}
+                    if context
+                    else None
+                ),
+            }
+
+        return {
+            "entity_id": data.entity_id,
+            "old_state": None if old_raw == b"null" else LazyJSON(old_raw, self._generic.decode),
+            "new_state": new_state_dict,
+        }
+
+
+def create_event_decoder(backend: DecoderBackend = "auto") -> EventDecoder:
+    """Create a frame decoder, falling back to the standard library if unavailable.
+
+    Args:
+        backend: Preferred backend
+
+    Returns:
+        Event decoder
+    """
+    try:
+        return EventDecoder(backend)
+    except ValueError as e:
+        logger.warning(f"{e}, falling back to automatic decoder selection")
+        return EventDecoder("auto")
@@ -0,0 +1,232 @@
+"""Bounded event queues with dedicated workers for WebSocket event processing."""
+
+import asyncio
+import itertools
+import logging
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Hashable
+from typing import Any, Literal
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["coalesce", "drop"]
+
+
+class EventChannel:
+    """Bounded queue for one event type, processed by dedicated worker tasks.
+
+    Events are partitioned across workers by key (e.g. entity_id), so events for
+    the same key are always handled by the same worker, in arrival order.
+    ``put`` never blocks, which keeps the WebSocket reader responsive.
+
+    Overflow policies:
+    - ``coalesce``: A new event for a key that is still pending replaces the
+      pending payload (latest state wins, original queue position kept). When
+      the queue is full, events for new keys are dropped.
+    - ``drop``: Every event is queued individually; when the queue is full, new
+      events are dropped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Coroutine[Any, Any, None]],
+        max_size: int = 10000,
+        workers: int = 1,
+        overflow: OverflowPolicy = "drop",
+        key_func: Callable[[Any], Hashable | None] | None = None,
+        on_drop: Callable[[Any], None] | None = None,
+    ) -> None:
+        """Initialize event channel.
+
+        Args:
+            name: Channel name used in logs and metrics (usually the event type)
+            handler: Async handler called for each event
+            max_size: Maximum pending events across all partitions
+            workers: Number of worker tasks (partitions)
+            overflow: Overflow policy ("coalesce" or "drop")
+            key_func: Returns the ordering/coalescing key for an event (None = no key)
+            on_drop: Called with each event dropped because the queue is full, so
+                consumers that must not miss events can resynchronize
+        """
+        self.name = name
+        self.handler = handler
+        self.max_size = max_size
+        self.workers = max(1, workers)
+        self.overflow = overflow
+        self.key_func = key_func
+        self.on_drop = on_drop
+
+        # One pending map per worker: key -> (enqueued_at, event)
+        self._partitions: list[OrderedDict[Hashable, tuple[float, Any]]] = [
+            OrderedDict() for _ in range(self.workers)
+        ]
+        self._ready = [asyncio.Event() for _ in range(self.workers)]
+        self._tasks: list[asyncio.Task[None]] = []
+        self._seq = itertools.count()
+        self._depth = 0
+
+        # Metrics
+        self._enqueued = 0
+        self._processed = 0
+        self._coalesced = 0
+        self._dropped = 0
+        self._errors = 0
+        self._max_depth = 0
+        self._lag_total = 0.0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Number of events waiting to be processed."""
+        return self._depth
+
+    def start(self) -> None:
+        """Start worker tasks (no-op if already running)."""
+        if self._tasks:
+            return
+        loop = asyncio.get_running_loop()
+        for index in range(self.workers):
+            task = loop.create_task(self._worker(index))
+            task.set_name(f"event_channel_{self.name}_{index}")
+            self._tasks.append(task)
+
+    async def stop(self, drain_timeout: float = 5.0) -> None:
+        """Stop workers, first giving them a bounded time to drain pending events.
+
+        Args:
+            drain_timeout: Seconds to wait for pending events before cancelling
+        """
+        if not self._tasks:
+            return
+
+        deadline = time.monotonic() + drain_timeout
+        while self._depth and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        if self._depth:
+            logger.warning(f"Event channel {self.name} stopped with {self._depth} pending events")
+
+    def put(self, event: Any) -> bool:
+        """Queue an event without blocking.
+
+        Args:
+            event: Event payload passed to the handler
+
+        Returns:
+            True if queued or coalesced, False if dropped because the queue is full
+        """
+        key = self.key_func(event) if self.key_func else None
+        partition_index = self._partition_for(key)
+        partition = self._partitions[partition_index]
+
+        if self.overflow == "coalesce" and key is not None and key in partition:
+            enqueued_at, _ = partition[key]
+            partition[key] = (enqueued_at, event)
+            self._coalesced += 1
+            return True
+
+        if self._depth >= self.max_size:
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 1000 == 0:
+                logger.warning(
+                    f"Event channel {self.name} full ({self.max_size}), "
+                    f"dropped {self._dropped} events so far"
+                )
+            if self.on_drop is not None:
+                try:
+                    self.on_drop(event)
+                except Exception as e:
+                    logger.error(f"Error in {self.name} drop handler: {e}", exc_info=True)
+            return False
+
+        # Without coalescing each event needs a unique slot; order within the
+        # partition is still arrival order
+        slot: Hashable = key if self.overflow == "coalesce" and key is not None else next(self._seq)
+        partition[slot] = (time.monotonic(), event)
+        self._depth += 1
+        self._enqueued += 1
+        self._max_depth = max(self._max_depth, self._depth)
+        self._ready[partition_index].set()
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue depth, throughput and lag metrics.
+
+        Returns:
+            Dictionary of channel metrics (lag in milliseconds)
+        """
+        avg_lag = self._lag_total / self._processed if self._processed else 0.0
+        return {
+            "workers": self.workers,
+            "overflow": self.overflow,
+            "depth": self._depth,
+            "max_depth": self._max_depth,
+            "max_size": self.max_size,
+            "enqueued": self._enqueued,
+            "processed": self._processed,
+            "coalesced": self._coalesced,
+            "dropped": self._dropped,
+            "errors": self._errors,
+            "last_lag_ms": round(self._last_lag * 1000, 2),
+            "avg_lag_ms": round(avg_lag * 1000, 2),
+            "max_lag_ms": round(self._max_lag * 1000, 2),
+        }
+
+    def _partition_for(self, key: Hashable | None) -> int:
+        """Pick the worker partition for a key.
+
+        Args:
+            key: Event key (None = any partition)
+
+        Returns:
+            Partition index
+        """
+        if self.workers == 1:
+            return 0
+        if key is None:
+            # Unkeyed events have no ordering requirement: use the shortest partition
+            return min(range(self.workers), key=lambda i: len(self._partitions[i]))
+        # Stable across runs (unlike hash() for strings)
+        return zlib.crc32(str(key).encode()) % self.workers
+
+    async def _worker(self, index: int) -> None:
+        """Process events of one partition in order.
+
+        Args:
+            index: Partition index
+        """
+        partition = self._partitions[index]
+        ready = self._ready[index]
+
+        while True:
+            if not partition:
+                ready.clear()
+                await ready.wait()
+                continue
+
+            _, (enqueued_at, event) = partition.popitem(last=False)
+            self._depth -= 1
+
+            lag = time.monotonic() - enqueued_at
+            self._last_lag = lag
+            self._lag_total += lag
+            self._max_lag = max(self._max_lag, lag)
+
+            try:
+                await self.handler(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._errors += 1
+                logger.error(f"Error processing {self.name} event: {e}", exc_info=True)
+            finally:
+                self._processed += 1
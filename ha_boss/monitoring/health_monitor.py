@@ -1,7 +1,8 @@
 """Health monitoring for Home Assistant entities."""
 
 import asyncio
-import fnmatch
+import heapq
+import itertools
 import logging
 from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime, timedelta
@@ -10,6 +11,7 @@ from typing import Any
 from ha_boss.core.config import Config
 from ha_boss.core.database import Database, HealthEvent
 from ha_boss.core.exceptions import DatabaseError
+from ha_boss.core.patterns import EntityPatternMatcher
 from ha_boss.core.types import HealthIssue
 from ha_boss.monitoring.state_tracker import EntityState, StateTracker
 
@@ -25,6 +27,12 @@ class HealthMonitor:
     - Stale entities (no updates for configured threshold)
 
     Respects grace periods to avoid false positives from transient issues.
+
+    Instead of rescanning every entity on a fixed interval, the monitor keeps a
+    min-heap of per-entity deadlines (when a healthy entity would turn stale, or
+    when an issue's grace period expires). State changes from the StateTracker
+    mark entities dirty, so the loop only wakes for changed entities and
+    deadlines that have actually passed.
     """
 
     def __init__(
@@ -54,6 +62,21 @@ class HealthMonitor:
         # Track previously reported issues to avoid duplicate notifications
         self._reported_issues: set[str] = set()  # entity_id
 
+        # Deadline scheduler: heap of (deadline_epoch, seq, entity_id). A heap entry is
+        # only valid while it matches _deadlines[entity_id] (lazy deletion).
+        self._deadline_heap: list[tuple[float, int, str]] = []
+        self._deadlines: dict[str, float] = {}
+        self._heap_seq = itertools.count()
+
+        # Entities changed since the last wake-up, fed by StateTracker updates
+        self._dirty: set[str] = set()
+        self._wakeup = asyncio.Event()
+
+        # Compiled include/exclude patterns with memoized per-entity verdicts
+        self.pattern_matcher = EntityPatternMatcher(
+            include=config.monitoring.include, exclude=config.monitoring.exclude
+        )
+
         # Monitoring task
         self._monitor_task: asyncio.Task[None] | None = None
         self._running = False
@@ -61,12 +84,14 @@ class HealthMonitor:
     async def start(self) -> None:
         """Start health monitoring loop."""
         self._running = True
+        self.state_tracker.add_listener(self._on_state_changed)
         self._monitor_task = asyncio.create_task(self._monitor_loop())
         logger.info("Health monitor started")
 
     async def stop(self) -> None:
         """Stop health monitoring loop."""
         self._running = False
+        self.state_tracker.remove_listener(self._on_state_changed)
         if self._monitor_task and not self._monitor_task.done():
             self._monitor_task.cancel()
             try:
@@ -76,19 +101,29 @@ class HealthMonitor:
         logger.info("Health monitor stopped")
 
     async def _monitor_loop(self) -> None:
-        """Main monitoring loop - periodically checks entity health."""
+        """Main monitoring loop - wakes on state changes and expired deadlines."""
+        # Seed the scheduler with one full pass; afterwards only dirty entities
+        # and entities whose deadline has passed are evaluated
+        try:
+            await self._check_all_entities()
+        except Exception as e:
+            logger.error(f"Error in health monitoring loop: {e}", exc_info=True)
+
         while self._running:
+            timeout = self._time_until_next_deadline()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+
             try:
-                await self._check_all_entities()
+                await self._process_due_entities()
             except Exception as e:
                 logger.error(f"Error in health monitoring loop: {e}", exc_info=True)
 
-            # Sleep until next check (use a fraction of grace period)
-            check_interval = max(30, self.config.monitoring.grace_period_seconds // 2)
-            await asyncio.sleep(check_interval)
-
     async def _check_all_entities(self) -> None:
-        """Check health of all monitored entities."""
+        """Check health of all monitored entities and schedule their deadlines."""
         all_states = await self.state_tracker.get_all_states()
 
         for entity_id, entity_state in all_states.items():
@@ -97,6 +132,104 @@ class HealthMonitor:
                 continue
 
             await self._check_entity_health(entity_state)
+            self._schedule_next_deadline(entity_state)
+
+    def _on_state_changed(self, new_state: EntityState, old_state: EntityState | None) -> None:
+        """StateTracker listener: mark entity for re-evaluation and wake the loop.
+
+        Args:
+            new_state: Updated entity state
+            old_state: Previous entity state (if any)
+        """
+        self._dirty.add(new_state.entity_id)
+        self._wakeup.set()
+
+    async def _process_due_entities(self) -> None:
+        """Evaluate entities that changed or whose deadline has expired."""
+        due = self._dirty
+        self._dirty = set()
+
+        now = datetime.now(UTC).timestamp()
+        while self._deadline_heap and self._deadline_heap[0][0] <= now:
+            deadline, _, entity_id = heapq.heappop(self._deadline_heap)
+            if self._deadlines.get(entity_id) == deadline:
+                del self._deadlines[entity_id]
+                due.add(entity_id)
+
+        for entity_id in due:
+            if not self._should_monitor_entity(entity_id):
+                continue
+
+            entity_state = await self.state_tracker.get_state(entity_id)
+            if entity_state is None:
+                # Entity removed from cache - stop tracking it
+                self._forget_entity(entity_id)
+                continue
+
+            await self._check_entity_health(entity_state)
+            self._schedule_next_deadline(entity_state)
+
+    def _schedule_next_deadline(self, entity_state: EntityState) -> None:
+        """Schedule the next time this entity needs to be re-evaluated.
+
+        Healthy entities are scheduled for when they would become stale; entities
+        with an unreported issue are scheduled for the end of their grace period.
+        Entities with a reported issue wait for a state change to recover.
+
+        Args:
+            entity_state: Current entity state
+        """
+        entity_id = entity_state.entity_id
+        tracked = self._issue_tracker.get(entity_id)
+
+        if tracked is None:
+            deadline_ts = (
+                entity_state.last_updated_ts + self.config.monitoring.stale_threshold_seconds
+            )
+        elif entity_id not in self._reported_issues:
+            deadline_ts = (
+                tracked[1] + timedelta(seconds=self.config.monitoring.grace_period_seconds)
+            ).timestamp()
+        else:
+            return
+
+        current = self._deadlines.get(entity_id)
+        if current is not None and current <= deadline_ts:
+            # An earlier wake-up is already pending; it will reschedule on expiry.
+            # This keeps frequently-updating entities from flooding the heap.
+            return
+
+        self._deadlines[entity_id] = deadline_ts
+        heapq.heappush(self._deadline_heap, (deadline_ts, next(self._heap_seq), entity_id))
+        self._compact_heap()
+
+    def _forget_entity(self, entity_id: str) -> None:
+        """Drop all scheduling and issue tracking for an entity.
+
+        Args:
+            entity_id: Entity identifier
+        """
+        self._deadlines.pop(entity_id, None)
+        self._issue_tracker.pop(entity_id, None)
+        self._reported_issues.discard(entity_id)
+
+    def _time_until_next_deadline(self) -> float | None:
+        """Seconds until the earliest valid deadline, or None if nothing is scheduled."""
+        while self._deadline_heap:
+            deadline, _, entity_id = self._deadline_heap[0]
+            if self._deadlines.get(entity_id) == deadline:
+                return max(0.0, deadline - datetime.now(UTC).timestamp())
+            # Discard superseded entry
+            heapq.heappop(self._deadline_heap)
+        return None
+
+    def _compact_heap(self) -> None:
+        """Rebuild the heap when superseded entries dominate it."""
+        if len(self._deadline_heap) > 2 * len(self._deadlines) + 64:
+            self._deadline_heap = [
+                entry for entry in self._deadline_heap if self._deadlines.get(entry[2]) == entry[0]
+            ]
+            heapq.heapify(self._deadline_heap)
 
     async def _check_entity_health(self, entity_state: EntityState) -> None:
         """Check health of a single entity.
@@ -133,10 +266,9 @@ class HealthMonitor:
             return "unknown"
 
         # Check for stale state (no updates for threshold period)
-        time_since_update = datetime.now(UTC) - entity_state.last_updated
-        stale_threshold = timedelta(seconds=self.config.monitoring.stale_threshold_seconds)
+        time_since_update = datetime.now(UTC).timestamp() - entity_state.last_updated_ts
 
-        if time_since_update > stale_threshold:
+        if time_since_update > self.config.monitoring.stale_threshold_seconds:
             return "stale"
 
         return None
@@ -219,16 +351,27 @@ class HealthMonitor:
             f"(first detected: {first_detected})"
         )
 
+        details: dict[str, Any] = {
+            "state": entity_state.state,
+            "last_updated": entity_state.last_updated.isoformat(),
+            "grace_period_seconds": self.config.monitoring.grace_period_seconds,
+        }
+
+        # How widespread the failure is within the integration (index lookup, O(k))
+        integration_id = self.state_tracker.get_integration_id(entity_id)
+        if integration_id and issue_type in ("unavailable", "unknown"):
+            affected = await self.state_tracker.query(
+                state=entity_state.state, integration_id=integration_id
+            )
+            details["integration_id"] = integration_id
+            details["integration_entities_affected"] = len(affected)
+
         # Create health issue object
         issue = HealthIssue(
             entity_id=entity_id,
             issue_type=issue_type,
             detected_at=first_detected,
-            details={
-                "state": entity_state.state,
-                "last_updated": entity_state.last_updated.isoformat(),
-                "grace_period_seconds": self.config.monitoring.grace_period_seconds,
-            },
+            details=details,
         )
 
         # Persist to database
@@ -300,21 +443,9 @@ class HealthMonitor:
         Returns:
             True if entity should be monitored
         """
-        # Check exclude patterns first
-        for pattern in self.config.monitoring.exclude:
-            if fnmatch.fnmatch(entity_id, pattern):
-                return False
-
-        # If include list is empty, monitor all (except excluded)
-        if not self.config.monitoring.include:
-            return True
-
-        # Check include patterns
-        for pattern in self.config.monitoring.include:
-            if fnmatch.fnmatch(entity_id, pattern):
-                return True
-
-        return False
+        # Picks up hot-reloaded patterns (recompiles and drops cached verdicts)
+        self.pattern_matcher.sync(self.config.monitoring.include, self.config.monitoring.exclude)
+        return self.pattern_matcher.matches(entity_id)
 
     async def check_entity_now(self, entity_id: str) -> HealthIssue | None:
         """Manually check health of a specific entity (bypasses grace period).
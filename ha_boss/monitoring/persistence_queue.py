@@ -0,0 +1,354 @@
+"""Write-behind persistence queue for entity state updates."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ha_boss.core.database import Database, Entity, StateHistory
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EntityUpsert:
+    """Pending upsert of an entity row (coalesced by instance and entity)."""
+
+    instance_id: str
+    entity_id: str
+    domain: str
+    last_seen: datetime
+    last_state: str | None
+    friendly_name: str | None = None
+    integration_id: str | None = None
+
+
+@dataclass
+class StateHistoryRecord:
+    """Pending state history row (never coalesced - every transition is kept)."""
+
+    instance_id: str
+    entity_id: str
+    old_state: str | None
+    new_state: str
+    timestamp: datetime
+
+
+async def upsert_entities(session: AsyncSession, upserts: list[EntityUpsert]) -> None:
+    """Bulk upsert entity rows with a single ``INSERT ... ON CONFLICT`` statement.
+
+    Only ``last_seen``, ``last_state`` and ``updated_at`` are overwritten on conflict,
+    so fields managed elsewhere (suppression, device/integration mapping) are kept.
+    The caller owns the transaction and must commit.
+
+    Args:
+        session: Open database session
+        upserts: Entity rows to insert or update
+    """
+    if not upserts:
+        return
+
+    now = datetime.now(UTC)
+    stmt = sqlite_insert(Entity)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Entity.instance_id, Entity.entity_id],
+        set_={
+            "last_seen": stmt.excluded.last_seen,
+            "last_state": stmt.excluded.last_state,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    await session.execute(
+        stmt,
+        [
+            {
+                "instance_id": upsert.instance_id,
+                "entity_id": upsert.entity_id,
+                "domain": upsert.domain,
+                "friendly_name": upsert.friendly_name,
+                "integration_id": upsert.integration_id,
+                "last_seen": upsert.last_seen,
+                "last_state": upsert.last_state,
+                "is_monitored": True,
+                "healing_suppressed": False,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for upsert in upserts
+        ],
+    )
+
+
+class StatePersistenceQueue:
+    """Batches entity upserts and state history inserts into bulk transactions.
+
+    Producers (state trackers) submit rows synchronously; upserts are coalesced
+    by ``(instance_id, entity_id)`` so a burst of updates for the same entity
+    results in a single row write. A background task flushes the buffers in one
+    transaction when ``batch_size`` is reached or every ``flush_interval_seconds``.
+
+    When more than ``max_pending`` rows are buffered, producers awaiting
+    :meth:`wait_for_capacity` are held back until the next flush completes.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        batch_size: int = 500,
+        flush_interval_seconds: float = 1.0,
+        max_pending: int = 10000,
+    ) -> None:
+        """Initialize persistence queue.
+
+        Args:
+            database: Database manager for persistence
+            batch_size: Number of pending rows that triggers an immediate flush
+            flush_interval_seconds: Maximum time a row waits before being flushed
+            max_pending: Pending row count above which producers are throttled
+        """
+        self.database = database
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max_pending
+
+        # (instance_id, entity_id) -> latest pending upsert
+        self._pending_entities: dict[tuple[str, str], EntityUpsert] = {}
+        self._pending_history: list[StateHistoryRecord] = []
+
+        self._flush_requested = asyncio.Event()
+        self._capacity_available = asyncio.Event()
+        self._capacity_available.set()
+        self._flush_lock = asyncio.Lock()
+
+        self._flush_task: asyncio.Task[None] | None = None
+        self._running = False
+
+        # Metrics
+        self._submitted = 0
+        self._coalesced = 0
+        self._entities_written = 0
+        self._history_written = 0
+        self._history_dropped = 0
+        self._flushes = 0
+        self._flush_errors = 0
+        self._backpressure_waits = 0
+        self._backpressure_wait_seconds = 0.0
+        self._last_flush_seconds = 0.0
+        self._last_flush_size = 0
+        self._max_depth = 0
+
+    @property
+    def depth(self) -> int:
+        """Number of rows currently waiting to be flushed."""
+        return len(self._pending_entities) + len(self._pending_history)
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if self._running:
+            return
+        self._running = True
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(
+            f"State persistence queue started (batch_size={self.batch_size}, "
+            f"flush_interval={self.flush_interval_seconds}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the flush task and drain all pending rows to the database."""
+        was_running = self._running
+        self._running = False
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+
+        drained = await self.flush()
+        # Release any producers still waiting on capacity
+        self._capacity_available.set()
+        if was_running:
+            logger.info(f"State persistence queue stopped (drained {drained} rows)")
+
+    def submit_entity(self, upsert: EntityUpsert) -> None:
+        """Queue an entity upsert, replacing any pending upsert for the same entity.
+
+        Args:
+            upsert: Entity row to write
+        """
+        key = (upsert.instance_id, upsert.entity_id)
+        previous = self._pending_entities.get(key)
+        if previous is not None:
+            self._coalesced += 1
+            # Keep identity fields from the first sighting if the newer update lacks them
+            if upsert.friendly_name is None:
+                upsert.friendly_name = previous.friendly_name
+            if upsert.integration_id is None:
+                upsert.integration_id = previous.integration_id
+        self._pending_entities[key] = upsert
+        self._submitted += 1
+        self._after_submit()
+
+    def submit_history(self, record: StateHistoryRecord) -> None:
+        """Queue a state history row.
+
+        Args:
+            record: State transition to record
+        """
+        self._pending_history.append(record)
+        self._submitted += 1
+        self._after_submit()
+
+    async def wait_for_capacity(self) -> None:
+        """Wait until the queue is below its pending limit (backpressure)."""
+        if self.depth < self.max_pending:
+            return
+
+        self._backpressure_waits += 1
+        started = time.monotonic()
+        if not self._running:
+            # No background flusher - flush inline so callers cannot deadlock
+            await self.flush()
+        else:
+            await self._capacity_available.wait()
+        self._backpressure_wait_seconds += time.monotonic() - started
+
+    async def flush(self) -> int:
+        """Write all pending rows in a single transaction.
+
+        Returns:
+            Number of rows written
+        """
+        async with self._flush_lock:
+            if not self._pending_entities and not self._pending_history:
+                return 0
+
+            entities = self._pending_entities
+            history = self._pending_history
+            self._pending_entities = {}
+            self._pending_history = []
+
+            started = time.monotonic()
+            try:
+                await self._write_batch(list(entities.values()), history)
+            except Exception as e:
+                self._flush_errors += 1
+                # Re-queue entity upserts unless a newer one arrived meanwhile; history
+                # rows are dropped so a failing database cannot grow the queue unbounded
+                for key, upsert in entities.items():
+                    self._pending_entities.setdefault(key, upsert)
+                self._history_dropped += len(history)
+                logger.error(
+                    f"Failed to flush state persistence queue "
+                    f"({len(entities)} entities, {len(history)} history rows): {e}",
+                    exc_info=True,
+                )
+                return 0
+            finally:
+                self._update_capacity()
+
+            elapsed = time.monotonic() - started
+            written = len(entities) + len(history)
+            self._flushes += 1
+            self._entities_written += len(entities)
+            self._history_written += len(history)
+            self._last_flush_seconds = elapsed
+            self._last_flush_size = written
+            logger.debug(
+                f"Flushed {len(entities)} entity upserts and {len(history)} history rows "
+                f"in {elapsed * 1000:.1f}ms"
+            )
+            return written
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue and backpressure metrics.
+
+        Returns:
+            Dictionary of queue statistics
+        """
+        return {
+            "depth": self.depth,
+            "max_depth": self._max_depth,
+            "max_pending": self.max_pending,
+            "submitted": self._submitted,
+            "coalesced": self._coalesced,
+            "entities_written": self._entities_written,
+            "history_written": self._history_written,
+            "history_dropped": self._history_dropped,
+            "flushes": self._flushes,
+            "flush_errors": self._flush_errors,
+            "last_flush_seconds": round(self._last_flush_seconds, 4),
+            "last_flush_size": self._last_flush_size,
+            "backpressure_waits": self._backpressure_waits,
+            "backpressure_wait_seconds": round(self._backpressure_wait_seconds, 4),
+        }
+
+    def _after_submit(self) -> None:
+        """Update depth metrics and wake the flusher when thresholds are crossed."""
+        depth = self.depth
+        if depth > self._max_depth:
+            self._max_depth = depth
+        if depth >= self.batch_size:
+            self._flush_requested.set()
+        if depth >= self.max_pending:
+            self._capacity_available.clear()
+
+    def _update_capacity(self) -> None:
+        """Release throttled producers once the queue is below its limit."""
+        if self.depth < self.max_pending:
+            self._capacity_available.set()
+
+    async def _flush_loop(self) -> None:
+        """Flush pending rows on size or time threshold until stopped."""
+        while self._running:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(), timeout=self.flush_interval_seconds
+                )
+            except TimeoutError:
+                pass
+            self._flush_requested.clear()
+
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in persistence flush loop: {e}", exc_info=True)
+
+    async def _write_batch(
+        self, entities: list[EntityUpsert], history: list[StateHistoryRecord]
+    ) -> None:
+        """Write one batch of rows using a bulk upsert and bulk insert.
+
+        Args:
+            entities: Coalesced entity upserts
+            history: State history rows
+        """
+        async with self.database.async_session() as session:
+            if entities:
+                await upsert_entities(session, entities)
+
+            if history:
+                await session.execute(
+                    insert(StateHistory),
+                    [
+                        {
+                            "instance_id": record.instance_id,
+                            "entity_id": record.entity_id,
+                            "old_state": record.old_state,
+                            "new_state": record.new_state,
+                            "timestamp": record.timestamp,
+                        }
+                        for record in history
+                    ],
+                )
+
+            await session.commit()
@@ -0,0 +1,246 @@
+"""Delta-based reconciliation of REST snapshots against the state cache."""
+
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from ha_boss.monitoring.state_tracker import EntityState, StateTracker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReconciliationResult:
+    """Outcome of reconciling one REST snapshot."""
+
+    compared: int = 0
+    unchanged: int = 0
+    stale_snapshot: int = 0  # Cache already newer than the snapshot (event arrived meanwhile)
+    diverged: list[str] = field(default_factory=list)  # Cached but out of date
+    missing: list[str] = field(default_factory=list)  # In HA but not in the cache
+    removed: list[str] = field(default_factory=list)  # In the cache but gone from HA
+    duration_ms: float = 0.0
+    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def missed_events(self) -> int:
+        """Number of WebSocket events that must have been missed since the last run."""
+        return len(self.diverged) + len(self.missing) + len(self.removed)
+
+
+class SnapshotReconciler:
+    """Reconcile periodic REST snapshots with the StateTracker cache.
+
+    Instead of replaying every entity through ``StateTracker.update_state``,
+    the snapshot is diffed against the cache (by ``context.id`` first, then
+    ``last_updated`` and state) and only real divergences are applied as
+    synthetic ``state_changed`` events. Every run records drift statistics so
+    missed WebSocket events are visible per interval.
+    """
+
+    def __init__(self, state_tracker: StateTracker, history_size: int = 100) -> None:
+        """Initialize reconciler.
+
+        Args:
+            state_tracker: State tracker whose cache is reconciled
+            history_size: Number of recent runs kept for drift statistics
+        """
+        self.state_tracker = state_tracker
+        self._history: deque[ReconciliationResult] = deque(maxlen=history_size)
+        self._runs = 0
+        self._total_missed = 0
+        self._total_compared = 0
+
+    async def fetch_and_reconcile(
+        self, fetch_states: Callable[[], Awaitable[list[dict[str, Any]]]]
+    ) -> ReconciliationResult:
+        """Fetch a REST snapshot and reconcile it against the cache as of the fetch.
+
+        The cache is captured before the request is sent, so entities added or
+        changed over WebSocket while it is in flight are left alone.
+
+        Args:
+            fetch_states: Coroutine function returning ``/api/states``, sent as a new
+                request (e.g. ``partial(HomeAssistantClient.get_states, fresh=True)``);
+                a cached or already in-flight snapshot may predate the baseline
+
+        Returns:
+            Reconciliation result for this snapshot
+        """
+        tracker = self.state_tracker
+        baseline_version = tracker.version
+        baseline = await tracker.get_all_states()
+        states = await fetch_states()
+        return await self.reconcile(states, baseline, baseline_version)
+
+    async def reconcile(
+        self,
+        states: list[dict[str, Any]],
+        baseline: Mapping[str, EntityState] | None = None,
+        baseline_version: int | None = None,
+    ) -> ReconciliationResult:
+        """Diff a REST ``/api/states`` snapshot against the cache and apply divergences.
+
+        Entities that received an event after ``baseline_version`` are newer than
+        the snapshot and are skipped. Each change is checked against the live cache
+        right before it is applied, and applied only if the entity is still unchanged.
+
+        Args:
+            states: State dicts from ``HomeAssistantClient.get_states()``
+            baseline: Cache as of the snapshot request (default: the current cache)
+            baseline_version: Cache ``version`` as of the snapshot request
+
+        Returns:
+            Reconciliation result for this snapshot
+        """
+        started = time.perf_counter()
+        result = ReconciliationResult()
+        tracker = self.state_tracker
+        if baseline_version is None:
+            baseline_version = tracker.version
+        if baseline is None:
+            baseline = await tracker.get_all_states()
+        seen: set[str] = set()
+
+        for state_data in states:
+            entity_id = state_data.get("entity_id")
+            if not entity_id:
+                continue
+            if tracker.entity_discovery and not tracker.entity_discovery.is_entity_monitored(
+                entity_id
+            ):
+                continue
+
+            seen.add(entity_id)
+            result.compared += 1
+            if tracker.changed_since(entity_id, baseline_version):
+                # An event arrived while the snapshot was in flight
+                result.stale_snapshot += 1
+                continue
+            current = await tracker.get_state(entity_id)
+
+            if current is None:
+                result.missing.append(entity_id)
+            else:
+                verdict = self._compare(current, state_data)
+                if verdict == "unchanged":
+                    result.unchanged += 1
+                    continue
+                if verdict == "stale":
+                    result.stale_snapshot += 1
+                    continue
+                result.diverged.append(entity_id)
+
+            # Apply as a synthetic state_changed event (event data shape, not the raw REST dict)
+            await tracker.update_state(
+                {"entity_id": entity_id, "new_state": state_data},
+                if_unchanged_since=baseline_version,
+            )
+
+        for entity_id in baseline.keys() - seen:
+            # Cached entities that no longer exist in Home Assistant
+            if tracker.entity_discovery and not tracker.entity_discovery.is_entity_monitored(
+                entity_id
+            ):
+                continue
+            if tracker.changed_since(entity_id, baseline_version):
+                result.stale_snapshot += 1
+                continue
+            result.removed.append(entity_id)
+            await tracker.update_state(
+                {"entity_id": entity_id, "new_state": None}, if_unchanged_since=baseline_version
+            )
+
+        result.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        self._record(result)
+        return result
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get drift statistics.
+
+        Returns:
+            Dictionary with run counts, missed events per interval and last run details
+        """
+        last = self._history[-1] if self._history else None
+        recent_missed = [run.missed_events for run in self._history]
+        return {
+            "runs": self._runs,
+            "total_compared": self._total_compared,
+            "total_missed_events": self._total_missed,
+            "avg_missed_per_interval": (
+                round(sum(recent_missed) / len(recent_missed), 2) if recent_missed else 0.0
+            ),
+            "max_missed_per_interval": max(recent_missed, default=0),
+            "last_run": (
+                {
+                    "timestamp": last.timestamp.isoformat(),
+                    "compared": last.compared,
+                    "unchanged": last.unchanged,
+                    "stale_snapshot": last.stale_snapshot,
+                    "diverged": len(last.diverged),
+                    "missing": len(last.missing),
+                    "removed": len(last.removed),
+                    "duration_ms": last.duration_ms,
+                }
+                if last
+                else None
+            ),
+        }
+
+    def _record(self, result: ReconciliationResult) -> None:
+        """Add a run to the drift statistics.
+
+        Args:
+            result: Completed reconciliation result
+        """
+        self._runs += 1
+        self._total_compared += result.compared
+        self._total_missed += result.missed_events
+        self._history.append(result)
+
+    @staticmethod
+    def _compare(current: EntityState, state_data: dict[str, Any]) -> str:
+        """Compare a cached state with its REST snapshot entry.
+
+        Args:
+            current: Cached entity state
+            state_data: REST state dict
+
+        Returns:
+            "unchanged", "stale" (cache is newer than the snapshot) or "diverged"
+        """
+        context_id = (state_data.get("context") or {}).get("id")
+        if context_id and context_id == current.context_id:
+            # Same originating change as the cached state
+            return "unchanged"
+
+        snapshot_updated = _parse_timestamp(state_data.get("last_updated"))
+        if snapshot_updated is None:
+            return "unchanged" if state_data.get("state") == current.state else "diverged"
+        if snapshot_updated < current.last_updated:
+            return "stale"
+        if snapshot_updated == current.last_updated and state_data.get("state") == current.state:
+            return "unchanged"
+        return "diverged"
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    """Parse an ISO 8601 timestamp from Home Assistant as an aware datetime.
+
+    Args:
+        value: Timestamp string (may end in "Z")
+
+    Returns:
+        Timezone-aware datetime, or None if missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
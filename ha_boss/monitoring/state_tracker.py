@@ -2,53 +2,183 @@
 
 import asyncio
 import logging
-from collections.abc import Callable, Coroutine
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterable, Mapping
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from sqlalchemy import select
 
 from ha_boss.core.database import Database, Entity, StateHistory
 from ha_boss.core.exceptions import DatabaseError
+from ha_boss.monitoring.persistence_queue import (
+    EntityUpsert,
+    StateHistoryRecord,
+    StatePersistenceQueue,
+    upsert_entities,
+)
 
 if TYPE_CHECKING:
     from ha_boss.discovery.entity_discovery import EntityDiscoveryService
+    from ha_boss.discovery.registry_cache import RegistryCache
     from ha_boss.healing.integration_manager import IntegrationDiscovery
 
 logger = logging.getLogger(__name__)
 
 
+# Shared empty mapping for states without (retained) attributes
+_NO_ATTRIBUTES: Mapping[str, Any] = MappingProxyType({})
+
+# Marks allowlisted attributes absent from a state
+_MISSING = object()
+
+# Attributes whose values are (nearly) unique per entity; interning them would only
+# grow the intern table
+_UNIQUE_ATTRIBUTES = frozenset({"friendly_name"})
+
+
 class EntityState:
-    """Represents a single entity's current state."""
+    """Represents a single entity's current state.
+
+    Kept compact because the tracker holds one per monitored entity: slotted,
+    state values interned (they repeat across entities; entity IDs are unique and
+    already shared with the cache key), and the update time stored as an epoch
+    float with the datetime built on access.
+    """
+
+    __slots__ = ("entity_id", "state", "last_updated_ts", "attributes", "context_id")
 
     def __init__(
         self,
         entity_id: str,
         state: str,
         last_updated: datetime,
-        attributes: dict[str, Any] | None = None,
+        attributes: Mapping[str, Any] | None = None,
+        context_id: str | None = None,
     ) -> None:
         """Initialize entity state.
 
         Args:
             entity_id: Entity identifier (e.g., "sensor.temperature")
             state: Current state value
-            last_updated: When state was last updated
-            attributes: Optional state attributes
+            last_updated: When state was last updated (naive datetimes are UTC)
+            attributes: Optional state attributes (may be lazily decoded)
+            context_id: Home Assistant context ID of the change that produced this state
         """
         self.entity_id = entity_id
-        self.state = state
-        # Ensure last_updated is timezone-aware
+        self.state = sys.intern(state) if isinstance(state, str) else state
         if last_updated.tzinfo is None:
-            self.last_updated = last_updated.replace(tzinfo=UTC)
-        else:
-            self.last_updated = last_updated
-        self.attributes = attributes or {}
+            last_updated = last_updated.replace(tzinfo=UTC)
+        self.last_updated_ts = last_updated.timestamp()
+        # Not `attributes or {}`: truthiness would force lazily decoded attributes to parse
+        self.attributes: Mapping[str, Any] = (
+            attributes if attributes is not None else _NO_ATTRIBUTES
+        )
+        self.context_id = context_id
+
+    @property
+    def last_updated(self) -> datetime:
+        """When state was last updated (timezone-aware UTC)."""
+        return datetime.fromtimestamp(self.last_updated_ts, UTC)
 
     def __repr__(self) -> str:
         return f"<EntityState({self.entity_id}, state={self.state}, updated={self.last_updated})>"
 
 
+class StateTransition(NamedTuple):
+    """A recorded state change (compact: epoch milliseconds and interned state)."""
+
+    timestamp_ms: int
+    state: str
+
+    @property
+    def timestamp(self) -> datetime:
+        """Transition time as a timezone-aware datetime."""
+        return datetime.fromtimestamp(self.timestamp_ms / 1000, UTC)
+
+
+class _TransitionBuffer:
+    """Bounded ring buffer of one entity's recent transitions."""
+
+    __slots__ = ("entries", "covered_since_ms")
+
+    def __init__(self, max_size: int, covered_since_ms: int) -> None:
+        self.entries: deque[StateTransition] = deque(maxlen=max_size)
+        # Every transition at or after this time is in the buffer
+        self.covered_since_ms = covered_since_ms
+
+    def append(self, transition: StateTransition, cutoff_ms: int) -> None:
+        entries = self.entries
+        if len(entries) == entries.maxlen:
+            self.covered_since_ms = entries[0].timestamp_ms + 1
+        entries.append(transition)
+        while entries and entries[0].timestamp_ms < cutoff_ms:
+            self.covered_since_ms = entries.popleft().timestamp_ms + 1
+
+
+def _epoch_ms(value: datetime) -> int:
+    # Naive datetimes (e.g. read back from SQLite) are UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return int(value.timestamp() * 1000)
+
+
+def _index_add(index: dict[str, set[str]], key: str | None, entity_id: str) -> None:
+    if key is not None:
+        index.setdefault(key, set()).add(entity_id)
+
+
+def _index_discard(index: dict[str, set[str]], key: str | None, entity_id: str) -> None:
+    if key is None:
+        return
+    members = index.get(key)
+    if members is not None:
+        members.discard(entity_id)
+        if not members:
+            del index[key]
+
+
+# States that count as "not recovered" for availability waits
+UNAVAILABLE_STATES = frozenset({"unavailable", "unknown"})
+
+
+def is_available(state: EntityState) -> bool:
+    """Whether an entity state is a real (recovered) value."""
+    return state.state not in UNAVAILABLE_STATES
+
+
+@dataclass
+class StateWaitResult:
+    """Outcome of waiting for entities to reach a condition."""
+
+    satisfied: bool
+    matched: list[str]  # Entities meeting the condition when the wait ended
+    pending: list[str]  # Entities not meeting it
+    elapsed_seconds: float
+
+
+@dataclass(eq=False)
+class _StateWaiter:
+    """A pending wait_for() call, resolved from state updates."""
+
+    predicate: Callable[[EntityState], bool]
+    required: int
+    future: asyncio.Future[None]
+    matched: set[str] = field(default_factory=set)
+
+    def update(self, entity_id: str, state: EntityState | None) -> None:
+        if state is not None and self.predicate(state):
+            self.matched.add(entity_id)
+        else:
+            self.matched.discard(entity_id)
+        if len(self.matched) >= self.required and not self.future.done():
+            self.future.set_result(None)
+
+
 class StateTracker:
     """In-memory cache of entity states with database persistence.
 
@@ -66,6 +196,12 @@ class StateTracker:
         on_state_updated: (
             Callable[[EntityState, EntityState | None], Coroutine[Any, Any, None]] | None
         ) = None,
+        persistence_queue: StatePersistenceQueue | None = None,
+        history_size: int = 64,
+        history_seconds: int = 86400,
+        cached_attributes: Iterable[str] | None = None,
+        registry_cache: "RegistryCache | None" = None,
+        on_entity_removed: Callable[[str], None] | None = None,
     ) -> None:
         """Initialize state tracker.
 
@@ -75,25 +211,83 @@ class StateTracker:
             entity_discovery: Optional entity discovery service for filtering
             integration_discovery: Optional integration discovery for entity→integration mapping
             on_state_updated: Optional callback for state changes (new_state, old_state)
+            persistence_queue: Optional write-behind queue. When set, state updates are
+                batched by the queue instead of committed one-by-one under the cache lock.
+            history_size: Recent transitions kept in memory per entity (0 disables)
+            history_seconds: Maximum age of in-memory transitions
+            cached_attributes: Attribute names kept on cached states (None keeps all)
+            registry_cache: Optional registry cache used to answer device queries
+            on_entity_removed: Optional synchronous callback with the entity ID of
+                every entity dropped from the cache
         """
         self.instance_id = instance_id
         self.database = database
         self.entity_discovery = entity_discovery
         self.integration_discovery = integration_discovery
         self.on_state_updated = on_state_updated
+        self.on_entity_removed = on_entity_removed
+        self.persistence_queue = persistence_queue
+        self.registry_cache = registry_cache
 
-        # In-memory cache: entity_id -> EntityState
+        # In-memory cache: entity_id -> EntityState. Only mutated through _put()/_drop(),
+        # which keep the version and secondary indexes in step.
         self._cache: dict[str, EntityState] = {}
 
-        # Lock for concurrent access
+        # Serializes writers (which may hold it across DB commits); readers never take it
         self._lock = asyncio.Lock()
 
-    async def initialize(self, initial_states: list[dict[str, Any]]) -> None:
+        # Immutable view of the cache for get_all_states(), rebuilt when the version moves
+        self._version = 0
+        self._view: Mapping[str, EntityState] = MappingProxyType({})
+        self._view_version = 0
+        # Cache version at which each entity last received a state or was removed
+        # (see wait_for(updated_after) and update_state(if_unchanged_since))
+        self._received_version: dict[str, int] = {}
+
+        # Secondary indexes: key -> entity_ids, maintained incrementally by _put()/_drop()
+        self._by_domain: dict[str, set[str]] = {}
+        self._by_state: dict[str, set[str]] = {}
+        self._by_integration: dict[str, set[str]] = {}
+        self._entity_integration: dict[str, str] = {}
+
+        # Synchronous listeners notified after each cache update (e.g. HealthMonitor)
+        self._listeners: list[Callable[[EntityState, EntityState | None], None]] = []
+
+        # Pending wait_for() calls by entity, resolved from live updates
+        self._waiters: dict[str, set[_StateWaiter]] = {}
+
+        # Recent transitions per entity; older ranges are read from StateHistory.
+        # Entities without a buffer have had no transitions since _history_since_ms.
+        self.history_size = history_size
+        self.history_seconds = history_seconds
+
+        # Attribute allowlist for cached states (None keeps full attributes)
+        self.cached_attributes = (
+            frozenset(cached_attributes) if cached_attributes is not None else None
+        )
+        self._history: dict[str, _TransitionBuffer] = {}
+        self._history_since_ms = _epoch_ms(datetime.now(UTC))
+        self._history_hits = 0
+        self._history_misses = 0
+
+        # Statistics from the last bulk hydration (see initialize())
+        self.hydration_stats: dict[str, Any] = {}
+
+    async def initialize(self, initial_states: list[dict[str, Any]]) -> dict[str, Any]:
         """Initialize cache with initial state snapshot from REST API.
 
+        Hydrates the database in bulk: existing entity rows are preloaded with a
+        single query, diffed in memory, and only new or changed rows are written
+        in one multi-row upsert transaction.
+
         Args:
             initial_states: List of state dicts from Home Assistant
+
+        Returns:
+            Hydration statistics including per-phase timings in milliseconds
         """
+        started = time.perf_counter()
+
         async with self._lock:
             filtered_count = 0
             for state_data in initial_states:
@@ -127,24 +321,51 @@ class StateTracker:
                     entity_id=entity_id,
                     state=state,
                     last_updated=last_updated,
-                    attributes=attributes,
+                    attributes=self._retain_attributes(attributes),
+                    context_id=(state_data.get("context") or {}).get("id"),
                 )
 
-                self._cache[entity_id] = entity_state
+                self._put(entity_state)
 
-                # Persist to database
-                await self._persist_entity(entity_state)
+            # Transitions before this snapshot (or missed while disconnected) are unknown
+            self._history.clear()
+            self._history_since_ms = _epoch_ms(datetime.now(UTC))
 
-            logger.info(
-                f"Initialized state tracker with {len(self._cache)} entities "
-                f"({filtered_count} filtered out by discovery)"
-            )
+            snapshot = list(self._cache.values())
+
+        parse_ms = (time.perf_counter() - started) * 1000
 
-    async def update_state(self, state_data: dict[str, Any]) -> None:
+        # Persist to database (outside the lock - readers can use the cache already)
+        stats = await self._hydrate_database(snapshot)
+        stats["parse_ms"] = round(parse_ms, 1)
+        stats["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        stats["entities"] = len(snapshot)
+        stats["filtered"] = filtered_count
+        self.hydration_stats = stats
+
+        logger.info(
+            f"Initialized state tracker with {len(snapshot)} entities "
+            f"({filtered_count} filtered out by discovery)"
+        )
+        logger.info(
+            f"[{self.instance_id}] State hydration: {stats['inserted']} new, "
+            f"{stats['updated']} changed, {stats['unchanged']} unchanged "
+            f"(parse {stats['parse_ms']}ms, preload {stats['preload_ms']}ms, "
+            f"diff {stats['diff_ms']}ms, write {stats['write_ms']}ms, "
+            f"total {stats['total_ms']}ms)"
+        )
+        return stats
+
+    async def update_state(
+        self, state_data: dict[str, Any], if_unchanged_since: int | None = None
+    ) -> None:
         """Update entity state from WebSocket state_changed event.
 
         Args:
             state_data: State change event data from WebSocket
+            if_unchanged_since: Cache ``version``; if given, the update is skipped when
+                the entity received a state (or was removed) after it, so older data
+                (e.g. a REST snapshot) never overwrites a newer event
         """
         entity_id = state_data.get("entity_id")
         if not entity_id:
@@ -160,7 +381,7 @@ class StateTracker:
             # Entity was explicitly removed from Home Assistant
             # Only remove if we have this entity in cache
             if entity_id in self._cache:
-                await self._remove_entity(entity_id)
+                await self._remove_entity(entity_id, if_unchanged_since)
             return
 
         # If new_state_data is an empty dict or incomplete, skip this event
@@ -184,25 +405,46 @@ class StateTracker:
             entity_id=entity_id,
             state=new_state,
             last_updated=last_updated,
-            attributes=attributes,
+            attributes=self._retain_attributes(attributes),
+            context_id=(new_state_data.get("context") or {}).get("id"),
         )
 
         # Update cache
         async with self._lock:
-            old_state = self._cache.get(entity_id)
-            self._cache[entity_id] = new_entity_state
+            if if_unchanged_since is not None and self.changed_since(entity_id, if_unchanged_since):
+                return
+            old_state = self._put(new_entity_state)
+            if self.history_size > 0:
+                self._record_transition(new_entity_state, old_state)
+
+            if self.persistence_queue:
+                # Write-behind: queue rows without awaiting DB I/O under the lock
+                self._enqueue_persistence(new_entity_state, old_state)
+            else:
+                # Persist to database
+                await self._persist_entity(new_entity_state)
+
+                # Record state history if state actually changed
+                if old_state and old_state.state != new_state:
+                    await self._record_state_history(
+                        entity_id=entity_id,
+                        old_state=old_state.state,
+                        new_state=new_state,
+                        timestamp=last_updated,
+                    )
 
-            # Persist to database
-            await self._persist_entity(new_entity_state)
+        # Apply backpressure outside the lock so readers are never blocked by it
+        if self.persistence_queue:
+            await self.persistence_queue.wait_for_capacity()
 
-            # Record state history if state actually changed
-            if old_state and old_state.state != new_state:
-                await self._record_state_history(
-                    entity_id=entity_id,
-                    old_state=old_state.state,
-                    new_state=new_state,
-                    timestamp=last_updated,
-                )
+        self._notify_waiters(entity_id, new_entity_state)
+
+        # Notify listeners (cheap, synchronous)
+        for listener in self._listeners:
+            try:
+                listener(new_entity_state, old_state)
+            except Exception as e:
+                logger.error(f"Error in state listener: {e}", exc_info=True)
 
         # Call callback if registered
         if self.on_state_updated:
@@ -211,6 +453,276 @@ class StateTracker:
             except Exception as e:
                 logger.error(f"Error in state_updated callback: {e}", exc_info=True)
 
+    def add_listener(self, listener: Callable[[EntityState, EntityState | None], None]) -> None:
+        """Register a synchronous listener called after every cached state update.
+
+        Listeners must not block; they are intended for in-memory bookkeeping
+        such as scheduling health re-checks.
+
+        Args:
+            listener: Callable receiving (new_state, old_state)
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[EntityState, EntityState | None], None]) -> None:
+        """Unregister a previously added listener.
+
+        Args:
+            listener: Listener to remove
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    async def wait_for(
+        self,
+        entity_ids: Iterable[str],
+        predicate: Callable[[EntityState], bool],
+        count: int | None = None,
+        timeout: float | None = None,
+        updated_after: int | None = None,
+    ) -> StateWaitResult:
+        """Wait until entities reach a condition, resolved from live state updates.
+
+        Returns as soon as ``count`` of the entities satisfy ``predicate`` (checked
+        against the cache first, then on every update) or when ``timeout`` expires.
+        Entities that fall out of the condition again stop counting.
+
+        Args:
+            entity_ids: Entities to watch
+            predicate: Condition each entity's state must meet
+            count: Number of entities that must meet the condition (default: all)
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            updated_after: Cache ``version`` taken before an action; cached states
+                received before it are ignored, so only the action's effect counts
+
+        Returns:
+            Wait result with the matched and pending entities
+        """
+        start = time.monotonic()
+        watched = list(dict.fromkeys(entity_ids))
+        required = len(watched) if count is None else min(max(count, 0), len(watched))
+
+        waiter = _StateWaiter(predicate, required, asyncio.get_running_loop().create_future())
+        for entity_id in watched:
+            if updated_after is None or self.changed_since(entity_id, updated_after):
+                waiter.update(entity_id, self._cache.get(entity_id))
+
+        if len(waiter.matched) < required:
+            for entity_id in watched:
+                self._waiters.setdefault(entity_id, set()).add(waiter)
+            try:
+                await asyncio.wait_for(waiter.future, timeout)
+            except TimeoutError:
+                pass
+            finally:
+                for entity_id in watched:
+                    waiters = self._waiters.get(entity_id)
+                    if waiters is not None:
+                        waiters.discard(waiter)
+                        if not waiters:
+                            del self._waiters[entity_id]
+
+        return StateWaitResult(
+            satisfied=len(waiter.matched) >= required,
+            matched=[e for e in watched if e in waiter.matched],
+            pending=[e for e in watched if e not in waiter.matched],
+            elapsed_seconds=time.monotonic() - start,
+        )
+
+    async def wait_until_available(
+        self,
+        entity_ids: Iterable[str],
+        count: int | None = None,
+        timeout: float | None = None,
+        updated_after: int | None = None,
+    ) -> StateWaitResult:
+        """Wait until entities leave ``unavailable``/``unknown``.
+
+        Args:
+            entity_ids: Entities to watch
+            count: Number of entities that must recover (default: all)
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            updated_after: Only count states received after this cache ``version``
+
+        Returns:
+            Wait result with the recovered (matched) and pending entities
+        """
+        return await self.wait_for(
+            entity_ids, is_available, count=count, timeout=timeout, updated_after=updated_after
+        )
+
+    def _notify_waiters(self, entity_id: str, state: EntityState | None) -> None:
+        """Re-evaluate pending waits watching an entity."""
+        waiters = self._waiters.get(entity_id)
+        if not waiters:
+            return
+        for waiter in list(waiters):
+            try:
+                waiter.update(entity_id, state)
+            except Exception as e:
+                logger.error(f"Error evaluating state wait for {entity_id}: {e}", exc_info=True)
+
+    def _put(self, entity_state: EntityState) -> EntityState | None:
+        """Store a state in the cache and update the indexes.
+
+        Returns:
+            The state it replaced, if any
+        """
+        entity_id = entity_state.entity_id
+        old_state = self._cache.get(entity_id)
+        self._cache[entity_id] = entity_state
+        self._version += 1
+        self._received_version[entity_id] = self._version
+
+        if old_state is None:
+            _index_add(self._by_domain, entity_id.split(".", 1)[0], entity_id)
+            _index_add(self._by_state, entity_state.state, entity_id)
+        elif old_state.state != entity_state.state:
+            _index_discard(self._by_state, old_state.state, entity_id)
+            _index_add(self._by_state, entity_state.state, entity_id)
+
+        # Re-resolved on every update so late integration mappings are picked up
+        if self.integration_discovery:
+            integration_id = self.integration_discovery.get_integration_for_entity(entity_id)
+            previous = self._entity_integration.get(entity_id)
+            if integration_id != previous:
+                _index_discard(self._by_integration, previous, entity_id)
+                _index_add(self._by_integration, integration_id, entity_id)
+                if integration_id is None:
+                    del self._entity_integration[entity_id]
+                else:
+                    self._entity_integration[entity_id] = integration_id
+
+        return old_state
+
+    def _drop(self, entity_id: str) -> EntityState | None:
+        """Remove an entity from the cache, its indexes and its transition history.
+
+        Returns:
+            The removed state, or None if the entity was not cached
+        """
+        self._history.pop(entity_id, None)
+        old_state = self._cache.pop(entity_id, None)
+        if old_state is None:
+            return None
+        self._version += 1
+        self._received_version[entity_id] = self._version
+
+        _index_discard(self._by_domain, entity_id.split(".", 1)[0], entity_id)
+        _index_discard(self._by_state, old_state.state, entity_id)
+        integration_id = self._entity_integration.pop(entity_id, None)
+        _index_discard(self._by_integration, integration_id, entity_id)
+        return old_state
+
+    def _retain_attributes(self, attributes: Mapping[str, Any] | None) -> Mapping[str, Any] | None:
+        """Restrict attributes to the configured allowlist before caching."""
+        if self.cached_attributes is None or attributes is None:
+            return attributes
+        retained: dict[str, Any] = {}
+        for key in self.cached_attributes:
+            # get() rather than `in`: lazily decoded attributes answer peek keys unparsed
+            value = attributes.get(key, _MISSING)
+            if value is not _MISSING:
+                # Values such as device_class repeat across entities
+                if isinstance(value, str) and key not in _UNIQUE_ATTRIBUTES:
+                    value = sys.intern(value)
+                retained[sys.intern(key)] = value
+        return retained or None
+
+    def _record_transition(self, new_state: EntityState, old_state: EntityState | None) -> None:
+        """Append a state change to the entity's in-memory history."""
+        entity_id = new_state.entity_id
+        buffer = self._history.get(entity_id)
+        if old_state is None:
+            # First sighting (new or newly monitored entity): the state has held since
+            # it was last updated, earlier transitions are unknown
+            self._history[entity_id] = _TransitionBuffer(
+                self.history_size,
+                min(int(new_state.last_updated_ts * 1000), _epoch_ms(datetime.now(UTC))),
+            )
+            return
+        if old_state.state == new_state.state:
+            return
+
+        if buffer is None:
+            buffer = self._history[entity_id] = _TransitionBuffer(
+                self.history_size, self._unbuffered_covered_since_ms(old_state)
+            )
+        cutoff_ms = _epoch_ms(datetime.now(UTC)) - self.history_seconds * 1000
+        buffer.append(
+            StateTransition(int(new_state.last_updated_ts * 1000), new_state.state),
+            cutoff_ms,
+        )
+
+    def _unbuffered_covered_since_ms(self, state: EntityState) -> int:
+        """Coverage of an entity without buffered transitions.
+
+        Its cached state is unchanged since _history_since_ms, and has held
+        since it was last updated (hydrated states usually predate the snapshot).
+        """
+        return min(self._history_since_ms, int(state.last_updated_ts * 1000))
+
+    def get_recent_transitions(
+        self,
+        entity_id: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[StateTransition] | None:
+        """Get an entity's recent state transitions from memory.
+
+        Args:
+            entity_id: Entity identifier
+            start: Start of the range (None returns everything buffered)
+            end: End of the range (default: now)
+
+        Returns:
+            Transitions in the range, oldest first, or None if the range is not
+            fully covered in memory (entity not tracked, or ``start`` predates the
+            buffer) and must be read from the database instead
+        """
+        if entity_id not in self._cache or self.history_size <= 0:
+            self._history_misses += 1
+            return None
+
+        buffer = self._history.get(entity_id)
+        covered_since_ms = (
+            buffer.covered_since_ms
+            if buffer
+            else self._unbuffered_covered_since_ms(self._cache[entity_id])
+        )
+        start_ms = _epoch_ms(start) if start is not None else None
+        if start_ms is not None and start_ms < covered_since_ms:
+            self._history_misses += 1
+            return None
+
+        self._history_hits += 1
+        if buffer is None:
+            return []
+        end_ms = _epoch_ms(end) if end is not None else None
+        return [
+            t
+            for t in buffer.entries
+            if (start_ms is None or t.timestamp_ms >= start_ms)
+            and (end_ms is None or t.timestamp_ms <= end_ms)
+        ]
+
+    def get_history_stats(self) -> dict[str, Any]:
+        """Get in-memory history buffer statistics.
+
+        Returns:
+            Buffered entities and transitions, and reads served from memory
+            (hits) or left to the database (misses)
+        """
+        return {
+            "entities": len(self._history),
+            "transitions": sum(len(b.entries) for b in self._history.values()),
+            "max_per_entity": self.history_size,
+            "max_age_seconds": self.history_seconds,
+            "hits": self._history_hits,
+            "misses": self._history_misses,
+        }
+
     async def get_state(self, entity_id: str) -> EntityState | None:
         """Get current state for an entity.
 
@@ -220,17 +732,39 @@ class StateTracker:
         Returns:
             Entity state or None if not found
         """
-        async with self._lock:
-            return self._cache.get(entity_id)
+        return self._cache.get(entity_id)
 
-    async def get_all_states(self) -> dict[str, EntityState]:
+    @property
+    def version(self) -> int:
+        """Cache version, incremented on every state change, addition or removal."""
+        return self._version
+
+    def changed_since(self, entity_id: str, version: int) -> bool:
+        """Check whether an entity received a state or was removed after a cache version.
+
+        Args:
+            entity_id: Entity identifier
+            version: Earlier value of ``version``
+
+        Returns:
+            True if the entity changed after that version
+        """
+        return self._received_version.get(entity_id, 0) > version
+
+    async def get_all_states(self) -> Mapping[str, EntityState]:
         """Get all cached entity states.
 
+        Returns a read-only snapshot that later updates do not change, so callers
+        may await while iterating. The snapshot is shared between callers and only
+        rebuilt after the cache has changed.
+
         Returns:
-            Dictionary of entity_id -> EntityState
+            Read-only mapping of entity_id -> EntityState
         """
-        async with self._lock:
-            return dict(self._cache)
+        if self._view_version != self._version:
+            self._view = MappingProxyType(dict(self._cache))
+            self._view_version = self._version
+        return self._view
 
     async def get_entities_by_domain(self, domain: str) -> list[EntityState]:
         """Get all entities for a specific domain.
@@ -241,12 +775,69 @@ class StateTracker:
         Returns:
             List of entity states for the domain
         """
-        async with self._lock:
-            return [
-                state
-                for entity_id, state in self._cache.items()
-                if entity_id.startswith(f"{domain}.")
-            ]
+        return [self._cache[entity_id] for entity_id in self._by_domain.get(domain, ())]
+
+    def get_integration_id(self, entity_id: str) -> str | None:
+        """Get the integration entry ID indexed for a cached entity.
+
+        Args:
+            entity_id: Entity identifier
+
+        Returns:
+            Integration entry ID, or None if unknown
+        """
+        return self._entity_integration.get(entity_id)
+
+    async def query(
+        self,
+        *,
+        domain: str | None = None,
+        state: str | None = None,
+        integration_id: str | None = None,
+        device_id: str | None = None,
+    ) -> list[EntityState]:
+        """Find cached entities matching all given criteria using the indexes.
+
+        Costs O(k) in the size of the smallest matching index rather than a
+        scan of the cache, e.g. ``query(state="unavailable", integration_id=...)``.
+
+        Args:
+            domain: Entity domain (e.g., "light")
+            state: Current state value (e.g., "unavailable")
+            integration_id: Integration config entry ID
+            device_id: Device ID (resolved through the registry cache)
+
+        Returns:
+            Matching entity states sorted by entity_id
+
+        Raises:
+            RuntimeError: device_id given but no registry cache is configured
+        """
+        candidates: list[Iterable[str]] = []
+        if domain is not None:
+            candidates.append(self._by_domain.get(domain, ()))
+        if state is not None:
+            candidates.append(self._by_state.get(state, ()))
+        if integration_id is not None:
+            candidates.append(self._by_integration.get(integration_id, ()))
+        if device_id is not None:
+            if self.registry_cache is None:
+                raise RuntimeError("Device queries require a registry cache")
+            candidates.append(await self.registry_cache.get_device_entities(device_id))
+
+        if not candidates:
+            return sorted(self._cache.values(), key=lambda s: s.entity_id)
+
+        sets = sorted((c if isinstance(c, set) else set(c) for c in candidates), key=len)
+        smallest, rest = sets[0], sets[1:]
+        return sorted(
+            (
+                self._cache[entity_id]
+                for entity_id in smallest
+                if entity_id in self._cache and all(entity_id in s for s in rest)
+            ),
+            key=lambda s: s.entity_id,
+        )
 
     async def is_entity_monitored(self, entity_id: str) -> bool:
         """Check if an entity exists and is being monitored.
@@ -257,8 +848,118 @@ class StateTracker:
         Returns:
             True if entity is in cache (being monitored)
         """
-        async with self._lock:
-            return entity_id in self._cache
+        return entity_id in self._cache
+
+    async def _hydrate_database(self, entity_states: list[EntityState]) -> dict[str, Any]:
+        """Bulk-persist a state snapshot, writing only new or changed entity rows.
+
+        Args:
+            entity_states: Entity states to persist
+
+        Returns:
+            Row counts and preload/diff/write phase timings in milliseconds
+
+        Raises:
+            DatabaseError: If the preload or write transaction fails
+        """
+        try:
+            async with self.database.async_session() as session:
+                # Phase 1: preload existing rows for this instance in one query
+                phase_start = time.perf_counter()
+                result = await session.execute(
+                    select(Entity.entity_id, Entity.last_state, Entity.last_seen).where(
+                        Entity.instance_id == self.instance_id
+                    )
+                )
+                existing = {row.entity_id: (row.last_state, row.last_seen) for row in result}
+                preload_ms = (time.perf_counter() - phase_start) * 1000
+
+                # Phase 2: diff in memory
+                phase_start = time.perf_counter()
+                upserts: list[EntityUpsert] = []
+                inserted = 0
+                for entity_state in entity_states:
+                    known = existing.get(entity_state.entity_id)
+                    last_seen = entity_state.last_updated.astimezone(UTC).replace(tzinfo=None)
+                    if known is not None:
+                        known_state, known_seen = known
+                        if known_seen is not None and known_seen.tzinfo is not None:
+                            known_seen = known_seen.astimezone(UTC).replace(tzinfo=None)
+                        if known_state == entity_state.state and known_seen == last_seen:
+                            continue
+                    else:
+                        inserted += 1
+                    upserts.append(self._build_upsert(entity_state))
+                diff_ms = (time.perf_counter() - phase_start) * 1000
+
+                # Phase 3: single multi-row upsert transaction
+                phase_start = time.perf_counter()
+                if upserts:
+                    await upsert_entities(session, upserts)
+                    await session.commit()
+                write_ms = (time.perf_counter() - phase_start) * 1000
+
+        except Exception as e:
+            logger.error(f"[{self.instance_id}] Failed to hydrate entities: {e}", exc_info=True)
+            raise DatabaseError(f"Failed to hydrate entities: {e}") from e
+
+        return {
+            "inserted": inserted,
+            "updated": len(upserts) - inserted,
+            "unchanged": len(entity_states) - len(upserts),
+            "preload_ms": round(preload_ms, 1),
+            "diff_ms": round(diff_ms, 1),
+            "write_ms": round(write_ms, 1),
+        }
+
+    def _build_upsert(self, entity_state: EntityState) -> EntityUpsert:
+        """Build an entity upsert row from a cached state.
+
+        Args:
+            entity_state: Entity state to persist
+
+        Returns:
+            Upsert row for the persistence layer
+        """
+        integration_id = None
+        if self.integration_discovery:
+            integration_id = self.integration_discovery.get_integration_for_entity(
+                entity_state.entity_id
+            )
+
+        return EntityUpsert(
+            instance_id=self.instance_id,
+            entity_id=entity_state.entity_id,
+            domain=entity_state.entity_id.split(".")[0],
+            last_seen=entity_state.last_updated,
+            last_state=entity_state.state,
+            friendly_name=entity_state.attributes.get("friendly_name"),
+            integration_id=integration_id,
+        )
+
+    def _enqueue_persistence(
+        self, entity_state: EntityState, old_state: EntityState | None
+    ) -> None:
+        """Submit entity upsert (and history row on change) to the write-behind queue.
+
+        Args:
+            entity_state: New entity state
+            old_state: Previous cached state, if any
+        """
+        assert self.persistence_queue is not None
+
+        self.persistence_queue.submit_entity(self._build_upsert(entity_state))
+
+        if old_state and old_state.state != entity_state.state:
+            self.persistence_queue.submit_history(
+                StateHistoryRecord(
+                    instance_id=self.instance_id,
+                    entity_id=entity_state.entity_id,
+                    old_state=old_state.state,
+                    new_state=entity_state.state,
+                    timestamp=entity_state.last_updated,
+                )
+            )
 
     async def _persist_entity(self, entity_state: EntityState) -> None:
         """Persist entity state to database.
@@ -340,16 +1041,32 @@ class StateTracker:
             logger.error(f"Failed to record state history for {entity_id}: {e}", exc_info=True)
             # Don't raise - history is non-critical
 
-    async def _remove_entity(self, entity_id: str) -> None:
+    async def _remove_entity(self, entity_id: str, if_unchanged_since: int | None = None) -> None:
         """Remove entity from cache when it's deleted from HA.
 
         Args:
             entity_id: Entity identifier
+            if_unchanged_since: Skip the removal if the entity changed after this version
         """
         async with self._lock:
-            if entity_id in self._cache:
-                del self._cache[entity_id]
+            if if_unchanged_since is not None and self.changed_since(entity_id, if_unchanged_since):
+                return
+            removed = self._drop(entity_id) is not None
+            if removed:
                 logger.info(f"Entity {entity_id} removed from cache")
+        self._notify_waiters(entity_id, None)
+        if removed:
+            self._notify_removed([entity_id])
+
+    def _notify_removed(self, entity_ids: list[str]) -> None:
+        """Call the on_entity_removed callback for entities dropped from the cache."""
+        if not self.on_entity_removed:
+            return
+        for entity_id in entity_ids:
+            try:
+                self.on_entity_removed(entity_id)
+            except Exception as e:
+                logger.error(f"Error in entity_removed callback: {e}", exc_info=True)
 
     async def refresh_monitored_set(self) -> None:
         """Refresh monitored entity set after discovery refresh.
@@ -368,7 +1085,7 @@ class StateTracker:
             to_remove = [eid for eid in self._cache if eid not in monitored]
 
             for entity_id in to_remove:
-                del self._cache[entity_id]
+                self._drop(entity_id)
                 logger.debug(f"Removed {entity_id} from cache (no longer monitored)")
 
             if to_remove:
@@ -376,6 +1093,8 @@ class StateTracker:
                     f"Refreshed monitored set: removed {len(to_remove)} entities from cache"
                 )
 
+        self._notify_removed(to_remove)
+
 
 async def create_state_tracker(
     instance_id: str,
@@ -14,9 +14,12 @@ from ha_boss.core.exceptions import (
     HomeAssistantAuthError,
     HomeAssistantConnectionError,
 )
+from ha_boss.monitoring.event_decoder import create_event_decoder
+from ha_boss.monitoring.event_pipeline import EventChannel
 
 if TYPE_CHECKING:
     from ha_boss.discovery.entity_discovery import EntityDiscoveryService
+    from ha_boss.discovery.registry_cache import RegistryCache
     from ha_boss.monitoring.automation_tracker import AutomationTracker
 
 logger = logging.getLogger(__name__)
@@ -27,6 +30,12 @@ class WebSocketClient:
 
     Provides automatic reconnection, authentication, and event subscription
     for monitoring state changes in real-time.
+
+    Reception is decoupled from processing: the listen loop only parses frames
+    and queues events into a bounded channel per event type, which is drained
+    by dedicated worker tasks. A slow handler therefore never stalls the socket
+    reader. state_changed events are partitioned by entity_id so events for the
+    same entity are processed in order.
     """
 
     def __init__(
@@ -36,6 +45,7 @@ class WebSocketClient:
         entity_discovery: "EntityDiscoveryService | None" = None,
         automation_tracker: "AutomationTracker | None" = None,
         on_state_changed: Callable[[dict[str, Any]], Coroutine[Any, Any, None]] | None = None,
+        registry_cache: "RegistryCache | None" = None,
     ) -> None:
         """Initialize WebSocket client.
 
@@ -45,6 +55,7 @@ class WebSocketClient:
             entity_discovery: Optional entity discovery service for reload event handling
             automation_tracker: Optional automation tracker for usage tracking
             on_state_changed: Async callback for state_changed events
+            registry_cache: Optional registry cache kept current by registry update events
         """
         # Build WebSocket URL from HTTP URL
         ws_url = instance.url.replace("http://", "ws://").replace("https://", "wss://")
@@ -55,6 +66,7 @@ class WebSocketClient:
         self.config = config
         self.entity_discovery = entity_discovery
         self.automation_tracker = automation_tracker
+        self.registry_cache = registry_cache
 
         # Connection settings
         self.max_retries = config.rest.retry_attempts
@@ -69,6 +81,47 @@ class WebSocketClient:
         self._running = False
         self._reconnect_task: asyncio.Task[None] | None = None
 
+        # Event pipeline (one bounded channel per event type)
+        ws_config = config.websocket
+        self._decoder = create_event_decoder(ws_config.decoder)
+        self._channels: dict[str, EventChannel] = {
+            "state_changed": EventChannel(
+                "state_changed",
+                self._handle_state_changed,
+                max_size=ws_config.event_queue_size,
+                workers=ws_config.state_workers,
+                overflow=ws_config.overflow_policy,
+                key_func=lambda data: data.get("entity_id"),
+            ),
+            "automation_triggered": EventChannel(
+                "automation_triggered",
+                self._handle_automation_triggered,
+                max_size=ws_config.event_queue_size,
+                overflow="drop",
+            ),
+            # Single worker: reload-triggered discovery refreshes must not overlap
+            "call_service": EventChannel(
+                "call_service",
+                self._handle_service_call,
+                max_size=ws_config.event_queue_size,
+                overflow="drop",
+            ),
+            # A dropped registry event would leave the registry cache stale for good,
+            # so dropping one marks the cache for a full reload instead
+            "entity_registry_updated": EventChannel(
+                "entity_registry_updated",
+                self._handle_entity_registry_updated,
+                max_size=ws_config.event_queue_size,
+                on_drop=self._on_registry_event_dropped,
+            ),
+            "device_registry_updated": EventChannel(
+                "device_registry_updated",
+                self._handle_device_registry_updated,
+                max_size=ws_config.event_queue_size,
+                on_drop=self._on_registry_event_dropped,
+            ),
+        }
+
     def _next_id(self) -> int:
         """Get next message ID for requests."""
         self._message_id += 1
@@ -146,8 +199,34 @@ class WebSocketClient:
 
         logger.info(f"Subscribed to {event_type} events")
 
+    async def _subscribe_registry_events(self) -> None:
+        """Subscribe to entity and device registry update events."""
+        await self.subscribe_events("entity_registry_updated")
+        await self.subscribe_events("device_registry_updated")
+
+    def _dispatch_message(self, message: dict[str, Any]) -> None:
+        """Queue an incoming WebSocket message for processing by the channel workers.
+
+        Never blocks: when a channel is full its overflow policy applies.
+
+        Args:
+            message: Parsed JSON message from WebSocket
+        """
+        msg_type = message.get("type")
+
+        if msg_type == "event":
+            event = message.get("event", {})
+            channel = self._channels.get(event.get("event_type"))
+            if channel is not None:
+                channel.put(event.get("data", {}))
+        elif msg_type == "pong":
+            # Response to ping, ignore
+            pass
+        else:
+            logger.debug(f"Received message type: {msg_type}")
+
     async def _handle_message(self, message: dict[str, Any]) -> None:
-        """Handle incoming WebSocket message.
+        """Handle incoming WebSocket message inline, bypassing the event queues.
 
         Args:
             message: Parsed JSON message from WebSocket
@@ -158,11 +237,8 @@ class WebSocketClient:
             event = message.get("event", {})
             event_type = event.get("event_type")
 
-            if event_type == "state_changed" and self.on_state_changed:
-                try:
-                    await self.on_state_changed(event.get("data", {}))
-                except Exception as e:
-                    logger.error(f"Error in state_changed callback: {e}", exc_info=True)
+            if event_type == "state_changed":
+                await self._handle_state_changed(event.get("data", {}))
 
             elif event_type == "automation_triggered":
                 # Track automation execution
@@ -172,12 +248,59 @@ class WebSocketClient:
                 # Handle automation/scene/script reload events and track service calls
                 await self._handle_service_call(event.get("data", {}))
 
+            elif event_type == "entity_registry_updated":
+                await self._handle_entity_registry_updated(event.get("data", {}))
+
+            elif event_type == "device_registry_updated":
+                await self._handle_device_registry_updated(event.get("data", {}))
+
         elif msg_type == "pong":
             # Response to ping, ignore
             pass
         else:
             logger.debug(f"Received message type: {msg_type}")
 
+    async def _handle_state_changed(self, data: dict[str, Any]) -> None:
+        """Handle state_changed events by invoking the state callback.
+
+        Args:
+            data: State changed event data (entity_id, old_state, new_state)
+        """
+        if not self.on_state_changed:
+            return
+
+        try:
+            await self.on_state_changed(data)
+        except Exception as e:
+            logger.error(f"Error in state_changed callback: {e}", exc_info=True)
+
+    async def _handle_entity_registry_updated(self, data: dict[str, Any]) -> None:
+        """Apply entity registry changes to the registry cache.
+
+        Args:
+            data: Event data (action, entity_id, changes)
+        """
+        if self.registry_cache:
+            self.registry_cache.handle_entity_registry_updated(data)
+
+    async def _handle_device_registry_updated(self, data: dict[str, Any]) -> None:
+        """Apply device registry changes to the registry cache.
+
+        Args:
+            data: Event data (action, device_id, changes)
+        """
+        if self.registry_cache:
+            self.registry_cache.handle_device_registry_updated(data)
+
+    def _on_registry_event_dropped(self, data: dict[str, Any]) -> None:
+        """Invalidate the registry cache when a registry event could not be queued.
+
+        Args:
+            data: Dropped event data
+        """
+        if self.registry_cache:
+            self.registry_cache.invalidate()
+
     async def _handle_automation_triggered(self, data: dict[str, Any]) -> None:
         """Handle automation_triggered events to track automation executions.
 
@@ -290,9 +413,9 @@ class WebSocketClient:
                     break
 
                 try:
-                    data = json.loads(message)
-                    await self._handle_message(data)
-                except json.JSONDecodeError as e:
+                    data = self._decoder.decode(message)
+                    self._dispatch_message(data)
+                except ValueError as e:
                     logger.error(f"Failed to parse WebSocket message: {e}")
                 except Exception as e:
                     logger.error(f"Error handling message: {e}", exc_info=True)
@@ -328,6 +451,11 @@ class WebSocketClient:
                 if self.automation_tracker:
                     await self.subscribe_events("automation_triggered")
 
+                if self.registry_cache:
+                    await self._subscribe_registry_events()
+                    # Registry events may have been missed while disconnected
+                    self.registry_cache.invalidate()
+
                 logger.info("Reconnection successful")
 
                 # Restart listen loop
@@ -349,6 +477,10 @@ class WebSocketClient:
         """
         self._running = True
 
+        # Workers must be running before the first event is queued
+        for channel in self._channels.values():
+            channel.start()
+
         await self.connect()
         await self.subscribe_events()  # Subscribe to state_changed
 
@@ -360,6 +492,10 @@ class WebSocketClient:
         if self.automation_tracker:
             await self.subscribe_events("automation_triggered")
 
+        # Subscribe to registry updates to keep the registry cache current
+        if self.registry_cache:
+            await self._subscribe_registry_events()
+
         # Start listening loop
         asyncio.create_task(self._listen_loop())
         logger.info("WebSocket client started")
@@ -379,8 +515,20 @@ class WebSocketClient:
             await self._ws.close()
             self._ws = None
 
+        # Give workers a bounded chance to finish events already received
+        for channel in self._channels.values():
+            await channel.stop(drain_timeout=self.config.websocket.timeout_seconds)
+
         logger.info("WebSocket client stopped")
 
+    def get_pipeline_stats(self) -> dict[str, dict[str, Any]]:
+        """Get queue depth, lag and overflow metrics per event type.
+
+        Returns:
+            Dictionary mapping event type to channel statistics
+        """
+        return {name: channel.get_stats() for name, channel in self._channels.items()}
+
     async def ping(self) -> bool:
         """Send ping to check connection health.
 
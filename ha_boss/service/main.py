@@ -5,27 +5,37 @@ import logging
 import signal
 from datetime import UTC, datetime
 from functools import partial
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from ha_boss.automation.health_tracker import AutomationHealthTracker
-from ha_boss.core.config import Config
+from ha_boss.core.config import Config, HomeAssistantInstance
 from ha_boss.core.database import Database
 from ha_boss.core.exceptions import (
     CircuitBreakerOpenError,
     DatabaseError,
 )
+from ha_boss.core.ha_client import HomeAssistantClient
 from ha_boss.core.types import HealthIssue
+from ha_boss.discovery.registry_cache import RegistryCache
 from ha_boss.healing.cascade_orchestrator import CascadeOrchestrator
 from ha_boss.healing.device_healer import DeviceHealer
 from ha_boss.healing.entity_healer import EntityHealer
 from ha_boss.healing.escalation import NotificationEscalator
+from ha_boss.healing.heal_coalescer import HealCoalescer
 from ha_boss.healing.heal_strategies import HealingManager
 from ha_boss.healing.integration_manager import IntegrationDiscovery
 from ha_boss.monitoring.automation_tracker import AutomationTracker
 from ha_boss.monitoring.health_monitor import HealthMonitor
+from ha_boss.monitoring.persistence_queue import StatePersistenceQueue
+from ha_boss.monitoring.reconciler import SnapshotReconciler
 from ha_boss.monitoring.state_tracker import EntityState, StateTracker
 from ha_boss.monitoring.websocket_client import WebSocketClient
 from ha_boss.notifications.manager import NotificationManager
+from ha_boss.service.startup import InstanceReadiness, InstanceStartup
+
+if TYPE_CHECKING:
+    from ha_boss.api.broadcast_limiter import BroadcastLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -62,15 +72,18 @@ class HABossService:
 
         # Shared components (initialized in start())
         self.database: Database | None = None
+        self.persistence_queue: StatePersistenceQueue | None = None
 
         # Per-instance components (keyed by instance_id)
         self.ha_clients: dict[str, Any] = {}
         self.websocket_clients: dict[str, WebSocketClient] = {}
         self.state_trackers: dict[str, StateTracker] = {}
+        self.snapshot_reconcilers: dict[str, SnapshotReconciler] = {}
         self.health_monitors: dict[str, HealthMonitor] = {}
         self.integration_discoveries: dict[str, IntegrationDiscovery] = {}
         self.entity_discoveries: dict[str, Any] = {}  # EntityDiscoveryService
         self.healing_managers: dict[str, HealingManager] = {}
+        self.heal_coalescers: dict[str, HealCoalescer] = {}
         self.notification_managers: dict[str, NotificationManager] = {}
         self.escalation_managers: dict[str, NotificationEscalator] = {}
         self.pattern_collectors: dict[str, Any] = {}  # PatternCollector (Phase 2)
@@ -79,6 +92,10 @@ class HABossService:
         self.cascade_orchestrators: dict[str, CascadeOrchestrator] = {}
         self.entity_healers: dict[str, EntityHealer] = {}
         self.device_healers: dict[str, DeviceHealer] = {}
+        self.registry_caches: dict[str, RegistryCache] = {}
+
+        # Startup readiness and phase timing per instance
+        self.instance_startup: dict[str, InstanceStartup] = {}
 
         # Background tasks
         self._tasks: list[asyncio.Task[None]] = []
@@ -92,10 +109,8 @@ class HABossService:
         self.healings_succeeded: dict[str, int] = {}
         self.healings_failed: dict[str, int] = {}
 
-        # WebSocket broadcast throttling (per instance, per entity)
-        # Key: f"{instance_id}:{entity_id}", Value: last broadcast timestamp
-        self._last_ws_broadcasts: dict[str, datetime] = {}
-        self._ws_broadcast_min_interval: float = 1.0  # Minimum 1 second between broadcasts
+        # Dashboard broadcast throttling and rate limiting (per instance)
+        self._broadcast_limiters: dict[str, BroadcastLimiter] = {}
 
     def _get_default_instance_id(self) -> str:
         """Get the default instance ID (first instance or 'default').
@@ -151,6 +166,13 @@ class HABossService:
         """Get the default pattern collector for backward compatibility."""
         return self.pattern_collectors.get(self._get_default_instance_id())
 
+    def _cascade_journal_path(self, instance_id: str) -> Path | None:
+        """Get the cascade journal fallback file next to the database (None if in memory)."""
+        db_path = Path(str(self.config.database.path))
+        if str(db_path) == ":memory:":
+            return None
+        return db_path.with_name(f"cascade_journal_{instance_id}.jsonl")
+
     async def _initialize_instance(
         self, instance_id: str, url: str, token: str, bridge_enabled: bool
     ) -> None:
@@ -167,6 +189,7 @@ class HABossService:
             HomeAssistantAuthError: Authentication failed
         """
         logger.info(f"[{instance_id}] Initializing instance...")
+        startup = self.instance_startup.setdefault(instance_id, InstanceStartup(instance_id))
 
         # Initialize statistics for this instance
         self.health_checks_performed[instance_id] = 0
@@ -175,10 +198,8 @@ class HABossService:
         self.healings_failed[instance_id] = 0
 
         # 1. Create Home Assistant client
+        startup.begin_phase(InstanceReadiness.CONNECTING)
         logger.info(f"[{instance_id}] Connecting to Home Assistant at {url}...")
-        from ha_boss.core.config import HomeAssistantInstance
-        from ha_boss.core.ha_client import HomeAssistantClient
-
         instance = HomeAssistantInstance(
             instance_id=instance_id, url=url, token=token, bridge_enabled=bridge_enabled
         )
@@ -189,6 +210,7 @@ class HABossService:
         logger.info(f"[{instance_id}] ✓ Home Assistant connection established")
 
         # 2. Initialize notification manager
+        startup.begin_phase(InstanceReadiness.DISCOVERING)
         logger.info(f"[{instance_id}] Initializing notification manager...")
         self.notification_managers[instance_id] = NotificationManager(
             config=self.config,
@@ -242,6 +264,7 @@ class HABossService:
             self.entity_discoveries[instance_id] = None
 
         # 5. Initialize state tracker with REST snapshot
+        startup.begin_phase(InstanceReadiness.HYDRATING)
         logger.info(f"[{instance_id}] Initializing state tracker...")
 
         # Create callback wrapper to include instance_id
@@ -250,25 +273,40 @@ class HABossService:
         ) -> None:
             await self._on_state_updated(instance_id, new_state, old_state)
 
+        def on_entity_removed(entity_id: str) -> None:
+            # Stop throttling entities that no longer exist
+            limiter = self._broadcast_limiters.get(instance_id)
+            if limiter:
+                limiter.forget(entity_id)
+
+        # Registry cache loads lazily on first lookup (device queries, device healing)
+        self.registry_caches[instance_id] = RegistryCache(
+            self.ha_clients[instance_id], instance_id=instance_id
+        )
         self.state_trackers[instance_id] = StateTracker(
             instance_id=instance_id,
             database=self.database,
+            integration_discovery=self.integration_discoveries[instance_id],
+            registry_cache=self.registry_caches[instance_id],
             on_state_updated=on_state_updated_wrapper,
+            on_entity_removed=on_entity_removed,
+            persistence_queue=self.persistence_queue,
+            history_size=self.config.monitoring.history_buffer_size,
+            history_seconds=self.config.monitoring.history_buffer_seconds,
+            cached_attributes=self.config.monitoring.cached_attributes,
         )
 
-        # Fetch initial state from REST API
+        # Fetch initial state from REST API and hydrate cache + database in bulk
         states = await self.ha_clients[instance_id].get_states()
-        for state_data in states:
-            # Wrap REST API format in WebSocket event format
-            event_data = {
-                "entity_id": state_data.get("entity_id"),
-                "new_state": state_data,
-            }
-            await self.state_trackers[instance_id].update_state(event_data)
+        await self.state_trackers[instance_id].initialize(states)
+        self.snapshot_reconcilers[instance_id] = SnapshotReconciler(
+            self.state_trackers[instance_id]
+        )
 
         logger.info(f"[{instance_id}] ✓ State tracker initialized with {len(states)} entities")
 
         # 6. Initialize health monitor
+        startup.begin_phase(InstanceReadiness.CONFIGURING)
         logger.info(f"[{instance_id}] Initializing health monitor...")
         self.health_monitors[instance_id] = HealthMonitor(
             config=self.config,
@@ -287,6 +325,14 @@ class HABossService:
             ha_client=self.ha_clients[instance_id],
             integration_discovery=self.integration_discoveries[instance_id],
         )
+        if self.config.healing.coalesce_window_seconds > 0:
+            self.heal_coalescers[instance_id] = HealCoalescer(
+                healing_manager=self.healing_managers[instance_id],
+                integration_discovery=self.integration_discoveries[instance_id],
+                on_outcome=partial(self._on_heal_outcome, instance_id),
+                window_seconds=self.config.healing.coalesce_window_seconds,
+                instance_id=instance_id,
+            )
         logger.info(f"[{instance_id}] ✓ Healing manager initialized")
 
         # 8. Initialize escalation manager
@@ -343,6 +389,8 @@ class HABossService:
             reboot_timeout_seconds=self.config.healing.device_healing_reboot_timeout,
             state_verification_timeout=self.config.healing.device_state_verification_timeout,
             state_verification_partial_threshold=self.config.healing.device_state_verification_partial_success_threshold,
+            registry_cache=self.registry_caches[instance_id],
+            state_tracker=self.state_trackers[instance_id],
         )
         logger.info(f"[{instance_id}] ✓ Device healer initialized")
 
@@ -357,7 +405,12 @@ class HABossService:
             instance_id=instance_id,
             pattern_match_threshold=2,  # Default threshold
             max_concurrent_healings=self.config.healing.max_concurrent_entity_healing,
+            journal_fallback_path=self._cascade_journal_path(instance_id),
         )
+        # Write journals of cascades whose final transaction failed last run,
+        # then warm the pattern index so it includes them
+        await self.cascade_orchestrators[instance_id].replay_journals()
+        await self.cascade_orchestrators[instance_id].warm_pattern_index()
         logger.info(f"[{instance_id}] ✓ Cascade orchestrator initialized")
 
         # 9e. Initialize healing plan components (if enabled)
@@ -371,17 +424,19 @@ class HABossService:
 
                 plan_loader = PlanLoader(
                     database=self.database,
-                    builtin_enabled=self.config.healing.healing_plans_use_builtin,
                     user_plans_directory=self.config.healing.healing_plans_directory,
+                    use_builtin=self.config.healing.healing_plans_use_builtin,
                 )
-                plans = plan_loader.load_all_plans()
+                plans = await plan_loader.load_all_plans()
                 logger.info(f"[{instance_id}] Loaded {len(plans)} healing plan(s)")
 
-                plan_matcher = PlanMatcher(plans=plans)
+                plan_matcher = PlanMatcher(plan_loader=plan_loader)
+                await plan_matcher.refresh()
                 plan_executor = PlanExecutor(
                     database=self.database,
                     entity_healer=self.entity_healers[instance_id],
                     device_healer=self.device_healers[instance_id],
+                    state_tracker=self.state_trackers[instance_id],
                 )
 
                 # Inject into cascade orchestrator
@@ -414,10 +469,12 @@ class HABossService:
             config=config_for_tracker,
             cascade_orchestrator=self.cascade_orchestrators[instance_id],
             health_tracker=self.health_trackers[instance_id],
+            state_tracker=self.state_trackers[instance_id],
         )
         logger.info(f"[{instance_id}] ✓ Automation tracker initialized")
 
         # 10. Connect WebSocket
+        startup.begin_phase(InstanceReadiness.SUBSCRIBING)
         logger.info(f"[{instance_id}] Connecting to Home Assistant WebSocket...")
         self.websocket_clients[instance_id] = WebSocketClient(
             instance=instance,
@@ -425,6 +482,7 @@ class HABossService:
             entity_discovery=self.entity_discoveries.get(instance_id),
             automation_tracker=self.automation_trackers.get(instance_id),
             on_state_changed=lambda event: self._on_websocket_state_changed(instance_id, event),
+            registry_cache=self.registry_caches.get(instance_id),
         )
         await self.websocket_clients[instance_id].start()
 
@@ -444,26 +502,72 @@ class HABossService:
 
         logger.info(f"[{instance_id}] ✅ Instance initialization complete")
 
+    async def _start_instance(
+        self, instance_config: HomeAssistantInstance, slots: asyncio.Semaphore
+    ) -> None:
+        """Initialize one instance within the startup fan-out and start its tasks.
+
+        An instance begins monitoring as soon as its own initialization finishes,
+        without waiting for slower instances. A failed instance is marked failed
+        and its partially created components are stopped.
+
+        Args:
+            instance_config: Instance configuration
+            slots: Semaphore bounding concurrent instance initialization
+
+        Raises:
+            Exception: Whatever aborted this instance's initialization
+        """
+        instance_id = instance_config.instance_id
+        startup = self.instance_startup[instance_id]
+
+        async with slots:
+            try:
+                await self._initialize_instance(
+                    instance_id=instance_id,
+                    url=instance_config.url,
+                    token=instance_config.token,
+                    bridge_enabled=instance_config.bridge_enabled,
+                )
+            except Exception as e:
+                startup.mark_failed(e)
+                logger.error(f"[{instance_id}] ❌ Instance initialization failed: {startup.error}")
+                await self._cleanup_instance(instance_id)
+                raise
+
+        startup.mark_ready()
+        logger.info(
+            f"[{instance_id}] Instance ready in {startup.total_ms:.0f}ms "
+            f"({startup.format_timings()})"
+        )
+        self._start_instance_tasks(instance_id)
+
     async def start(self) -> None:
         """Start the HA Boss service and all components.
 
-        Initialization order:
+        Initialization order (steps 3-11 run per instance, for up to
+        home_assistant.startup_concurrency instances concurrently; each instance
+        starts its background tasks as soon as it is ready):
         1. Database initialization
-        2. Home Assistant client connection + test
-        3. Notification manager
-        4. Integration discovery
-        5. Entity discovery (auto-discovery from automations/scenes/scripts)
-        6. State tracker with REST snapshot (filtered by discovery)
-        7. Health monitor
-        8. Healing manager
-        9. Escalation manager
-        10. WebSocket connection and subscription
-        11. Background monitoring tasks (including periodic discovery)
+        2. API server (so /api/health reports instances while they start)
+        3. Home Assistant client connection + test
+        4. Notification manager
+        5. Integration discovery
+        6. Entity discovery (auto-discovery from automations/scenes/scripts)
+        7. State tracker with REST snapshot (filtered by discovery)
+        8. Health monitor
+        9. Healing manager
+        10. Escalation manager
+        11. WebSocket connection and subscription
+        12. Background monitoring tasks (including periodic discovery)
+
+        Startup fails only if every instance fails; otherwise failed instances are
+        reported through their readiness state.
 
         Raises:
             DatabaseError: Database initialization failed
-            HomeAssistantConnectionError: Cannot connect to HA
-            HomeAssistantAuthError: Authentication failed
+            HomeAssistantConnectionError: Cannot connect to HA (all instances)
+            HomeAssistantAuthError: Authentication failed (all instances)
         """
         if self.state != ServiceState.STOPPED:
             logger.warning(f"Service already started or starting (state: {self.state})")
@@ -476,7 +580,11 @@ class HABossService:
         try:
             # 1. Initialize database (shared across all instances)
             logger.info("Initializing database...")
-            self.database = Database(self.config.database.path)
+            self.database = Database(
+                self.config.database.path,
+                echo=self.config.database.echo,
+                tuning=self.config.database.tuning,
+            )
             await self.database.init_db()
 
             # Validate database schema version
@@ -486,6 +594,16 @@ class HABossService:
                 raise DatabaseError(message)
             logger.info(f"✓ Database initialized ({message})")
 
+            # Write-behind queue for entity state persistence (shared across instances)
+            if self.config.database.write_behind_enabled:
+                self.persistence_queue = StatePersistenceQueue(
+                    database=self.database,
+                    batch_size=self.config.database.write_batch_size,
+                    flush_interval_seconds=self.config.database.write_flush_interval_seconds,
+                    max_pending=self.config.database.write_queue_max_pending,
+                )
+                await self.persistence_queue.start()
+
             # 2. Initialize all Home Assistant instances
             # First check config file instances
             instances = self.config.home_assistant.instances
@@ -502,8 +620,6 @@ class HABossService:
 
                 if db_instances:
                     logger.info(f"Found {len(db_instances)} instance(s) in database")
-                    from ha_boss.core.config import HomeAssistantInstance
-
                     instances = [
                         HomeAssistantInstance(
                             instance_id=inst_id,
@@ -535,29 +651,51 @@ class HABossService:
                         "Cannot start service."
                     )
 
-            logger.info(f"Initializing {len(instances)} Home Assistant instance(s)...")
-
-            # Initialize instances sequentially to avoid overwhelming resources
-            for instance_config in instances:
-                await self._initialize_instance(
-                    instance_id=instance_config.instance_id,
-                    url=instance_config.url,
-                    token=instance_config.token,
-                    bridge_enabled=instance_config.bridge_enabled,
-                )
-
-            logger.info(f"✅ All {len(instances)} instance(s) initialized successfully")
+            concurrency = self.config.home_assistant.startup_concurrency
+            logger.info(
+                f"Initializing {len(instances)} Home Assistant instance(s) "
+                f"(up to {concurrency} concurrently)..."
+            )
 
-            # 3. Start background tasks
-            logger.info("Starting background tasks...")
-            self._start_background_tasks()
+            # Initialize instances concurrently (bounded); each instance starts its
+            # background tasks as soon as it is ready
+            self.instance_startup = {
+                inst.instance_id: InstanceStartup(inst.instance_id) for inst in instances
+            }
 
-            # 11. Start API server if enabled
+            # Start API server first so /api/health reports instances while they connect
             if self.config.api.enabled:
                 api_addr = f"{self.config.api.host}:{self.config.api.port}"
                 logger.info(f"Starting API server on {api_addr}...")
                 self._start_api_server()
 
+            slots = asyncio.Semaphore(concurrency)
+            results = await asyncio.gather(
+                *(self._start_instance(inst, slots) for inst in instances),
+                return_exceptions=True,
+            )
+            failures = [result for result in results if isinstance(result, BaseException)]
+
+            if len(failures) == len(instances):
+                raise failures[0]
+            if failures:
+                failed_ids = [
+                    instance_id
+                    for instance_id, startup in self.instance_startup.items()
+                    if startup.state == InstanceReadiness.FAILED
+                ]
+                logger.warning(
+                    f"⚠️ {len(instances) - len(failures)}/{len(instances)} instance(s) "
+                    f"initialized; failed: {', '.join(failed_ids)}"
+                )
+            else:
+                logger.info(f"✅ All {len(instances)} instance(s) initialized successfully")
+
+            logger.info(
+                f"Started {len(self._tasks)} background tasks for "
+                f"{len(instances) - len(failures)} instance(s)"
+            )
+
             self.state = ServiceState.RUNNING
             logger.info("✅ HA Boss service started successfully")
             logger.info(
@@ -573,40 +711,44 @@ class HABossService:
             await self._cleanup()
             raise
 
-    def _start_background_tasks(self) -> None:
-        """Start all background tasks for all instances."""
-        # Start tasks for each instance
+    def _start_instance_tasks(self, instance_id: str) -> None:
+        """Start background tasks for one initialized instance.
+
+        Args:
+            instance_id: Instance identifier
+        """
         # Note: WebSocket is already started in _initialize_instance() via start()
         # which creates its own internal listening loop - no need to start again here
-        for instance_id in self.websocket_clients:
-            # Periodic REST snapshot validation (every 5 minutes)
-            task = asyncio.create_task(self._periodic_snapshot_validation(instance_id))
-            task.set_name(f"periodic_snapshot_validation_{instance_id}")
-            self._tasks.append(task)
+        # Periodic REST snapshot validation (every 5 minutes)
+        task = asyncio.create_task(self._periodic_snapshot_validation(instance_id))
+        task.set_name(f"periodic_snapshot_validation_{instance_id}")
+        self._tasks.append(task)
 
-            # Periodic entity discovery refresh (if enabled and interval > 0)
-            entity_discovery = self.entity_discoveries.get(instance_id)
-            if (
-                entity_discovery
-                and self.config.monitoring.auto_discovery.refresh_interval_seconds > 0
-            ):
-                task = asyncio.create_task(
-                    entity_discovery.start_periodic_refresh(
-                        self.config.monitoring.auto_discovery.refresh_interval_seconds
-                    )
+        # Periodic entity discovery refresh (if enabled and interval > 0)
+        entity_discovery = self.entity_discoveries.get(instance_id)
+        if entity_discovery and self.config.monitoring.auto_discovery.refresh_interval_seconds > 0:
+            task = asyncio.create_task(
+                entity_discovery.start_periodic_refresh(
+                    self.config.monitoring.auto_discovery.refresh_interval_seconds
                 )
-                task.set_name(f"periodic_discovery_refresh_{instance_id}")
-                self._tasks.append(task)
+            )
+            task.set_name(f"periodic_discovery_refresh_{instance_id}")
+            self._tasks.append(task)
 
         # Note: HealthMonitor runs its own internal monitoring loop (per instance)
         # No need for separate periodic health check task here
 
-        logger.info(
-            f"Started {len(self._tasks)} background tasks for {len(self.websocket_clients)} instance(s)"
-        )
-
     def _start_api_server(self) -> None:
         """Start the FastAPI server in a background task."""
+        from ha_boss.api.websocket_manager import get_websocket_manager
+
+        # The app built by _run_api_server has no lifespan, so apply broadcast settings here
+        get_websocket_manager().configure(
+            flush_interval=self.config.api.websocket_flush_interval_ms / 1000,
+            client_queue_size=self.config.api.websocket_client_queue_size,
+            send_timeout=self.config.api.websocket_send_timeout_seconds,
+        )
+
         task = asyncio.create_task(self._run_api_server())
         task.set_name("api_server")
         self._tasks.append(task)
@@ -822,20 +964,24 @@ Access the web dashboard at `/dashboard` for a visual interface.
         while not self._shutdown_event.is_set():
             try:
                 ha_client = self.ha_clients.get(instance_id)
-                state_tracker = self.state_trackers.get(instance_id)
+                reconciler = self.snapshot_reconcilers.get(instance_id)
 
-                if ha_client and state_tracker:
+                if ha_client and reconciler:
                     logger.debug(f"[{instance_id}] Fetching REST API snapshot for validation...")
-                    states = await ha_client.get_states()
-
-                    # Update state tracker with fresh data
-                    for state_data in states:
-                        entity_id = state_data.get("entity_id")
-                        if entity_id:
-                            await state_tracker.update_state(state_data)
+                    # Apply only entities that drifted from the cache (missed WebSocket events)
+                    result = await reconciler.fetch_and_reconcile(
+                        partial(ha_client.get_states, fresh=True)
+                    )
 
+                    if result.missed_events:
+                        logger.info(
+                            f"[{instance_id}] Snapshot reconciliation: {result.missed_events} "
+                            f"missed events ({len(result.diverged)} diverged, "
+                            f"{len(result.missing)} missing, {len(result.removed)} removed)"
+                        )
                     logger.debug(
-                        f"[{instance_id}] Validated {len(states)} entities via REST snapshot"
+                        f"[{instance_id}] Validated {result.compared} entities via REST snapshot "
+                        f"({result.unchanged} unchanged, {result.duration_ms}ms)"
                     )
 
                 await asyncio.sleep(interval)
@@ -866,6 +1012,37 @@ Access the web dashboard at `/dashboard` for a visual interface.
                 f"[{instance_id}] Error handling WebSocket state change: {e}", exc_info=True
             )
 
+    def _get_broadcast_limiter(self, instance_id: str) -> "BroadcastLimiter":
+        """Get (or create) the dashboard broadcast limiter of an instance.
+
+        Args:
+            instance_id: Home Assistant instance identifier
+
+        Returns:
+            Broadcast limiter configured from the API settings
+        """
+        limiter = self._broadcast_limiters.get(instance_id)
+        if limiter is None:
+            from ha_boss.api.broadcast_limiter import BroadcastLimiter
+            from ha_boss.api.websocket_manager import get_websocket_manager
+
+            api_config = self.config.api
+
+            async def send_summary(summary: dict[str, Any]) -> None:
+                await get_websocket_manager().broadcast_entity_summary(instance_id, summary)
+
+            limiter = BroadcastLimiter(
+                instance_id,
+                send_summary,
+                min_interval=api_config.websocket_entity_min_interval_seconds,
+                max_entities=api_config.websocket_throttle_max_entities,
+                rate=api_config.websocket_rate_limit_per_second,
+                burst=api_config.websocket_rate_limit_burst,
+                summary_interval=api_config.websocket_summary_interval_seconds,
+            )
+            self._broadcast_limiters[instance_id] = limiter
+        return limiter
+
     async def _on_state_updated(
         self, instance_id: str, new_state: EntityState, old_state: EntityState | None
     ) -> None:
@@ -880,22 +1057,18 @@ Access the web dashboard at `/dashboard` for a visual interface.
         try:
             from ha_boss.api.websocket_manager import get_websocket_manager
 
-            # Check if we should broadcast (rate limiting)
-            broadcast_key = f"{instance_id}:{new_state.entity_id}"
-            now = datetime.now(UTC)
-            last_broadcast = self._last_ws_broadcasts.get(broadcast_key)
+            ws_manager = get_websocket_manager()
 
-            # Always broadcast if state value changed (not just attributes)
+            # Attribute-only updates are throttled per entity; state changes
+            # only count against the instance's rate limit. Nothing is built
+            # when no dashboard is connected to this instance.
             state_changed = old_state is None or old_state.state != new_state.state
+            limiter = self._get_broadcast_limiter(instance_id)
 
-            # Otherwise, check throttle interval
-            should_broadcast = state_changed or (
-                last_broadcast is None
-                or (now - last_broadcast).total_seconds() >= self._ws_broadcast_min_interval
-            )
-
-            if should_broadcast:
-                ws_manager = get_websocket_manager()
+            if ws_manager.get_instance_connection_count(instance_id) and limiter.admit(
+                new_state.entity_id, state_changed
+            ):
+                # Attributes stay unparsed until the coalesced frame is serialized
                 await ws_manager.broadcast_entity_state(
                     instance_id=instance_id,
                     entity_id=new_state.entity_id,
@@ -905,12 +1078,6 @@ Access the web dashboard at `/dashboard` for a visual interface.
                         "attributes": new_state.attributes,
                     },
                 )
-                self._last_ws_broadcasts[broadcast_key] = now
-            else:
-                logger.debug(
-                    f"[{instance_id}] Throttled WebSocket broadcast for {new_state.entity_id} "
-                    f"(last broadcast {(now - last_broadcast).total_seconds():.1f}s ago)"
-                )
 
         except Exception as e:
             logger.debug(f"[{instance_id}] Failed to broadcast state change: {e}")
@@ -971,7 +1138,6 @@ Access the web dashboard at `/dashboard` for a visual interface.
         pattern_collector = self.pattern_collectors.get(instance_id)
         integration_discovery = self.integration_discoveries.get(instance_id)
         healing_manager = self.healing_managers.get(instance_id)
-        escalation_manager = self.escalation_managers.get(instance_id)
 
         # Record unavailable event for pattern analysis (Phase 2)
         if pattern_collector and issue.issue_type in ("unavailable", "stale"):
@@ -998,149 +1164,206 @@ Access the web dashboard at `/dashboard` for a visual interface.
 
         # Attempt auto-healing if enabled
         if self.config.healing.enabled and healing_manager:
+            self.healings_attempted[instance_id] = self.healings_attempted.get(instance_id, 0) + 1
+
+            # Heal together with other failing entities of the same integration
+            heal_coalescer = self.heal_coalescers.get(instance_id)
+            if heal_coalescer:
+                logger.info(f"[{instance_id}] Queued auto-heal for {issue.entity_id}")
+                heal_coalescer.submit(issue)
+                return
+
             try:
                 logger.info(f"[{instance_id}] Attempting auto-heal for {issue.entity_id}...")
-                self.healings_attempted[instance_id] = (
-                    self.healings_attempted.get(instance_id, 0) + 1
-                )
-
                 success = await healing_manager.heal(issue)
+                await self._on_heal_result(instance_id, issue, success)
+            except Exception as e:
+                await self._on_heal_error(instance_id, [issue], e)
+        else:
+            logger.info(f"[{instance_id}] Auto-healing disabled, issue logged only")
+
+    async def _on_heal_outcome(
+        self,
+        instance_id: str,
+        issues: list[HealthIssue],
+        healed: list[HealthIssue],
+        error: Exception | None,
+    ) -> None:
+        """Callback when a (possibly coalesced) integration heal completes.
+
+        Fans the outcome of the group's single reload back to every entity.
 
-                # Record healing attempt for pattern analysis (Phase 2)
-                if pattern_collector:
-                    try:
-                        # Get integration info
-                        integration_id = None
-                        integration_domain = None
-                        if integration_discovery:
-                            integration_id = integration_discovery.get_integration_for_entity(
-                                issue.entity_id
-                            )
-                            if integration_id:
-                                integration_domain = integration_discovery.get_domain(
-                                    integration_id
-                                )
-
-                        if success:
-                            await pattern_collector.record_healing_attempt(
-                                entity_id=issue.entity_id,
-                                integration_id=integration_id,
-                                integration_domain=integration_domain,
-                                success=True,
-                                timestamp=datetime.now(UTC),
-                                details={"issue_type": issue.issue_type},
-                            )
-                        else:
-                            await pattern_collector.record_healing_attempt(
-                                entity_id=issue.entity_id,
-                                integration_id=integration_id,
-                                integration_domain=integration_domain,
-                                success=False,
-                                timestamp=datetime.now(UTC),
-                                details={
-                                    "issue_type": issue.issue_type,
-                                    "max_attempts": self.config.healing.max_attempts,
-                                },
-                            )
-                    except Exception as e:
-                        logger.debug(f"[{instance_id}] Failed to record healing attempt: {e}")
+        Args:
+            instance_id: Home Assistant instance identifier
+            issues: Health issues healed together
+            healed: Issues the reload was performed for
+            error: Exception raised by the heal attempt, if any
+        """
+        if error is not None:
+            await self._on_heal_error(instance_id, issues, error)
+            return
+
+        healed_ids = {issue.entity_id for issue in healed}
+        for issue in issues:
+            await self._on_heal_result(instance_id, issue, issue.entity_id in healed_ids)
+
+    async def _on_heal_result(self, instance_id: str, issue: HealthIssue, success: bool) -> None:
+        """Record, broadcast and (on failure) escalate one entity's heal result.
+
+        Args:
+            instance_id: Home Assistant instance identifier
+            issue: Health issue that was healed
+            success: Whether healing succeeded
+        """
+        pattern_collector = self.pattern_collectors.get(instance_id)
+        integration_discovery = self.integration_discoveries.get(instance_id)
+        escalation_manager = self.escalation_managers.get(instance_id)
+
+        # Record healing attempt for pattern analysis (Phase 2)
+        if pattern_collector:
+            try:
+                # Get integration info
+                integration_id = None
+                integration_domain = None
+                if integration_discovery:
+                    integration_id = integration_discovery.get_integration_for_entity(
+                        issue.entity_id
+                    )
+                    if integration_id:
+                        integration_domain = integration_discovery.get_domain(integration_id)
 
                 if success:
-                    logger.info(f"[{instance_id}] ✓ Successfully healed {issue.entity_id}")
-                    self.healings_succeeded[instance_id] = (
-                        self.healings_succeeded.get(instance_id, 0) + 1
+                    await pattern_collector.record_healing_attempt(
+                        entity_id=issue.entity_id,
+                        integration_id=integration_id,
+                        integration_domain=integration_domain,
+                        success=True,
+                        timestamp=datetime.now(UTC),
+                        details={"issue_type": issue.issue_type},
+                    )
+                else:
+                    await pattern_collector.record_healing_attempt(
+                        entity_id=issue.entity_id,
+                        integration_id=integration_id,
+                        integration_domain=integration_domain,
+                        success=False,
+                        timestamp=datetime.now(UTC),
+                        details={
+                            "issue_type": issue.issue_type,
+                            "max_attempts": self.config.healing.max_attempts,
+                        },
                     )
+            except Exception as e:
+                logger.debug(f"[{instance_id}] Failed to record healing attempt: {e}")
 
-                    # Emit WebSocket event for successful healing action
-                    try:
-                        from ha_boss.api.websocket_manager import get_websocket_manager
-
-                        ws_manager = get_websocket_manager()
-                        await ws_manager.broadcast_healing_action(
-                            instance_id=instance_id,
-                            action={
-                                "entity_id": issue.entity_id,
-                                "action": "heal",
-                                "success": True,
-                                "issue_type": issue.issue_type,
-                                "timestamp": datetime.now(UTC).isoformat(),
-                            },
-                        )
-                    except Exception as e:
-                        logger.debug(f"[{instance_id}] Failed to broadcast healing action: {e}")
+        if success:
+            logger.info(f"[{instance_id}] ✓ Successfully healed {issue.entity_id}")
+            self.healings_succeeded[instance_id] = self.healings_succeeded.get(instance_id, 0) + 1
 
-                else:
-                    logger.warning(f"[{instance_id}] ✗ Healing failed for {issue.entity_id}")
-                    self.healings_failed[instance_id] = self.healings_failed.get(instance_id, 0) + 1
-
-                    # Emit WebSocket event for failed healing action
-                    try:
-                        from ha_boss.api.websocket_manager import get_websocket_manager
-
-                        ws_manager = get_websocket_manager()
-                        await ws_manager.broadcast_healing_action(
-                            instance_id=instance_id,
-                            action={
-                                "entity_id": issue.entity_id,
-                                "action": "heal",
-                                "success": False,
-                                "issue_type": issue.issue_type,
-                                "timestamp": datetime.now(UTC).isoformat(),
-                                "error": f"Healing failed after {self.config.healing.max_attempts} attempts",
-                            },
-                        )
-                    except Exception as e:
-                        logger.debug(f"[{instance_id}] Failed to broadcast healing action: {e}")
-
-                    # Escalate to notifications
-                    if escalation_manager:
-                        await escalation_manager.notify_healing_failure(
-                            health_issue=issue,
-                            error=Exception(
-                                f"Healing failed after {self.config.healing.max_attempts} attempts"
-                            ),
-                            attempts=self.config.healing.max_attempts,
-                        )
+            # Emit WebSocket event for successful healing action
+            try:
+                from ha_boss.api.websocket_manager import get_websocket_manager
 
-            except CircuitBreakerOpenError:
-                logger.warning(
-                    f"[{instance_id}] Circuit breaker open, skipping heal attempt for {issue.entity_id}"
+                ws_manager = get_websocket_manager()
+                await ws_manager.broadcast_healing_action(
+                    instance_id=instance_id,
+                    action={
+                        "entity_id": issue.entity_id,
+                        "action": "heal",
+                        "success": True,
+                        "issue_type": issue.issue_type,
+                        "timestamp": datetime.now(UTC).isoformat(),
+                    },
                 )
-                # Escalate circuit breaker trip
-                if escalation_manager and integration_discovery:
-                    # Get integration name for notification
-                    entry_id = integration_discovery.get_integration_for_entity(issue.entity_id)
-                    integration_name = issue.entity_id  # Default to entity_id
-                    if entry_id:
-                        details = integration_discovery.get_integration_details(entry_id)
-                        if details:
-                            integration_name = (
-                                details.get("title") or details.get("domain") or entry_id
-                            )
-
-                    # Calculate reset time
-                    from datetime import timedelta
-
-                    reset_time = datetime.now(UTC) + timedelta(
-                        seconds=self.config.healing.circuit_breaker_reset_seconds
-                    )
+            except Exception as e:
+                logger.debug(f"[{instance_id}] Failed to broadcast healing action: {e}")
 
-                    await escalation_manager.notify_circuit_breaker_open(
-                        integration_name=integration_name,
-                        failure_count=self.config.healing.circuit_breaker_threshold,
-                        reset_time=reset_time,
-                    )
+        else:
+            logger.warning(f"[{instance_id}] ✗ Healing failed for {issue.entity_id}")
+            self.healings_failed[instance_id] = self.healings_failed.get(instance_id, 0) + 1
+
+            # Emit WebSocket event for failed healing action
+            try:
+                from ha_boss.api.websocket_manager import get_websocket_manager
 
+                ws_manager = get_websocket_manager()
+                await ws_manager.broadcast_healing_action(
+                    instance_id=instance_id,
+                    action={
+                        "entity_id": issue.entity_id,
+                        "action": "heal",
+                        "success": False,
+                        "issue_type": issue.issue_type,
+                        "timestamp": datetime.now(UTC).isoformat(),
+                        "error": f"Healing failed after {self.config.healing.max_attempts} attempts",
+                    },
+                )
             except Exception as e:
-                logger.error(
-                    f"[{instance_id}] Error during healing attempt for {issue.entity_id}: {e}",
-                    exc_info=True,
+                logger.debug(f"[{instance_id}] Failed to broadcast healing action: {e}")
+
+            # Escalate to notifications
+            if escalation_manager:
+                await escalation_manager.notify_healing_failure(
+                    health_issue=issue,
+                    error=Exception(
+                        f"Healing failed after {self.config.healing.max_attempts} attempts"
+                    ),
+                    attempts=self.config.healing.max_attempts,
+                )
+
+    async def _on_heal_error(
+        self, instance_id: str, issues: list[HealthIssue], error: Exception
+    ) -> None:
+        """Handle a heal attempt that raised, once for all entities healed together.
+
+        Args:
+            instance_id: Home Assistant instance identifier
+            issues: Health issues healed together
+            error: Exception raised by the heal attempt
+        """
+        integration_discovery = self.integration_discoveries.get(instance_id)
+        escalation_manager = self.escalation_managers.get(instance_id)
+        entity_id = issues[0].entity_id
+        target = entity_id if len(issues) == 1 else f"{len(issues)} entities ({entity_id}, ...)"
+
+        if isinstance(error, CircuitBreakerOpenError):
+            logger.warning(
+                f"[{instance_id}] Circuit breaker open, skipping heal attempt for {target}"
+            )
+            # Escalate circuit breaker trip
+            if escalation_manager and integration_discovery:
+                # Get integration name for notification
+                entry_id = integration_discovery.get_integration_for_entity(entity_id)
+                integration_name = entity_id  # Default to entity_id
+                if entry_id:
+                    details = integration_discovery.get_integration_details(entry_id)
+                    if details:
+                        integration_name = details.get("title") or details.get("domain") or entry_id
+
+                # Calculate reset time
+                from datetime import timedelta
+
+                reset_time = datetime.now(UTC) + timedelta(
+                    seconds=self.config.healing.circuit_breaker_reset_seconds
+                )
+
+                await escalation_manager.notify_circuit_breaker_open(
+                    integration_name=integration_name,
+                    failure_count=self.config.healing.circuit_breaker_threshold,
+                    reset_time=reset_time,
                 )
         else:
-            logger.info(f"[{instance_id}] Auto-healing disabled, issue logged only")
+            logger.error(
+                f"[{instance_id}] Error during healing attempt for {target}: {error}",
+                exc_info=error,
+            )
 
     async def stop(self) -> None:
-        """Gracefully stop the HA Boss service."""
+        """Gracefully stop the HA Boss service.
+
+        Pending write-behind state updates are drained to the database after
+        the WebSocket clients stop and before the database is closed.
+        """
         if self.state not in (ServiceState.RUNNING, ServiceState.STARTING):
             logger.warning(f"Service not running (state: {self.state})")
             return
@@ -1166,81 +1389,117 @@ Access the web dashboard at `/dashboard` for a visual interface.
         self.state = ServiceState.STOPPED
         logger.info("HA Boss service stopped")
 
-    async def _cleanup(self) -> None:
-        """Clean up all components for all instances."""
-        # Stop API server (shared)
-        if self._api_server:
+    async def _cleanup_instance(self, instance_id: str) -> None:
+        """Stop and release the components of one instance.
+
+        Safe to call more than once and on partially initialized instances.
+
+        Args:
+            instance_id: Instance identifier
+        """
+        logger.info(f"[{instance_id}] Cleaning up instance components...")
+
+        # Drop queued heals
+        heal_coalescer = self.heal_coalescers.pop(instance_id, None)
+        if heal_coalescer:
+            await heal_coalescer.close()
+
+        # Stop health monitor
+        health_monitor = self.health_monitors.get(instance_id)
+        if health_monitor:
             try:
-                logger.info("Stopping API server...")
-                self._api_server.should_exit = True
-                await asyncio.sleep(0.1)  # Give it time to shutdown gracefully
+                await health_monitor.stop()
             except Exception as e:
-                logger.error(f"Error stopping API server: {e}")
+                logger.error(f"[{instance_id}] Error stopping health monitor: {e}")
 
-        # Clean up each instance
-        for instance_id in list(self.ha_clients.keys()):
-            logger.info(f"[{instance_id}] Cleaning up instance components...")
+        # Stop entity discovery periodic refresh
+        entity_discovery = self.entity_discoveries.get(instance_id)
+        if entity_discovery:
+            try:
+                await entity_discovery.stop_periodic_refresh()
+            except Exception as e:
+                logger.error(f"[{instance_id}] Error stopping entity discovery: {e}")
 
-            # Stop health monitor
-            health_monitor = self.health_monitors.get(instance_id)
-            if health_monitor:
-                try:
-                    await health_monitor.stop()
-                except Exception as e:
-                    logger.error(f"[{instance_id}] Error stopping health monitor: {e}")
+        # Stop dashboard broadcast summaries
+        limiter = self._broadcast_limiters.pop(instance_id, None)
+        if limiter:
+            await limiter.close()
+
+        # Stop WebSocket
+        websocket_client = self.websocket_clients.get(instance_id)
+        if websocket_client:
+            try:
+                await websocket_client.stop()
 
-            # Stop entity discovery periodic refresh
-            entity_discovery = self.entity_discoveries.get(instance_id)
-            if entity_discovery:
+                # Emit WebSocket event for instance disconnection
                 try:
-                    await entity_discovery.stop_periodic_refresh()
+                    from ha_boss.api.websocket_manager import get_websocket_manager
+
+                    ws_manager = get_websocket_manager()
+                    await ws_manager.broadcast_instance_connection(
+                        instance_id=instance_id,
+                        connected=False,
+                    )
                 except Exception as e:
-                    logger.error(f"[{instance_id}] Error stopping entity discovery: {e}")
+                    logger.debug(f"[{instance_id}] Failed to broadcast instance disconnection: {e}")
 
-            # Stop WebSocket
-            websocket_client = self.websocket_clients.get(instance_id)
-            if websocket_client:
-                try:
-                    await websocket_client.stop()
+            except Exception as e:
+                logger.error(f"[{instance_id}] Error stopping WebSocket: {e}")
 
-                    # Emit WebSocket event for instance disconnection
-                    try:
-                        from ha_boss.api.websocket_manager import get_websocket_manager
+        # Close HA client
+        ha_client = self.ha_clients.get(instance_id)
+        if ha_client:
+            try:
+                await ha_client.close()
+            except Exception as e:
+                logger.error(f"[{instance_id}] Error closing HA client: {e}")
 
-                        ws_manager = get_websocket_manager()
-                        await ws_manager.broadcast_instance_connection(
-                            instance_id=instance_id,
-                            connected=False,
-                        )
-                    except Exception as e:
-                        logger.debug(
-                            f"[{instance_id}] Failed to broadcast instance disconnection: {e}"
-                        )
+        # Cleanup automation tracker validators
+        automation_tracker = self.automation_trackers.get(instance_id)
+        if automation_tracker:
+            try:
+                await automation_tracker.cleanup()
+            except Exception as e:
+                logger.error(f"[{instance_id}] Error cleaning up automation tracker: {e}")
 
-                except Exception as e:
-                    logger.error(f"[{instance_id}] Error stopping WebSocket: {e}")
+        # Remove new components from dictionaries
+        self.health_trackers.pop(instance_id, None)
+        self.cascade_orchestrators.pop(instance_id, None)
+        self.entity_healers.pop(instance_id, None)
+        self.device_healers.pop(instance_id, None)
+        self.registry_caches.pop(instance_id, None)
 
-            # Close HA client
-            ha_client = self.ha_clients.get(instance_id)
-            if ha_client:
-                try:
-                    await ha_client.close()
-                except Exception as e:
-                    logger.error(f"[{instance_id}] Error closing HA client: {e}")
+    async def _cleanup(self) -> None:
+        """Clean up all components for all instances."""
+        # Stop API server (shared)
+        if self._api_server:
+            try:
+                logger.info("Stopping API server...")
+                self._api_server.should_exit = True
+                await asyncio.sleep(0.1)  # Give it time to shutdown gracefully
+            except Exception as e:
+                logger.error(f"Error stopping API server: {e}")
 
-            # Cleanup automation tracker validators
-            automation_tracker = self.automation_trackers.get(instance_id)
-            if automation_tracker:
-                try:
-                    await automation_tracker.cleanup()
-                except Exception as e:
-                    logger.error(f"[{instance_id}] Error cleaning up automation tracker: {e}")
+        # Stop dashboard broadcast writer and flush tasks (shared)
+        if self.config.api.enabled:
+            try:
+                from ha_boss.api.websocket_manager import get_websocket_manager
+
+                await get_websocket_manager().close()
+            except Exception as e:
+                logger.error(f"Error closing WebSocket manager: {e}")
+
+        # Clean up each instance
+        for instance_id in list(self.ha_clients.keys()):
+            await self._cleanup_instance(instance_id)
 
-            # Remove new components from dictionaries
-            self.health_trackers.pop(instance_id, None)
-            self.cascade_orchestrators.pop(instance_id, None)
-            self.entity_healers.pop(instance_id, None)
-            self.device_healers.pop(instance_id, None)
+        # Drain write-behind persistence queue (shared) before closing the database
+        if self.persistence_queue:
+            try:
+                logger.info("Draining state persistence queue...")
+                await self.persistence_queue.stop()
+            except Exception as e:
+                logger.error(f"Error draining state persistence queue: {e}")
 
         # Close database (shared)
         if self.database:
@@ -1307,7 +1566,9 @@ Access the web dashboard at `/dashboard` for a visual interface.
                     instance_healings_succeeded / instance_healings_attempted
                 ) * 100
 
+            startup = self.instance_startup.get(instance_id)
             instances_status[instance_id] = {
+                "readiness": startup.to_dict() if startup else None,
                 "websocket_connected": (
                     websocket_client.is_connected() if websocket_client else False
                 ),
@@ -1318,7 +1579,7 @@ Access the web dashboard at `/dashboard` for a visual interface.
                 "healing_success_rate": instance_success_rate,
             }
 
-        return {
+        status: dict[str, Any] = {
             "state": self.state,
             "mode": self.config.mode,
             "uptime_seconds": uptime_seconds,
@@ -1334,3 +1595,65 @@ Access the web dashboard at `/dashboard` for a visual interface.
                 "healing_success_rate": success_rate,
             },
         }
+
+        if self.persistence_queue:
+            status["persistence_queue"] = self.persistence_queue.get_stats()
+
+        if self.websocket_clients:
+            status["event_pipeline"] = {
+                instance_id: client.get_pipeline_stats()
+                for instance_id, client in self.websocket_clients.items()
+            }
+
+        rest_requests = {
+            instance_id: client.get_request_stats()
+            for instance_id, client in self.ha_clients.items()
+            if isinstance(client, HomeAssistantClient)
+        }
+        if rest_requests:
+            status["rest_requests"] = rest_requests
+
+        healing_policy = {
+            instance_id: manager.policy.get_stats()
+            for instance_id, manager in self.healing_managers.items()
+            if isinstance(manager, HealingManager)
+        }
+        if healing_policy:
+            status["healing_policy"] = healing_policy
+
+        if self.heal_coalescers:
+            status["heal_coalescing"] = {
+                instance_id: coalescer.get_stats()
+                for instance_id, coalescer in self.heal_coalescers.items()
+            }
+
+        if self.registry_caches:
+            status["registry_cache"] = {
+                instance_id: cache.get_stats()
+                for instance_id, cache in self.registry_caches.items()
+            }
+
+        state_history = {
+            instance_id: tracker.get_history_stats()
+            for instance_id, tracker in self.state_trackers.items()
+            if isinstance(tracker, StateTracker)
+        }
+        if state_history:
+            status["state_history"] = state_history
+
+        from ha_boss.api.websocket_manager import get_websocket_manager
+
+        status["dashboard_broadcast"] = get_websocket_manager().get_stats()
+        if self._broadcast_limiters:
+            status["dashboard_broadcast"]["rate_limiting"] = {
+                instance_id: limiter.get_stats()
+                for instance_id, limiter in self._broadcast_limiters.items()
+            }
+
+        if self.snapshot_reconcilers:
+            status["snapshot_reconciliation"] = {
+                instance_id: reconciler.get_stats()
+                for instance_id, reconciler in self.snapshot_reconcilers.items()
+            }
+
+        return status
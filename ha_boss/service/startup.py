@@ -0,0 +1,96 @@
+"""Per-instance startup readiness tracking."""
+
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+
+class InstanceReadiness:
+    """Startup phases of a Home Assistant instance, in order."""
+
+    PENDING = "pending"  # Waiting for a startup slot
+    CONNECTING = "connecting"  # REST client created and connection tested
+    DISCOVERING = "discovering"  # Integration and entity discovery
+    HYDRATING = "hydrating"  # REST snapshot loaded into the state tracker
+    CONFIGURING = "configuring"  # Health monitor started, healing components created
+    SUBSCRIBING = "subscribing"  # WebSocket connect, auth and event subscription
+    READY = "ready"
+    FAILED = "failed"
+
+
+@dataclass
+class InstanceStartup:
+    """Readiness state and per-phase timing of one instance's startup."""
+
+    instance_id: str
+    state: str = InstanceReadiness.PENDING
+    phase_durations_ms: dict[str, float] = field(default_factory=dict)
+    started_at: datetime | None = None
+    ready_at: datetime | None = None
+    error: str | None = None
+    _phase_started: float | None = field(default=None, repr=False)
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the instance finished startup successfully."""
+        return self.state == InstanceReadiness.READY
+
+    @property
+    def total_ms(self) -> float:
+        """Total duration of the finished startup phases."""
+        return round(sum(self.phase_durations_ms.values()), 1)
+
+    def begin_phase(self, state: str) -> None:
+        """Finish the current phase (recording its duration) and enter the next one.
+
+        Args:
+            state: InstanceReadiness phase being entered
+        """
+        now = time.perf_counter()
+        if self.started_at is None:
+            self.started_at = datetime.now(UTC)
+        self._finish_phase(now)
+        self.state = state
+        self._phase_started = now
+
+    def mark_ready(self) -> None:
+        """Finish the last phase and mark the instance ready."""
+        self._finish_phase(time.perf_counter())
+        self.state = InstanceReadiness.READY
+        self.ready_at = datetime.now(UTC)
+
+    def mark_failed(self, error: BaseException) -> None:
+        """Finish the current phase and mark the instance failed.
+
+        Args:
+            error: Exception that aborted startup
+        """
+        failed_phase = self.state
+        self._finish_phase(time.perf_counter())
+        self.state = InstanceReadiness.FAILED
+        self.error = f"{failed_phase}: {error}"
+
+    def format_timings(self) -> str:
+        """Human-readable phase timings for logs (e.g. "connecting 120ms, ...")."""
+        return ", ".join(f"{name} {ms:.0f}ms" for name, ms in self.phase_durations_ms.items())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize readiness for status and health endpoints.
+
+        Returns:
+            Dictionary with state, timings and error
+        """
+        return {
+            "state": self.state,
+            "phase_durations_ms": dict(self.phase_durations_ms),
+            "total_ms": self.total_ms,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "ready_at": self.ready_at.isoformat() if self.ready_at else None,
+            "error": self.error,
+        }
+
+    def _finish_phase(self, now: float) -> None:
+        if self._phase_started is not None:
+            self.phase_durations_ms[self.state] = round((now - self._phase_started) * 1000, 1)
+            self._phase_started = None
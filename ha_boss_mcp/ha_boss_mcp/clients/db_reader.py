@@ -1,12 +1,19 @@
 """Read-only SQLite database client for HA Boss data."""
 
 import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import aiosqlite
 
+# Per-connection sqlite3 statement cache size. Pooled connections are long-lived,
+# so each distinct query string is prepared once and reused across tool calls.
+STATEMENT_CACHE_SIZE = 256
+
 
 class DBReaderError(Exception):
     """Base exception for database reader errors."""
@@ -20,10 +27,17 @@ class DBReader:
     Provides direct database access for performance-optimized queries.
     All operations are read-only to maintain data integrity.
 
+    Queries run on a small pool of long-lived connections opened with
+    ``mode=ro``, shared cache and ``PRAGMA query_only``, so chained MCP tool
+    calls don't pay the connect and schema-load cost every time. Aggregate
+    queries are additionally served from a short TTL result cache.
+
     Attributes:
         db_path: Path to SQLite database file
         max_retries: Maximum connection retry attempts
         retry_delay: Delay between retries in seconds
+        pool_size: Maximum number of pooled read-only connections
+        cache_ttl_seconds: TTL for cached aggregate results (0 disables)
     """
 
     def __init__(
@@ -31,6 +45,8 @@ class DBReader:
         db_path: str | Path,
         max_retries: int = 30,
         retry_delay: float = 2.0,
+        pool_size: int = 4,
+        cache_ttl_seconds: float = 30.0,
     ) -> None:
         """Initialize database reader.
 
@@ -38,12 +54,193 @@ class DBReader:
             db_path: Path to HA Boss SQLite database
             max_retries: Max retries to wait for DB (default: 30 = 60s)
             retry_delay: Seconds between retries (default: 2.0)
+            pool_size: Maximum pooled read-only connections (default: 4)
+            cache_ttl_seconds: TTL for aggregate query results (default: 30.0)
         """
         self.db_path = Path(db_path)
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.pool_size = pool_size
+        self.cache_ttl_seconds = cache_ttl_seconds
         self._db_ready = False
 
+        # Connection pool: idle connections, all opened connections, and one slot per
+        # connection that may be borrowed (freed when a connection is returned or discarded)
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._connections: set[aiosqlite.Connection] = set()
+        self._slots = asyncio.Semaphore(pool_size)
+
+        # TTL result cache: key -> (expires_at monotonic, value)
+        self._result_cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+
+        # Counters
+        self._pool_hits = 0
+        self._pool_misses = 0
+        self._pool_waits = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._queries = 0
+        self._query_seconds_total = 0.0
+        self._query_seconds_max = 0.0
+
+    async def close(self) -> None:
+        """Close all pooled connections and clear cached results."""
+        connections = list(self._connections)
+        self._connections.clear()
+        self._result_cache.clear()
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        for conn in connections:
+            try:
+                await conn.close()
+            except Exception:
+                pass  # Already closed
+
+    async def __aenter__(self) -> "DBReader":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get connection pool, result cache and latency counters.
+
+        Returns:
+            Dict with pool hit/miss/wait counts, cache hit/miss counts,
+            query count and average/max query latency in milliseconds
+        """
+        avg_ms = (self._query_seconds_total / self._queries * 1000) if self._queries else 0.0
+        return {
+            "pool_size": self.pool_size,
+            "connections_open": len(self._connections),
+            "connections_idle": self._idle.qsize(),
+            "pool_hits": self._pool_hits,
+            "pool_misses": self._pool_misses,
+            "pool_waits": self._pool_waits,
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
+            "cache_entries": len(self._result_cache),
+            "queries": self._queries,
+            "avg_query_ms": round(avg_ms, 3),
+            "max_query_ms": round(self._query_seconds_max * 1000, 3),
+        }
+
+    async def _open_connection(self) -> aiosqlite.Connection:
+        """Open a read-only pooled connection.
+
+        Returns:
+            Connection with row factory and query_only set
+        """
+        conn = await aiosqlite.connect(
+            f"file:{self.db_path}?mode=ro&cache=shared",
+            uri=True,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = aiosqlite.Row
+        await conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    async def _acquire(self) -> aiosqlite.Connection:
+        """Wait for a free slot, then take an idle connection or open a new one.
+
+        The caller owns the slot until it calls ``_release``.
+
+        Returns:
+            Read-only database connection
+        """
+        if self._slots.locked():
+            self._pool_waits += 1
+        await self._slots.acquire()
+
+        try:
+            conn = self._idle.get_nowait()
+            self._pool_hits += 1
+            return conn
+        except asyncio.QueueEmpty:
+            pass
+
+        try:
+            conn = await self._open_connection()
+        except BaseException:
+            self._slots.release()
+            raise
+        self._connections.add(conn)
+        self._pool_misses += 1
+        return conn
+
+    async def _release(self, conn: aiosqlite.Connection, discard: bool) -> None:
+        """Return a borrowed connection to the pool (or close it) and free its slot.
+
+        Args:
+            conn: Connection from ``_acquire``
+            discard: Close the connection instead of keeping it idle
+        """
+        try:
+            if discard:
+                self._connections.discard(conn)
+                try:
+                    await conn.close()
+                except Exception:
+                    pass
+            elif conn in self._connections:
+                self._idle.put_nowait(conn)
+        finally:
+            # Wakes a waiter, which reuses an idle connection or opens a replacement
+            self._slots.release()
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a pooled connection for one query.
+
+        Reuses an idle connection when available (pool hit), opens a new one
+        while below pool_size (pool miss), and otherwise waits for a connection
+        to be returned. Connections that raise are discarded, and their slot is
+        freed so a waiting caller can open a replacement.
+
+        Yields:
+            Read-only database connection
+        """
+        conn = await self._acquire()
+        start = time.perf_counter()
+        discard = True
+        try:
+            yield conn
+            discard = False
+        finally:
+            elapsed = time.perf_counter() - start
+            self._queries += 1
+            self._query_seconds_total += elapsed
+            self._query_seconds_max = max(self._query_seconds_max, elapsed)
+            await self._release(conn, discard)
+
+    async def _cached(
+        self, key: tuple[Any, ...], loader: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """Return a cached aggregate result, loading it when missing or expired.
+
+        Args:
+            key: Cache key (method name plus arguments)
+            loader: Coroutine factory computing the fresh result
+
+        Returns:
+            Copy of the cached or freshly loaded result
+        """
+        now = time.monotonic()
+        cached = self._result_cache.get(key)
+        if cached is not None and cached[0] > now:
+            self._cache_hits += 1
+            return dict(cached[1])
+
+        self._cache_misses += 1
+        value = await loader()
+        if self.cache_ttl_seconds > 0:
+            # Drop expired entries so the cache stays bounded by distinct live keys
+            self._result_cache = {k: v for k, v in self._result_cache.items() if v[0] > now}
+            self._result_cache[key] = (now + self.cache_ttl_seconds, value)
+        return dict(value)
+
     async def wait_for_database(self) -> None:
         """Wait for database to be created by main HA Boss service.
 
@@ -91,8 +288,7 @@ class DBReader:
             Entity data dict or None if not found
         """
         await self.ensure_ready()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._connection() as db:
             async with db.execute(
                 """
                 SELECT entity_id, domain, friendly_name, device_id,
@@ -122,8 +318,7 @@ class DBReader:
         where_clause = "WHERE is_monitored = 1" if monitored_only else ""
 
         await self.ensure_ready()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._connection() as db:
             query = f"""
                 SELECT entity_id, domain, friendly_name, device_id,
                        integration_id, last_seen, last_state, is_monitored
@@ -152,8 +347,7 @@ class DBReader:
         since = datetime.utcnow() - timedelta(hours=hours)
 
         await self.ensure_ready()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._connection() as db:
             async with db.execute(
                 """
                 SELECT old_state, new_state, timestamp, context
@@ -190,8 +384,7 @@ class DBReader:
             params = (since.isoformat(), entity_id)
 
         await self.ensure_ready()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._connection() as db:
             query = f"""
                 SELECT id, entity_id, event_type, timestamp, details
                 FROM health_events
@@ -226,8 +419,7 @@ class DBReader:
             params = (since.isoformat(), entity_id)
 
         await self.ensure_ready()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._connection() as db:
             query = f"""
                 SELECT id, entity_id, integration_id, action, attempt_number,
                        timestamp, success, error, duration_seconds
@@ -243,6 +435,17 @@ class DBReader:
     async def get_healing_stats(self, days: int = 7) -> dict[str, Any]:
         """Get healing statistics.
 
+        Args:
+            days: Days of data to analyze
+
+        Returns:
+            Dict with success/failure counts and rates
+        """
+        return await self._cached(("healing_stats", days), lambda: self._load_healing_stats(days))
+
+    async def _load_healing_stats(self, days: int) -> dict[str, Any]:
+        """Query healing statistics (uncached).
+
         Args:
             days: Days of data to analyze
 
@@ -252,7 +455,7 @@ class DBReader:
         since = datetime.utcnow() - timedelta(days=days)
 
         await self.ensure_ready()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             # Get total count and success count
             async with db.execute(
                 """
@@ -288,8 +491,7 @@ class DBReader:
             Integration data dict or None if not found
         """
         await self.ensure_ready()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._connection() as db:
             async with db.execute(
                 """
                 SELECT entry_id, domain, title, source, entity_ids,
@@ -330,8 +532,7 @@ class DBReader:
             where_clause = f"WHERE {where_clause}"
 
         await self.ensure_ready()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._connection() as db:
             query = f"""
                 SELECT entry_id, domain, title, source, entity_ids,
                        is_discovered, disabled, last_successful_reload,
@@ -367,8 +568,7 @@ class DBReader:
             params = (since.isoformat(), integration_domain)
 
         await self.ensure_ready()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._connection() as db:
             query = f"""
                 SELECT id, integration_id, integration_domain, timestamp,
                        event_type, entity_id
@@ -393,7 +593,7 @@ class DBReader:
         where_clause = "WHERE is_monitored = 1" if monitored_only else ""
 
         await self.ensure_ready()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             query = f"SELECT COUNT(*) FROM entities {where_clause}"
             async with db.execute(query) as cursor:
                 row = await cursor.fetchone()
@@ -431,8 +631,7 @@ class DBReader:
         where_clause = " AND ".join(where_clauses)
 
         await self.ensure_ready()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._connection() as db:
             query = f"""
                 SELECT id, instance_id, automation_id, executed_at,
                        trigger_type, duration_ms, success, error_message
@@ -475,8 +674,7 @@ class DBReader:
         where_clause = " AND ".join(where_clauses)
 
         await self.ensure_ready()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._connection() as db:
             query = f"""
                 SELECT id, instance_id, automation_id, service_name,
                        entity_id, called_at, response_time_ms, success
@@ -506,10 +704,28 @@ class DBReader:
             Dict with execution_count, failure_count, avg_duration_ms,
             service_call_count, most_common_trigger, last_executed
         """
+        return await self._cached(
+            ("automation_usage_stats", automation_id, instance_id, days),
+            lambda: self._load_automation_usage_stats(automation_id, instance_id, days),
+        )
+
+    async def _load_automation_usage_stats(
+        self, automation_id: str, instance_id: str, days: int
+    ) -> dict[str, Any]:
+        """Query aggregated usage statistics for an automation (uncached).
+
+        Args:
+            automation_id: Automation ID
+            instance_id: Home Assistant instance identifier
+            days: Days of data to analyze
+
+        Returns:
+            Dict with usage statistics
+        """
         since = datetime.utcnow() - timedelta(days=days)
 
         await self.ensure_ready()
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             # Get execution stats
             async with db.execute(
                 """
@@ -28,6 +28,12 @@ class HABossSettings(BaseSettings):
     database_path: str = Field(
         default="/app/data/ha_boss.db", description="Path to HA Boss SQLite database"
     )
+    database_pool_size: int = Field(
+        default=4, ge=1, le=32, description="Pooled read-only database connections"
+    )
+    database_cache_ttl_seconds: float = Field(
+        default=30.0, ge=0.0, description="TTL for cached aggregate query results (0 = off)"
+    )
 
     model_config = SettingsConfigDict(env_prefix="HABOSS_")
 
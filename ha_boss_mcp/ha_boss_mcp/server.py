@@ -83,7 +83,11 @@ async def create_server(config: MCPConfig | None = None) -> FastMCP:
     # Initialize database reader
     print(f"Waiting for database at {config.haboss.database_path}...", file=sys.stderr)
     try:
-        db_reader = DBReader(config.haboss.database_path)
+        db_reader = DBReader(
+            config.haboss.database_path,
+            pool_size=config.haboss.database_pool_size,
+            cache_ttl_seconds=config.haboss.database_cache_ttl_seconds,
+        )
         await db_reader.wait_for_database()
         entity_count = await db_reader.count_entities()
         print(f"✓ Database ready ({entity_count} entities)", file=sys.stderr)
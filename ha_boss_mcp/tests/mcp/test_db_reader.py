@@ -0,0 +1,125 @@
+"""Tests for the pooled read-only DBReader."""
+
+import asyncio
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from ha_boss_mcp.clients.db_reader import DBReader
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """Create a minimal HA Boss database."""
+    path = tmp_path / "ha_boss.db"
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE schema_version (version INTEGER);
+        CREATE TABLE entities (
+            entity_id TEXT, domain TEXT, friendly_name TEXT, device_id TEXT,
+            integration_id TEXT, last_seen TEXT, last_state TEXT, is_monitored INTEGER
+        );
+        CREATE TABLE healing_actions (
+            id INTEGER PRIMARY KEY, entity_id TEXT, integration_id TEXT, action TEXT,
+            attempt_number INTEGER, timestamp TEXT, success INTEGER, error TEXT,
+            duration_seconds REAL
+        );
+        """)
+    conn.execute(
+        "INSERT INTO entities VALUES ('light.kitchen', 'light', 'Kitchen', NULL, NULL, "
+        "'2024-01-01', 'on', 1)"
+    )
+    now = datetime.now(UTC).replace(tzinfo=None).isoformat()
+    conn.executemany(
+        "INSERT INTO healing_actions (entity_id, action, timestamp, success) VALUES (?, ?, ?, ?)",
+        [("light.kitchen", "reload", now, 1), ("light.kitchen", "reload", now, 0)],
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.mark.asyncio
+async def test_connections_are_pooled(db_path: Path) -> None:
+    """Sequential queries reuse one long-lived connection."""
+    async with DBReader(db_path, max_retries=1) as reader:
+        for _ in range(5):
+            entity = await reader.get_entity("light.kitchen")
+            assert entity is not None
+            assert entity["last_state"] == "on"
+
+        stats = reader.get_stats()
+        assert stats["connections_open"] == 1
+        assert stats["pool_misses"] == 1
+        assert stats["pool_hits"] == 4
+        assert stats["queries"] == 5
+        assert stats["max_query_ms"] >= stats["avg_query_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_pooled_connections_are_read_only(db_path: Path) -> None:
+    """Pooled connections refuse writes."""
+    async with DBReader(db_path, max_retries=1) as reader:
+        await reader.ensure_ready()
+        with pytest.raises(sqlite3.OperationalError):
+            async with reader._connection() as db:
+                await db.execute("DELETE FROM entities")
+
+        # The failed connection is discarded rather than returned to the pool
+        assert reader.get_stats()["connections_open"] == 0
+        assert await reader.count_entities() == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_connections_free_their_slot(db_path: Path) -> None:
+    """Callers waiting for a full pool get a replacement when connections fail."""
+    async with DBReader(db_path, max_retries=1, pool_size=1) as reader:
+        await reader.ensure_ready()
+
+        async def failing_query() -> None:
+            async with reader._connection() as db:
+                await asyncio.sleep(0.01)
+                await db.execute("DELETE FROM entities")
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                failing_query(), failing_query(), reader.count_entities(), return_exceptions=True
+            ),
+            timeout=5,
+        )
+
+        assert isinstance(results[0], sqlite3.OperationalError)
+        assert isinstance(results[1], sqlite3.OperationalError)
+        assert results[2] == 1
+        assert reader.get_stats()["pool_waits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_aggregate_results_are_cached(db_path: Path) -> None:
+    """get_healing_stats is served from the TTL cache on repeat calls."""
+    async with DBReader(db_path, max_retries=1, cache_ttl_seconds=60.0) as reader:
+        first = await reader.get_healing_stats(days=7)
+        second = await reader.get_healing_stats(days=7)
+        other = await reader.get_healing_stats(days=1)
+
+        assert first == second
+        assert first["total_attempts"] == 2
+        assert first["successful_attempts"] == 1
+        assert other["days"] == 1
+
+        stats = reader.get_stats()
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_with_zero_ttl(db_path: Path) -> None:
+    """A TTL of zero always queries the database."""
+    async with DBReader(db_path, max_retries=1, cache_ttl_seconds=0) as reader:
+        await reader.get_healing_stats()
+        await reader.get_healing_stats()
+
+        assert reader.get_stats()["cache_hits"] == 0
+        assert reader.get_stats()["cache_entries"] == 0
@@ -7,6 +7,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from ha_boss.api.app import create_app
+from ha_boss.service.startup import InstanceReadiness, InstanceStartup
 
 
 @pytest.fixture
@@ -67,6 +68,7 @@ def mock_service():
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     service.database.async_session = MagicMock(return_value=mock_session)
+    service.database.read_session = service.database.async_session
 
     # Mock state tracker with cache (multi-instance)
     state_tracker = MagicMock()
@@ -220,6 +222,23 @@ def test_health_endpoint_unhealthy(client, mock_service):
     assert data["critical"]["service_state"]["status"] == "unhealthy"
 
 
+def test_health_reports_instance_readiness(client, mock_service):
+    """Instance startup readiness is reported in the critical tier."""
+    startup = InstanceStartup("default")
+    startup.begin_phase(InstanceReadiness.CONNECTING)
+    startup.mark_failed(ConnectionError("refused"))
+    mock_service.instance_startup = {"default": startup}
+
+    response = client.get("/api/health?instance_id=default")
+    assert response.status_code == 503
+
+    readiness = response.json()["critical"]["instance_readiness"]
+    assert readiness["status"] == "unhealthy"
+    assert readiness["details"]["state"] == "failed"
+    assert readiness["details"]["error"] == "connecting: refused"
+    assert "connecting" in readiness["details"]["phase_durations_ms"]
+
+
 def test_health_tier_isolation(client, mock_service):
     """Test that Tier 5 (intelligence) doesn't affect overall health status."""
     # Disable intelligence components
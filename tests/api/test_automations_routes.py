@@ -92,6 +92,8 @@ def mock_service(mock_desired_states):
 
     service.database.async_session = MagicMock(return_value=mock_session)
 
+    service.database.read_session = service.database.async_session
+
     return service
 
 
@@ -169,6 +171,7 @@ def test_create_desired_state_success(client, mock_service):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.post(
         "/api/automations/automation.test_lights/desired-states",
@@ -219,6 +222,7 @@ def test_update_desired_state_success(client, mock_service, mock_desired_states)
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.put(
         "/api/automations/automation.test_lights/desired-states/light.bedroom",
@@ -248,6 +252,7 @@ def test_update_desired_state_not_found(client, mock_service):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.put(
         "/api/automations/automation.test_lights/desired-states/light.nonexistent",
@@ -284,6 +289,7 @@ def test_delete_desired_state_success(client, mock_service, mock_desired_states)
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.delete(
         "/api/automations/automation.test_lights/desired-states/light.bedroom",
@@ -306,6 +312,7 @@ def test_delete_desired_state_not_found(client, mock_service):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.delete(
         "/api/automations/automation.test_lights/desired-states/light.nonexistent",
@@ -624,6 +631,7 @@ def test_report_failure_without_execution_id(client, mock_service):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     # Mock config
     mock_service.config.outcome_validation = MagicMock()
@@ -793,6 +801,7 @@ def test_report_failure_no_execution_found(client, mock_service):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.post(
         "/api/automations/automation.test_lights/report-failure",
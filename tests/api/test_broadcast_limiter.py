@@ -0,0 +1,95 @@
+"""Tests for dashboard broadcast throttling and rate limiting."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from ha_boss.api.broadcast_limiter import BroadcastLimiter
+
+
+class _Summaries:
+    """Collects summaries passed to the limiter's send callback."""
+
+    def __init__(self) -> None:
+        self.received: list[dict[str, Any]] = []
+
+    async def __call__(self, summary: dict[str, Any]) -> None:
+        self.received.append(summary)
+
+
+class TestBroadcastLimiter:
+    """Test per-entity throttling, registry bounds and the token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_attribute_updates_throttled_state_changes_pass(self) -> None:
+        """Attribute-only updates are throttled per entity, state changes are not."""
+        limiter = BroadcastLimiter("default", _Summaries(), min_interval=60.0)
+
+        assert limiter.admit("sensor.a", state_changed=False)
+        assert not limiter.admit("sensor.a", state_changed=False)
+        assert limiter.admit("sensor.a", state_changed=True)
+        assert limiter.admit("sensor.b", state_changed=False)
+
+        stats = limiter.get_stats()
+        assert stats["admitted"] == 3
+        assert stats["throttled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_throttle_registry_is_bounded(self) -> None:
+        """Least recently broadcast entities are dropped from the registry."""
+        limiter = BroadcastLimiter("default", _Summaries(), max_entities=100, burst=1000)
+
+        for i in range(250):
+            assert limiter.admit(f"sensor.transient_{i}", state_changed=True)
+
+        stats = limiter.get_stats()
+        assert stats["tracked_entities"] == 100
+        assert stats["registry_evictions"] == 150
+        # Oldest entity was forgotten, so it is no longer throttled
+        assert limiter.admit("sensor.transient_0", state_changed=False)
+        assert not limiter.admit("sensor.transient_249", state_changed=False)
+
+    @pytest.mark.asyncio
+    async def test_empty_bucket_switches_to_summary_mode(self) -> None:
+        """A burst beyond the bucket is aggregated into summary frames."""
+        summaries = _Summaries()
+        limiter = BroadcastLimiter("default", summaries, rate=1.0, burst=5, summary_interval=0.05)
+
+        admitted = [limiter.admit(f"light.l{i % 3}", state_changed=True) for i in range(20)]
+
+        assert admitted[:5] == [True] * 5
+        assert not any(admitted[5:])
+        assert limiter.summary_mode
+        stats = limiter.get_stats()
+        assert stats["rate_limited"] == 15
+        # 15 rate-limited updates across 3 entities
+        assert stats["coalesced"] == 12
+
+        await asyncio.sleep(0.1)
+
+        assert summaries.received
+        first = summaries.received[0]
+        assert first["instance_id"] == "default"
+        assert first["updates"] == 15
+        assert first["entities"] == 3
+        assert first["domains"] == {"light": 15}
+        await limiter.close()
+
+    @pytest.mark.asyncio
+    async def test_summary_mode_ends_when_rate_recovers(self) -> None:
+        """Individual updates resume after a quiet summary interval."""
+        summaries = _Summaries()
+        limiter = BroadcastLimiter("default", summaries, rate=100.0, burst=2, summary_interval=0.05)
+
+        for i in range(3):
+            limiter.admit(f"sensor.s{i}", state_changed=True)
+        assert limiter.summary_mode
+
+        await asyncio.sleep(0.1)
+
+        assert not limiter.summary_mode
+        assert summaries.received[-1]["summary_mode"] is False
+        assert limiter.get_stats()["summaries_sent"] == 1
+        assert limiter.admit("sensor.s9", state_changed=True)
+        await limiter.close()
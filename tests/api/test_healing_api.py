@@ -384,6 +384,8 @@ def mock_service(
 
     service.database.async_session = MagicMock(return_value=mock_session)
 
+    service.database.read_session = service.database.async_session
+
     return service
 
 
@@ -502,6 +504,7 @@ def test_get_statistics_no_data(client, mock_service):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.get("/api/healing/statistics?instance_id=test_instance")
 
@@ -598,6 +601,7 @@ def test_get_automation_health_no_executions(client, mock_service):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.get(
         "/api/automations/automation.new_automation/health?instance_id=test_instance"
@@ -737,6 +741,7 @@ def test_suppress_healing_success(client, mock_service, mock_entity):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.post("/api/healing/suppress/light.bedroom?instance_id=test_instance")
 
@@ -746,6 +751,9 @@ def test_suppress_healing_success(client, mock_service, mock_entity):
     assert data["entity_id"] == "light.bedroom"
     assert data["suppressed"] is True
     assert "Healing suppressed" in data["message"]
+    # In-memory policy state of the instance is updated too
+    policy = mock_service.healing_managers.get.return_value.policy
+    policy.set_suppressed.assert_called_once_with("light.bedroom", True)
 
 
 def test_suppress_healing_create_new_entity(client, mock_service):
@@ -765,6 +773,7 @@ def test_suppress_healing_create_new_entity(client, mock_service):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.post("/api/healing/suppress/sensor.new_entity?instance_id=test_instance")
 
@@ -825,6 +834,7 @@ def test_unsuppress_healing_success(client, mock_service, mock_suppressed_entity
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.delete("/api/healing/suppress/light.bedroom?instance_id=test_instance")
 
@@ -834,6 +844,8 @@ def test_unsuppress_healing_success(client, mock_service, mock_suppressed_entity
     assert data["entity_id"] == "light.bedroom"
     assert data["suppressed"] is False
     assert "enabled" in data["message"].lower()
+    policy = mock_service.healing_managers.get.return_value.policy
+    policy.set_suppressed.assert_called_once_with("light.bedroom", False)
 
 
 def test_unsuppress_healing_not_found(client, mock_service):
@@ -852,6 +864,7 @@ def test_unsuppress_healing_not_found(client, mock_service):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.delete("/api/healing/suppress/sensor.nonexistent?instance_id=test_instance")
 
@@ -1034,6 +1047,7 @@ def test_get_healing_history_success(client, mock_service, mock_healing_action):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.get("/api/healing/history?instance_id=test_instance")
 
@@ -1075,6 +1089,7 @@ def test_get_healing_history_with_filter_success(client, mock_service, mock_heal
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.get("/api/healing/history?instance_id=test_instance&filter=success")
 
@@ -1113,6 +1128,7 @@ def test_get_healing_history_with_pagination(client, mock_service, mock_healing_
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.get("/api/healing/history?instance_id=test_instance&limit=10")
 
@@ -1148,6 +1164,7 @@ def test_get_healing_history_empty(client, mock_service):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.get("/api/healing/history?instance_id=test_instance")
 
@@ -1186,6 +1203,7 @@ def test_get_suppressed_entities_success(client, mock_service, mock_suppressed_e
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.get("/api/healing/suppressed?instance_id=test_instance")
 
@@ -1227,6 +1245,7 @@ def test_get_suppressed_entities_multiple(client, mock_service):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.get("/api/healing/suppressed?instance_id=test_instance")
 
@@ -1252,6 +1271,7 @@ def test_get_suppressed_entities_empty(client, mock_service):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.get("/api/healing/suppressed?instance_id=test_instance")
 
@@ -1288,6 +1308,7 @@ def test_get_suppressed_entities_all_instances(client, mock_service):
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     mock_service.database.async_session = MagicMock(return_value=mock_session)
+    mock_service.database.read_session = mock_service.database.async_session
 
     response = client.get("/api/healing/suppressed?instance_id=all")
 
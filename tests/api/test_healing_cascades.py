@@ -48,6 +48,7 @@ def make_mock_service(cascades: list[MagicMock]) -> MagicMock:
 
     mock_db = MagicMock()
     mock_db.async_session.return_value = mock_session
+    mock_db.read_session.return_value = mock_session
 
     mock_service = MagicMock()
     mock_service.database = mock_db
@@ -128,6 +129,7 @@ class TestListCascadesEndpoint:
 
         mock_db = MagicMock()
         mock_db.async_session.return_value = mock_session
+        mock_db.read_session.return_value = mock_session
 
         mock_service = MagicMock()
         mock_service.database = mock_db
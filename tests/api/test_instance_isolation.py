@@ -121,6 +121,7 @@ def isolated_instances_service():
     mock_session.__aenter__ = AsyncMock(return_value=mock_session)
     mock_session.__aexit__ = AsyncMock(return_value=None)
     service.database.async_session = MagicMock(return_value=mock_session)
+    service.database.read_session = service.database.async_session
 
     return service
 
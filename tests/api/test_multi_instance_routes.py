@@ -8,7 +8,7 @@ Tests that API routes properly support multiple Home Assistant instances:
 - Statistics separation between instances
 """
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -166,6 +166,8 @@ def mock_multi_instance_service():
 
     service.database.async_session = MagicMock(side_effect=make_session_mock)
 
+    service.database.read_session = service.database.async_session
+
     return service
 
 
@@ -403,3 +405,79 @@ def test_explicit_all_instance_same_as_omitted(multi_instance_client):
     # Both should return same aggregated data
     assert data_implicit["health_checks_performed"] == data_explicit["health_checks_performed"]
     assert data_implicit["healings_attempted"] == data_explicit["healings_attempted"]
+
+
+# ==================== Entity History Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_entity_history_served_from_state_tracker(
+    multi_instance_client, mock_multi_instance_service
+):
+    """Recent history comes from the tracker's transition buffer, not the database."""
+    from ha_boss.monitoring.state_tracker import StateTracker
+
+    tracker = StateTracker("home", MagicMock(), history_size=8)
+    now = datetime.now(UTC)
+    with patch.object(tracker, "_persist_entity", new_callable=AsyncMock):
+        # First seen holding "40" since two hours ago, so the last hour is covered
+        for state, last_updated in (
+            ("40", now - timedelta(hours=2)),
+            ("45", now - timedelta(minutes=10)),
+            ("50", now),
+        ):
+            await tracker.update_state(
+                {
+                    "entity_id": "sensor.humidity",
+                    "new_state": {"state": state, "last_updated": last_updated.isoformat()},
+                }
+            )
+    mock_multi_instance_service.state_trackers["home"] = tracker
+    read_session = MagicMock(side_effect=AssertionError("database queried"))
+    mock_multi_instance_service.database.read_session = read_session
+
+    response = multi_instance_client.get(
+        "/api/entities/sensor.humidity/history?instance_id=home&hours=1"
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [entry["state"] for entry in data["history"]] == ["50", "45"]
+    assert data["count"] == 2
+    read_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_entity_filters_served_from_state_tracker_indexes(
+    multi_instance_client, mock_multi_instance_service
+):
+    """Filtered entity listings come from the trackers' indexes, not the database."""
+    from ha_boss.monitoring.state_tracker import StateTracker
+
+    tracker = StateTracker("home", MagicMock())
+    hydration = dict.fromkeys(
+        ("inserted", "updated", "unchanged", "preload_ms", "diff_ms", "write_ms"), 0
+    )
+    with patch.object(tracker, "_hydrate_database", new_callable=AsyncMock, return_value=hydration):
+        await tracker.initialize(
+            [
+                {"entity_id": "light.porch", "state": "unavailable"},
+                {"entity_id": "light.hall", "state": "on"},
+                {"entity_id": "sensor.humidity", "state": "unavailable"},
+            ]
+        )
+    mock_multi_instance_service.state_trackers["home"] = tracker
+    read_session = MagicMock(side_effect=AssertionError("database queried"))
+    mock_multi_instance_service.database.read_session = read_session
+
+    response = multi_instance_client.get("/api/entities?instance_id=home&state=unavailable")
+
+    assert response.status_code == 200
+    assert [e["entity_id"] for e in response.json()] == ["light.porch", "sensor.humidity"]
+
+    response = multi_instance_client.get(
+        "/api/entities?instance_id=home&state=unavailable&domain=light"
+    )
+
+    assert [e["entity_id"] for e in response.json()] == ["light.porch"]
+    read_session.assert_not_called()
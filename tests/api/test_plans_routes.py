@@ -1,6 +1,6 @@
 """Tests for healing plan API endpoints."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -143,6 +143,8 @@ def test_toggle_plan():
     mock_orchestrator = MagicMock()
     mock_matcher = MagicMock()
     mock_matcher.plans = [mock_plan]
+    mock_matcher.plan_loader.set_plan_enabled = AsyncMock()
+    mock_matcher.refresh = AsyncMock()
     mock_orchestrator.plan_matcher = mock_matcher
     mock_service.cascade_orchestrators = {"default": mock_orchestrator}
 
@@ -153,6 +155,10 @@ def test_toggle_plan():
         assert data["plan_name"] == "test_plan"
         assert data["enabled"] is False  # Toggled from True to False
 
+    # Change is persisted and the compiled plan index rebuilt
+    mock_matcher.plan_loader.set_plan_enabled.assert_awaited_once_with("test_plan", False)
+    mock_matcher.refresh.assert_awaited_once()
+
 
 def test_toggle_plan_not_found():
     """Test POST /api/healing/plans/{name}/toggle with nonexistent plan."""
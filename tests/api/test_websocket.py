@@ -1,5 +1,8 @@
 """Tests for WebSocket functionality."""
 
+import asyncio
+import json
+from types import MappingProxyType
 from unittest.mock import MagicMock
 
 import pytest
@@ -20,10 +23,10 @@ class TestWebSocketManager:
         # Mock WebSocket
         ws = MagicMock(spec=WebSocket)
 
-        async def mock_send(data: dict) -> None:
+        async def mock_send(data: str) -> None:
             pass
 
-        ws.send_json = mock_send
+        ws.send_text = mock_send
 
         # Connect
         await manager.connect(ws, "default")
@@ -50,10 +53,10 @@ class TestWebSocketManager:
         ws = MagicMock(spec=WebSocket)
         send_calls = []
 
-        async def mock_send(data: dict) -> None:
-            send_calls.append(data)
+        async def mock_send(data: str) -> None:
+            send_calls.append(json.loads(data))
 
-        ws.send_json = mock_send
+        ws.send_text = mock_send
 
         # Connect
         await manager.connect(ws, "default")
@@ -64,6 +67,7 @@ class TestWebSocketManager:
             entity_id="sensor.test",
             state={"state": "on", "last_updated": "2024-01-01T00:00:00Z"},
         )
+        await manager.drain()
 
         # Check message was sent
         assert len(send_calls) == 2  # 1 for connect, 1 for broadcast
@@ -81,10 +85,10 @@ class TestWebSocketManager:
         ws = MagicMock(spec=WebSocket)
         send_calls = []
 
-        async def mock_send(data: dict) -> None:
-            send_calls.append(data)
+        async def mock_send(data: str) -> None:
+            send_calls.append(json.loads(data))
 
-        ws.send_json = mock_send
+        ws.send_text = mock_send
 
         # Connect
         await manager.connect(ws, "default")
@@ -98,6 +102,7 @@ class TestWebSocketManager:
                 "detected_at": "2024-01-01T00:00:00Z",
             },
         )
+        await manager.drain()
 
         # Check message was sent
         assert len(send_calls) == 2  # 1 for connect, 1 for broadcast
@@ -114,10 +119,10 @@ class TestWebSocketManager:
         ws = MagicMock(spec=WebSocket)
         send_calls = []
 
-        async def mock_send(data: dict) -> None:
-            send_calls.append(data)
+        async def mock_send(data: str) -> None:
+            send_calls.append(json.loads(data))
 
-        ws.send_json = mock_send
+        ws.send_text = mock_send
 
         # Connect
         await manager.connect(ws, "default")
@@ -135,6 +140,7 @@ class TestWebSocketManager:
                 "timestamp": "2024-01-01T00:00:00Z",
             },
         )
+        await manager.drain()
 
         # Check message was sent
         assert len(send_calls) == 2  # 1 for connect, 1 for broadcast
@@ -151,10 +157,10 @@ class TestWebSocketManager:
         ws = MagicMock(spec=WebSocket)
         send_calls = []
 
-        async def mock_send(data: dict) -> None:
-            send_calls.append(data)
+        async def mock_send(data: str) -> None:
+            send_calls.append(json.loads(data))
 
-        ws.send_json = mock_send
+        ws.send_text = mock_send
 
         # Connect
         await manager.connect(ws, "default")
@@ -164,6 +170,7 @@ class TestWebSocketManager:
             instance_id="default",
             connected=True,
         )
+        await manager.drain()
 
         # Check message was sent
         assert len(send_calls) == 2  # 1 for connect, 1 for broadcast
@@ -184,14 +191,14 @@ class TestWebSocketManager:
         default_calls = []
         home_calls = []
 
-        async def mock_send_default(data: dict) -> None:
-            default_calls.append(data)
+        async def mock_send_default(data: str) -> None:
+            default_calls.append(json.loads(data))
 
-        async def mock_send_home(data: dict) -> None:
-            home_calls.append(data)
+        async def mock_send_home(data: str) -> None:
+            home_calls.append(json.loads(data))
 
-        ws_default.send_json = mock_send_default
-        ws_home.send_json = mock_send_home
+        ws_default.send_text = mock_send_default
+        ws_home.send_text = mock_send_home
 
         # Connect to different instances
         await manager.connect(ws_default, "default")
@@ -203,6 +210,7 @@ class TestWebSocketManager:
             entity_id="sensor.test",
             state={"state": "on"},
         )
+        await manager.drain()
 
         # Check only default received the message
         assert len(default_calls) == 2  # connect + broadcast
@@ -217,10 +225,10 @@ class TestWebSocketManager:
         # Mock WebSocket
         ws = MagicMock(spec=WebSocket)
 
-        async def mock_send(data: dict) -> None:
+        async def mock_send(data: str) -> None:
             pass
 
-        ws.send_json = mock_send
+        ws.send_text = mock_send
 
         # Connect
         await manager.connect(ws, "default")
@@ -232,6 +240,106 @@ class TestWebSocketManager:
         assert manager._connections[ws]["subscriptions"] == {"status", "entities"}
 
 
+class TestBroadcastPipeline:
+    """Test serialize-once fan-out, coalescing and slow consumer eviction."""
+
+    @staticmethod
+    async def _connect(manager: WebSocketManager, instance_id: str = "default") -> list[dict]:
+        ws = MagicMock(spec=WebSocket)
+        received: list[dict] = []
+
+        async def mock_send(data: str) -> None:
+            received.append(json.loads(data))
+
+        ws.send_text = mock_send
+        await manager.connect(ws, instance_id)
+        return received
+
+    @pytest.mark.asyncio
+    async def test_entity_updates_coalesced_into_batch(self) -> None:
+        """Updates within a flush interval become one frame; latest state wins."""
+        manager = WebSocketManager(flush_interval=60)
+        first = await self._connect(manager)
+        second = await self._connect(manager)
+        serialized = manager.get_stats()["messages_serialized"]
+
+        await manager.broadcast_entity_state("default", "light.a", {"state": "off"})
+        await manager.broadcast_entity_state("default", "light.b", {"state": "on"})
+        await manager.broadcast_entity_state("default", "light.a", {"state": "on"})
+        await manager.drain()
+
+        assert first[1:] == second[1:]
+        assert len(first) == 2  # connect + one batch
+        batch = first[1]
+        assert batch["type"] == "entity_states_batch"
+        assert batch["updates"] == [
+            {"entity_id": "light.a", "state": {"state": "on"}},
+            {"entity_id": "light.b", "state": {"state": "on"}},
+        ]
+
+        stats = manager.get_stats()
+        assert stats["messages_serialized"] == serialized + 1  # Once for both clients
+        assert stats["entity_updates_coalesced"] == 1
+        assert stats["batches_sent"] == 1
+        assert stats["fanout_latency_ms"]["max"] is not None
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_read_only_attributes_serialized_at_flush(self) -> None:
+        """Attribute mappings are passed through and encoded once per frame."""
+        manager = WebSocketManager(flush_interval=60)
+        received = await self._connect(manager)
+        attributes = MappingProxyType({"friendly_name": "Lamp", "brightness": 128})
+
+        await manager.broadcast_entity_state(
+            "default", "light.a", {"state": "on", "attributes": attributes}
+        )
+        await manager.drain()
+
+        assert received[-1]["state"]["attributes"] == {"friendly_name": "Lamp", "brightness": 128}
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_interval_sends_without_drain(self) -> None:
+        """Coalesced updates are flushed by the timer."""
+        manager = WebSocketManager(flush_interval=0.01)
+        received = await self._connect(manager)
+
+        await manager.broadcast_entity_state("default", "sensor.test", {"state": "1"})
+        await asyncio.sleep(0.05)
+
+        assert received[-1]["type"] == "entity_state_changed"
+        assert received[-1]["entity_id"] == "sensor.test"
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_evicted_without_blocking_others(self) -> None:
+        """A client that stops reading is evicted once its queue overflows."""
+        manager = WebSocketManager(client_queue_size=8)
+        fast = await self._connect(manager)
+
+        slow_ws = MagicMock(spec=WebSocket)
+        blocked = asyncio.Event()
+
+        async def stalled_send(data: str) -> None:
+            await blocked.wait()
+
+        slow_ws.send_text = stalled_send
+        await manager.connect(slow_ws, "default")
+
+        for i in range(20):
+            await manager.broadcast_instance_connection("default", connected=i % 2 == 0)
+            await asyncio.sleep(0)  # Let writers run, as between real events
+        await asyncio.wait_for(manager.drain(), timeout=1)
+        await asyncio.gather(*manager._background_tasks)
+
+        assert len(fast) == 21  # connect + every broadcast
+        assert manager.get_stats()["evictions"] == 1
+        assert slow_ws not in manager._connections
+        slow_ws.close.assert_awaited_once()
+        await manager.close()
+
+
 class TestOriginValidation:
     """Test WebSocket origin validation functionality."""
 
@@ -1,5 +1,6 @@
 """Tests for WebSocket subscription filtering functionality."""
 
+import json
 from unittest.mock import MagicMock
 
 import pytest
@@ -23,14 +24,14 @@ class TestWebSocketSubscriptionFiltering:
         entities_calls = []
         healing_calls = []
 
-        async def mock_send_entities(data: dict) -> None:
-            entities_calls.append(data)
+        async def mock_send_entities(data: str) -> None:
+            entities_calls.append(json.loads(data))
 
-        async def mock_send_healing(data: dict) -> None:
-            healing_calls.append(data)
+        async def mock_send_healing(data: str) -> None:
+            healing_calls.append(json.loads(data))
 
-        ws_entities.send_json = mock_send_entities
-        ws_healing.send_json = mock_send_healing
+        ws_entities.send_text = mock_send_entities
+        ws_healing.send_text = mock_send_healing
 
         # Connect both clients
         await manager.connect(ws_entities, "default")
@@ -46,6 +47,7 @@ class TestWebSocketSubscriptionFiltering:
             entity_id="sensor.test",
             state={"state": "on"},
         )
+        await manager.drain()
 
         # Only entities client should receive the message
         assert len(entities_calls) == 2  # connect + entity state
@@ -64,14 +66,14 @@ class TestWebSocketSubscriptionFiltering:
         health_calls = []
         entities_calls = []
 
-        async def mock_send_health(data: dict) -> None:
-            health_calls.append(data)
+        async def mock_send_health(data: str) -> None:
+            health_calls.append(json.loads(data))
 
-        async def mock_send_entities(data: dict) -> None:
-            entities_calls.append(data)
+        async def mock_send_entities(data: str) -> None:
+            entities_calls.append(json.loads(data))
 
-        ws_health.send_json = mock_send_health
-        ws_entities.send_json = mock_send_entities
+        ws_health.send_text = mock_send_health
+        ws_entities.send_text = mock_send_entities
 
         # Connect both clients
         await manager.connect(ws_health, "default")
@@ -86,6 +88,7 @@ class TestWebSocketSubscriptionFiltering:
             instance_id="default",
             health={"entity_id": "sensor.test", "issue_type": "unavailable"},
         )
+        await manager.drain()
 
         # Only health client should receive the message
         assert len(health_calls) == 2  # connect + health status
@@ -104,14 +107,14 @@ class TestWebSocketSubscriptionFiltering:
         healing_calls = []
         health_calls = []
 
-        async def mock_send_healing(data: dict) -> None:
-            healing_calls.append(data)
+        async def mock_send_healing(data: str) -> None:
+            healing_calls.append(json.loads(data))
 
-        async def mock_send_health(data: dict) -> None:
-            health_calls.append(data)
+        async def mock_send_health(data: str) -> None:
+            health_calls.append(json.loads(data))
 
-        ws_healing.send_json = mock_send_healing
-        ws_health.send_json = mock_send_health
+        ws_healing.send_text = mock_send_healing
+        ws_health.send_text = mock_send_health
 
         # Connect both clients
         await manager.connect(ws_healing, "default")
@@ -126,6 +129,7 @@ class TestWebSocketSubscriptionFiltering:
             instance_id="default",
             action={"entity_id": "sensor.test", "action": "heal", "success": True},
         )
+        await manager.drain()
 
         # Only healing client should receive the message
         assert len(healing_calls) == 2  # connect + healing action
@@ -144,14 +148,14 @@ class TestWebSocketSubscriptionFiltering:
         wildcard_calls = []
         specific_calls = []
 
-        async def mock_send_wildcard(data: dict) -> None:
-            wildcard_calls.append(data)
+        async def mock_send_wildcard(data: str) -> None:
+            wildcard_calls.append(json.loads(data))
 
-        async def mock_send_specific(data: dict) -> None:
-            specific_calls.append(data)
+        async def mock_send_specific(data: str) -> None:
+            specific_calls.append(json.loads(data))
 
-        ws_wildcard.send_json = mock_send_wildcard
-        ws_specific.send_json = mock_send_specific
+        ws_wildcard.send_text = mock_send_wildcard
+        ws_specific.send_text = mock_send_specific
 
         # Connect both clients
         await manager.connect(ws_wildcard, "default")
@@ -165,12 +169,15 @@ class TestWebSocketSubscriptionFiltering:
         await manager.broadcast_entity_state(
             instance_id="default", entity_id="sensor.test", state={"state": "on"}
         )
+        await manager.drain()
         await manager.broadcast_health_status(
             instance_id="default", health={"entity_id": "sensor.test"}
         )
+        await manager.drain()
         await manager.broadcast_healing_action(
             instance_id="default", action={"entity_id": "sensor.test"}
         )
+        await manager.drain()
 
         # Wildcard client should receive all messages
         assert len(wildcard_calls) == 4  # connect + 3 broadcasts
@@ -191,10 +198,10 @@ class TestWebSocketSubscriptionFiltering:
         ws = MagicMock(spec=WebSocket)
         calls = []
 
-        async def mock_send(data: dict) -> None:
-            calls.append(data)
+        async def mock_send(data: str) -> None:
+            calls.append(json.loads(data))
 
-        ws.send_json = mock_send
+        ws.send_text = mock_send
 
         # Connect
         await manager.connect(ws, "default")
@@ -204,6 +211,7 @@ class TestWebSocketSubscriptionFiltering:
 
         # Broadcast connection status
         await manager.broadcast_instance_connection(instance_id="default", connected=False)
+        await manager.drain()
 
         # Should receive connection status despite not subscribing
         assert len(calls) == 2  # connect + connection status
@@ -219,10 +227,10 @@ class TestWebSocketSubscriptionFiltering:
         ws = MagicMock(spec=WebSocket)
         calls = []
 
-        async def mock_send(data: dict) -> None:
-            calls.append(data)
+        async def mock_send(data: str) -> None:
+            calls.append(json.loads(data))
 
-        ws.send_json = mock_send
+        ws.send_text = mock_send
 
         # Connect
         await manager.connect(ws, "default")
@@ -234,12 +242,15 @@ class TestWebSocketSubscriptionFiltering:
         await manager.broadcast_entity_state(
             instance_id="default", entity_id="sensor.test", state={"state": "on"}
         )
+        await manager.drain()
         await manager.broadcast_health_status(
             instance_id="default", health={"entity_id": "sensor.test"}
         )
+        await manager.drain()
         await manager.broadcast_healing_action(
             instance_id="default", action={"entity_id": "sensor.test"}
         )
+        await manager.drain()
 
         # Should receive entity and healing messages, not health
         assert len(calls) == 3  # connect + entity + healing (no health)
@@ -257,10 +268,10 @@ class TestWebSocketSubscriptionFiltering:
         ws = MagicMock(spec=WebSocket)
         calls = []
 
-        async def mock_send(data: dict) -> None:
-            calls.append(data)
+        async def mock_send(data: str) -> None:
+            calls.append(json.loads(data))
 
-        ws.send_json = mock_send
+        ws.send_text = mock_send
 
         # Connect
         await manager.connect(ws, "default")
@@ -272,13 +283,17 @@ class TestWebSocketSubscriptionFiltering:
         await manager.broadcast_entity_state(
             instance_id="default", entity_id="sensor.test", state={"state": "on"}
         )
+        await manager.drain()
         await manager.broadcast_health_status(
             instance_id="default", health={"entity_id": "sensor.test"}
         )
+        await manager.drain()
         await manager.broadcast_healing_action(
             instance_id="default", action={"entity_id": "sensor.test"}
         )
+        await manager.drain()
         await manager.broadcast_instance_connection(instance_id="default", connected=True)
+        await manager.drain()
 
         # Should only receive connect message and connection status (critical)
         assert len(calls) == 2  # connect + connection status
@@ -427,11 +427,12 @@ class TestOutcomeValidatorIntegration:
 
         # Mock multiple entity histories (one fails, one succeeds)
         def get_history_side_effect(filter_entity_id, **kwargs):
-            if filter_entity_id == "light.test1":
-                return mock_history_failure("light.test1", "off")
-            elif filter_entity_id == "light.test2":
-                return mock_history_success("light.test2", "on")
-            return [[]]
+            # Entities are fetched in one batched request
+            histories = {
+                "light.test1": mock_history_failure("light.test1", "off"),
+                "light.test2": mock_history_success("light.test2", "on"),
+            }
+            return [group for entity_id in filter_entity_id for group in histories[entity_id]]
 
         mock_ha_client.get_history.side_effect = get_history_side_effect
 
@@ -625,7 +626,8 @@ class TestEndToEndIntegration:
                     ]
                 ],
             }
-            return histories.get(filter_entity_id, [[]])
+            # Entities are fetched in one batched request
+            return [group for entity_id in filter_entity_id for group in histories[entity_id]]
 
         mock_ha_client.get_history.side_effect = get_history_side_effect
 
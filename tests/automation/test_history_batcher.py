@@ -0,0 +1,101 @@
+"""Tests for batched history requests of outcome validation."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from ha_boss.automation.history_batcher import HistoryBatcher
+from ha_boss.core.exceptions import HomeAssistantConnectionError
+
+START = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+
+def _state(entity_id: str, state: str, seconds: float) -> dict:
+    changed = (START + timedelta(seconds=seconds)).isoformat()
+    return {"entity_id": entity_id, "state": state, "last_changed": changed}
+
+
+@pytest.fixture
+def ha_client():
+    client = AsyncMock()
+    client.get_history = AsyncMock(
+        return_value=[
+            [_state("light.a", "off", 0), _state("light.a", "on", 3), _state("light.a", "off", 9)],
+            [_state("switch.b", "on", 1)],
+        ]
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_overlapping_requests_share_one_fetch(ha_client):
+    """Entities of overlapping validations are fetched once and fanned back out."""
+    batcher = HistoryBatcher(ha_client, window_seconds=0.01)
+
+    first, second = await asyncio.gather(
+        batcher.fetch(["light.a"], START, START + timedelta(seconds=5), attributes=False),
+        batcher.fetch(
+            ["light.a", "switch.b"],
+            START + timedelta(seconds=2),
+            START + timedelta(seconds=10),
+            attributes=False,
+        ),
+    )
+
+    ha_client.get_history.assert_called_once()
+    kwargs = ha_client.get_history.call_args.kwargs
+    assert kwargs["filter_entity_id"] == ["light.a", "switch.b"]
+    assert kwargs["start_time"] == START
+    assert kwargs["end_time"] == START + timedelta(seconds=10)
+    assert kwargs["minimal_response"] is True
+    assert kwargs["no_attributes"] is True
+
+    # Each request only sees its own window
+    assert [s["state"] for s in first["light.a"]] == ["off", "on"]
+    assert set(first) == {"light.a"}
+    # The state in effect at the window start is moved to the window start
+    assert [s["state"] for s in second["light.a"]] == ["off", "on", "off"]
+    assert second["light.a"][0]["last_changed"] == (START + timedelta(seconds=2)).isoformat()
+    assert second["switch.b"][0]["last_changed"] == (START + timedelta(seconds=2)).isoformat()
+
+    stats = batcher.get_stats()
+    assert stats["requests"] == 2
+    assert stats["fetches"] == 1
+    assert stats["requests_saved"] == 2
+
+
+@pytest.mark.asyncio
+async def test_disjoint_windows_and_attributes(ha_client):
+    """Disjoint windows are fetched separately; attributes are kept when needed."""
+    batcher = HistoryBatcher(ha_client, window_seconds=0.01)
+
+    await asyncio.gather(
+        batcher.fetch(["light.a"], START, START + timedelta(seconds=5), attributes=True),
+        batcher.fetch(
+            ["switch.b"], START + timedelta(minutes=5), START + timedelta(minutes=6), False
+        ),
+    )
+
+    assert ha_client.get_history.call_count == 2
+    first_call = ha_client.get_history.call_args_list[0].kwargs
+    assert first_call["filter_entity_id"] == ["light.a"]
+    assert first_call["minimal_response"] is False
+    assert first_call["no_attributes"] is False
+
+
+@pytest.mark.asyncio
+async def test_fetch_error_reaches_every_request(ha_client):
+    """A failed history request fails every validation waiting on it."""
+    ha_client.get_history.side_effect = HomeAssistantConnectionError("Connection lost")
+    batcher = HistoryBatcher(ha_client, window_seconds=0.01)
+
+    results = await asyncio.gather(
+        batcher.fetch(["light.a"], START, START + timedelta(seconds=5)),
+        batcher.fetch(["switch.b"], START, START + timedelta(seconds=5)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, HomeAssistantConnectionError) for result in results)
+    ha_client.get_history.assert_called_once()
@@ -100,6 +100,7 @@ class TestOutcomeValidator:
         light_history = [
             [
                 {
+                    "entity_id": "light.bedroom",
                     "state": "on",
                     "attributes": {"brightness": 128},
                     "last_changed": "2024-01-01T12:00:01Z",
@@ -110,6 +111,7 @@ class TestOutcomeValidator:
         switch_history = [
             [
                 {
+                    "entity_id": "switch.fan",
                     "state": "off",
                     "attributes": {},
                     "last_changed": "2024-01-01T12:00:02Z",
@@ -117,7 +119,8 @@ class TestOutcomeValidator:
             ]
         ]
 
-        mock_ha_client.get_history.side_effect = [light_history, switch_history]
+        # Both entities are fetched in one batched history request
+        mock_ha_client.get_history.return_value = light_history + switch_history
 
         # Run validation
         result = await validator.validate_execution(execution_id=123)
@@ -157,6 +160,7 @@ class TestOutcomeValidator:
         light_history = [
             [
                 {
+                    "entity_id": "light.bedroom",
                     "state": "on",
                     "attributes": {"brightness": 128},
                     "last_changed": "2024-01-01T12:00:01Z",
@@ -167,6 +171,7 @@ class TestOutcomeValidator:
         switch_history = [
             [
                 {
+                    "entity_id": "switch.fan",
                     "state": "on",  # Still on instead of off
                     "attributes": {},
                     "last_changed": "2024-01-01T12:00:02Z",
@@ -174,7 +179,8 @@ class TestOutcomeValidator:
             ]
         ]
 
-        mock_ha_client.get_history.side_effect = [light_history, switch_history]
+        # Both entities are fetched in one batched history request
+        mock_ha_client.get_history.return_value = light_history + switch_history
 
         # Run validation
         result = await validator.validate_execution(execution_id=123)
@@ -210,6 +216,7 @@ class TestOutcomeValidator:
         light_history = [
             [
                 {
+                    "entity_id": "light.bedroom",
                     "state": "off",  # Still off
                     "attributes": {"brightness": 0},
                     "last_changed": "2024-01-01T12:00:01Z",
@@ -220,6 +227,7 @@ class TestOutcomeValidator:
         switch_history = [
             [
                 {
+                    "entity_id": "switch.fan",
                     "state": "on",  # Still on
                     "attributes": {},
                     "last_changed": "2024-01-01T12:00:02Z",
@@ -227,7 +235,8 @@ class TestOutcomeValidator:
             ]
         ]
 
-        mock_ha_client.get_history.side_effect = [light_history, switch_history]
+        # Both entities are fetched in one batched history request
+        mock_ha_client.get_history.return_value = light_history + switch_history
 
         # Run validation
         result = await validator.validate_execution(execution_id=123)
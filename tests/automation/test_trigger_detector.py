@@ -1,8 +1,10 @@
 """Tests for trigger failure detector."""
 
+import asyncio
+import time
 from datetime import UTC, datetime
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -12,6 +14,7 @@ from ha_boss.automation.trigger_detector import (
 )
 from ha_boss.core.database import AutomationDesiredState, Database
 from ha_boss.core.ha_client import HomeAssistantClient
+from ha_boss.monitoring.state_tracker import StateTracker
 
 
 @pytest.fixture
@@ -211,6 +214,46 @@ class TestMonitorStateChanges:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_monitor_reports_failure_on_first_matching_change(
+        self, mock_database: MagicMock, mock_ha_client: MagicMock
+    ) -> None:
+        """With a state tracker, a failure is reported without waiting out the window."""
+        tracker = StateTracker("default", mock_database)
+        detector = TriggerFailureDetector(
+            mock_database, mock_ha_client, "default", state_tracker=tracker
+        )
+        mock_ha_client.get_state = AsyncMock(
+            return_value={"state": "off", "entity_id": "light.hall"}
+        )
+        detector._get_trigger_config = AsyncMock(
+            return_value=[{"platform": "state", "entity_id": "light.hall", "to": "on"}]
+        )
+
+        async def turn_on() -> None:
+            await asyncio.sleep(0.01)
+            with patch.object(tracker, "_persist_entity", new_callable=AsyncMock):
+                await tracker.update_state(
+                    {
+                        "entity_id": "light.hall",
+                        "new_state": {"state": "on", "last_updated": "2024-01-01T12:00:00Z"},
+                    }
+                )
+
+        start = time.monotonic()
+        result, _ = await asyncio.gather(
+            detector.monitor_state_changes(
+                automation_id="automation.hall",
+                expected_trigger={"entity_id": "light.hall"},
+                validation_window=30,
+            ),
+            turn_on(),
+        )
+
+        assert time.monotonic() - start < 5
+        assert result is not None
+        assert result.actual_state["final"]["light.hall"]["state"] == "on"
+
 
 class TestValidateTriggerFired:
     """Test validate_trigger_fired method."""
@@ -6,12 +6,14 @@ import pytest
 
 from ha_boss.core.database import (
     AutomationDesiredState,
+    AutomationExecution,
     AutomationOutcomePattern,
     AutomationOutcomeValidation,
     Entity,
     HealingAction,
     HealthEvent,
     Integration,
+    StateHistory,
     init_database,
 )
 
@@ -179,6 +181,117 @@ async def test_cleanup_old_records(tmp_path):
         assert len(events) == 1
         assert events[0].entity_id == "sensor.test2"
 
+
+@pytest.mark.asyncio
+async def test_cleanup_old_records_in_chunks(tmp_path):
+    """Test chunked cleanup across time-series tables with progress reporting."""
+    db = await init_database(tmp_path / "test.db")
+
+    old_timestamp = datetime.now(UTC) - timedelta(days=60)
+    recent_timestamp = datetime.now(UTC) - timedelta(days=5)
+
+    async with db.async_session() as session:
+        for i in range(7):
+            session.add(
+                StateHistory(
+                    entity_id=f"sensor.s{i}",
+                    old_state="1",
+                    new_state="2",
+                    timestamp=old_timestamp,
+                )
+            )
+        session.add(
+            StateHistory(
+                entity_id="sensor.recent",
+                old_state="1",
+                new_state="2",
+                timestamp=recent_timestamp,
+            )
+        )
+        session.add_all(
+            [
+                AutomationExecution(
+                    instance_id="default",
+                    automation_id="automation.old",
+                    executed_at=old_timestamp,
+                ),
+                AutomationExecution(
+                    instance_id="default",
+                    automation_id="automation.recent",
+                    executed_at=recent_timestamp,
+                ),
+            ]
+        )
+        await session.commit()
+
+    assert (await db.count_expired_records(30))["state_history"] == 7
+
+    progress: list[tuple[str, int]] = []
+    deleted = await db.cleanup_old_records(
+        retention_days=30,
+        chunk_size=3,
+        progress_callback=lambda table, count: progress.append((table, count)),
+    )
+
+    assert deleted["state_history"] == 7
+    assert deleted["automation_executions"] == 1
+    assert deleted["health_events"] == 0
+    assert [count for table, count in progress if table == "state_history"] == [3, 6, 7]
+
+    async with db.async_session() as session:
+        from sqlalchemy import select
+
+        history = (await session.execute(select(StateHistory))).scalars().all()
+        executions = (await session.execute(select(AutomationExecution))).scalars().all()
+
+    assert [h.entity_id for h in history] == ["sensor.recent"]
+    assert [e.automation_id for e in executions] == ["automation.recent"]
+
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_old_records_with_vacuum(tmp_path):
+    """Test incremental vacuum after cleanup."""
+    db = await init_database(tmp_path / "test.db")
+
+    async with db.async_session() as session:
+        session.add_all(
+            StateHistory(
+                entity_id=f"sensor.s{i}",
+                old_state="x" * 200,
+                new_state="y" * 200,
+                timestamp=datetime.now(UTC) - timedelta(days=60),
+            )
+            for i in range(500)
+        )
+        await session.commit()
+
+    deleted = await db.cleanup_old_records(retention_days=30, vacuum=True)
+    assert deleted["state_history"] == 500
+    assert deleted["vacuum_pages_freed"] >= 0
+
+    # Converted to incremental auto_vacuum; subsequent runs are incremental
+    async with db.engine.connect() as conn:
+        assert (await conn.exec_driver_sql("PRAGMA auto_vacuum")).scalar() == 2
+
+    async with db.async_session() as session:
+        session.add_all(
+            StateHistory(
+                entity_id=f"sensor.s{i}",
+                old_state="x" * 200,
+                new_state="y" * 200,
+                timestamp=datetime.now(UTC) - timedelta(days=60),
+            )
+            for i in range(500)
+        )
+        await session.commit()
+
+    deleted = await db.cleanup_old_records(retention_days=30, vacuum=True)
+    assert deleted["vacuum_pages_freed"] > 0
+
+    await db.close()
+
     await db.close()
 
 
@@ -332,3 +445,59 @@ async def test_automation_desired_state_unique_constraint(tmp_path):
             await session.commit()
 
     await db.close()
+
+
+@pytest.mark.asyncio
+async def test_tuning_pragmas_applied(tmp_path):
+    """Test that the tuning profile is applied to new connections."""
+    from ha_boss.core.config import DatabaseTuningConfig
+
+    tuning = DatabaseTuningConfig(busy_timeout_ms=1234, cache_size_kb=2048, temp_store="MEMORY")
+    db = await init_database(tmp_path / "test.db", tuning=tuning)
+
+    async with db.engine.connect() as conn:
+        assert (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar() == "wal"
+        assert (await conn.exec_driver_sql("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert (await conn.exec_driver_sql("PRAGMA busy_timeout")).scalar() == 1234
+        assert (await conn.exec_driver_sql("PRAGMA cache_size")).scalar() == -2048
+        assert (await conn.exec_driver_sql("PRAGMA temp_store")).scalar() == 2  # MEMORY
+
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_read_session_is_read_only(tmp_path):
+    """Test that the read-only engine sees committed data but rejects writes."""
+    from sqlalchemy import select
+    from sqlalchemy.exc import OperationalError
+
+    db = await init_database(tmp_path / "test.db")
+
+    async with db.async_session() as session:
+        session.add(HealthEvent(entity_id="sensor.test", event_type="unavailable"))
+        await session.commit()
+
+    async with db.read_session() as session:
+        events = (await session.execute(select(HealthEvent))).scalars().all()
+        assert [e.entity_id for e in events] == ["sensor.test"]
+
+        session.add(HealthEvent(entity_id="sensor.other", event_type="unavailable"))
+        with pytest.raises(OperationalError, match="readonly"):
+            await session.commit()
+
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_read_session_disabled_uses_write_engine(tmp_path):
+    """Test that disabling the read-only engine shares the read-write sessions."""
+    from ha_boss.core.config import DatabaseTuningConfig
+
+    db = await init_database(
+        tmp_path / "test.db", tuning=DatabaseTuningConfig(read_only_engine_enabled=False)
+    )
+
+    assert db.read_engine is None
+    assert db.read_session is db.async_session
+
+    await db.close()
@@ -1,5 +1,7 @@
 """Tests for Home Assistant API client."""
 
+import asyncio
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -450,3 +452,146 @@ async def test_create_automation_api_error(client):
 
     with pytest.raises(HomeAssistantAPIError, match="Failed to create automation"):
         await client.create_automation(automation_config)
+
+
+def _counting_send(result, delay: float = 0.01):
+    """Fake transport that counts calls and returns after a short delay."""
+    calls = []
+
+    async def send(method, endpoint, data=None, retry=True):
+        calls.append((method, endpoint))
+        await asyncio.sleep(delay)
+        return result
+
+    return send, calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_share_one_request(client):
+    """Concurrent identical GETs are coalesced into a single HTTP request."""
+    send, calls = _counting_send([{"entity_id": "light.kitchen", "state": "on"}])
+
+    with patch.object(client, "_send", side_effect=send):
+        results = await asyncio.gather(*(client.get_states() for _ in range(3)))
+
+    assert calls == [("GET", "/api/states")]
+    assert all(r == [{"entity_id": "light.kitchen", "state": "on"}] for r in results)
+    assert results[0] is not results[1]  # Each caller gets its own list
+    assert client.get_request_stats()["/api/states"] == {
+        "requests": 3,
+        "cache_hits": 0,
+        "cache_misses": 0,
+        "coalesced": 2,
+    }
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_failure_reaches_every_caller(client):
+    """A failed shared request raises in all waiters and is not cached."""
+    calls = []
+
+    async def send(method, endpoint, data=None, retry=True):
+        calls.append(endpoint)
+        await asyncio.sleep(0.01)
+        raise HomeAssistantConnectionError("down")
+
+    client.snapshot_cache_ttl = 60
+    with patch.object(client, "_send", side_effect=send):
+        results = await asyncio.gather(
+            client.get_states(), client.get_states(), return_exceptions=True
+        )
+        assert all(isinstance(r, HomeAssistantConnectionError) for r in results)
+
+        with pytest.raises(HomeAssistantConnectionError):
+            await client.get_states()
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_snapshot_cache_disabled_by_default(client):
+    """Sequential snapshot reads hit the API unless the TTL cache is enabled."""
+    send, calls = _counting_send([])
+
+    with patch.object(client, "_send", side_effect=send):
+        await client.get_states()
+        await client.get_states()
+
+    assert len(calls) == 2
+    assert client.get_request_stats()["/api/states"]["cache_hits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_snapshot_cache_serves_and_invalidates(mock_config):
+    """Cached snapshots are served within the TTL and dropped on writes."""
+    mock_config.rest.snapshot_cache_ttl_seconds = 30
+    client = HomeAssistantClient(mock_config.home_assistant.get_default_instance(), mock_config)
+    send, calls = _counting_send([{"entity_id": "switch.fan", "state": "off"}])
+
+    with patch.object(client, "_send", side_effect=send):
+        await client.get_states()
+        await client._request("GET", "/api/config/entity_registry/list")
+        await client.get_states()
+        await client._request("GET", "/api/config/entity_registry/list")
+        await client.get_state("switch.fan")
+        await client.get_state("switch.fan")  # Per-entity reads are never cached
+
+        await client.call_service("switch", "turn_on", {"entity_id": "switch.fan"})
+        await client.get_states()
+
+    endpoints = [endpoint for _, endpoint in calls]
+    assert endpoints.count("/api/states") == 2
+    assert endpoints.count("/api/config/entity_registry/list") == 1
+    assert endpoints.count("/api/states/switch.fan") == 2
+
+    stats = client.get_request_stats()
+    assert stats["/api/states"]["cache_hits"] == 1
+    assert stats["/api/states"]["cache_misses"] == 2
+    assert stats["/api/config/entity_registry/list"]["cache_hits"] == 1
+    assert stats["/api/states/{entity_id}"]["requests"] == 2
+
+    client.invalidate_cache("/api/config/entity_registry/list")
+    assert "/api/config/entity_registry/list" not in client._snapshot_cache
+
+
+@pytest.mark.asyncio
+async def test_fresh_read_bypasses_cache_and_inflight(mock_config):
+    """A fresh read sends its own request instead of joining or reading the cache."""
+    mock_config.rest.snapshot_cache_ttl_seconds = 30
+    client = HomeAssistantClient(mock_config.home_assistant.get_default_instance(), mock_config)
+    send, calls = _counting_send([])
+
+    with patch.object(client, "_send", side_effect=send):
+        await client.get_states()  # Cached
+        await client.get_states(fresh=True)
+        await asyncio.gather(client.get_states(fresh=True), client.get_states(fresh=True))
+        # Later callers may join a fresh read in flight
+        client.invalidate_cache()
+        await asyncio.gather(client.get_states(fresh=True), client.get_states())
+
+    assert len(calls) == 5
+    assert client.get_request_stats()["/api/states"]["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_history_batches_entities_with_options(client):
+    """Several entities are fetched in one request with the response options."""
+    send, calls = _counting_send([[{"entity_id": "light.a", "state": "on"}]], delay=0)
+    start = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+    with patch.object(client, "_send", side_effect=send):
+        await client.get_history(
+            filter_entity_id=["light.a", "switch.b"],
+            start_time=start,
+            minimal_response=True,
+            no_attributes=True,
+        )
+        await client.get_history(filter_entity_id="light.a")
+
+    assert calls[0][1] == (
+        "/api/history/period/2024-01-01T12:00:00+00:00"
+        "?filter_entity_id=light.a,switch.b&minimal_response&no_attributes"
+    )
+    assert calls[1][1] == "/api/history/period?filter_entity_id=light.a"
+    assert client.get_request_stats()["/api/history/period"]["requests"] == 2
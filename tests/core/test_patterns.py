@@ -0,0 +1,84 @@
+"""Tests for compiled entity pattern matching."""
+
+from fnmatch import fnmatch
+
+from ha_boss.core.patterns import EntityPatternMatcher, compile_globs, get_pattern_matcher
+
+
+def test_compile_globs_matches_fnmatch() -> None:
+    """Combined regex gives the same verdicts as fnmatch per pattern."""
+    patterns = ("sensor.time*", "light.?itchen", "switch.[ab]*", "sun.sun")
+    regex = compile_globs(patterns)
+    assert regex is not None
+
+    entity_ids = [
+        "sensor.time_utc",
+        "sensor.temperature",
+        "light.kitchen",
+        "light.kitchen_2",
+        "switch.a1",
+        "switch.c1",
+        "sun.sun",
+        "sun.sunrise",
+    ]
+    for entity_id in entity_ids:
+        expected = any(fnmatch(entity_id, pattern) for pattern in patterns)
+        assert (regex.match(entity_id) is not None) == expected, entity_id
+
+
+def test_compile_globs_empty() -> None:
+    """No patterns compiles to None."""
+    assert compile_globs(()) is None
+
+
+def test_exclude_wins_over_include() -> None:
+    """Excluded entities are rejected even when included."""
+    matcher = EntityPatternMatcher(include=["sensor.*"], exclude=["sensor.time*"])
+
+    assert matcher.matches("sensor.temperature") is True
+    assert matcher.matches("sensor.time_utc") is False
+    assert matcher.matches("light.kitchen") is False
+
+
+def test_empty_include_accepts_everything_not_excluded() -> None:
+    """Without include patterns only excludes apply."""
+    matcher = EntityPatternMatcher(exclude=["sun.sun"])
+
+    assert matcher.filter(["sun.sun", "light.kitchen", "sensor.a"]) == [
+        "light.kitchen",
+        "sensor.a",
+    ]
+    assert matcher.any_match(["sun.sun"]) is False
+
+
+def test_verdict_cache_hits_and_bound() -> None:
+    """Verdicts are memoized in a bounded LRU cache."""
+    matcher = EntityPatternMatcher(include=["light.*"], cache_size=2)
+
+    matcher.matches("light.a")
+    matcher.matches("light.a")
+    matcher.matches("light.b")
+    matcher.matches("light.c")
+
+    info = matcher.cache_info()
+    assert info["hits"] == 1
+    assert info["misses"] == 3
+    assert info["size"] == 2
+
+
+def test_sync_recompiles_only_on_change() -> None:
+    """Changed patterns invalidate cached verdicts; unchanged ones keep them."""
+    matcher = EntityPatternMatcher(include=[], exclude=["sensor.*"])
+    assert matcher.matches("sensor.a") is False
+
+    matcher.sync([], ["sensor.*"])
+    assert matcher.cache_info()["size"] == 1
+
+    matcher.sync([], ["light.*"])
+    assert matcher.cache_info()["size"] == 0
+    assert matcher.matches("sensor.a") is True
+
+
+def test_get_pattern_matcher_is_shared() -> None:
+    """Matchers for identical pattern sets are reused."""
+    assert get_pattern_matcher(("light.*",)) is get_pattern_matcher(("light.*",))
@@ -0,0 +1,130 @@
+"""Tests for the indexed entity/device registry cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ha_boss.core.exceptions import HomeAssistantConnectionError
+from ha_boss.core.ha_client import HomeAssistantClient
+from ha_boss.discovery.registry_cache import RegistryCache
+
+ENTITY_REGISTRY = [
+    {"entity_id": "light.living_room", "device_id": "hub"},
+    {"entity_id": "light.bedroom", "device_id": "hub"},
+    {"entity_id": "switch.kitchen", "device_id": "plug"},
+    {"entity_id": "sensor.weather", "device_id": None},
+]
+
+DEVICE_REGISTRY = [
+    {"id": "hub", "manufacturer": "Philips", "config_entries": ["entry_hue"]},
+    {"id": "plug", "manufacturer": "Tuya", "config_entries": ["entry_tuya"]},
+]
+
+
+@pytest.fixture
+def ha_client():
+    """Mock HA client serving the sample registries."""
+    client = MagicMock(spec=HomeAssistantClient)
+    client.get_entity_registry = AsyncMock(return_value=ENTITY_REGISTRY)
+    client.get_device_registry = AsyncMock(return_value=DEVICE_REGISTRY)
+    return client
+
+
+@pytest.fixture
+def cache(ha_client):
+    """Registry cache over the mock client."""
+    return RegistryCache(ha_client, instance_id="test")
+
+
+@pytest.mark.asyncio
+async def test_lookups_use_indexes_after_single_load(cache, ha_client):
+    """Registries are fetched once; all lookups are served from the indexes."""
+    assert await cache.get_devices_for_entities(
+        ["light.living_room", "switch.kitchen", "light.bedroom", "sensor.weather", "x.unknown"]
+    ) == {"hub": ["light.living_room", "light.bedroom"], "plug": ["switch.kitchen"]}
+    assert await cache.get_device_id("switch.kitchen") == "plug"
+    assert await cache.get_device_entities("hub") == {"light.living_room", "light.bedroom"}
+    assert (await cache.get_device("plug"))["manufacturer"] == "Tuya"
+    assert await cache.get_config_entries("hub") == ["entry_hue"]
+    assert await cache.get_config_entries("missing") == []
+
+    ha_client.get_entity_registry.assert_awaited_once()
+    ha_client.get_device_registry.assert_awaited_once()
+    assert cache.get_stats()["entities"] == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_lookups_share_one_load(cache, ha_client):
+    """Callers racing on a cold cache trigger a single registry download."""
+    await asyncio.gather(*(cache.get_device("hub") for _ in range(5)))
+
+    ha_client.get_entity_registry.assert_awaited_once()
+    ha_client.get_device_registry.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_retried(cache, ha_client):
+    """A failed fetch leaves the cache stale so the next lookup retries."""
+    ha_client.get_device_registry.side_effect = [
+        HomeAssistantConnectionError("down"),
+        DEVICE_REGISTRY,
+    ]
+
+    with pytest.raises(HomeAssistantConnectionError):
+        await cache.get_device("hub")
+    assert not cache.is_loaded
+
+    assert await cache.get_device("hub") is not None
+    assert ha_client.get_device_registry.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_entity_events_update_or_invalidate(cache, ha_client):
+    """Removals apply in place, cosmetic updates are ignored, moves trigger a reload."""
+    await cache.ensure_loaded()
+
+    cache.handle_entity_registry_updated({"action": "remove", "entity_id": "light.bedroom"})
+    assert await cache.get_device_entities("hub") == {"light.living_room"}
+
+    cache.handle_entity_registry_updated(
+        {"action": "update", "entity_id": "light.living_room", "changes": {"name": "Old"}}
+    )
+    assert cache.is_loaded
+
+    cache.handle_entity_registry_updated(
+        {"action": "update", "entity_id": "switch.kitchen", "changes": {"device_id": None}}
+    )
+    assert not cache.is_loaded
+    await cache.get_device_id("switch.kitchen")
+
+    assert ha_client.get_entity_registry.await_count == 2
+    ha_client.get_device_registry.assert_awaited_once()  # Only the stale registry reloads
+    assert cache.get_stats()["events_ignored"] == 1
+
+
+@pytest.mark.asyncio
+async def test_device_events(cache, ha_client):
+    """Device removal detaches its entities; device updates reload the device registry."""
+    await cache.ensure_loaded()
+
+    cache.handle_device_registry_updated({"action": "remove", "device_id": "plug"})
+    assert await cache.get_device("plug") is None
+    assert await cache.get_devices_for_entities(["switch.kitchen"]) == {}
+
+    cache.handle_device_registry_updated({"action": "update", "device_id": "hub", "changes": {}})
+    await cache.get_device("hub")
+    assert ha_client.get_device_registry.await_count == 2
+    ha_client.get_entity_registry.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_full_reload(cache, ha_client):
+    """invalidate() (e.g. after a WebSocket reconnect) reloads both registries."""
+    await cache.ensure_loaded()
+    cache.invalidate()
+    await cache.ensure_loaded()
+
+    assert ha_client.get_entity_registry.await_count == 2
+    assert ha_client.get_device_registry.await_count == 2
+    assert cache.get_stats()["invalidations"] == 1
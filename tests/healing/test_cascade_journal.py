@@ -0,0 +1,122 @@
+"""Tests for cascade journaling and single-transaction flushes."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select
+
+from ha_boss.core.database import (
+    AutomationOutcomePattern,
+    EntityHealingAction,
+    HealingCascadeExecution,
+    init_database,
+)
+from ha_boss.healing.cascade_journal import (
+    CascadeJournal,
+    CascadeJournalWriter,
+    journal_healing_action,
+)
+
+
+@pytest.fixture
+async def database(tmp_path):
+    """Create test database."""
+    db = await init_database(tmp_path / "test.db")
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+async def _create_cascade(database) -> int:
+    async with database.async_session() as session:
+        cascade_exec = HealingCascadeExecution(
+            instance_id="default",
+            automation_id="automation.test",
+            trigger_type="outcome_failure",
+            failed_entities=["light.a"],
+            timeout_seconds=60,
+            routing_strategy="sequential",
+            entity_level_attempted=False,
+            device_level_attempted=False,
+            integration_level_attempted=False,
+            created_at=datetime.now(UTC),
+        )
+        session.add(cascade_exec)
+        await session.commit()
+        return cascade_exec.id
+
+
+def _make_journal(cascade_exec_id: int) -> CascadeJournal:
+    journal = CascadeJournal(cascade_exec_id, "default", "automation.test")
+    journal.record_level("entity", attempted=True, success=True)
+    journal.update_cascade(final_success=True, completed_at=datetime.now(UTC))
+    with journal.activate():
+        assert journal_healing_action(
+            EntityHealingAction(
+                instance_id="default",
+                entity_id="light.a",
+                action_type="retry_service_call",
+                success=True,
+            )
+        )
+    journal.record_pattern_success("light.a", "entity", "retry_service_call")
+    return journal
+
+
+async def _assert_applied(database) -> None:
+    async with database.async_session() as session:
+        cascade_exec = (await session.execute(select(HealingCascadeExecution))).scalar_one()
+        assert cascade_exec.entity_level_attempted is True
+        assert cascade_exec.entity_level_success is True
+        assert cascade_exec.final_success is True
+
+        action = (await session.execute(select(EntityHealingAction))).scalar_one()
+        assert action.entity_id == "light.a"
+
+        pattern = (await session.execute(select(AutomationOutcomePattern))).scalar_one()
+        assert pattern.successful_healing_level == "entity"
+        assert pattern.healing_success_count == 1
+
+
+def test_healing_action_not_journaled_outside_cascade():
+    """Healers commit their own rows when no journal is active."""
+    row = EntityHealingAction(instance_id="default", entity_id="light.a", action_type="retry")
+    assert journal_healing_action(row) is False
+
+
+@pytest.mark.asyncio
+async def test_flush_applies_journal(database):
+    """Level results, action rows and the learned pattern are written together."""
+    journal = _make_journal(await _create_cascade(database))
+    writer = CascadeJournalWriter(database)
+
+    assert await writer.flush(journal) is True
+    await _assert_applied(database)
+    assert writer.get_stats()["flushed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_goes_to_fallback_and_replays(database, tmp_path, monkeypatch):
+    """A journal that cannot be written is kept on disk and replayed later."""
+    journal = _make_journal(await _create_cascade(database))
+    fallback_path = tmp_path / "cascade_journal.jsonl"
+    writer = CascadeJournalWriter(database, fallback_path)
+
+    async def failing_apply(session, journal):
+        session.add(EntityHealingAction(instance_id="default", entity_id="light.a"))
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(writer, "_apply", failing_apply)
+    assert await writer.flush(journal) is False
+    assert len(fallback_path.read_text().splitlines()) == 1
+
+    # Nothing of the journal was written
+    async with database.async_session() as session:
+        assert (await session.execute(select(EntityHealingAction))).scalar_one_or_none() is None
+
+    monkeypatch.undo()
+    assert await writer.replay_fallback() == 1
+    await _assert_applied(database)
+    assert fallback_path.read_text() == ""
+    assert writer.get_stats() == {"flushed": 0, "fallback_writes": 1, "replayed": 1}
@@ -715,6 +715,62 @@ class TestPatternLearning:
             pattern = patterns[0]
             assert pattern.healing_success_count == 2  # Incremented
 
+    @pytest.mark.asyncio
+    async def test_patterns_learned_for_every_healed_entity(
+        self, orchestrator, database, entity_healer, device_healer
+    ):
+        """Every healed entity gets a pattern, and any of them can drive routing."""
+        device_healer.heal.return_value = DeviceHealingResult(
+            devices_attempted=["device_123"],
+            success=True,
+            devices_healed=["device_123"],
+            actions_attempted=["reconnect"],
+            final_action="reconnect",
+            error_message=None,
+            total_duration_seconds=2.0,
+        )
+        entity_healer.heal.return_value = EntityHealingResult(
+            entity_id="light.living_room",
+            success=False,
+            actions_attempted=["retry_service_call"],
+            final_action=None,
+            error_message="Retry failed",
+            total_duration_seconds=1.0,
+        )
+
+        for execution_id in (1, 2):
+            context = HealingContext(
+                instance_id="test_instance",
+                automation_id="automation.test",
+                execution_id=execution_id,
+                trigger_type="outcome_failure",
+                failed_entities=["light.living_room", "light.bedroom"],
+            )
+            result = await orchestrator.execute_cascade(context, use_intelligent_routing=False)
+            assert result.successful_level == HealingLevel.DEVICE
+
+        async with database.async_session() as session:
+            db_result = await session.execute(select(AutomationOutcomePattern))
+            patterns = {p.entity_id: p for p in db_result.scalars().all()}
+            assert set(patterns) == {"light.living_room", "light.bedroom"}
+            assert all(p.healing_success_count == 2 for p in patterns.values())
+
+        # Only the second entity fails now; its pattern is matched from memory
+        context = HealingContext(
+            instance_id="test_instance",
+            automation_id="automation.test",
+            execution_id=3,
+            trigger_type="outcome_failure",
+            failed_entities=["light.bedroom"],
+        )
+        result = await orchestrator.execute_cascade(context, use_intelligent_routing=True)
+
+        assert result.routing_strategy == "intelligent"
+        assert result.levels_attempted == [HealingLevel.DEVICE]
+        metrics = await orchestrator.get_routing_metrics("test_instance")
+        assert metrics["pattern_index"]["hits"] == 1
+        assert metrics["pattern_index"]["hit_rate"] == 1.0
+
 
 class TestDatabaseRecording:
     """Test cascade execution recording to database."""
@@ -1,5 +1,7 @@
 """Tests for device-level healing."""
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -8,6 +10,7 @@ from sqlalchemy import select
 from ha_boss.core.database import Database, DeviceHealingAction
 from ha_boss.core.ha_client import HomeAssistantClient
 from ha_boss.healing.device_healer import DeviceHealer
+from ha_boss.monitoring.state_tracker import StateTracker, StateWaitResult
 
 
 @pytest.fixture
@@ -1047,3 +1050,180 @@ class TestPartialSuccessThreshold:
             assert result is True
             # Should log warning about partial success
             assert mock_logger.warning.called
+
+
+class TestRegistryCache:
+    """Test device lookups through the shared registry cache."""
+
+    @pytest.mark.asyncio
+    async def test_heal_resolves_devices_without_registry_requests(self, database, ha_client):
+        """With a registry cache, healing does not download the registries."""
+        registry_cache = MagicMock()
+        registry_cache.get_devices_for_entities = AsyncMock(
+            return_value={"device_123": ["light.living_room"]}
+        )
+        registry_cache.get_device = AsyncMock(return_value=MOCK_DEVICE_REGISTRY[0])
+        healer = DeviceHealer(
+            database=database,
+            ha_client=ha_client,
+            instance_id="test_instance",
+            registry_cache=registry_cache,
+        )
+        ha_client.get_state.return_value = {"state": "on"}
+
+        with (
+            patch.object(healer, "_get_device_integration", return_value="zha"),
+            patch("ha_boss.healing.device_healer.asyncio.sleep", new=AsyncMock()),
+        ):
+            result = await healer.heal(["light.living_room"])
+
+        assert result.success is True
+        assert result.devices_healed == ["device_123"]
+        ha_client._request.assert_not_called()
+        registry_cache.get_device.assert_awaited_with("device_123")
+
+
+class TestEventDrivenVerification:
+    """Test verification and post-action waits driven by the state tracker."""
+
+    @pytest.mark.asyncio
+    async def test_verification_returns_on_recovery(self, database, ha_client):
+        """Verification succeeds as soon as enough entities recover, without REST polling."""
+        state_tracker = MagicMock()
+        state_tracker.wait_until_available = AsyncMock(
+            return_value=StateWaitResult(
+                satisfied=True,
+                matched=["light.1", "light.2"],
+                pending=["light.3"],
+                elapsed_seconds=0.2,
+            )
+        )
+        healer = DeviceHealer(
+            database=database,
+            ha_client=ha_client,
+            state_verification_timeout=30.0,
+            state_verification_partial_threshold=0.5,
+            state_tracker=state_tracker,
+        )
+
+        result = await healer._verify_entity_states(["light.1", "light.2", "light.3"])
+
+        assert result is True
+        state_tracker.wait_until_available.assert_awaited_once_with(
+            ["light.1", "light.2", "light.3"], count=2, timeout=30.0, updated_after=None
+        )
+        ha_client.get_state.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_verification_falls_back_to_rest_after_deadline(self, database, ha_client):
+        """Entities the tracker never saw recover are still checked via REST."""
+        state_tracker = MagicMock()
+        state_tracker.wait_until_available = AsyncMock(
+            return_value=StateWaitResult(
+                satisfied=False, matched=[], pending=["light.1"], elapsed_seconds=0.1
+            )
+        )
+        healer = DeviceHealer(
+            database=database,
+            ha_client=ha_client,
+            state_verification_timeout=0.1,
+            state_tracker=state_tracker,
+        )
+        ha_client.get_state.return_value = {"state": "on"}
+
+        assert await healer._verify_entity_states(["light.1"]) is True
+        ha_client.get_state.assert_awaited_once_with("light.1", fresh=True)
+
+    @staticmethod
+    async def _report(tracker: StateTracker, state: str) -> None:
+        with patch.object(tracker, "_persist_entity", new_callable=AsyncMock):
+            await tracker.update_state(
+                {
+                    "entity_id": "switch.kitchen",
+                    "new_state": {"state": state, "last_updated": "2024-01-01T12:00:00Z"},
+                }
+            )
+
+    @pytest.mark.asyncio
+    async def test_reboot_wait_ends_on_recovery(self, database, ha_client):
+        """The post-reboot wait ends when the device's entities go down and come back."""
+        tracker = StateTracker("test_instance", MagicMock(spec=Database))
+        healer = DeviceHealer(
+            database=database,
+            ha_client=ha_client,
+            reboot_timeout_seconds=30.0,
+            reboot_settle_seconds=10.0,
+            state_tracker=tracker,
+        )
+        ha_client._request.return_value = MOCK_DEVICE_REGISTRY
+        reported: list[str] = []
+
+        async def reboot_sequence() -> None:
+            for state in ("on", "unavailable", "on"):
+                await self._report(tracker, state)
+                reported.append(state)
+                await asyncio.sleep(0.05)
+
+        tasks = []
+        ha_client.call_service.side_effect = lambda **kwargs: tasks.append(
+            asyncio.create_task(reboot_sequence())
+        )
+
+        with patch.object(healer, "_get_device_integration", return_value="tuya"):
+            success = await asyncio.wait_for(
+                healer._reboot_device("device_456", entity_ids=["switch.kitchen"]), timeout=5
+            )
+
+        # The last "on" before going down did not count as recovery
+        assert reported == ["on", "unavailable", "on"]
+        assert success is True
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_reboot_wait_ignores_states_during_settle_time(self, database, ha_client):
+        """Without a reported outage, only states after the settle time count."""
+        tracker = StateTracker("test_instance", MagicMock(spec=Database))
+        healer = DeviceHealer(
+            database=database,
+            ha_client=ha_client,
+            reboot_timeout_seconds=0.3,
+            reboot_settle_seconds=0.1,
+            state_tracker=tracker,
+        )
+        ha_client._request.return_value = MOCK_DEVICE_REGISTRY
+
+        async def last_report(**kwargs):
+            await self._report(tracker, "on")
+
+        ha_client.call_service.side_effect = last_report
+
+        with patch.object(healer, "_get_device_integration", return_value="tuya"):
+            started = time.monotonic()
+            await healer._reboot_device("device_456", entity_ids=["switch.kitchen"])
+
+        assert time.monotonic() - started >= 0.3
+
+    @pytest.mark.asyncio
+    async def test_reboot_wait_ignores_state_from_before_the_action(self, database, ha_client):
+        """Entities already available before the reboot don't end the wait early."""
+        tracker = StateTracker("test_instance", MagicMock(spec=Database))
+        with patch.object(tracker, "_persist_entity", new_callable=AsyncMock):
+            await tracker.update_state(
+                {
+                    "entity_id": "switch.kitchen",
+                    "new_state": {"state": "on", "last_updated": "2024-01-01T12:00:00Z"},
+                }
+            )
+        healer = DeviceHealer(
+            database=database,
+            ha_client=ha_client,
+            reboot_timeout_seconds=0.2,
+            state_tracker=tracker,
+        )
+        ha_client._request.return_value = MOCK_DEVICE_REGISTRY
+
+        with patch.object(healer, "_get_device_integration", return_value="tuya"):
+            started = time.monotonic()
+            await healer._reboot_device("device_456", entity_ids=["switch.kitchen"])
+
+        assert time.monotonic() - started >= 0.2
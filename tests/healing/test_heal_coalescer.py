@@ -0,0 +1,121 @@
+"""Tests for integration-level heal coalescing."""
+
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ha_boss.core.exceptions import CircuitBreakerOpenError
+from ha_boss.core.types import HealthIssue
+from ha_boss.healing.heal_coalescer import HealCoalescer
+
+INTEGRATIONS = {"light.a": "zha", "light.b": "zha", "sensor.c": "zha", "switch.d": "mqtt"}
+
+
+def _issue(entity_id: str) -> HealthIssue:
+    return HealthIssue(entity_id=entity_id, issue_type="unavailable", detected_at=datetime.now(UTC))
+
+
+class _Outcomes:
+    """Collects outcomes passed to the coalescer's callback."""
+
+    def __init__(self) -> None:
+        self.received: list[tuple[list[str], list[str], Exception | None]] = []
+
+    async def __call__(
+        self, issues: list[HealthIssue], healed: list[HealthIssue], error: Exception | None
+    ) -> None:
+        self.received.append(([i.entity_id for i in issues], [i.entity_id for i in healed], error))
+
+
+@pytest.fixture
+def healing_manager() -> Any:
+    manager = MagicMock()
+    manager.heal = AsyncMock(return_value=True)
+    manager.heal_group = AsyncMock(side_effect=lambda integration_id, issues: issues)
+    return manager
+
+
+@pytest.fixture
+def integration_discovery() -> Any:
+    discovery = MagicMock()
+    discovery.get_integration_for_entity = INTEGRATIONS.get
+    return discovery
+
+
+@pytest.mark.asyncio
+async def test_groups_issues_by_integration(healing_manager, integration_discovery):
+    """Issues of one integration within the window share a single reload."""
+    outcomes = _Outcomes()
+    coalescer = HealCoalescer(healing_manager, integration_discovery, outcomes, window_seconds=0.05)
+
+    for entity_id in ("light.a", "light.b", "switch.d", "sensor.c", "light.a"):
+        coalescer.submit(_issue(entity_id))
+
+    # Nothing is healed before the window closes
+    healing_manager.heal_group.assert_not_called()
+    healing_manager.heal.assert_not_called()
+
+    await asyncio.sleep(0.1)
+    await coalescer.flush()
+
+    healing_manager.heal_group.assert_called_once()
+    integration_id, issues = healing_manager.heal_group.call_args.args
+    assert integration_id == "zha"
+    assert [i.entity_id for i in issues] == ["light.a", "light.b", "sensor.c"]
+    # Single-entity groups go through the regular heal path
+    healing_manager.heal.assert_called_once()
+
+    assert sorted(outcomes.received) == [
+        (["light.a", "light.b", "sensor.c"], ["light.a", "light.b", "sensor.c"], None),
+        (["switch.d"], ["switch.d"], None),
+    ]
+    stats = coalescer.get_stats()
+    assert stats["issues_received"] == 5
+    assert stats["groups_healed"] == 2
+    assert stats["reloads_saved"] == 2
+    assert stats["largest_group"] == 3
+
+
+@pytest.mark.asyncio
+async def test_error_fans_out_to_group(healing_manager, integration_discovery):
+    """An error from the group's reload is reported once for the whole group."""
+    error = CircuitBreakerOpenError("Circuit breaker is open for zha")
+    healing_manager.heal_group.side_effect = error
+    outcomes = _Outcomes()
+    coalescer = HealCoalescer(healing_manager, integration_discovery, outcomes, window_seconds=60)
+
+    coalescer.submit(_issue("light.a"))
+    coalescer.submit(_issue("light.b"))
+    await coalescer.flush()
+
+    assert outcomes.received == [(["light.a", "light.b"], [], error)]
+
+
+@pytest.mark.asyncio
+async def test_unknown_integration_healed_immediately(healing_manager, integration_discovery):
+    """Entities without a known integration are not held for a window."""
+    outcomes = _Outcomes()
+    coalescer = HealCoalescer(healing_manager, integration_discovery, outcomes, window_seconds=60)
+
+    coalescer.submit(_issue("binary_sensor.orphan"))
+    await asyncio.sleep(0)
+
+    healing_manager.heal.assert_called_once()
+    assert coalescer.get_stats()["open_groups"] == 0
+    await coalescer.close()
+
+
+@pytest.mark.asyncio
+async def test_close_drops_open_groups(healing_manager, integration_discovery):
+    """Closing the coalescer discards groups still waiting for their window."""
+    outcomes = _Outcomes()
+    coalescer = HealCoalescer(healing_manager, integration_discovery, outcomes, window_seconds=60)
+
+    coalescer.submit(_issue("light.a"))
+    await coalescer.close()
+
+    healing_manager.heal.assert_not_called()
+    assert coalescer.get_stats()["open_groups"] == 0
@@ -7,7 +7,7 @@ import pytest
 from sqlalchemy import select
 
 from ha_boss.core.config import Config, HealingConfig, HomeAssistantConfig
-from ha_boss.core.database import HealingAction, Integration, init_database
+from ha_boss.core.database import Entity, HealingAction, Integration, init_database
 from ha_boss.core.exceptions import (
     CircuitBreakerOpenError,
     HealingFailedError,
@@ -398,6 +398,9 @@ async def test_can_heal_checks(healing_manager, database):
         session.add(integration)
         await session.commit()
 
+    # Policy state is loaded once; pick up the row written behind its back
+    await healing_manager.policy.load()
+
     can_heal, reason = await healing_manager.can_heal("sensor.test_sensor")
     assert can_heal is False
     assert "Circuit breaker is open" in reason
@@ -451,3 +454,64 @@ async def test_healing_duration_recorded(healing_manager, sample_health_issue):
         action = result.scalar_one()
         assert action.duration_seconds is not None
         assert action.duration_seconds >= 0
+
+
+def _issues(*entity_ids: str) -> list[HealthIssue]:
+    return [
+        HealthIssue(entity_id=entity_id, issue_type="unavailable", detected_at=datetime.now(UTC))
+        for entity_id in entity_ids
+    ]
+
+
+@pytest.mark.asyncio
+async def test_heal_group_single_reload_and_action(healing_manager, mock_ha_client):
+    """Test that a group is healed with one reload recorded as one action."""
+    issues = _issues("light.a", "light.b", "sensor.c")
+
+    healed = await healing_manager.heal_group("test_integration_123", issues)
+
+    assert healed == issues
+    mock_ha_client.reload_integration.assert_called_once_with("test_integration_123")
+
+    async with healing_manager.database.async_session() as session:
+        result = await session.execute(select(HealingAction))
+        action = result.scalar_one()
+        assert action.entity_id == "light.a"
+        assert action.group_members == ["light.a", "light.b", "sensor.c"]
+        assert action.success is True
+
+
+@pytest.mark.asyncio
+async def test_heal_group_skips_suppressed_entities(healing_manager, mock_ha_client):
+    """Test that suppressed entities are left out of the group."""
+    async with healing_manager.database.async_session() as session:
+        session.add(
+            Entity(
+                instance_id="default",
+                entity_id="light.b",
+                domain="light",
+                last_seen=datetime.now(UTC),
+                healing_suppressed=True,
+            )
+        )
+        await session.commit()
+
+    healed = await healing_manager.heal_group("test_integration_123", _issues("light.a", "light.b"))
+    assert [issue.entity_id for issue in healed] == ["light.a"]
+    mock_ha_client.reload_integration.assert_called_once()
+
+    # Every member suppressed: no reload
+    mock_ha_client.reload_integration.reset_mock()
+    assert await healing_manager.heal_group("test_integration_123", _issues("light.b")) == []
+    mock_ha_client.reload_integration.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_heal_group_respects_cooldown(healing_manager, mock_ha_client):
+    """Test that the cooldown applies to the group as a whole."""
+    await healing_manager.heal_group("test_integration_123", _issues("light.a", "light.b"))
+
+    with pytest.raises(HealingFailedError, match="Cooldown active"):
+        await healing_manager.heal_group("test_integration_123", _issues("light.c", "light.d"))
+
+    mock_ha_client.reload_integration.assert_called_once()
@@ -0,0 +1,85 @@
+"""Tests for the in-memory healing pattern index."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from ha_boss.core.database import AutomationOutcomePattern, init_database
+from ha_boss.healing.pattern_index import HealingPatternIndex
+
+
+@pytest.fixture
+async def database(tmp_path):
+    """Create test database."""
+    db = await init_database(tmp_path / "test.db")
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+def _pattern(instance_id: str, entity_id: str, level: str | None, count: int):
+    now = datetime.now(UTC)
+    return AutomationOutcomePattern(
+        instance_id=instance_id,
+        automation_id="automation.test",
+        entity_id=entity_id,
+        observed_state="on",
+        successful_healing_level=level,
+        successful_healing_strategy="reconnect" if level else None,
+        healing_success_count=count,
+        first_observed=now,
+        last_observed=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_and_match_considers_every_entity(database):
+    """The strongest actionable pattern among all failed entities is matched."""
+    async with database.async_session() as session:
+        session.add_all(
+            [
+                _pattern("default", "light.a", "entity", 2),
+                _pattern("default", "light.b", "device", 5),
+                _pattern("default", "light.c", None, 9),
+                _pattern("other", "light.d", "device", 9),
+            ]
+        )
+        await session.commit()
+
+    index = HealingPatternIndex(database, "default")
+    await index.load()
+
+    match = index.match(
+        "default", "automation.test", ["light.a", "light.b", "light.c", "light.d"], 2
+    )
+    assert match is not None
+    assert match.entity_id == "light.b"
+    assert match.successful_healing_level == "device"
+    assert match.id is not None
+
+    # Below threshold and unknown entities do not match
+    assert index.match("default", "automation.test", ["light.a"], 3) is None
+    assert index.match("default", "automation.other", ["light.b"], 2) is None
+
+    stats = index.get_stats(2)
+    assert stats["patterns"] == 3
+    assert stats["actionable_patterns"] == 2
+    assert stats["lookups"] == 3
+    assert stats["hits"] == 1
+    assert stats["hit_rate"] == pytest.approx(0.3333)
+
+
+@pytest.mark.asyncio
+async def test_record_success_updates_incrementally(database):
+    """Successes create or update entries without touching the database."""
+    index = HealingPatternIndex(database, "default")
+    await index.ensure_loaded()
+
+    index.record_success("default", "automation.test", "light.a", "entity", "retry")
+    assert index.match("default", "automation.test", ["light.a"], 2) is None
+
+    entry = index.record_success("default", "automation.test", "light.a", "device", "reconnect")
+    assert entry.healing_success_count == 2
+    assert entry.successful_healing_level == "device"
+    assert index.match("default", "automation.test", ["light.a"], 2) is entry
@@ -426,6 +426,45 @@ class TestPlanExecutorExecution:
         assert mock_session.commit.await_count >= 1
 
 
+class TestPlanExecutorRecovery:
+    @pytest.mark.asyncio
+    async def test_step_finishes_when_entities_recover(self) -> None:
+        """A running step ends as soon as the state tracker sees the entities recover."""
+        db = Mock(spec=Database)
+        db.async_session = AsyncMock()
+        entity_healer = Mock(spec=EntityHealer)
+        device_healer = Mock(spec=DeviceHealer)
+        healer_cancelled = asyncio.Event()
+
+        async def slow_heal(**kwargs: object) -> DeviceHealingResult:
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                healer_cancelled.set()
+                raise
+            raise AssertionError("step should have been cut short")
+
+        device_healer.heal = slow_heal
+        state_tracker = Mock()
+        recovered = asyncio.Event()
+
+        async def wait_until_available(entity_ids: list[str]) -> None:
+            await recovered.wait()
+
+        state_tracker.wait_until_available = wait_until_available
+
+        executor = PlanExecutor(db, entity_healer, device_healer, state_tracker=state_tracker)
+        plan = _make_plan([_make_step("device_reconnect", "device", "reconnect")])
+        context = _make_context(["sensor.test"])
+
+        asyncio.get_running_loop().call_later(0.01, recovered.set)
+        result = await asyncio.wait_for(executor.execute_plan(plan, context), timeout=5)
+
+        assert result.success is True
+        assert result.steps_attempted[0].duration_seconds < 5
+        assert healer_cancelled.is_set()
+
+
 class TestPlanExecutionResult:
     def test_result_fields(self) -> None:
         result = PlanExecutionResult(
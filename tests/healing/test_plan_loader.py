@@ -227,3 +227,27 @@ class TestPlanLoaderDatabase:
             )
             plan = result.scalar_one()
             assert plan.enabled is False
+
+    @pytest.mark.asyncio
+    async def test_set_plan_enabled_bumps_revision(self, database, plans_directory):
+        """Test that plan changes are persisted and advance the revision."""
+        loader = PlanLoader(
+            database=database,
+            user_plans_directory=str(plans_directory),
+            use_builtin=False,
+        )
+        assert loader.revision == 0
+        await loader.load_all_plans()
+        assert loader.revision == 1
+
+        await loader.set_plan_enabled("test_zigbee", False)
+        assert loader.revision == 2
+
+        enabled = {plan.name for plan in await loader.get_all_enabled_plans()}
+        all_plans = {plan.name for plan in await loader.get_all_plans()}
+        assert "test_zigbee" not in enabled
+        assert "test_zigbee" in all_plans
+
+        with pytest.raises(HealingPlanNotFoundError):
+            await loader.set_plan_enabled("nonexistent", True)
+        assert loader.revision == 2
@@ -78,7 +78,8 @@ def _make_context(
 def _make_matcher(plans: list[HealingPlanDefinition]) -> PlanMatcher:
     """Create a plan matcher with mocked plan loader."""
     mock_loader = Mock(spec=PlanLoader)
-    mock_loader.get_all_enabled_plans = AsyncMock(return_value=plans)
+    mock_loader.get_all_plans = AsyncMock(return_value=plans)
+    mock_loader.revision = 1
     return PlanMatcher(plan_loader=mock_loader)
 
 
@@ -352,3 +353,61 @@ class TestMatchCriteriaToDict:
         assert result["failure_types"] == ["unavailable"]
         assert result["time_window"] == {"start_hour": 8, "end_hour": 18}
         assert result["device_manufacturers"] == []
+
+
+class TestPlanIndex:
+    @pytest.mark.asyncio
+    async def test_index_built_once_until_loader_changes(self) -> None:
+        plan = _make_plan("test", entity_patterns=["light.*"])
+        matcher = _make_matcher([plan])
+        context = _make_context(["light.bedroom"])
+
+        for _ in range(3):
+            assert await matcher.find_matching_plan(context) == plan
+        matcher.plan_loader.get_all_plans.assert_awaited_once()
+
+        # A loader sync (or API change) bumps the revision and triggers a rebuild
+        matcher.plan_loader.revision = 2
+        assert await matcher.find_matching_plan(context) == plan
+        assert matcher.plan_loader.get_all_plans.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_plans_listed_but_not_matched(self) -> None:
+        disabled = _make_plan("disabled", priority=100, entity_patterns=["light.*"], enabled=False)
+        enabled = _make_plan("enabled", priority=10, entity_patterns=["light.*"])
+        matcher = _make_matcher([enabled, disabled])
+
+        result = await matcher.find_matching_plan(_make_context(["light.bedroom"]))
+
+        assert result == enabled
+        assert [plan.name for plan in matcher.plans] == ["disabled", "enabled"]
+
+    @pytest.mark.asyncio
+    async def test_bucketed_candidates_keep_priority_order(self) -> None:
+        wildcard = _make_plan("wildcard", priority=1, entity_patterns=["light.*"])
+        zha = _make_plan(
+            "zha", priority=50, integration_domains=["zha"], failure_types=["unavailable"]
+        )
+        mqtt = _make_plan("mqtt", priority=90, integration_domains=["mqtt"])
+        timeout = _make_plan("timeout", priority=99, failure_types=["timeout"])
+        multi = _make_plan(
+            "multi",
+            priority=70,
+            integration_domains=["zha", "mqtt"],
+            failure_types=["unavailable", "unknown"],
+        )
+        matcher = _make_matcher([wildcard, zha, mqtt, timeout, multi])
+        index = await matcher.refresh()
+
+        candidates = index.candidates("unavailable", {"zha"})
+        assert [c.plan.name for c in candidates] == ["multi", "zha", "wildcard"]
+
+        # Without integration info, domain criteria are ignored
+        candidates = index.candidates("unavailable", None)
+        assert [c.plan.name for c in candidates] == ["mqtt", "multi", "zha", "wildcard"]
+
+        result = await matcher.find_matching_plan(
+            _make_context(["light.bedroom", "sensor.plug"]),
+            entity_integration_map={"light.bedroom": "hue", "sensor.plug": "mqtt"},
+        )
+        assert result == mqtt
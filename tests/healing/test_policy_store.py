@@ -0,0 +1,138 @@
+"""Tests for in-memory healing policy state."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from ha_boss.core.database import Entity, HealingAction, Integration, init_database
+from ha_boss.healing.policy_store import HealingPolicyStore
+
+
+@pytest.fixture
+async def database(tmp_path):
+    """Create test database."""
+    db = await init_database(tmp_path / "test.db")
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+async def _seed(database) -> None:
+    now = datetime.now(UTC)
+    async with database.async_session() as session:
+        session.add_all(
+            [
+                Entity(
+                    instance_id="default",
+                    entity_id="light.a",
+                    domain="light",
+                    last_seen=now,
+                    healing_suppressed=True,
+                ),
+                Entity(
+                    instance_id="other",
+                    entity_id="light.b",
+                    domain="light",
+                    last_seen=now,
+                    healing_suppressed=True,
+                ),
+                Integration(
+                    entry_id="zha_1",
+                    domain="zha",
+                    title="ZHA",
+                    consecutive_failures=2,
+                    circuit_breaker_open_until=now + timedelta(seconds=300),
+                ),
+                HealingAction(
+                    entity_id="light.c",
+                    integration_id="zha_1",
+                    action="reload_integration",
+                    attempt_number=1,
+                    success=False,
+                    timestamp=now - timedelta(seconds=30),
+                ),
+                HealingAction(
+                    entity_id="light.c",
+                    integration_id="zha_1",
+                    action="reload_integration",
+                    attempt_number=2,
+                    success=False,
+                    timestamp=now - timedelta(seconds=10),
+                ),
+            ]
+        )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_load_restores_policy_state(database):
+    """Suppression, circuit breaker, cooldown and attempt counts survive a restart."""
+    await _seed(database)
+    store = HealingPolicyStore(database, "default")
+    await store.load()
+
+    assert store.is_suppressed("light.a")
+    # Other instances' suppression is not loaded
+    assert not store.is_suppressed("light.b")
+
+    assert store.failure_count == {"zha_1": 2}
+    remaining = store.circuit_breaker_remaining("zha_1")
+    assert remaining is not None and remaining > timedelta(seconds=250)
+    assert store.circuit_breaker_remaining("mqtt_1") is None
+
+    cooldown = store.cooldown_remaining("zha_1", timedelta(seconds=60))
+    assert cooldown is not None and cooldown <= timedelta(seconds=50)
+    assert store.next_attempt_number("light.c", "zha_1") == 3
+    assert store.next_attempt_number("light.d", "zha_1") == 1
+
+
+@pytest.mark.asyncio
+async def test_changes_are_written_through(database):
+    """Failure, circuit breaker and success updates reach the database."""
+    await _seed(database)
+    store = HealingPolicyStore(database, "default")
+    await store.load()
+
+    assert await store.record_failure("zha_1") == 3
+    until = datetime.now(UTC) + timedelta(seconds=600)
+    await store.open_circuit_breaker("zha_1", until)
+
+    async with database.async_session() as session:
+        integration = (await session.execute(select(Integration))).scalar_one()
+        assert integration.consecutive_failures == 3
+        assert integration.circuit_breaker_open_until is not None
+
+    await store.record_success("zha_1")
+    assert store.circuit_breaker_remaining("zha_1") is None
+
+    async with database.async_session() as session:
+        integration = (await session.execute(select(Integration))).scalar_one()
+        assert integration.consecutive_failures == 0
+        assert integration.circuit_breaker_open_until is None
+        assert integration.last_successful_reload is not None
+
+    # A fresh store sees the same state
+    reloaded = HealingPolicyStore(database, "default")
+    await reloaded.load()
+    assert reloaded.failure_count == {}
+    assert reloaded.circuit_open_until == {}
+
+
+@pytest.mark.asyncio
+async def test_expired_circuit_breaker_and_suppression_updates(database):
+    """Expired breakers report zero remaining; suppression changes apply in memory."""
+    store = HealingPolicyStore(database, "default")
+    await store.ensure_loaded()
+    assert store.loaded
+
+    past = datetime.now(UTC) - timedelta(seconds=5)
+    store.circuit_open_until["zha_1"] = past
+    assert store.circuit_breaker_remaining("zha_1") == timedelta(0)
+    assert store.get_stats()["circuit_breakers_open"] == 0
+
+    store.set_suppressed("light.a", True)
+    assert store.is_suppressed("light.a")
+    store.set_suppressed("light.a", False)
+    assert not store.is_suppressed("light.a")
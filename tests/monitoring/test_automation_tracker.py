@@ -394,6 +394,7 @@ async def test_outcome_validation_triggered(tracker_with_validation, mock_ha_cli
             cascade_orchestrator=tracker_with_validation.cascade_orchestrator,
             health_tracker=tracker_with_validation.health_tracker,
             config=tracker_with_validation.config,
+            state_tracker=tracker_with_validation.state_tracker,
         )
 
         # Verify validation was called
@@ -0,0 +1,119 @@
+"""Tests for pluggable WebSocket frame decoding."""
+
+import importlib.util
+import json
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from ha_boss.monitoring.event_decoder import EventDecoder, LazyJSON, create_event_decoder
+from ha_boss.monitoring.state_tracker import EntityState
+
+AVAILABLE_BACKENDS = ["json"] + [
+    name for name in ("msgspec", "orjson") if importlib.util.find_spec(name) is not None
+]
+
+
+def _state_changed_frame() -> str:
+    return json.dumps(
+        {
+            "id": 7,
+            "type": "event",
+            "event": {
+                "event_type": "state_changed",
+                "data": {
+                    "entity_id": "light.kitchen",
+                    "old_state": {"entity_id": "light.kitchen", "state": "off", "attributes": {}},
+                    "new_state": {
+                        "entity_id": "light.kitchen",
+                        "state": "on",
+                        "last_changed": "2024-01-01T12:00:00+00:00",
+                        "last_updated": "2024-01-01T12:00:00+00:00",
+                        "attributes": {"friendly_name": "Kitchen", "brightness": 200},
+                        "context": {"id": "ctx-1", "parent_id": None, "user_id": None},
+                    },
+                },
+                "origin": "LOCAL",
+            },
+        }
+    )
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+def test_backends_produce_equivalent_messages(backend: str) -> None:
+    """Every backend yields the fields the client and StateTracker rely on."""
+    message = EventDecoder(backend).decode(_state_changed_frame())  # type: ignore[arg-type]
+
+    assert message["type"] == "event"
+    event = message["event"]
+    assert event["event_type"] == "state_changed"
+    data: dict[str, Any] = event["data"]
+    assert data["entity_id"] == "light.kitchen"
+    assert data["new_state"]["state"] == "on"
+    assert data["new_state"]["last_updated"] == "2024-01-01T12:00:00+00:00"
+    assert data["new_state"]["context"]["id"] == "ctx-1"
+    assert dict(data["new_state"]["attributes"]) == {"friendly_name": "Kitchen", "brightness": 200}
+    assert data["old_state"]["state"] == "off"
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+def test_non_event_messages_decoded_completely(backend: str) -> None:
+    """Results and pongs keep all their fields."""
+    decoder = EventDecoder(backend)  # type: ignore[arg-type]
+
+    assert decoder.decode('{"id": 1, "type": "result", "success": true, "result": null}') == {
+        "id": 1,
+        "type": "result",
+        "success": True,
+        "result": None,
+    }
+    assert decoder.decode('{"id": 2, "type": "pong"}')["type"] == "pong"
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+def test_invalid_frame_raises_value_error(backend: str) -> None:
+    """All backends signal malformed frames with a ValueError subclass."""
+    with pytest.raises(ValueError):
+        EventDecoder(backend).decode("not json")  # type: ignore[arg-type]
+
+
+def test_msgspec_attributes_are_lazy() -> None:
+    """Attributes and old_state stay raw until read; friendly_name needs no parse."""
+    pytest.importorskip("msgspec")
+    data = EventDecoder("msgspec").decode(_state_changed_frame())["event"]["data"]
+
+    attributes = data["new_state"]["attributes"]
+    assert isinstance(attributes, LazyJSON)
+    assert isinstance(data["old_state"], LazyJSON)
+
+    # StateTracker only needs friendly_name for persistence
+    entity = EntityState("light.kitchen", "on", datetime.now(UTC), attributes)
+    assert entity.attributes.get("friendly_name") == "Kitchen"
+    assert not attributes.is_loaded
+    assert not data["old_state"].is_loaded
+
+    assert attributes["brightness"] == 200
+    assert attributes.is_loaded
+
+
+def test_lazy_json_mapping_behaviour() -> None:
+    """LazyJSON behaves like a read-only dict once parsed."""
+    lazy = LazyJSON(b'{"a": 1, "b": [1, 2]}', json.loads)
+
+    assert len(lazy) == 2
+    assert "a" in lazy
+    assert lazy.get("missing", "default") == "default"
+    assert lazy == {"a": 1, "b": [1, 2]}
+    assert LazyJSON(b"[]", json.loads) == {}
+
+
+def test_unavailable_backend_falls_back() -> None:
+    """Requesting a backend that is not installed falls back to auto selection."""
+    decoder = create_event_decoder("auto")
+    assert decoder.backend in AVAILABLE_BACKENDS
+
+    if "msgspec" not in AVAILABLE_BACKENDS:
+        with pytest.raises(ValueError):
+            EventDecoder("msgspec")
+        assert create_event_decoder("msgspec").backend in AVAILABLE_BACKENDS
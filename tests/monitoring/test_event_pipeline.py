@@ -0,0 +1,171 @@
+"""Tests for the bounded WebSocket event pipeline."""
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from ha_boss.core.config import Config, HomeAssistantConfig
+from ha_boss.monitoring.event_pipeline import EventChannel
+from ha_boss.monitoring.websocket_client import WebSocketClient
+
+
+def _state_event(entity_id: str, state: str) -> dict[str, Any]:
+    return {"entity_id": entity_id, "new_state": {"entity_id": entity_id, "state": state}}
+
+
+async def _wait_drained(channel: EventChannel, timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while channel.depth or channel.get_stats()["processed"] < channel.get_stats()["enqueued"]:
+            await asyncio.sleep(0.005)
+
+
+@pytest.mark.asyncio
+async def test_per_entity_ordering_across_workers() -> None:
+    """Events for one entity are processed in arrival order, even with many workers."""
+    seen: dict[str, list[str]] = {}
+
+    async def handler(data: dict[str, Any]) -> None:
+        await asyncio.sleep(0)  # Let workers interleave
+        seen.setdefault(data["entity_id"], []).append(data["new_state"]["state"])
+
+    channel = EventChannel(
+        "state_changed",
+        handler,
+        workers=4,
+        overflow="drop",
+        key_func=lambda d: d["entity_id"],
+    )
+    channel.start()
+    try:
+        for i in range(50):
+            for entity in ("light.a", "light.b", "sensor.c"):
+                channel.put(_state_event(entity, str(i)))
+        await _wait_drained(channel)
+    finally:
+        await channel.stop()
+
+    for states in seen.values():
+        assert states == [str(i) for i in range(50)]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_keeps_latest_state_per_entity() -> None:
+    """Pending events for the same entity collapse to the latest state."""
+    processed: list[tuple[str, str]] = []
+
+    async def handler(data: dict[str, Any]) -> None:
+        processed.append((data["entity_id"], data["new_state"]["state"]))
+
+    channel = EventChannel(
+        "state_changed",
+        handler,
+        max_size=10,
+        overflow="coalesce",
+        key_func=lambda d: d["entity_id"],
+    )
+    # Queue before starting workers to simulate a slow consumer
+    for i in range(5):
+        channel.put(_state_event("sensor.temp", str(i)))
+    channel.put(_state_event("light.kitchen", "on"))
+
+    channel.start()
+    try:
+        await _wait_drained(channel)
+    finally:
+        await channel.stop()
+
+    # Original position of sensor.temp is kept, with the latest payload
+    assert processed == [("sensor.temp", "4"), ("light.kitchen", "on")]
+    stats = channel.get_stats()
+    assert stats["coalesced"] == 4
+    assert stats["dropped"] == 0
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_when_full() -> None:
+    """New events are dropped once the queue is full."""
+    channel = EventChannel("automation_triggered", AsyncMock(), max_size=3, overflow="drop")
+
+    results = [channel.put({"entity_id": "automation.a"}) for _ in range(5)]
+
+    assert results == [True, True, True, False, False]
+    stats = channel.get_stats()
+    assert stats["depth"] == 3
+    assert stats["max_depth"] == 3
+    assert stats["dropped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_handler_errors_do_not_stop_worker() -> None:
+    """A failing handler is counted and the worker keeps going."""
+    handler = AsyncMock(side_effect=[RuntimeError("boom"), None])
+    channel = EventChannel("call_service", handler)
+    channel.start()
+    try:
+        channel.put({"domain": "light"})
+        channel.put({"domain": "switch"})
+        await _wait_drained(channel)
+    finally:
+        await channel.stop()
+
+    stats = channel.get_stats()
+    assert stats["processed"] == 2
+    assert stats["errors"] == 1
+    assert stats["max_lag_ms"] >= stats["avg_lag_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_slow_handler_does_not_block_reception() -> None:
+    """The listen loop keeps receiving while a state callback is blocked."""
+    release = asyncio.Event()
+    received: list[str] = []
+
+    async def on_state_changed(data: dict[str, Any]) -> None:
+        await release.wait()
+        received.append(data["entity_id"])
+
+    config = Config(
+        home_assistant=HomeAssistantConfig(url="http://ha.local:8123", token="test_token")
+    )
+    client = WebSocketClient(
+        config.home_assistant.get_default_instance(), config, on_state_changed=on_state_changed
+    )
+
+    frames = [
+        json.dumps(
+            {
+                "type": "event",
+                "event": {"event_type": "state_changed", "data": _state_event(f"light.l{i}", "on")},
+            }
+        )
+        for i in range(20)
+    ]
+
+    class FakeSocket:
+        def __aiter__(self) -> Any:
+            return self._frames()
+
+        async def _frames(self) -> Any:
+            for frame in frames:
+                yield frame
+
+    client._ws = FakeSocket()
+    client._running = True
+    for channel in client._channels.values():
+        channel.start()
+    try:
+        # Completes although every handler is still blocked
+        await asyncio.wait_for(client._listen_loop(), timeout=1.0)
+        stats = client.get_pipeline_stats()["state_changed"]
+        assert stats["enqueued"] == 20
+        assert received == []
+
+        release.set()
+        await _wait_drained(client._channels["state_changed"])
+        assert sorted(received) == sorted(f"light.l{i}" for i in range(20))
+    finally:
+        client._ws = None
+        await client.stop()
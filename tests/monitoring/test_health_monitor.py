@@ -352,6 +352,107 @@ class TestHealthMonitorPersistence:
             await health_monitor._persist_health_event(issue)
 
 
+class TestHealthMonitorDeadlineScheduler:
+    """Tests for event-driven deadline scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_state_change_marks_entity_dirty(self, health_monitor: HealthMonitor) -> None:
+        """Listener marks the entity dirty and wakes the loop."""
+        entity_state = EntityState("sensor.test", "on", datetime.now(UTC))
+
+        health_monitor._on_state_changed(entity_state, None)
+
+        assert health_monitor._dirty == {"sensor.test"}
+        assert health_monitor._wakeup.is_set()
+
+    @pytest.mark.asyncio
+    async def test_dirty_unavailable_schedules_grace_deadline(
+        self, health_monitor: HealthMonitor, mock_state_tracker: StateTracker
+    ) -> None:
+        """An unavailable entity is tracked and scheduled for the end of its grace period."""
+        entity_state = EntityState("sensor.test", "unavailable", datetime.now(UTC))
+        mock_state_tracker.get_state = AsyncMock(return_value=entity_state)
+
+        health_monitor._on_state_changed(entity_state, None)
+        await health_monitor._process_due_entities()
+
+        issue_type, first_detected = health_monitor._issue_tracker["sensor.test"]
+        assert issue_type == "unavailable"
+        expected = (first_detected + timedelta(seconds=300)).timestamp()
+        assert health_monitor._deadlines["sensor.test"] == expected
+        assert health_monitor._time_until_next_deadline() == pytest.approx(300, abs=5)
+
+    @pytest.mark.asyncio
+    async def test_expired_grace_deadline_reports_issue(
+        self, health_monitor: HealthMonitor, mock_state_tracker: StateTracker
+    ) -> None:
+        """Only entities whose deadline passed are evaluated, and the issue is reported."""
+        entity_state = EntityState("sensor.test", "unavailable", datetime.now(UTC))
+        mock_state_tracker.get_state = AsyncMock(return_value=entity_state)
+        callback = AsyncMock()
+        health_monitor.on_issue_detected = callback
+
+        past = datetime.now(UTC) - timedelta(minutes=10)
+        health_monitor._issue_tracker["sensor.test"] = ("unavailable", past)
+        health_monitor._schedule_next_deadline(entity_state)
+
+        with patch.object(health_monitor, "_persist_health_event", new_callable=AsyncMock):
+            await health_monitor._process_due_entities()
+
+        callback.assert_called_once()
+        mock_state_tracker.get_all_states.assert_not_called()
+        # Reported issues wait for a state change rather than a deadline
+        assert "sensor.test" not in health_monitor._deadlines
+        assert health_monitor._time_until_next_deadline() is None
+
+    @pytest.mark.asyncio
+    async def test_healthy_entity_scheduled_for_staleness(
+        self, health_monitor: HealthMonitor
+    ) -> None:
+        """Healthy entities are scheduled for when they would become stale."""
+        last_updated = datetime.now(UTC)
+        health_monitor._schedule_next_deadline(EntityState("sensor.test", "on", last_updated))
+
+        expected = (last_updated + timedelta(seconds=3600)).timestamp()
+        assert health_monitor._deadlines["sensor.test"] == expected
+
+    @pytest.mark.asyncio
+    async def test_frequent_updates_do_not_grow_heap(self, health_monitor: HealthMonitor) -> None:
+        """Later stale deadlines keep the earlier pending entry instead of pushing."""
+        start = datetime.now(UTC)
+        for offset in range(100):
+            health_monitor._schedule_next_deadline(
+                EntityState("sensor.power", "42", start + timedelta(seconds=offset))
+            )
+
+        assert len(health_monitor._deadline_heap) == 1
+
+    @pytest.mark.asyncio
+    async def test_removed_entity_is_forgotten(
+        self, health_monitor: HealthMonitor, mock_state_tracker: StateTracker
+    ) -> None:
+        """Dirty entities no longer in the cache drop their tracking state."""
+        health_monitor._issue_tracker["sensor.gone"] = ("unavailable", datetime.now(UTC))
+        health_monitor._deadlines["sensor.gone"] = datetime.now(UTC).timestamp() + 60
+        mock_state_tracker.get_state = AsyncMock(return_value=None)
+
+        health_monitor._dirty.add("sensor.gone")
+        await health_monitor._process_due_entities()
+
+        assert "sensor.gone" not in health_monitor._issue_tracker
+        assert "sensor.gone" not in health_monitor._deadlines
+
+    @pytest.mark.asyncio
+    async def test_excluded_entities_not_evaluated(
+        self, health_monitor: HealthMonitor, mock_state_tracker: StateTracker
+    ) -> None:
+        """Dirty entities matching exclude patterns are skipped."""
+        health_monitor._dirty.add("sensor.time_utc")
+        await health_monitor._process_due_entities()
+
+        mock_state_tracker.get_state.assert_not_called()
+
+
 class TestHealthMonitorLifecycle:
     """Tests for monitor start/stop lifecycle."""
 
@@ -363,6 +464,9 @@ class TestHealthMonitorLifecycle:
 
             assert health_monitor._running is True
             assert health_monitor._monitor_task is not None
+            health_monitor.state_tracker.add_listener.assert_called_once_with(
+                health_monitor._on_state_changed
+            )
 
     @pytest.mark.asyncio
     async def test_stop_monitor(self, health_monitor: HealthMonitor) -> None:
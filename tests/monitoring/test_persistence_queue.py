@@ -0,0 +1,218 @@
+"""Tests for the write-behind state persistence queue."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select
+
+from ha_boss.core.database import Database, Entity, StateHistory, init_database
+from ha_boss.monitoring.persistence_queue import (
+    EntityUpsert,
+    StateHistoryRecord,
+    StatePersistenceQueue,
+)
+from ha_boss.monitoring.state_tracker import StateTracker
+
+
+@pytest.fixture
+async def database(tmp_path) -> Database:
+    """Create a real SQLite database."""
+    db = await init_database(tmp_path / "test.db")
+    yield db
+    await db.close()
+
+
+def _upsert(entity_id: str, state: str, instance_id: str = "default") -> EntityUpsert:
+    return EntityUpsert(
+        instance_id=instance_id,
+        entity_id=entity_id,
+        domain=entity_id.split(".")[0],
+        last_seen=datetime.now(UTC),
+        last_state=state,
+        friendly_name=f"{entity_id} name",
+    )
+
+
+@pytest.mark.asyncio
+async def test_coalesces_upserts_per_entity(database: Database) -> None:
+    """Multiple updates for one entity collapse into a single pending upsert."""
+    queue = StatePersistenceQueue(database)
+
+    for value in range(5):
+        queue.submit_entity(_upsert("sensor.power", str(value)))
+    queue.submit_entity(_upsert("sensor.power", "5", instance_id="other"))
+
+    assert queue.depth == 2
+    stats = queue.get_stats()
+    assert stats["submitted"] == 6
+    assert stats["coalesced"] == 4
+
+    written = await queue.flush()
+    assert written == 2
+
+    async with database.async_session() as session:
+        result = await session.execute(select(Entity).order_by(Entity.instance_id))
+        rows = result.scalars().all()
+
+    assert [(r.instance_id, r.last_state) for r in rows] == [("default", "4"), ("other", "5")]
+    assert rows[0].friendly_name == "sensor.power name"
+
+
+@pytest.mark.asyncio
+async def test_flush_updates_existing_rows(database: Database) -> None:
+    """Upsert updates last_state without clobbering fields managed elsewhere."""
+    async with database.async_session() as session:
+        session.add(
+            Entity(
+                instance_id="default",
+                entity_id="light.kitchen",
+                domain="light",
+                friendly_name="Kitchen",
+                last_seen=datetime.now(UTC) - timedelta(hours=1),
+                last_state="off",
+                healing_suppressed=True,
+            )
+        )
+        await session.commit()
+
+    queue = StatePersistenceQueue(database)
+    upsert = _upsert("light.kitchen", "on")
+    upsert.friendly_name = None
+    queue.submit_entity(upsert)
+    await queue.flush()
+
+    async with database.async_session() as session:
+        result = await session.execute(select(Entity))
+        entity = result.scalar_one()
+
+    assert entity.last_state == "on"
+    assert entity.friendly_name == "Kitchen"
+    assert entity.healing_suppressed is True
+
+
+@pytest.mark.asyncio
+async def test_history_rows_are_not_coalesced(database: Database) -> None:
+    """Every state transition is written to state_history."""
+    queue = StatePersistenceQueue(database)
+    now = datetime.now(UTC)
+    for old, new in [("on", "off"), ("off", "on"), ("on", "unavailable")]:
+        queue.submit_history(
+            StateHistoryRecord(
+                instance_id="default",
+                entity_id="switch.pump",
+                old_state=old,
+                new_state=new,
+                timestamp=now,
+            )
+        )
+
+    assert await queue.flush() == 3
+
+    async with database.async_session() as session:
+        result = await session.execute(select(StateHistory))
+        assert len(result.scalars().all()) == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_size_triggers_flush_request() -> None:
+    """Reaching batch_size wakes the background flusher."""
+    queue = StatePersistenceQueue(MagicMock(spec=Database), batch_size=2)
+
+    queue.submit_entity(_upsert("sensor.a", "1"))
+    assert not queue._flush_requested.is_set()
+    queue.submit_entity(_upsert("sensor.b", "1"))
+    assert queue._flush_requested.is_set()
+
+
+@pytest.mark.asyncio
+async def test_backpressure_flushes_inline_when_not_running(database: Database) -> None:
+    """Producers over max_pending are throttled until the queue drains."""
+    queue = StatePersistenceQueue(database, max_pending=2)
+
+    queue.submit_entity(_upsert("sensor.a", "1"))
+    await queue.wait_for_capacity()
+    assert queue.get_stats()["backpressure_waits"] == 0
+
+    queue.submit_entity(_upsert("sensor.b", "1"))
+    await queue.wait_for_capacity()
+
+    stats = queue.get_stats()
+    assert stats["backpressure_waits"] == 1
+    assert stats["depth"] == 0
+    assert stats["entities_written"] == 2
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_pending_rows(database: Database) -> None:
+    """Stopping the queue writes everything still buffered."""
+    queue = StatePersistenceQueue(database, flush_interval_seconds=60.0)
+    await queue.start()
+
+    queue.submit_entity(_upsert("sensor.a", "1"))
+    queue.submit_entity(_upsert("sensor.b", "2"))
+    await queue.stop()
+
+    assert queue.depth == 0
+    async with database.async_session() as session:
+        result = await session.execute(select(Entity))
+        assert len(result.scalars().all()) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_requeues_entities() -> None:
+    """A failed flush keeps entity upserts for the next attempt."""
+    database = MagicMock(spec=Database)
+    database.async_session = MagicMock(side_effect=Exception("database is locked"))
+    queue = StatePersistenceQueue(database)
+
+    queue.submit_entity(_upsert("sensor.a", "1"))
+    queue.submit_history(
+        StateHistoryRecord(
+            instance_id="default",
+            entity_id="sensor.a",
+            old_state="0",
+            new_state="1",
+            timestamp=datetime.now(UTC),
+        )
+    )
+
+    assert await queue.flush() == 0
+
+    stats = queue.get_stats()
+    assert stats["flush_errors"] == 1
+    assert stats["history_dropped"] == 1
+    assert queue.depth == 1
+
+
+@pytest.mark.asyncio
+async def test_state_tracker_uses_queue(database: Database) -> None:
+    """StateTracker submits to the queue instead of committing per event."""
+    queue = StatePersistenceQueue(database)
+    tracker = StateTracker("default", database, persistence_queue=queue)
+
+    for value in ("on", "off", "on"):
+        await tracker.update_state(
+            {
+                "entity_id": "switch.pump",
+                "new_state": {
+                    "entity_id": "switch.pump",
+                    "state": value,
+                    "last_updated": datetime.now(UTC).isoformat(),
+                    "attributes": {"friendly_name": "Pump"},
+                },
+            }
+        )
+
+    # Nothing written until flush; one coalesced upsert plus two transitions pending
+    assert queue.depth == 3
+
+    await queue.flush()
+
+    async with database.async_session() as session:
+        entity = (await session.execute(select(Entity))).scalar_one()
+        history = (await session.execute(select(StateHistory))).scalars().all()
+
+    assert entity.last_state == "on"
+    assert entity.friendly_name == "Pump"
+    assert [(h.old_state, h.new_state) for h in history] == [("on", "off"), ("off", "on")]
@@ -0,0 +1,210 @@
+"""Tests for delta-based snapshot reconciliation."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ha_boss.core.database import Database
+from ha_boss.monitoring.reconciler import SnapshotReconciler
+from ha_boss.monitoring.state_tracker import StateTracker
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def _rest_state(
+    entity_id: str, state: str, minutes: int = 0, context_id: str | None = None
+) -> dict:
+    return {
+        "entity_id": entity_id,
+        "state": state,
+        "last_updated": (BASE_TIME + timedelta(minutes=minutes)).isoformat(),
+        "attributes": {},
+        "context": {"id": context_id or f"{entity_id}-{minutes}"},
+    }
+
+
+@pytest.fixture
+async def tracker() -> StateTracker:
+    """State tracker hydrated with three entities (database writes mocked)."""
+    tracker = StateTracker("default", MagicMock(spec=Database))
+    tracker._hydrate_database = AsyncMock(  # type: ignore[method-assign]
+        return_value={
+            "inserted": 3,
+            "updated": 0,
+            "unchanged": 0,
+            "preload_ms": 0.0,
+            "diff_ms": 0.0,
+            "write_ms": 0.0,
+        }
+    )
+    tracker._persist_entity = AsyncMock()  # type: ignore[method-assign]
+    tracker._record_state_history = AsyncMock()  # type: ignore[method-assign]
+    await tracker.initialize(
+        [
+            _rest_state("light.kitchen", "on"),
+            _rest_state("sensor.temp", "20"),
+            _rest_state("switch.pump", "off"),
+        ]
+    )
+    return tracker
+
+
+@pytest.mark.asyncio
+async def test_unchanged_snapshot_applies_nothing(tracker: StateTracker) -> None:
+    """Identical snapshots produce no updates, DB writes or callbacks."""
+    callback = AsyncMock()
+    tracker.on_state_updated = callback
+    reconciler = SnapshotReconciler(tracker)
+
+    result = await reconciler.reconcile(
+        [
+            _rest_state("light.kitchen", "on"),
+            _rest_state("sensor.temp", "20"),
+            _rest_state("switch.pump", "off"),
+        ]
+    )
+
+    assert result.compared == 3
+    assert result.unchanged == 3
+    assert result.missed_events == 0
+    callback.assert_not_called()
+    tracker._persist_entity.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_divergences_applied_as_events(tracker: StateTracker) -> None:
+    """Diverged, missing and removed entities are applied to the cache."""
+    reconciler = SnapshotReconciler(tracker)
+
+    result = await reconciler.reconcile(
+        [
+            _rest_state("light.kitchen", "off", minutes=5),  # missed change
+            _rest_state("sensor.temp", "20"),  # unchanged
+            _rest_state("binary_sensor.door", "on", minutes=1),  # new entity
+        ]
+    )
+
+    assert result.diverged == ["light.kitchen"]
+    assert result.missing == ["binary_sensor.door"]
+    assert result.removed == ["switch.pump"]
+    assert result.missed_events == 3
+
+    states = await tracker.get_all_states()
+    assert states["light.kitchen"].state == "off"
+    assert states["binary_sensor.door"].state == "on"
+    assert "switch.pump" not in states
+
+
+@pytest.mark.asyncio
+async def test_newer_cache_is_not_overwritten(tracker: StateTracker) -> None:
+    """A WebSocket event newer than the snapshot wins over the snapshot."""
+    await tracker.update_state(
+        {"entity_id": "sensor.temp", "new_state": _rest_state("sensor.temp", "21", minutes=10)}
+    )
+    reconciler = SnapshotReconciler(tracker)
+
+    result = await reconciler.reconcile(
+        [
+            _rest_state("light.kitchen", "on"),
+            _rest_state("sensor.temp", "20", minutes=2, context_id="older"),
+            _rest_state("switch.pump", "off"),
+        ]
+    )
+
+    assert result.stale_snapshot == 1
+    assert result.missed_events == 0
+    assert (await tracker.get_state("sensor.temp")).state == "21"
+
+
+@pytest.mark.asyncio
+async def test_drift_statistics(tracker: StateTracker) -> None:
+    """Missed events are tracked per interval."""
+    reconciler = SnapshotReconciler(tracker)
+    snapshot = [
+        _rest_state("light.kitchen", "on"),
+        _rest_state("sensor.temp", "20"),
+        _rest_state("switch.pump", "off"),
+    ]
+
+    await reconciler.reconcile(snapshot)
+    snapshot[0] = _rest_state("light.kitchen", "off", minutes=1)
+    snapshot[1] = _rest_state("sensor.temp", "22", minutes=1)
+    await reconciler.reconcile(snapshot)
+
+    stats = reconciler.get_stats()
+    assert stats["runs"] == 2
+    assert stats["total_missed_events"] == 2
+    assert stats["max_missed_per_interval"] == 2
+    assert stats["avg_missed_per_interval"] == 1.0
+    assert stats["last_run"]["diverged"] == 2
+
+
+@pytest.mark.asyncio
+async def test_entity_added_during_fetch_is_not_removed(tracker: StateTracker) -> None:
+    """An entity created over WebSocket while the snapshot is in flight is kept."""
+    reconciler = SnapshotReconciler(tracker)
+    snapshot = [
+        _rest_state("light.kitchen", "on"),
+        _rest_state("sensor.temp", "20"),
+        _rest_state("switch.pump", "off"),
+    ]
+
+    async def fetch_states() -> list[dict]:
+        await tracker.update_state(
+            {"entity_id": "light.new", "new_state": _rest_state("light.new", "on", minutes=1)}
+        )
+        return snapshot
+
+    result = await reconciler.fetch_and_reconcile(fetch_states)
+
+    assert result.removed == []
+    assert (await tracker.get_state("light.new")).state == "on"
+
+
+@pytest.mark.asyncio
+async def test_event_during_fetch_wins_over_snapshot(tracker: StateTracker) -> None:
+    """Changes received while the snapshot is in flight are not overwritten or removed."""
+    reconciler = SnapshotReconciler(tracker)
+    snapshot = [
+        _rest_state("light.kitchen", "off", minutes=5),
+        _rest_state("sensor.temp", "20"),
+    ]
+
+    async def fetch_states() -> list[dict]:
+        await tracker.update_state(
+            {
+                "entity_id": "light.kitchen",
+                "new_state": _rest_state("light.kitchen", "on", minutes=4, context_id="ws"),
+            }
+        )
+        await tracker.update_state(
+            {"entity_id": "switch.pump", "new_state": _rest_state("switch.pump", "on", 4)}
+        )
+        return snapshot
+
+    result = await reconciler.fetch_and_reconcile(fetch_states)
+
+    assert result.stale_snapshot == 2
+    assert result.missed_events == 0
+    assert (await tracker.get_state("light.kitchen")).state == "on"
+    assert (await tracker.get_state("switch.pump")).state == "on"
+
+
+@pytest.mark.asyncio
+async def test_stale_update_skipped_after_newer_event(tracker: StateTracker) -> None:
+    """A snapshot update queued behind a newer event is dropped when applied."""
+    version = tracker.version
+    await tracker.update_state(
+        {"entity_id": "sensor.temp", "new_state": _rest_state("sensor.temp", "21", minutes=10)}
+    )
+
+    await tracker.update_state(
+        {"entity_id": "sensor.temp", "new_state": _rest_state("sensor.temp", "20", minutes=2)},
+        if_unchanged_since=version,
+    )
+    await tracker.update_state(
+        {"entity_id": "sensor.temp", "new_state": None}, if_unchanged_since=version
+    )
+
+    assert (await tracker.get_state("sensor.temp")).state == "21"
@@ -1,12 +1,15 @@
 """Tests for state_tracker module."""
 
-from datetime import UTC, datetime
+import asyncio
+import sys
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from ha_boss.core.database import Database
 from ha_boss.core.exceptions import DatabaseError
+from ha_boss.monitoring.event_decoder import LazyJSON
 from ha_boss.monitoring.state_tracker import (
     EntityState,
     StateTracker,
@@ -14,6 +17,20 @@ from ha_boss.monitoring.state_tracker import (
 )
 
 
+def _mock_hydrate() -> AsyncMock:
+    """Mock bulk hydration returning empty phase statistics."""
+    return AsyncMock(
+        return_value={
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "preload_ms": 0.0,
+            "diff_ms": 0.0,
+            "write_ms": 0.0,
+        }
+    )
+
+
 @pytest.fixture
 async def mock_database() -> Database:
     """Create a mock database."""
@@ -71,6 +88,22 @@ class TestEntityState:
         assert state.last_updated == now
         assert state.attributes == {"key": "value"}
 
+    def test_entity_state_is_compact(self) -> None:
+        """EntityState is slotted, interns state values and stores an epoch timestamp."""
+        updated = datetime(2024, 1, 1, 12, 0, 0)  # Naive: treated as UTC
+        state = EntityState(
+            entity_id="".join(["sensor.", "test"]),
+            state="".join(["act", "ive"]),
+            last_updated=updated,
+        )
+
+        assert not hasattr(state, "__dict__")
+        assert state.entity_id == "sensor.test"
+        assert state.state is sys.intern("active")
+        assert state.last_updated_ts == updated.replace(tzinfo=UTC).timestamp()
+        assert state.last_updated == updated.replace(tzinfo=UTC)
+        assert state.attributes == {}
+
     def test_entity_state_repr(self) -> None:
         """Test EntityState string representation."""
         now = datetime.now(UTC)
@@ -91,7 +124,7 @@ class TestStateTrackerInitialization:
     @pytest.mark.asyncio
     async def test_initialize_empty(self, state_tracker: StateTracker) -> None:
         """Test initialization with empty state list."""
-        with patch.object(state_tracker, "_persist_entity", new_callable=AsyncMock):
+        with patch.object(state_tracker, "_hydrate_database", new_callable=_mock_hydrate):
             await state_tracker.initialize([])
             states = await state_tracker.get_all_states()
             assert len(states) == 0
@@ -101,7 +134,7 @@ class TestStateTrackerInitialization:
         self, state_tracker: StateTracker, sample_states: list[dict]
     ) -> None:
         """Test initialization with sample states."""
-        with patch.object(state_tracker, "_persist_entity", new_callable=AsyncMock):
+        with patch.object(state_tracker, "_hydrate_database", new_callable=_mock_hydrate):
             await state_tracker.initialize(sample_states)
 
             states = await state_tracker.get_all_states()
@@ -125,7 +158,7 @@ class TestStateTrackerInitialization:
             }
         ]
 
-        with patch.object(state_tracker, "_persist_entity", new_callable=AsyncMock):
+        with patch.object(state_tracker, "_hydrate_database", new_callable=_mock_hydrate):
             await state_tracker.initialize(states)
 
             test_state = await state_tracker.get_state("sensor.test")
@@ -164,7 +197,7 @@ class TestStateTrackerUpdates:
         self, state_tracker: StateTracker, sample_states: list[dict]
     ) -> None:
         """Test updating state for existing entity."""
-        with patch.object(state_tracker, "_persist_entity", new_callable=AsyncMock):
+        with patch.object(state_tracker, "_hydrate_database", new_callable=_mock_hydrate):
             await state_tracker.initialize(sample_states)
 
         # Update temperature sensor
@@ -195,7 +228,7 @@ class TestStateTrackerUpdates:
         self, state_tracker: StateTracker, sample_states: list[dict]
     ) -> None:
         """Test updating state when state value doesn't change."""
-        with patch.object(state_tracker, "_persist_entity", new_callable=AsyncMock):
+        with patch.object(state_tracker, "_hydrate_database", new_callable=_mock_hydrate):
             await state_tracker.initialize(sample_states)
 
         # Update with same state value
@@ -240,11 +273,30 @@ class TestStateTrackerUpdates:
         assert args[0].entity_id == "sensor.test"
         assert args[1] is None  # No old state
 
+    @pytest.mark.asyncio
+    async def test_update_state_notifies_listeners(self, state_tracker: StateTracker) -> None:
+        """Test that registered listeners receive each cached update."""
+        listener = MagicMock()
+        state_tracker.add_listener(listener)
+        state_data = {
+            "entity_id": "sensor.test",
+            "new_state": {"state": "on", "last_updated": "2024-01-01T12:00:00Z"},
+        }
+
+        with patch.object(state_tracker, "_persist_entity", new_callable=AsyncMock):
+            await state_tracker.update_state(state_data)
+            listener.assert_called_once()
+            assert listener.call_args[0][0].state == "on"
+
+            state_tracker.remove_listener(listener)
+            await state_tracker.update_state(state_data)
+            listener.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_update_state_entity_removed(self, state_tracker: StateTracker) -> None:
         """Test updating state when entity is removed."""
         # Initialize with entity
-        with patch.object(state_tracker, "_persist_entity", new_callable=AsyncMock):
+        with patch.object(state_tracker, "_hydrate_database", new_callable=_mock_hydrate):
             await state_tracker.initialize(
                 [
                     {
@@ -262,11 +314,17 @@ class TestStateTrackerUpdates:
             "new_state": None,
         }
 
+        state_tracker.on_entity_removed = MagicMock()
         await state_tracker.update_state(removal_data)
 
         # Entity should be removed from cache
         removed_state = await state_tracker.get_state("sensor.removed")
         assert removed_state is None
+        state_tracker.on_entity_removed.assert_called_once_with("sensor.removed")
+
+        # Removing an entity that is not cached doesn't report it again
+        await state_tracker.update_state(removal_data)
+        state_tracker.on_entity_removed.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_update_state_missing_entity_id(self, state_tracker: StateTracker) -> None:
@@ -290,7 +348,7 @@ class TestStateTrackerQueries:
         self, state_tracker: StateTracker, sample_states: list[dict]
     ) -> None:
         """Test getting state for existing entity."""
-        with patch.object(state_tracker, "_persist_entity", new_callable=AsyncMock):
+        with patch.object(state_tracker, "_hydrate_database", new_callable=_mock_hydrate):
             await state_tracker.initialize(sample_states)
 
         state = await state_tracker.get_state("sensor.temperature")
@@ -308,7 +366,7 @@ class TestStateTrackerQueries:
         self, state_tracker: StateTracker, sample_states: list[dict]
     ) -> None:
         """Test getting all states."""
-        with patch.object(state_tracker, "_persist_entity", new_callable=AsyncMock):
+        with patch.object(state_tracker, "_hydrate_database", new_callable=_mock_hydrate):
             await state_tracker.initialize(sample_states)
 
         all_states = await state_tracker.get_all_states()
@@ -322,7 +380,7 @@ class TestStateTrackerQueries:
         self, state_tracker: StateTracker, sample_states: list[dict]
     ) -> None:
         """Test getting entities by domain."""
-        with patch.object(state_tracker, "_persist_entity", new_callable=AsyncMock):
+        with patch.object(state_tracker, "_hydrate_database", new_callable=_mock_hydrate):
             await state_tracker.initialize(sample_states)
 
         sensors = await state_tracker.get_entities_by_domain("sensor")
@@ -342,7 +400,7 @@ class TestStateTrackerQueries:
         self, state_tracker: StateTracker, sample_states: list[dict]
     ) -> None:
         """Test checking if entity is monitored."""
-        with patch.object(state_tracker, "_persist_entity", new_callable=AsyncMock):
+        with patch.object(state_tracker, "_hydrate_database", new_callable=_mock_hydrate):
             await state_tracker.initialize(sample_states)
 
         assert await state_tracker.is_entity_monitored("sensor.temperature") is True
@@ -408,7 +466,7 @@ class TestCreateStateTracker:
         self, mock_database: Database, sample_states: list[dict]
     ) -> None:
         """Test creating and initializing state tracker."""
-        with patch.object(StateTracker, "_persist_entity", new_callable=AsyncMock):
+        with patch.object(StateTracker, "_hydrate_database", new_callable=_mock_hydrate):
             tracker = await create_state_tracker("default", mock_database, sample_states)
 
             assert isinstance(tracker, StateTracker)
@@ -420,9 +478,396 @@ class TestCreateStateTracker:
         """Test creating state tracker with callback."""
         callback = AsyncMock()
 
-        with patch.object(StateTracker, "_persist_entity", new_callable=AsyncMock):
+        with patch.object(StateTracker, "_hydrate_database", new_callable=_mock_hydrate):
             tracker = await create_state_tracker(
                 "default", mock_database, [], on_state_updated=callback
             )
 
             assert tracker.on_state_updated == callback
+
+
+class TestStateTrackerBulkHydration:
+    """Tests for bulk startup hydration against a real database."""
+
+    @pytest.mark.asyncio
+    async def test_hydration_writes_only_new_or_changed_rows(
+        self, tmp_path, sample_states: list[dict]
+    ) -> None:
+        """Second hydration with one changed entity writes a single row."""
+        from sqlalchemy import select
+
+        from ha_boss.core.database import Entity, init_database
+
+        db = await init_database(tmp_path / "test.db")
+        try:
+            stats = await StateTracker("default", db).initialize(sample_states)
+            assert stats["inserted"] == 3
+            assert stats["updated"] == 0
+            for phase in ("parse_ms", "preload_ms", "diff_ms", "write_ms", "total_ms"):
+                assert phase in stats
+
+            changed = [dict(s) for s in sample_states]
+            changed[0]["state"] = "25.0"
+            changed[0]["last_updated"] = "2024-01-01T13:00:00Z"
+
+            tracker = StateTracker("default", db)
+            stats = await tracker.initialize(changed)
+            assert stats == tracker.hydration_stats
+            assert (stats["inserted"], stats["updated"], stats["unchanged"]) == (0, 1, 2)
+
+            async with db.async_session() as session:
+                result = await session.execute(
+                    select(Entity).where(Entity.entity_id == "sensor.temperature")
+                )
+                entity = result.scalar_one()
+            assert entity.last_state == "25.0"
+            assert entity.friendly_name == "Living Room Temperature"
+        finally:
+            await db.close()
+
+    @pytest.mark.asyncio
+    async def test_hydration_isolated_per_instance(
+        self, tmp_path, sample_states: list[dict]
+    ) -> None:
+        """Rows from another instance are not treated as existing."""
+        from ha_boss.core.database import init_database
+
+        db = await init_database(tmp_path / "test.db")
+        try:
+            await StateTracker("home", db).initialize(sample_states)
+            stats = await StateTracker("cabin", db).initialize(sample_states)
+            assert stats["inserted"] == 3
+        finally:
+            await db.close()
+
+    @pytest.mark.asyncio
+    async def test_hydration_database_error(
+        self, mock_database: Database, sample_states: list[dict]
+    ) -> None:
+        """Hydration failures surface as DatabaseError."""
+        mock_database.async_session.side_effect = Exception("disk I/O error")
+        tracker = StateTracker("default", mock_database)
+
+        with pytest.raises(DatabaseError):
+            await tracker.initialize(sample_states)
+
+        # Cache is still populated so monitoring can proceed after the caller handles it
+        assert len(await tracker.get_all_states()) == 3
+
+
+class TestStateWaiters:
+    """Tests for event-driven state waits."""
+
+    @staticmethod
+    async def _push(tracker: StateTracker, entity_id: str, state: str) -> None:
+        with patch.object(tracker, "_persist_entity", new_callable=AsyncMock):
+            await tracker.update_state(
+                {
+                    "entity_id": entity_id,
+                    "new_state": {"state": state, "last_updated": "2024-01-01T12:00:00Z"},
+                }
+            )
+
+    @pytest.mark.asyncio
+    async def test_wait_resolves_on_update(self, state_tracker: StateTracker) -> None:
+        """A wait returns as soon as the entity recovers, well before the timeout."""
+        await self._push(state_tracker, "light.kitchen", "unavailable")
+
+        waiter = asyncio.create_task(
+            state_tracker.wait_until_available(["light.kitchen"], timeout=10)
+        )
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await self._push(state_tracker, "light.kitchen", "on")
+        result = await asyncio.wait_for(waiter, timeout=1)
+
+        assert result.satisfied
+        assert result.matched == ["light.kitchen"]
+        assert result.elapsed_seconds < 1
+        assert state_tracker._waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_wait_already_satisfied(self, state_tracker: StateTracker) -> None:
+        """Entities already meeting the condition resolve without waiting."""
+        await self._push(state_tracker, "sensor.temperature", "21.0")
+
+        result = await state_tracker.wait_until_available(["sensor.temperature"], timeout=0)
+
+        assert result.satisfied
+        assert result.pending == []
+
+    @pytest.mark.asyncio
+    async def test_wait_ignores_states_received_before_version(
+        self, state_tracker: StateTracker
+    ) -> None:
+        """With updated_after, only states received after that version count."""
+        await self._push(state_tracker, "light.kitchen", "on")
+        since = state_tracker.version
+
+        waiter = asyncio.create_task(
+            state_tracker.wait_until_available(["light.kitchen"], timeout=10, updated_after=since)
+        )
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await self._push(state_tracker, "light.kitchen", "on")
+        result = await asyncio.wait_for(waiter, timeout=1)
+
+        assert result.satisfied
+        assert (
+            await state_tracker.wait_until_available(["light.kitchen"], updated_after=since)
+        ).satisfied
+
+    @pytest.mark.asyncio
+    async def test_wait_n_of_m_with_relapse(self, state_tracker: StateTracker) -> None:
+        """Only entities currently meeting the condition count towards N of M."""
+        for entity_id in ("light.a", "light.b", "light.c"):
+            await self._push(state_tracker, entity_id, "unavailable")
+
+        waiter = asyncio.create_task(
+            state_tracker.wait_until_available(["light.a", "light.b", "light.c"], count=2)
+        )
+        await asyncio.sleep(0)
+        await self._push(state_tracker, "light.a", "on")
+        await self._push(state_tracker, "light.a", "unavailable")  # Relapsed
+        await self._push(state_tracker, "light.b", "on")
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await self._push(state_tracker, "light.c", "off")
+        result = await asyncio.wait_for(waiter, timeout=1)
+
+        assert result.satisfied
+        assert result.matched == ["light.b", "light.c"]
+        assert result.pending == ["light.a"]
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out(self, state_tracker: StateTracker) -> None:
+        """A deadline ends the wait with the unmet entities reported as pending."""
+        await self._push(state_tracker, "light.a", "unavailable")
+
+        result = await state_tracker.wait_for(
+            ["light.a", "light.untracked"], lambda s: s.state == "on", timeout=0.01
+        )
+
+        assert not result.satisfied
+        assert result.pending == ["light.a", "light.untracked"]
+        assert state_tracker._waiters == {}
+
+
+class TestTransitionHistory:
+    """Tests for the in-memory per-entity transition buffer."""
+
+    @staticmethod
+    async def _push(tracker: StateTracker, entity_id: str, state: str, at: datetime) -> None:
+        with patch.object(tracker, "_persist_entity", new_callable=AsyncMock):
+            await tracker.update_state(
+                {
+                    "entity_id": entity_id,
+                    "new_state": {"state": state, "last_updated": at.isoformat()},
+                }
+            )
+
+    @pytest.mark.asyncio
+    async def test_records_state_changes_in_range(self, mock_database: Database) -> None:
+        """Only actual state changes are recorded, with interned state strings."""
+        tracker = StateTracker("default", mock_database, history_size=8)
+        now = datetime.now(UTC)
+        await self._push(tracker, "light.kitchen", "off", now)  # First sighting
+        await self._push(tracker, "light.kitchen", "on", now + timedelta(seconds=1))
+        await self._push(tracker, "light.kitchen", "on", now + timedelta(seconds=2))
+        await self._push(tracker, "light.kitchen", "off", now + timedelta(seconds=3))
+
+        transitions = tracker.get_recent_transitions("light.kitchen", now)
+
+        assert transitions is not None
+        assert [t.state for t in transitions] == ["on", "off"]
+        assert transitions[0].state is sys.intern("on")
+        assert transitions[0].timestamp == now.replace(
+            microsecond=now.microsecond // 1000 * 1000
+        ) + timedelta(seconds=1)
+        window = tracker.get_recent_transitions("light.kitchen", now, now + timedelta(seconds=2))
+        assert window is not None and [t.state for t in window] == ["on"]
+
+    @pytest.mark.asyncio
+    async def test_ranges_before_coverage_fall_back(self, mock_database: Database) -> None:
+        """Ranges older than the buffer (or unknown entities) return None."""
+        tracker = StateTracker("default", mock_database, history_size=2)
+        start = datetime.now(UTC)
+        for i in range(5):
+            await self._push(tracker, "sensor.power", str(i), start + timedelta(seconds=i))
+
+        assert tracker.get_recent_transitions("sensor.power", start) is None
+        recent = tracker.get_recent_transitions("sensor.power", start + timedelta(seconds=3))
+        assert recent is not None and [t.state for t in recent] == ["3", "4"]
+        assert tracker.get_recent_transitions("sensor.unknown") is None
+
+        stats = tracker.get_history_stats()
+        assert stats["transitions"] == 2
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_history_dropped_with_entity(self, mock_database: Database) -> None:
+        """Removing an entity discards its buffered transitions."""
+        tracker = StateTracker("default", mock_database)
+        now = datetime.now(UTC)
+        await self._push(tracker, "switch.fan", "off", now)
+        await self._push(tracker, "switch.fan", "on", now + timedelta(seconds=1))
+
+        await tracker._remove_entity("switch.fan")
+
+        assert tracker.get_recent_transitions("switch.fan") is None
+        assert tracker.get_history_stats()["entities"] == 0
+
+
+class TestCachedAttributes:
+    """Tests for the cached attribute allowlist."""
+
+    @pytest.mark.asyncio
+    async def test_allowlist_restricts_cached_attributes(
+        self, mock_database: Database, sample_states: list[dict]
+    ) -> None:
+        """Only allowlisted attributes are kept on cached states."""
+        tracker = StateTracker(
+            "default", mock_database, cached_attributes=["friendly_name", "device_class"]
+        )
+        with patch.object(tracker, "_hydrate_database", new_callable=_mock_hydrate):
+            await tracker.initialize(sample_states)
+
+        door = await tracker.get_state("binary_sensor.door")
+        light = await tracker.get_state("light.bedroom")
+        assert door is not None and light is not None
+        assert dict(door.attributes) == {"friendly_name": "Front Door", "device_class": "door"}
+        assert dict(light.attributes) == {"friendly_name": "Bedroom Light"}
+
+    def test_allowlist_reads_peek_keys_without_parsing(self, mock_database: Database) -> None:
+        """Allowlisted peek keys are read without fully decoding lazy attributes."""
+        tracker = StateTracker("default", mock_database, cached_attributes=["friendly_name"])
+        loads = MagicMock(return_value={"friendly_name": "Kitchen", "brightness": 180})
+        attributes = LazyJSON(
+            b'{"friendly_name": "Kitchen", "brightness": 180}',
+            loads,
+            peek=lambda raw: {"friendly_name": "Kitchen"},
+            peek_keys=frozenset({"friendly_name"}),
+        )
+
+        assert tracker._retain_attributes(attributes) == {"friendly_name": "Kitchen"}
+        loads.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_default_keeps_all_attributes(self, mock_database: Database) -> None:
+        """Without an allowlist, cached states keep every attribute."""
+        tracker = StateTracker("default", mock_database)
+        with patch.object(tracker, "_persist_entity", new_callable=AsyncMock):
+            await tracker.update_state(
+                {
+                    "entity_id": "light.kitchen",
+                    "new_state": {
+                        "state": "on",
+                        "last_updated": "2024-01-01T12:00:00Z",
+                        "attributes": {"friendly_name": "Kitchen", "brightness": 180},
+                    },
+                }
+            )
+
+        state = await tracker.get_state("light.kitchen")
+        assert state is not None
+        assert dict(state.attributes) == {"friendly_name": "Kitchen", "brightness": 180}
+
+
+class TestSnapshotsAndIndexes:
+    """Tests for lock-free reads, versioned snapshots and secondary indexes."""
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_wait_for_writer(self, state_tracker: StateTracker) -> None:
+        """Readers are served while a writer holds the lock across DB I/O."""
+        with patch.object(state_tracker, "_hydrate_database", new_callable=_mock_hydrate):
+            await state_tracker.initialize(
+                [{"entity_id": "light.a", "state": "on", "last_updated": "2024-01-01T12:00:00Z"}]
+            )
+
+        async with state_tracker._lock:
+            state = await asyncio.wait_for(state_tracker.get_state("light.a"), timeout=1)
+            states = await asyncio.wait_for(state_tracker.get_all_states(), timeout=1)
+            lights = await asyncio.wait_for(
+                state_tracker.get_entities_by_domain("light"), timeout=1
+            )
+
+        assert state is not None and state.state == "on"
+        assert list(states) == ["light.a"]
+        assert [s.entity_id for s in lights] == ["light.a"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_immutable_and_versioned(
+        self, state_tracker: StateTracker, sample_states: list[dict]
+    ) -> None:
+        """Snapshots are shared until the cache changes and never change afterwards."""
+        with patch.object(state_tracker, "_hydrate_database", new_callable=_mock_hydrate):
+            await state_tracker.initialize(sample_states)
+
+        first = await state_tracker.get_all_states()
+        assert await state_tracker.get_all_states() is first
+        with pytest.raises(TypeError):
+            first["sensor.new"] = first["light.bedroom"]  # type: ignore[index]
+
+        version = state_tracker.version
+        await state_tracker._remove_entity("light.bedroom")
+
+        second = await state_tracker.get_all_states()
+        assert state_tracker.version > version
+        assert "light.bedroom" in first
+        assert "light.bedroom" not in second
+
+    @pytest.mark.asyncio
+    async def test_query_combines_indexes(self, mock_database: Database) -> None:
+        """Queries intersect domain, state and integration indexes as states change."""
+        integration_discovery = MagicMock()
+        integration_discovery.get_integration_for_entity.side_effect = lambda e: (
+            "zha_entry" if e.startswith("light.") else "hue_entry"
+        )
+        tracker = StateTracker(
+            "default", mock_database, integration_discovery=integration_discovery
+        )
+        with patch.object(tracker, "_hydrate_database", new_callable=_mock_hydrate):
+            await tracker.initialize(
+                [
+                    {"entity_id": "light.a", "state": "unavailable"},
+                    {"entity_id": "light.b", "state": "on"},
+                    {"entity_id": "switch.c", "state": "unavailable"},
+                ]
+            )
+
+        unavailable_zha = await tracker.query(state="unavailable", integration_id="zha_entry")
+        assert [s.entity_id for s in unavailable_zha] == ["light.a"]
+
+        with patch.object(tracker, "_persist_entity", new_callable=AsyncMock):
+            await tracker.update_state(
+                {
+                    "entity_id": "light.b",
+                    "new_state": {"state": "unavailable", "last_updated": "2024-01-01T12:00:00Z"},
+                }
+            )
+        await tracker._remove_entity("light.a")
+
+        unavailable_zha = await tracker.query(state="unavailable", integration_id="zha_entry")
+        assert [s.entity_id for s in unavailable_zha] == ["light.b"]
+        assert [s.entity_id for s in await tracker.query(domain="switch")] == ["switch.c"]
+        assert await tracker.query(state="on") == []
+        assert tracker._by_state == {"unavailable": {"light.b", "switch.c"}}
+
+    @pytest.mark.asyncio
+    async def test_query_by_device_uses_registry_cache(self, mock_database: Database) -> None:
+        """Device queries resolve members through the registry cache."""
+        registry_cache = MagicMock()
+        registry_cache.get_device_entities = AsyncMock(return_value={"light.a", "light.gone"})
+        tracker = StateTracker("default", mock_database, registry_cache=registry_cache)
+        with patch.object(tracker, "_hydrate_database", new_callable=_mock_hydrate):
+            await tracker.initialize(
+                [{"entity_id": "light.a", "state": "on"}, {"entity_id": "light.b", "state": "on"}]
+            )
+
+        result = await tracker.query(device_id="device_1", state="on")
+
+        assert [s.entity_id for s in result] == ["light.a"]
+        registry_cache.get_device_entities.assert_awaited_once_with("device_1")
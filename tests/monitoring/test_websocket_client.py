@@ -1,7 +1,7 @@
 """Tests for Home Assistant WebSocket client."""
 
 import json
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -364,3 +364,63 @@ async def test_callback_error_handling(ws_client):
 
     # Should not raise, just log
     await ws_client._handle_message(event_message)
+
+
+@pytest.mark.asyncio
+async def test_registry_events_update_registry_cache(ws_client):
+    """Registry update events are forwarded to the registry cache."""
+    ws_client.registry_cache = MagicMock()
+
+    for event_type in ("entity_registry_updated", "device_registry_updated"):
+        await ws_client._handle_message(
+            {
+                "type": "event",
+                "event": {"event_type": event_type, "data": {"action": "remove"}},
+            }
+        )
+
+    ws_client.registry_cache.handle_entity_registry_updated.assert_called_once_with(
+        {"action": "remove"}
+    )
+    ws_client.registry_cache.handle_device_registry_updated.assert_called_once_with(
+        {"action": "remove"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_reconnect_invalidates_registry_cache(ws_client):
+    """Registry events missed while disconnected force a registry reload."""
+    ws_client._running = True
+    ws_client.registry_cache = MagicMock()
+    ws_client.connect = AsyncMock()
+    ws_client.subscribe_events = AsyncMock()
+
+    with patch("asyncio.sleep"), patch("asyncio.create_task"):
+        await ws_client._reconnect()
+
+    subscribed = [call.args[0] for call in ws_client.subscribe_events.call_args_list if call.args]
+    assert {"entity_registry_updated", "device_registry_updated"} <= set(subscribed)
+    ws_client.registry_cache.invalidate.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_dropped_registry_event_invalidates_registry_cache(mock_config):
+    """A registry event dropped by a full queue forces a registry reload."""
+    mock_config.websocket.event_queue_size = 10
+    instance = mock_config.home_assistant.get_default_instance()
+    registry_cache = MagicMock()
+    ws_client = WebSocketClient(instance, mock_config, registry_cache=registry_cache)
+
+    for entity_id in (f"light.l{i}" for i in range(11)):
+        ws_client._dispatch_message(
+            {
+                "type": "event",
+                "event": {
+                    "event_type": "entity_registry_updated",
+                    "data": {"action": "create", "entity_id": entity_id},
+                },
+            }
+        )
+
+    registry_cache.invalidate.assert_called_once()
+    assert ws_client.get_pipeline_stats()["entity_registry_updated"]["dropped"] == 1
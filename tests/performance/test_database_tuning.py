@@ -0,0 +1,164 @@
+"""Performance benchmarks for the SQLite tuning profile.
+
+Each setting of DatabaseTuningConfig is measured by toggling it on top of a
+plain SQLite baseline (rollback journal, synchronous=FULL, no mmap, default
+cache) and timing small committed writes, which is the write pattern of the
+state tracker and healing components.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+
+from ha_boss.core.config import DatabaseTuningConfig
+from ha_boss.core.database import Database, HealthEvent, StateHistory
+
+WRITE_COUNT = 300
+ROUNDS = 3
+
+BASELINE = DatabaseTuningConfig(
+    wal_enabled=False,
+    synchronous="FULL",
+    busy_timeout_ms=5000,
+    mmap_size_mb=0,
+    cache_size_kb=2000,
+    temp_store="DEFAULT",
+    read_only_engine_enabled=False,
+)
+
+# Settings measured one at a time on top of the baseline
+SINGLE_SETTINGS: dict[str, dict[str, object]] = {
+    "wal": {"wal_enabled": True},
+    "synchronous_normal": {"synchronous": "NORMAL"},
+    "mmap": {"mmap_size_mb": 64},
+    "cache_size": {"cache_size_kb": 16384},
+    "temp_store_memory": {"temp_store": "MEMORY"},
+}
+
+
+async def _open(tmp_path: Path, name: str, tuning: DatabaseTuningConfig) -> Database:
+    db = Database(tmp_path / f"{name}.db", tuning=tuning)
+    await db.init_db()
+    return db
+
+
+async def _timed_writes(db: Database, count: int = WRITE_COUNT) -> float:
+    """Commit `count` single-row transactions and return elapsed seconds."""
+    start = time.perf_counter()
+    for i in range(count):
+        async with db.async_session() as session:
+            session.add(
+                StateHistory(
+                    entity_id=f"sensor.bench_{i % 50}",
+                    old_state=str(i),
+                    new_state=str(i + 1),
+                )
+            )
+            await session.commit()
+    return time.perf_counter() - start
+
+
+async def _compare(baseline_db: Database, tuned_db: Database) -> tuple[float, float]:
+    """Time both databases in interleaved rounds after a warm-up to reduce drift."""
+    await _timed_writes(baseline_db, 20)
+    await _timed_writes(tuned_db, 20)
+
+    baseline_seconds = tuned_seconds = 0.0
+    for _ in range(ROUNDS):
+        baseline_seconds += await _timed_writes(baseline_db, WRITE_COUNT // ROUNDS)
+        tuned_seconds += await _timed_writes(tuned_db, WRITE_COUNT // ROUNDS)
+    return baseline_seconds, tuned_seconds
+
+
+@pytest.fixture
+async def tuned_database(tmp_path: Path) -> AsyncGenerator[Database, None]:
+    """Database with the default tuning profile."""
+    db = await _open(tmp_path, "tuned", DatabaseTuningConfig())
+    yield db
+    await db.close()
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+@pytest.mark.parametrize("setting", list(SINGLE_SETTINGS))
+async def test_single_setting_write_throughput(tmp_path: Path, setting: str) -> None:
+    """Measure the write cost of each tuning setting against the baseline.
+
+    Acceptance: No individual setting makes small commits more than 2x slower
+    (these settings mainly pay off on real disks and under read contention).
+    """
+    baseline_db = await _open(tmp_path, "baseline", BASELINE)
+    tuned_db = await _open(tmp_path, setting, BASELINE.model_copy(update=SINGLE_SETTINGS[setting]))
+    try:
+        baseline_seconds, tuned_seconds = await _compare(baseline_db, tuned_db)
+    finally:
+        await baseline_db.close()
+        await tuned_db.close()
+
+    print(
+        f"\n{setting}: baseline {WRITE_COUNT / baseline_seconds:.0f} commits/s, "
+        f"tuned {WRITE_COUNT / tuned_seconds:.0f} commits/s "
+        f"({baseline_seconds / tuned_seconds:.2f}x)"
+    )
+
+    assert tuned_seconds < baseline_seconds * 2
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_full_profile_write_throughput(tmp_path: Path) -> None:
+    """Measure the complete default profile against the baseline.
+
+    Acceptance: The default profile is at least as fast as the baseline.
+    """
+    baseline_db = await _open(tmp_path, "baseline", BASELINE)
+    tuned_db = await _open(tmp_path, "tuned", DatabaseTuningConfig())
+    try:
+        baseline_seconds, tuned_seconds = await _compare(baseline_db, tuned_db)
+    finally:
+        await baseline_db.close()
+        await tuned_db.close()
+
+    print(
+        f"\nfull profile: baseline {WRITE_COUNT / baseline_seconds:.0f} commits/s, "
+        f"tuned {WRITE_COUNT / tuned_seconds:.0f} commits/s "
+        f"({baseline_seconds / tuned_seconds:.2f}x)"
+    )
+
+    assert tuned_seconds <= baseline_seconds * 1.1
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_reads_not_blocked_by_open_write_transaction(tuned_database: Database) -> None:
+    """Read-only engine queries succeed while a write transaction is open.
+
+    Acceptance: Dashboard reads complete in < 100ms while the writer holds its lock.
+    """
+    async with tuned_database.async_session() as session:
+        session.add(HealthEvent(entity_id="sensor.committed", event_type="unavailable"))
+        await session.commit()
+
+    async with tuned_database.async_session() as writer:
+        writer.add(HealthEvent(entity_id="sensor.pending", event_type="unavailable"))
+        await writer.flush()  # Holds the write lock until commit
+
+        latencies = []
+        for _ in range(20):
+            start = time.perf_counter()
+            async with tuned_database.read_session() as reader:
+                count = await reader.scalar(select(func.count()).select_from(HealthEvent))
+            latencies.append(time.perf_counter() - start)
+            # Readers see the last committed snapshot only
+            assert count == 1
+            await asyncio.sleep(0)
+
+        await writer.commit()
+
+    worst_ms = max(latencies) * 1000
+    print(f"\nread latency during open write: worst {worst_ms:.1f}ms")
+    assert worst_ms < 100
@@ -0,0 +1,184 @@
+"""Memory benchmarks for the cached entity state representation.
+
+Builds state caches the way StateTracker does (hydration from a snapshot, then
+a round of updates) and measures the memory they retain per entity with
+tracemalloc. The compact EntityState, with full attributes and with the
+``monitoring.cached_attributes`` allowlist, is compared against the previous
+representation: a plain class with a per-instance ``__dict__``, a tz-aware
+datetime and the full attributes dict.
+"""
+
+import gc
+import json
+import random
+import tracemalloc
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from ha_boss.monitoring.state_tracker import EntityState, StateTracker
+
+ENTITY_COUNTS = [10_000, 100_000]
+ALLOWLIST = ("friendly_name", "device_class")
+
+_STATES = {
+    "sensor": [str(v / 10) for v in range(150, 300)],
+    "binary_sensor": ["on", "off"],
+    "light": ["on", "off", "unavailable"],
+    "climate": ["heat", "cool", "off"],
+}
+
+_ATTRIBUTES: dict[str, dict[str, Any]] = {
+    "sensor": {
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+        "device_class": "temperature",
+    },
+    "binary_sensor": {"device_class": "motion"},
+    "light": {
+        "min_color_temp_kelvin": 2000,
+        "max_color_temp_kelvin": 6535,
+        "supported_color_modes": ["color_temp", "xy"],
+        "color_mode": "xy",
+        "brightness": 180,
+        "hs_color": [30.0, 62.7],
+        "xy_color": [0.523, 0.388],
+        "effect_list": ["blink", "breathe", "okay", "channel_change", "finish_effect"],
+        "supported_features": 44,
+    },
+    "climate": {
+        "hvac_modes": ["off", "heat", "cool", "auto"],
+        "min_temp": 7,
+        "max_temp": 35,
+        "fan_modes": ["auto", "low", "high"],
+        "current_temperature": 21.5,
+        "temperature": 22,
+        "hvac_action": "heating",
+        "supported_features": 411,
+    },
+}
+_DOMAINS = list(_STATES)
+
+
+class _DictEntityState:
+    """The previous EntityState layout, kept here as the baseline."""
+
+    def __init__(
+        self,
+        entity_id: str,
+        state: str,
+        last_updated: datetime,
+        attributes: Mapping[str, Any] | None = None,
+        context_id: str | None = None,
+    ) -> None:
+        self.entity_id = entity_id
+        self.state = state
+        self.last_updated = last_updated
+        self.attributes = attributes if attributes is not None else {}
+        self.context_id = context_id
+
+
+def _snapshot(count: int, seed: int, tag: str) -> list[dict[str, Any]]:
+    """Build a REST-style state snapshot.
+
+    Round-tripped through JSON so every payload owns its strings, lists and
+    dicts, as decoded Home Assistant messages do.
+    """
+    rng = random.Random(seed)
+    base = datetime(2024, 3, 1, tzinfo=UTC)
+    states = []
+    for i in range(count):
+        domain = _DOMAINS[i % len(_DOMAINS)]
+        states.append(
+            {
+                "entity_id": f"{domain}.{tag}_{i}",
+                "state": rng.choice(_STATES[domain]),
+                "last_updated": (base + timedelta(seconds=rng.randrange(86400))).isoformat(),
+                "attributes": {**_ATTRIBUTES[domain], "friendly_name": f"Entity {i}"},
+                "context": {"id": f"01HQ{rng.getrandbits(64):016X}"},
+            }
+        )
+    return json.loads(json.dumps(states))
+
+
+def _measure(count: int, tag: str, build: Callable[[dict[str, Any]], Any]) -> float:
+    """Return bytes per entity retained by a cache after hydration and one update round.
+
+    Snapshots are released before measuring, so everything the states keep
+    alive (strings, timestamps, attributes) is counted. Each representation
+    uses its own entity ids so interned strings are not shared between runs.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        cache = {data["entity_id"]: build(data) for data in _snapshot(count, 1, tag)}
+        for data in _snapshot(count, 2, tag):
+            cache[data["entity_id"]] = build(data)
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(cache) == count
+    return (after - before) / count
+
+
+def _legacy(data: dict[str, Any]) -> _DictEntityState:
+    return _DictEntityState(
+        entity_id=data["entity_id"],
+        state=data["state"],
+        last_updated=datetime.fromisoformat(data["last_updated"]),
+        attributes=data["attributes"],
+        context_id=data["context"]["id"],
+    )
+
+
+def _compact(data: dict[str, Any]) -> EntityState:
+    return EntityState(
+        entity_id=data["entity_id"],
+        state=data["state"],
+        last_updated=datetime.fromisoformat(data["last_updated"]),
+        attributes=data["attributes"],
+        context_id=data["context"]["id"],
+    )
+
+
+def _compact_allowlisted(tracker: StateTracker) -> Callable[[dict[str, Any]], EntityState]:
+    def build(data: dict[str, Any]) -> EntityState:
+        return EntityState(
+            entity_id=data["entity_id"],
+            state=data["state"],
+            last_updated=datetime.fromisoformat(data["last_updated"]),
+            attributes=tracker._retain_attributes(data["attributes"]),
+            context_id=data["context"]["id"],
+        )
+
+    return build
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("count", ENTITY_COUNTS)
+def test_entity_state_footprint(count: int) -> None:
+    """Compare per-entity cache footprint of each representation.
+
+    Acceptance: The compact state is smaller than the baseline even with full
+    attributes, and at least 40% smaller with the attribute allowlist.
+    """
+    tracker = StateTracker("benchmark", MagicMock(), cached_attributes=ALLOWLIST)
+
+    legacy = _measure(count, f"legacy{count}", _legacy)
+    compact = _measure(count, f"compact{count}", _compact)
+    allowlisted = _measure(count, f"allowlisted{count}", _compact_allowlisted(tracker))
+
+    print(
+        f"\n{count:,} entities: dict-backed {legacy:.0f} B/entity, "
+        f"compact {compact:.0f} B/entity ({compact / legacy:.0%}), "
+        f"compact + allowlisted attributes {allowlisted:.0f} B/entity "
+        f"({allowlisted / legacy:.0%})"
+    )
+
+    assert compact < legacy
+    assert allowlisted < legacy * 0.6
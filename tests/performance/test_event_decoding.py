@@ -0,0 +1,190 @@
+"""Performance benchmarks for WebSocket frame decoding.
+
+Decodes a recorded-style stream of Home Assistant WebSocket frames (sensor,
+light, climate and media player state_changed events with realistic attribute
+payloads, interleaved with automation and service call events) with every
+installed backend and runs the fields the state tracker needs through each
+message, as the client does per frame.
+"""
+
+import importlib.util
+import json
+import random
+import time
+from typing import Any
+
+import pytest
+
+from ha_boss.monitoring.event_decoder import EventDecoder
+
+FRAME_COUNT = 5000
+ROUNDS = 3
+
+AVAILABLE_BACKENDS = ["json"] + [
+    name for name in ("msgspec", "orjson") if importlib.util.find_spec(name) is not None
+]
+
+_ATTRIBUTE_TEMPLATES: dict[str, dict[str, Any]] = {
+    "sensor": {
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+        "device_class": "temperature",
+        "friendly_name": "Living Room Temperature",
+    },
+    "light": {
+        "min_color_temp_kelvin": 2000,
+        "max_color_temp_kelvin": 6535,
+        "supported_color_modes": ["color_temp", "xy"],
+        "color_mode": "xy",
+        "brightness": 180,
+        "hs_color": [30.0, 62.7],
+        "rgb_color": [255, 170, 95],
+        "xy_color": [0.523, 0.388],
+        "effect_list": ["blink", "breathe", "okay", "channel_change", "finish_effect"],
+        "friendly_name": "Kitchen Ceiling",
+        "supported_features": 44,
+    },
+    "climate": {
+        "hvac_modes": ["off", "heat", "cool", "auto", "dry", "fan_only"],
+        "min_temp": 7,
+        "max_temp": 35,
+        "target_temp_step": 0.5,
+        "fan_modes": ["auto", "low", "medium", "high"],
+        "preset_modes": ["none", "eco", "away", "boost", "comfort", "home", "sleep"],
+        "current_temperature": 21.5,
+        "temperature": 22,
+        "current_humidity": 45,
+        "fan_mode": "auto",
+        "hvac_action": "heating",
+        "preset_mode": "comfort",
+        "friendly_name": "Hallway Thermostat",
+        "supported_features": 411,
+    },
+    "media_player": {
+        "source_list": [f"Input {i}" for i in range(12)],
+        "volume_level": 0.35,
+        "is_volume_muted": False,
+        "media_content_type": "music",
+        "media_title": "Track title",
+        "media_artist": "Artist",
+        "media_album_name": "Album",
+        "entity_picture": "/api/media_player_proxy/media_player.living?token=abc&cache=123",
+        "friendly_name": "Living Room Speaker",
+        "supported_features": 152511,
+    },
+}
+
+
+def _state(entity_id: str, domain: str, value: str, ts: str, rng: random.Random) -> dict:
+    attributes = dict(_ATTRIBUTE_TEMPLATES[domain])
+    attributes["last_reading"] = rng.random()
+    return {
+        "entity_id": entity_id,
+        "state": value,
+        "attributes": attributes,
+        "last_changed": ts,
+        "last_reported": ts,
+        "last_updated": ts,
+        "context": {"id": f"01HQ{rng.getrandbits(64):016X}", "parent_id": None, "user_id": None},
+    }
+
+
+def _recorded_stream(count: int = FRAME_COUNT, seed: int = 42) -> list[str]:
+    """Build a deterministic frame stream shaped like a recorded HA session."""
+    rng = random.Random(seed)
+    frames = []
+    domains = list(_ATTRIBUTE_TEMPLATES)
+    for i in range(count):
+        ts = f"2024-03-01T12:{(i // 60) % 60:02d}:{i % 60:02d}.{i % 1000:03d}+00:00"
+        roll = rng.random()
+        if roll < 0.9:
+            domain = rng.choice(domains)
+            entity_id = f"{domain}.entity_{rng.randrange(200)}"
+            event = {
+                "event_type": "state_changed",
+                "data": {
+                    "entity_id": entity_id,
+                    "old_state": _state(entity_id, domain, str(i - 1), ts, rng),
+                    "new_state": _state(entity_id, domain, str(i), ts, rng),
+                },
+            }
+        elif roll < 0.95:
+            event = {
+                "event_type": "automation_triggered",
+                "data": {
+                    "name": "Motion lights",
+                    "entity_id": "automation.motion_lights",
+                    "source": "state of binary_sensor.motion",
+                },
+            }
+        else:
+            event = {
+                "event_type": "call_service",
+                "data": {
+                    "domain": "light",
+                    "service": "turn_on",
+                    "service_data": {"entity_id": "light.kitchen", "brightness": 200},
+                },
+            }
+        event.update({"origin": "LOCAL", "time_fired": ts, "context": {"id": str(i)}})
+        frames.append(json.dumps({"id": 1, "type": "event", "event": event}))
+    return frames
+
+
+def _consume(decoder: EventDecoder, frames: list[str]) -> float:
+    """Decode every frame and read the fields StateTracker.update_state uses."""
+    start = time.perf_counter()
+    for frame in frames:
+        message = decoder.decode(frame)
+        event = message["event"]
+        if event["event_type"] == "state_changed":
+            new_state = event["data"]["new_state"]
+            _ = (new_state["state"], new_state["last_updated"], new_state["context"]["id"])
+            _ = new_state["attributes"].get("friendly_name")
+    return time.perf_counter() - start
+
+
+@pytest.mark.performance
+def test_decoder_throughput_on_recorded_stream() -> None:
+    """Compare frame decode throughput of all installed backends.
+
+    Acceptance: Each fast backend (when installed) is at least 1.3x faster than
+    the standard library.
+    """
+    frames = _recorded_stream()
+    timings: dict[str, float] = {}
+
+    for backend in AVAILABLE_BACKENDS:
+        decoder = EventDecoder(backend)  # type: ignore[arg-type]
+        _consume(decoder, frames[:200])  # Warm-up
+        timings[backend] = min(_consume(decoder, frames) for _ in range(ROUNDS))
+
+    baseline = timings["json"]
+    for backend, seconds in timings.items():
+        print(
+            f"\n{backend}: {FRAME_COUNT / seconds:,.0f} frames/s "
+            f"({baseline / seconds:.2f}x vs json)"
+        )
+
+    for backend in ("msgspec", "orjson"):
+        if backend in timings:
+            assert timings[backend] * 1.3 < baseline
+
+
+@pytest.mark.performance
+def test_lazy_attributes_skip_unread_payloads() -> None:
+    """Attributes that are never read are never parsed (msgspec backend)."""
+    pytest.importorskip("msgspec")
+    decoder = EventDecoder("msgspec")
+
+    messages = [decoder.decode(frame) for frame in _recorded_stream(500)]
+    states = [
+        m["event"]["data"]["new_state"]
+        for m in messages
+        if m["event"]["event_type"] == "state_changed"
+    ]
+    for state in states:
+        state["attributes"].get("friendly_name")
+
+    assert states
+    assert not any(state["attributes"].is_loaded for state in states)
@@ -0,0 +1,111 @@
+"""Performance benchmark for batched outcome validation history queries.
+
+Validates bursts of concurrent automation executions, each with several
+entities, against a simulated Home Assistant history endpoint with a fixed
+per-request latency and a limited number of concurrent requests. Compares one
+history request per entity (the previous behaviour) with ``HistoryBatcher``.
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from ha_boss.automation.history_batcher import HistoryBatcher
+
+EXECUTIONS = 200
+ENTITIES_PER_EXECUTION = 5
+REQUEST_LATENCY = 0.005
+MAX_CONCURRENT_REQUESTS = 4
+
+
+class _SimulatedHistoryAPI:
+    """History endpoint with fixed latency and bounded concurrency."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self._slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def get_history(
+        self,
+        filter_entity_id: str | list[str] | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        minimal_response: bool = False,
+        no_attributes: bool = False,
+    ) -> list[list[dict[str, Any]]]:
+        entity_ids = (
+            [filter_entity_id] if isinstance(filter_entity_id, str) else filter_entity_id or []
+        )
+        async with self._slots:
+            self.requests += 1
+            await asyncio.sleep(REQUEST_LATENCY)
+        assert start_time is not None
+        changed = (start_time + timedelta(seconds=1)).isoformat()
+        return [
+            [{"entity_id": entity_id, "state": "on", "last_changed": changed}]
+            for entity_id in entity_ids
+        ]
+
+
+def _executions() -> list[tuple[list[str], datetime]]:
+    start = datetime.now(UTC)
+    return [
+        (
+            [f"light.room_{(i + j) % 50}" for j in range(ENTITIES_PER_EXECUTION)],
+            start + timedelta(milliseconds=10 * i),
+        )
+        for i in range(EXECUTIONS)
+    ]
+
+
+async def _per_entity(api: _SimulatedHistoryAPI) -> float:
+    async def validate(entity_ids: list[str], start: datetime) -> None:
+        for entity_id in entity_ids:
+            await api.get_history(
+                filter_entity_id=entity_id, start_time=start, end_time=start + timedelta(seconds=5)
+            )
+
+    began = time.perf_counter()
+    await asyncio.gather(*(validate(ids, start) for ids, start in _executions()))
+    return time.perf_counter() - began
+
+
+async def _batched(api: _SimulatedHistoryAPI) -> float:
+    batcher = HistoryBatcher(api, window_seconds=0.01)  # type: ignore[arg-type]
+
+    async def validate(entity_ids: list[str], start: datetime) -> None:
+        history = await batcher.fetch(
+            entity_ids, start, start + timedelta(seconds=5), attributes=False
+        )
+        assert set(history) == set(entity_ids)
+
+    began = time.perf_counter()
+    await asyncio.gather(*(validate(ids, start) for ids, start in _executions()))
+    return time.perf_counter() - began
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_batched_validation_throughput():
+    """Batched history queries validate executions >= 5x faster."""
+    per_entity_api = _SimulatedHistoryAPI()
+    per_entity_seconds = await _per_entity(per_entity_api)
+
+    batched_api = _SimulatedHistoryAPI()
+    batched_seconds = await _batched(batched_api)
+
+    per_entity_rate = EXECUTIONS / per_entity_seconds
+    batched_rate = EXECUTIONS / batched_seconds
+    print(
+        f"\nPer-entity: {per_entity_rate:.0f} validations/s "
+        f"({per_entity_api.requests} history requests)"
+        f"\nBatched:    {batched_rate:.0f} validations/s "
+        f"({batched_api.requests} history requests)"
+    )
+
+    assert per_entity_api.requests == EXECUTIONS * ENTITIES_PER_EXECUTION
+    assert batched_api.requests < EXECUTIONS / 10
+    assert batched_rate >= 5 * per_entity_rate
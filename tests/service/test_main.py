@@ -7,11 +7,12 @@ Tests verify multi-instance service architecture with:
 """
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from ha_boss.core.config import Config
+from ha_boss.core.exceptions import CircuitBreakerOpenError
 from ha_boss.core.types import HealthIssue
 from ha_boss.monitoring.state_tracker import EntityState
 from ha_boss.service.main import HABossService, ServiceState
@@ -82,7 +83,7 @@ class TestHABossServiceStart:
         # Mock all component initializations
         with (
             patch("ha_boss.service.main.Database") as mock_db_class,
-            patch("ha_boss.core.ha_client.HomeAssistantClient") as mock_ha_client_class,
+            patch("ha_boss.service.main.HomeAssistantClient") as mock_ha_client_class,
             patch("ha_boss.service.main.IntegrationDiscovery") as mock_integration_discovery,
             patch(
                 "ha_boss.discovery.entity_discovery.EntityDiscoveryService"
@@ -167,7 +168,8 @@ class TestHABossServiceStart:
             mock_db.init_db.assert_called_once()
             # get_states is called 3 times: connection test, initial snapshot, entity discovery
             assert mock_client.get_states.call_count == 3
-            # Note: StateTracker.initialize() is no longer called in multi-instance architecture
+            # Initial snapshot is bulk-hydrated via StateTracker.initialize()
+            mock_tracker.initialize.assert_called_once()
             mock_monitor.start.assert_called_once()
             # WebSocket now uses start() instead of connect() for initialization
             mock_ws.start.assert_called_once()
@@ -181,7 +183,7 @@ class TestHABossServiceStart:
         """Test that start() handles connection errors gracefully."""
         with (
             patch("ha_boss.service.main.Database") as mock_db_class,
-            patch("ha_boss.core.ha_client.HomeAssistantClient") as mock_ha_client_class,
+            patch("ha_boss.service.main.HomeAssistantClient") as mock_ha_client_class,
         ):
             mock_db = AsyncMock()
             mock_db.init_db = AsyncMock()
@@ -244,6 +246,21 @@ class TestHABossServiceStop:
         mock_health_monitor.stop.assert_called_once()
         mock_websocket.stop.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_stop_drains_persistence_queue(self, service: HABossService) -> None:
+        """Test that stop() drains the write-behind queue before closing the database."""
+        service.state = ServiceState.RUNNING
+        calls: list[str] = []
+
+        service.database = AsyncMock()
+        service.database.close = AsyncMock(side_effect=lambda: calls.append("db_close"))
+        service.persistence_queue = AsyncMock()
+        service.persistence_queue.stop = AsyncMock(side_effect=lambda: calls.append("drain"))
+
+        await service.stop()
+
+        assert calls == ["drain", "db_close"]
+
     @pytest.mark.asyncio
     async def test_stop_when_not_running(self, service: HABossService) -> None:
         """Test that stop() when not running does nothing."""
@@ -280,6 +297,32 @@ class TestHABossServiceCallbacks:
         # Verify health check was called
         mock_health_monitor.check_entity_now.assert_called_once_with("sensor.test")
 
+    @pytest.mark.asyncio
+    async def test_on_state_updated_skips_broadcast_without_subscribers(
+        self, service: HABossService
+    ) -> None:
+        """No payload is built or rate-limited when no dashboard is connected."""
+        ws_manager = MagicMock()
+        ws_manager.get_instance_connection_count.return_value = 0
+        ws_manager.broadcast_entity_state = AsyncMock()
+        new_state = EntityState(entity_id="sensor.test", state="on", last_updated=datetime.now(UTC))
+
+        with (
+            patch("ha_boss.api.websocket_manager.get_websocket_manager", return_value=ws_manager),
+            patch.object(service, "_get_broadcast_limiter") as get_limiter,
+        ):
+            await service._on_state_updated("default", new_state, None)
+
+        get_limiter.return_value.admit.assert_not_called()
+        ws_manager.broadcast_entity_state.assert_not_called()
+
+        ws_manager.get_instance_connection_count.return_value = 1
+        with patch("ha_boss.api.websocket_manager.get_websocket_manager", return_value=ws_manager):
+            await service._on_state_updated("default", new_state, None)
+
+        state = ws_manager.broadcast_entity_state.call_args.kwargs["state"]
+        assert state["attributes"] is new_state.attributes
+
     @pytest.mark.asyncio
     async def test_on_health_issue_triggers_healing(self, service: HABossService) -> None:
         """Test that health issues trigger healing."""
@@ -342,6 +385,82 @@ class TestHABossServiceCallbacks:
         assert service.healings_succeeded["default"] == 0
         assert service.healings_failed["default"] == 1
 
+    @pytest.mark.asyncio
+    async def test_on_health_issue_queues_coalesced_heal(self, service: HABossService) -> None:
+        """Test that issues are handed to the heal coalescer when one is configured."""
+        service.config.healing.enabled = True
+        service.healings_attempted["default"] = 0
+        service.healing_managers["default"] = AsyncMock()
+        mock_coalescer = MagicMock()
+        service.heal_coalescers["default"] = mock_coalescer
+
+        issue = HealthIssue(
+            entity_id="sensor.test",
+            issue_type="unavailable",
+            detected_at=datetime.now(UTC),
+        )
+
+        await service._on_health_issue("default", issue)
+
+        mock_coalescer.submit.assert_called_once_with(issue)
+        service.healing_managers["default"].heal.assert_not_called()
+        assert service.healings_attempted["default"] == 1
+
+    @pytest.mark.asyncio
+    async def test_on_heal_outcome_fans_out_to_group(self, service: HABossService) -> None:
+        """Test that a coalesced heal outcome is reported for every entity."""
+        service.healings_succeeded["default"] = 0
+        service.healings_failed["default"] = 0
+        mock_escalation = AsyncMock()
+        service.escalation_managers["default"] = mock_escalation
+
+        issues = [
+            HealthIssue(
+                entity_id=f"light.zigbee_{i}",
+                issue_type="unavailable",
+                detected_at=datetime.now(UTC),
+            )
+            for i in range(3)
+        ]
+
+        # Third entity was suppressed, so the reload did not cover it
+        await service._on_heal_outcome("default", issues, issues[:2], None)
+
+        assert service.healings_succeeded["default"] == 2
+        assert service.healings_failed["default"] == 1
+        mock_escalation.notify_healing_failure.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_on_heal_outcome_escalates_circuit_breaker_once(
+        self, service: HABossService
+    ) -> None:
+        """Test that an open circuit breaker is escalated once per group."""
+        mock_escalation = AsyncMock()
+        service.escalation_managers["default"] = mock_escalation
+        mock_discovery = MagicMock()
+        mock_discovery.get_integration_for_entity.return_value = "zha_entry"
+        mock_discovery.get_integration_details.return_value = {"title": "Zigbee"}
+        service.integration_discoveries["default"] = mock_discovery
+
+        issues = [
+            HealthIssue(
+                entity_id=f"light.zigbee_{i}",
+                issue_type="unavailable",
+                detected_at=datetime.now(UTC),
+            )
+            for i in range(5)
+        ]
+
+        await service._on_heal_outcome(
+            "default", issues, [], CircuitBreakerOpenError("Circuit breaker is open for Zigbee")
+        )
+
+        mock_escalation.notify_circuit_breaker_open.assert_called_once()
+        assert (
+            mock_escalation.notify_circuit_breaker_open.call_args.kwargs["integration_name"]
+            == "Zigbee"
+        )
+
     @pytest.mark.asyncio
     async def test_on_health_issue_skips_recovery_events(self, service: HABossService) -> None:
         """Test that recovery events don't trigger healing."""
@@ -0,0 +1,216 @@
+"""Tests for concurrent multi-instance startup and readiness tracking."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ha_boss.core.config import Config
+from ha_boss.service.main import HABossService, ServiceState
+from ha_boss.service.startup import InstanceReadiness, InstanceStartup
+
+
+@pytest.fixture
+def multi_config() -> Config:
+    """Configuration with three instances and a startup fan-out of two."""
+    return Config(
+        home_assistant={
+            "instances": [
+                {"instance_id": name, "url": f"http://{name}:8123", "token": "token"}
+                for name in ("home", "cabin", "office")
+            ],
+            "startup_concurrency": 2,
+        },
+        database={"path": ":memory:"},
+        api={"enabled": False},
+        mode="testing",
+    )
+
+
+@pytest.fixture
+def mock_database():
+    """Patch the service database with a valid, initialized mock."""
+    with patch("ha_boss.service.main.Database") as mock_db_class:
+        mock_db = AsyncMock()
+        mock_db.validate_version = AsyncMock(return_value=(True, "current"))
+        mock_db_class.return_value = mock_db
+        yield mock_db
+
+
+def test_phase_timings_recorded_in_order() -> None:
+    """Each phase records its duration when the next one begins."""
+    startup = InstanceStartup("home")
+
+    startup.begin_phase(InstanceReadiness.CONNECTING)
+    startup.begin_phase(InstanceReadiness.HYDRATING)
+    startup.mark_ready()
+
+    assert startup.is_ready
+    assert list(startup.phase_durations_ms) == ["connecting", "hydrating"]
+    assert startup.total_ms >= 0
+    assert startup.to_dict()["ready_at"] is not None
+
+
+def test_failure_records_failed_phase() -> None:
+    """The error message names the phase that failed."""
+    startup = InstanceStartup("home")
+    startup.begin_phase(InstanceReadiness.SUBSCRIBING)
+
+    startup.mark_failed(ConnectionError("refused"))
+
+    assert startup.state == InstanceReadiness.FAILED
+    assert startup.error == "subscribing: refused"
+    assert "subscribing" in startup.phase_durations_ms
+
+
+@pytest.mark.asyncio
+async def test_instances_initialize_concurrently_with_bound(
+    multi_config: Config, mock_database: AsyncMock
+) -> None:
+    """Instances start in parallel, limited by startup_concurrency."""
+    service = HABossService(multi_config)
+    active = 0
+    peak = 0
+
+    async def fake_initialize(instance_id: str, **kwargs: object) -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        service.instance_startup[instance_id].begin_phase(InstanceReadiness.CONNECTING)
+        await asyncio.sleep(0.02)
+        active -= 1
+
+    with (
+        patch.object(service, "_initialize_instance", side_effect=fake_initialize),
+        patch.object(service, "_start_instance_tasks") as start_tasks,
+    ):
+        await service.start()
+
+    assert service.state == ServiceState.RUNNING
+    assert peak == 2
+    assert start_tasks.call_count == 3
+    assert all(startup.is_ready for startup in service.instance_startup.values())
+    assert service.get_status()["instances"] == {}  # No real clients were created
+
+
+@pytest.mark.asyncio
+async def test_fast_instance_monitors_before_slow_instance_ready(
+    multi_config: Config, mock_database: AsyncMock
+) -> None:
+    """An instance that finishes early starts its tasks without waiting for others."""
+    service = HABossService(multi_config)
+    events: list[str] = []
+    delays = {"home": 0.0, "cabin": 0.05, "office": 0.0}
+
+    async def fake_initialize(instance_id: str, **kwargs: object) -> None:
+        await asyncio.sleep(delays[instance_id])
+        events.append(f"initialized:{instance_id}")
+
+    with (
+        patch.object(service, "_initialize_instance", side_effect=fake_initialize),
+        patch.object(
+            service,
+            "_start_instance_tasks",
+            side_effect=lambda instance_id: events.append(f"tasks:{instance_id}"),
+        ),
+    ):
+        await service.start()
+
+    assert events.index("tasks:home") < events.index("initialized:cabin")
+
+
+@pytest.mark.asyncio
+async def test_failed_instance_does_not_block_others(
+    multi_config: Config, mock_database: AsyncMock
+) -> None:
+    """A failing instance is marked failed and cleaned up; the rest keep running."""
+    service = HABossService(multi_config)
+
+    async def fake_initialize(instance_id: str, **kwargs: object) -> None:
+        service.instance_startup[instance_id].begin_phase(InstanceReadiness.CONNECTING)
+        if instance_id == "cabin":
+            raise ConnectionError("host unreachable")
+
+    with (
+        patch.object(service, "_initialize_instance", side_effect=fake_initialize),
+        patch.object(service, "_start_instance_tasks") as start_tasks,
+        patch.object(service, "_cleanup_instance", new=AsyncMock()) as cleanup,
+    ):
+        await service.start()
+
+    assert service.state == ServiceState.RUNNING
+    cabin = service.instance_startup["cabin"]
+    assert cabin.state == InstanceReadiness.FAILED
+    assert cabin.error == "connecting: host unreachable"
+    cleanup.assert_awaited_once_with("cabin")
+    assert sorted(call.args[0] for call in start_tasks.call_args_list) == ["home", "office"]
+
+
+@pytest.mark.asyncio
+async def test_start_fails_when_every_instance_fails(
+    multi_config: Config, mock_database: AsyncMock
+) -> None:
+    """The service only fails to start when no instance could be initialized."""
+    service = HABossService(multi_config)
+
+    with (
+        patch.object(service, "_initialize_instance", side_effect=ConnectionError("network down")),
+        patch.object(service, "_cleanup_instance", new=AsyncMock()),
+    ):
+        with pytest.raises(ConnectionError, match="network down"):
+            await service.start()
+
+    assert service.state == ServiceState.ERROR
+    assert all(
+        startup.state == InstanceReadiness.FAILED for startup in service.instance_startup.values()
+    )
+
+
+@pytest.mark.asyncio
+async def test_api_starts_before_instances(multi_config: Config, mock_database: AsyncMock) -> None:
+    """The API server is up while instances are still connecting."""
+    multi_config.api.enabled = True
+    service = HABossService(multi_config)
+    events: list[str] = []
+
+    async def fake_initialize(instance_id: str, **kwargs: object) -> None:
+        events.append(f"initialize:{instance_id}")
+
+    with (
+        patch.object(service, "_initialize_instance", side_effect=fake_initialize),
+        patch.object(service, "_start_instance_tasks"),
+        patch.object(
+            service, "_start_api_server", side_effect=lambda: events.append("api")
+        ) as start_api,
+    ):
+        await service.start()
+
+    start_api.assert_called_once()
+    assert events[0] == "api"
+
+
+@pytest.mark.asyncio
+async def test_api_server_configures_and_closes_websocket_manager(
+    multi_config: Config, mock_database: AsyncMock
+) -> None:
+    """Broadcast settings are applied on API start and writers stopped on shutdown."""
+    multi_config.api.enabled = True
+    multi_config.api.websocket_flush_interval_ms = 250
+    multi_config.api.websocket_client_queue_size = 64
+    service = HABossService(multi_config)
+    manager = MagicMock()
+    manager.close = AsyncMock()
+
+    with (
+        patch("ha_boss.api.websocket_manager.get_websocket_manager", return_value=manager),
+        patch.object(service, "_run_api_server", new=AsyncMock()),
+    ):
+        service._start_api_server()
+        await service._cleanup()
+
+    manager.configure.assert_called_once_with(
+        flush_interval=0.25,
+        client_queue_size=64,
+        send_timeout=multi_config.api.websocket_send_timeout_seconds,
+    )
+    manager.close.assert_awaited_once()
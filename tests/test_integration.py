@@ -14,6 +14,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from ha_boss.core.config import Config
+from ha_boss.core.ha_client import HomeAssistantClient
 from ha_boss.service.main import HABossService, ServiceState
 
 
@@ -51,6 +52,10 @@ async def test_service_full_startup_and_shutdown(integration_config: Config) ->
         patch(
             "ha_boss.monitoring.state_tracker.StateTracker._persist_entity", new_callable=AsyncMock
         ),
+        patch(
+            "ha_boss.monitoring.state_tracker.StateTracker._hydrate_database",
+            new_callable=AsyncMock,
+        ),
         patch(
             "ha_boss.monitoring.health_monitor.HealthMonitor._persist_health_event",
             new_callable=AsyncMock,
@@ -63,7 +68,7 @@ async def test_service_full_startup_and_shutdown(integration_config: Config) ->
             "ha_boss.healing.integration_manager.IntegrationDiscovery._save_to_database",
             new_callable=AsyncMock,
         ),
-        patch("ha_boss.core.ha_client.HomeAssistantClient") as mock_ha_client_class,
+        patch("ha_boss.service.main.HomeAssistantClient") as mock_ha_client_class,
         patch("ha_boss.service.main.WebSocketClient") as mock_ws_class,
     ):
         # Set up Database mock
@@ -135,8 +140,9 @@ async def test_service_full_startup_and_shutdown(integration_config: Config) ->
         assert "sensor.test1" in service.state_tracker._cache
         assert "sensor.test2" in service.state_tracker._cache
 
-        # Get status
-        status = service.get_status()
+        # Get status (isinstance checks need the real client class)
+        with patch("ha_boss.service.main.HomeAssistantClient", HomeAssistantClient):
+            status = service.get_status()
         assert status["state"] == ServiceState.RUNNING
         # Multi-instance: websocket_connected is per-instance
         assert status["instances"]["default"]["websocket_connected"] is True
@@ -154,7 +160,7 @@ async def test_service_full_startup_and_shutdown(integration_config: Config) ->
 @pytest.mark.asyncio
 async def test_service_handles_ha_unavailable(integration_config: Config) -> None:
     """Test service handles Home Assistant being unavailable."""
-    with patch("ha_boss.core.ha_client.HomeAssistantClient") as mock_ha_client_class:
+    with patch("ha_boss.service.main.HomeAssistantClient") as mock_ha_client_class:
         # Simulate HA being unavailable
         mock_client = AsyncMock()
         mock_client.get_states = AsyncMock(side_effect=Exception("Connection refused"))
@@ -179,6 +185,10 @@ async def test_service_state_update_flow(integration_config: Config) -> None:
         patch(
             "ha_boss.monitoring.state_tracker.StateTracker._persist_entity", new_callable=AsyncMock
         ),
+        patch(
+            "ha_boss.monitoring.state_tracker.StateTracker._hydrate_database",
+            new_callable=AsyncMock,
+        ),
         patch(
             "ha_boss.monitoring.health_monitor.HealthMonitor._persist_health_event",
             new_callable=AsyncMock,
@@ -191,7 +201,7 @@ async def test_service_state_update_flow(integration_config: Config) -> None:
             "ha_boss.healing.integration_manager.IntegrationDiscovery._save_to_database",
             new_callable=AsyncMock,
         ),
-        patch("ha_boss.core.ha_client.HomeAssistantClient") as mock_ha_client_class,
+        patch("ha_boss.service.main.HomeAssistantClient") as mock_ha_client_class,
         patch("ha_boss.service.main.WebSocketClient") as mock_ws_class,
     ):
         # Set up Database mock
@@ -272,6 +282,10 @@ async def test_service_healing_flow(integration_config: Config) -> None:
         patch(
             "ha_boss.monitoring.state_tracker.StateTracker._persist_entity", new_callable=AsyncMock
         ),
+        patch(
+            "ha_boss.monitoring.state_tracker.StateTracker._hydrate_database",
+            new_callable=AsyncMock,
+        ),
         patch(
             "ha_boss.monitoring.health_monitor.HealthMonitor._persist_health_event",
             new_callable=AsyncMock,
@@ -284,7 +298,7 @@ async def test_service_healing_flow(integration_config: Config) -> None:
             "ha_boss.healing.integration_manager.IntegrationDiscovery._save_to_database",
             new_callable=AsyncMock,
         ),
-        patch("ha_boss.core.ha_client.HomeAssistantClient") as mock_ha_client_class,
+        patch("ha_boss.service.main.HomeAssistantClient") as mock_ha_client_class,
         patch("ha_boss.service.main.WebSocketClient") as mock_ws_class,
     ):
         # Set up Database mock
@@ -337,8 +351,9 @@ async def test_service_healing_flow(integration_config: Config) -> None:
         # Mock healing manager to simulate successful heal
         service.healing_managers["default"].heal = AsyncMock(return_value=True)
 
-        # Trigger health issue callback with instance_id
+        # Trigger health issue callback with instance_id, then heal the coalesced group
         await service._on_health_issue("default", issue)
+        await service.heal_coalescers["default"].flush()
 
         # Verify healing was attempted (per-instance statistics)
         assert service.healings_attempted["default"] == 1
@@ -358,6 +373,10 @@ async def test_service_graceful_shutdown_on_signal(integration_config: Config) -
         patch(
             "ha_boss.monitoring.state_tracker.StateTracker._persist_entity", new_callable=AsyncMock
         ),
+        patch(
+            "ha_boss.monitoring.state_tracker.StateTracker._hydrate_database",
+            new_callable=AsyncMock,
+        ),
         patch(
             "ha_boss.monitoring.health_monitor.HealthMonitor._persist_health_event",
             new_callable=AsyncMock,
@@ -370,7 +389,7 @@ async def test_service_graceful_shutdown_on_signal(integration_config: Config) -
             "ha_boss.healing.integration_manager.IntegrationDiscovery._save_to_database",
             new_callable=AsyncMock,
         ),
-        patch("ha_boss.core.ha_client.HomeAssistantClient") as mock_ha_client_class,
+        patch("ha_boss.service.main.HomeAssistantClient") as mock_ha_client_class,
         patch("ha_boss.service.main.WebSocketClient") as mock_ws_class,
     ):
         # Set up Database mock